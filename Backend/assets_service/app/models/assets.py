@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Date, Float, ForeignKey, Enum as SQLEnum, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Date, Float, ForeignKey, Enum as SQLEnum, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
+from ...shared.search import search_vector_column, search_vector_index, trigram_index
 from ..schemas.assets import AssetType, AssetStatus, AssetCondition
 
 
@@ -36,6 +37,18 @@ class Asset(Base):
     history = relationship("AssetHistory", back_populates="asset", cascade="all, delete-orphan")
     maintenance = relationship("AssetMaintenance", back_populates="asset", cascade="all, delete-orphan")
 
+    # Busca textual (shared/search.py): tsvector em português + trigramas para substring
+    search_vector = search_vector_column(('name', 'A'), ('brand', 'B'), ('model', 'B'), ('description', 'C'))
+
+    __table_args__ = (
+        # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+        Index('idx_assets_created_id', 'created_at', 'id'),
+        search_vector_index('idx_assets_search'),
+        trigram_index('idx_assets_name_trgm', 'name'),
+        trigram_index('idx_assets_serial_number_trgm', 'serial_number'),
+        trigram_index('idx_assets_location_trgm', 'location'),
+    )
+
 
 class AssetHistory(Base):
     __tablename__ = "asset_history"
@@ -3,6 +3,9 @@ from typing import List, Optional
 from ..models.assets import Asset, AssetHistory, AssetMaintenance
 from ..schemas.assets import AssetIn, AssetUpdate, AssetHistoryIn, AssetMaintenanceIn, AssetDisposalIn
 from datetime import datetime, date
+from ...shared.pagination import Page, keyset_page
+from ...shared.search import contains, ranked_page, text_search
+from ...shared.aggregates import grouped_stats
 
 
 class AssetRepository:
@@ -58,7 +61,25 @@ class AssetRepository:
                    status: Optional[str] = None,
                    condition: Optional[str] = None,
                    location: Optional[str] = None,
-                   unit_id: Optional[int] = None) -> List[Asset]:
+                   unit_id: Optional[int] = None,
+                   cursor: Optional[str] = None,
+                   limit: Optional[int] = None) -> Page:
+        return keyset_page(self._assets_query(asset_type, status, condition, location, unit_id), Asset.created_at, Asset.id, cursor, limit)
+
+    def find_assets(self, 
+                    asset_type: Optional[str] = None,
+                    status: Optional[str] = None,
+                    condition: Optional[str] = None,
+                    location: Optional[str] = None,
+                    unit_id: Optional[int] = None) -> List[Asset]:
+        return self._assets_query(asset_type, status, condition, location, unit_id).order_by(Asset.name.asc()).all()
+
+    def _assets_query(self, 
+                      asset_type: Optional[str] = None,
+                      status: Optional[str] = None,
+                      condition: Optional[str] = None,
+                      location: Optional[str] = None,
+                      unit_id: Optional[int] = None):
         query = self.db.query(Asset)
         
         if asset_type:
@@ -68,20 +89,16 @@ class AssetRepository:
         if condition:
             query = query.filter(Asset.condition == condition)
         if location:
-            query = query.filter(Asset.location.ilike(f"%{location}%"))
+            query = query.filter(contains(Asset.location, location))
         if unit_id:
             query = query.filter(Asset.unit_id == unit_id)
             
-        return query.order_by(Asset.name.asc()).all()
+        return query
 
-    def search_assets(self, search_term: str) -> List[Asset]:
-        return self.db.query(Asset).filter(
-            (Asset.name.ilike(f"%{search_term}%")) |
-            (Asset.description.ilike(f"%{search_term}%")) |
-            (Asset.brand.ilike(f"%{search_term}%")) |
-            (Asset.model.ilike(f"%{search_term}%")) |
-            (Asset.serial_number.ilike(f"%{search_term}%"))
-        ).order_by(Asset.name.asc()).all()
+    def search_assets(self, search_term: str, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        # Nome, marca, modelo e descrição pelo search_vector; nome e número de série também por substring
+        match, rank = text_search(Asset.search_vector, search_term, [Asset.name, Asset.serial_number])
+        return ranked_page(self.db.query(Asset).filter(match), rank, Asset.id, cursor, limit)
 
     def update_asset(self, asset_id: int, update_data: AssetUpdate) -> Optional[Asset]:
         db_asset = self.get_asset(asset_id)
@@ -303,7 +320,7 @@ class AssetRepository:
 
     def get_assets_by_location(self, location: str) -> List[Asset]:
         return self.db.query(Asset).filter(
-            Asset.location.ilike(f"%{location}%")
+            contains(Asset.location, location)
         ).order_by(Asset.name.asc()).all()
 
     def get_assets_by_responsible_person(self, responsible_person: str) -> List[Asset]:
@@ -331,17 +348,16 @@ class AssetRepository:
             Asset.purchase_date <= end_date
         )
         
-        total_assets = query.count()
-        total_value = sum([asset.purchase_price for asset in query.all()])
-        
-        type_breakdown = {}
-        status_breakdown = {}
-        condition_breakdown = {}
-        
-        for asset in query.all():
-            type_breakdown[asset.asset_type] = type_breakdown.get(asset.asset_type, 0) + 1
-            status_breakdown[asset.status] = status_breakdown.get(asset.status, 0) + 1
-            condition_breakdown[asset.condition] = condition_breakdown.get(asset.condition, 0) + 1
+        stats = grouped_stats(
+            query,
+            {"type": Asset.asset_type, "status": Asset.status, "condition": Asset.condition},
+            sums={"value": Asset.purchase_price}
+        )
+        total_assets = stats["total"]
+        total_value = stats["sums"]["value"]
+        type_breakdown = stats["breakdowns"]["type"]
+        status_breakdown = stats["breakdowns"]["status"]
+        condition_breakdown = stats["breakdowns"]["condition"]
         
         return {
             "total_assets": total_assets,
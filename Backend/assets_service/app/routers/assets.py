@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.db import get_db
 from ..schemas.assets import AssetIn, AssetOut, AssetUpdate, AssetHistoryIn, AssetMaintenanceIn, AssetDisposalIn
 from ..services.asset_service import AssetService
 from datetime import datetime, date
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/assets", tags=["assets"])
 
@@ -20,21 +21,30 @@ def create_asset(asset_data: AssetIn, created_by: str = "Sistema", db: Session =
 
 @router.get("/", response_model=List[AssetOut])
 def list_assets(
+    response: Response,
     asset_type: Optional[str] = None,
     status: Optional[str] = None,
     condition: Optional[str] = None,
     location: Optional[str] = None,
     unit_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = AssetService(db)
-    return service.list_assets(asset_type, status, condition, location, unit_id)
+    return set_next_cursor(response, service.list_assets(asset_type, status, condition, location, unit_id, cursor, limit))
 
 
-@router.get("/search/{search_term}")
-def search_assets(search_term: str, db: Session = Depends(get_db)):
+@router.get("/search/{search_term}", response_model=List[AssetOut])
+def search_assets(
+    search_term: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
     service = AssetService(db)
-    return service.search_assets(search_term)
+    return set_next_cursor(response, service.search_assets(search_term, cursor, limit))
 
 
 @router.get("/{asset_id}", response_model=AssetOut)
@@ -3,6 +3,7 @@ from typing import List, Optional
 from ..repositories.asset_repository import AssetRepository
 from ..schemas.assets import AssetIn, AssetOut, AssetUpdate, AssetHistoryIn, AssetMaintenanceIn, AssetDisposalIn
 from datetime import datetime, date
+from ...shared.pagination import Page
 
 
 class AssetService:
@@ -36,13 +37,15 @@ class AssetService:
                    status: Optional[str] = None,
                    condition: Optional[str] = None,
                    location: Optional[str] = None,
-                   unit_id: Optional[int] = None) -> List[AssetOut]:
-        assets = self.repository.list_assets(asset_type, status, condition, location, unit_id)
-        return [AssetOut.from_orm(asset) for asset in assets]
+                   unit_id: Optional[int] = None,
+                   cursor: Optional[str] = None,
+                   limit: Optional[int] = None) -> Page:
+        page = self.repository.list_assets(asset_type, status, condition, location, unit_id, cursor, limit)
+        return Page([AssetOut.from_orm(asset) for asset in page.items], page.next_cursor)
 
-    def search_assets(self, search_term: str) -> List[AssetOut]:
-        assets = self.repository.search_assets(search_term)
-        return [AssetOut.from_orm(asset) for asset in assets]
+    def search_assets(self, search_term: str, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        page = self.repository.search_assets(search_term, cursor, limit)
+        return Page([AssetOut.from_orm(asset) for asset in page.items], page.next_cursor)
 
     def update_asset(self, asset_id: int, update_data: AssetUpdate, changed_by: str = "Sistema") -> Optional[AssetOut]:
         asset = self.repository.update_asset(asset_id, update_data)
@@ -164,13 +167,13 @@ class AssetService:
         return self.repository.get_assets_stats(start_date, end_date)
 
     def get_assets_by_unit(self, unit_id: int) -> List[AssetOut]:
-        assets = self.repository.list_assets(unit_id=unit_id)
+        assets = self.repository.find_assets(unit_id=unit_id)
         return [AssetOut.from_orm(asset) for asset in assets]
 
     def get_assets_by_creator(self, created_by: str) -> List[AssetOut]:
         # This would need to be implemented in the repository
         # For now, we'll use a simple approach
-        assets = self.repository.list_assets()
+        assets = self.repository.find_assets()
         filtered_assets = []
         
         for asset in assets:
@@ -234,7 +237,7 @@ class AssetService:
         return condition_history
 
     def get_assets_by_date_range(self, start_date: date, end_date: date) -> List[AssetOut]:
-        assets = self.repository.list_assets()
+        assets = self.repository.find_assets()
         filtered_assets = []
         
         for asset in assets:
@@ -244,7 +247,7 @@ class AssetService:
         return [AssetOut.from_orm(asset) for asset in filtered_assets]
 
     def get_assets_by_value_range(self, min_value: float, max_value: float) -> List[AssetOut]:
-        assets = self.repository.list_assets()
+        assets = self.repository.find_assets()
         filtered_assets = []
         
         for asset in assets:
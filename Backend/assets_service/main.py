@@ -1,9 +1,13 @@
 from fastapi import FastAPI
 from .app.core.db import engine, Base
 from .app.routers import assets
+from .app.models.assets import Asset
+from .shared.search import install_search_extensions, upgrade_search_schema
 
-# Create tables
+# Create tables (as extensões de busca precisam existir antes das colunas/índices)
+install_search_extensions(engine)
 Base.metadata.create_all(bind=engine)
+upgrade_search_schema(engine, Asset.__table__)
 
 app = FastAPI(title="Assets Service", version="1.0.0")
 
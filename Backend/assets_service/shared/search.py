@@ -0,0 +1,138 @@
+# Busca textual compartilhada pelos serviços SQLAlchemy: pg_trgm + tsvector em português sem acentos
+import base64
+import json
+from typing import Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import Column, Computed, Index, cast, func, literal_column, or_, text, tuple_
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, TSVECTOR
+from sqlalchemy.orm import deferred
+from sqlalchemy.schema import CreateColumn, CreateIndex
+
+from .pagination import Page, fetch_limit, list_size
+
+# Configuração de busca: dicionário portuguese_stem depois de remover acentos
+SEARCH_CONFIG = 'pt_unaccent'
+
+# Executado antes do create_all (e também em Scripts/init_db.sql). O advisory lock evita que
+# vários serviços subindo juntos disputem o CREATE OR REPLACE FUNCTION.
+SEARCH_DDL = [
+    "SELECT pg_advisory_xact_lock(hashtext('search_schema'))",
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    # unaccent() é STABLE; índices de expressão exigem uma função IMMUTABLE
+    """CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+       LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+       AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$""",
+    f"""DO $$
+    BEGIN
+      IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{SEARCH_CONFIG}') THEN
+        CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = portuguese);
+        ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG}
+          ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem;
+      END IF;
+    END $$""",
+]
+
+_REGCONFIG = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+
+
+def install_search_extensions(engine) -> None:
+    # Extensões, funções e configuração são do PostgreSQL (no SQLite não há busca a instalar)
+    if engine.dialect.name != 'postgresql':
+        return
+    with engine.begin() as conn:
+        for statement in SEARCH_DDL:
+            conn.execute(text(statement))
+
+
+def search_vector_column(*weighted: Tuple[str, str]):
+    """
+    Coluna ``tsvector`` gerada a partir de ``(coluna, peso)``, ex.: ``('title', 'A'), ('content', 'B')``.
+    É ``deferred``: só é lida quando usada em filtro/ordenação, nunca ao carregar a entidade.
+    """
+    expression = ' || '.join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce({name}, '')), '{weight}')"
+        for name, weight in weighted
+    )
+    return deferred(Column('search_vector', TSVECTOR, Computed(expression, persisted=True)))
+
+
+def search_vector_index(name: str, column_name: str = 'search_vector') -> Index:
+    return Index(name, column_name, postgresql_using='gin')
+
+
+def trigram_index(name: str, column_name: str) -> Index:
+    """Índice GIN de trigramas sobre ``f_unaccent(coluna)``: atende ``ILIKE '%termo%'`` via ``contains``."""
+    return Index(name, text(f'f_unaccent({column_name}) gin_trgm_ops'), postgresql_using='gin')
+
+
+def upgrade_search_schema(engine, table) -> None:
+    """Tabelas criadas antes da busca: acrescenta ``search_vector`` e os índices que faltarem."""
+    if engine.dialect.name != 'postgresql':
+        return
+    with engine.begin() as conn:
+        if 'search_vector' in table.c:
+            column = CreateColumn(table.c.search_vector).compile(dialect=conn.dialect)
+            conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {column}'))
+        for index in table.indexes:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def _escape_like(term: str) -> str:
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def contains(column, term: str):
+    """Substring sem diferenciar maiúsculas nem acentos (usa o índice de ``trigram_index``)."""
+    return func.f_unaccent(column).ilike(func.f_unaccent(f'%{_escape_like(term)}%'), escape='\\')
+
+
+def similarity(column, term: str):
+    # Quão bem o termo casa com algum trecho da coluna (0..1), para ordenar
+    return func.word_similarity(func.f_unaccent(term), func.f_unaccent(column))
+
+
+def text_search(vector_column, term: str, trigram_columns: Sequence = ()):
+    """
+    Devolve ``(filtro, relevância)`` para ``term``: casa pelo tsvector (com radicais, aceitando a
+    sintaxe de busca web: aspas, ``or``, ``-``) ou por substring nas ``trigram_columns``.
+    """
+    query = func.websearch_to_tsquery(_REGCONFIG, term)
+    rank = func.ts_rank_cd(vector_column, query)
+    for column in trigram_columns:
+        rank = rank + similarity(column, term)
+    match = or_(vector_column.op('@@')(query), *[contains(column, term) for column in trigram_columns])
+    return match, rank
+
+
+def encode_rank_cursor(rank: float, row_id: int) -> str:
+    raw = json.dumps([rank, row_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_rank_cursor(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        rank, row_id = json.loads(raw)
+        return float(rank), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail='Cursor de paginação inválido')
+
+
+def ranked_page(query, rank, id_column, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    """Pagina ``query`` por ``(relevância DESC, id DESC)``; o cursor carrega a posição da última linha."""
+    size = list_size(limit, cursor)
+    # ts_rank/similarity são real: em double precision o valor volta do cursor sem arredondar
+    rank = cast(rank, DOUBLE_PRECISION).label('search_rank')
+    position = decode_rank_cursor(cursor)
+    if position is not None:
+        query = query.filter(tuple_(rank.element, id_column) < tuple_(*position))
+    rows = query.add_columns(rank).order_by(rank.desc(), id_column.desc()).limit(fetch_limit(size)).all()
+    items = [row[0] for row in rows[:size]]
+    if size is not None and len(rows) > size:
+        last_rank, last = rows[size - 1][1], rows[size - 1][0]
+        return Page(items, encode_rank_cursor(last_rank, last.id))
+    return Page(items, None)
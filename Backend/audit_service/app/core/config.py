@@ -8,6 +8,17 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     tenant_id: Optional[int] = None
+    # Batch ingestion (/audit/logs/batch): rows are queued and written in multi-row INSERTs
+    audit_batch_size: int = 500
+    audit_flush_interval: float = 1.0  # seconds
+    audit_max_pending: int = 50000  # queued rows before requests get 429
+    audit_batch_max_items: int = 5000  # events per request
+    # Monthly partitions of audit_logs (PostgreSQL): created ahead of time, dropped by retention
+    audit_partition_months_ahead: int = 3
+    audit_partition_check_interval: float = 21600  # seconds
+    audit_retention_months: int = 0  # 0 keeps every partition
+    audit_archive_path: Optional[str] = None  # export partitions here before dropping them
+    audit_archive_format: str = "ndjson"  # ndjson (gzip) or parquet (zstd, needs pyarrow)
     
     class Config:
         env_file = ".env"
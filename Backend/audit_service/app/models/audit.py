@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Index
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
@@ -8,32 +8,39 @@ from ..schemas.audit import ActionType, LogLevel
 class AuditLog(Base):
     __tablename__ = "audit_logs"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String(255), nullable=False, index=True)
-    user_email = Column(String(255), nullable=False, index=True)
-    action = Column(SQLEnum(ActionType), nullable=False, index=True)
-    resource_type = Column(String(100), nullable=False, index=True)
-    resource_id = Column(String(100), index=True)
+    # Partitioned by month on created_at (see services/partitions.py); PostgreSQL requires the
+    # partition key in the primary key
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(String(255), nullable=False)
+    user_email = Column(String(255), nullable=False)
+    action = Column(SQLEnum(ActionType), nullable=False)
+    resource_type = Column(String(100), nullable=False)
+    resource_id = Column(String(100))
     resource_name = Column(String(255))
     description = Column(Text, nullable=False)
-    ip_address = Column(String(45), index=True)
+    ip_address = Column(String(45))
     user_agent = Column(Text)
-    session_id = Column(String(255), index=True)
-    tenant_id = Column(Integer, ForeignKey("tenants.id"), index=True)
-    unit_id = Column(Integer, ForeignKey("units.id"), index=True)
+    session_id = Column(String(255))
+    tenant_id = Column(Integer, ForeignKey("tenants.id"))
+    unit_id = Column(Integer, ForeignKey("units.id"))
     old_values = Column(JSON)
     new_values = Column(JSON)
     metadata = Column(JSON)
-    log_level = Column(SQLEnum(LogLevel), default=LogLevel.INFO, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    log_level = Column(SQLEnum(LogLevel), default=LogLevel.INFO)
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
 
-    # Create composite indexes for common queries
+    # Only the indexes the repository queries use: every lookup filters on one column and
+    # orders by created_at DESC. Low-cardinality filters (action, log_level) and the stats
+    # queries run on the created_at range, which partition pruning already narrows to a few months.
     __table_args__ = (
-        Index('idx_user_action', 'user_id', 'action'),
-        Index('idx_resource_action', 'resource_type', 'action'),
-        Index('idx_tenant_date', 'tenant_id', 'created_at'),
-        Index('idx_unit_date', 'unit_id', 'created_at'),
-        Index('idx_date_level', 'created_at', 'log_level'),
+        Index('idx_audit_logs_created', 'created_at'),
+        Index('idx_audit_logs_user_created', 'user_id', 'created_at'),
+        Index('idx_audit_logs_resource_created', 'resource_type', 'resource_id', 'created_at'),
+        Index('idx_audit_logs_tenant_created', 'tenant_id', 'created_at'),
+        Index('idx_audit_logs_unit_created', 'unit_id', 'created_at'),
+        Index('idx_audit_logs_session', 'session_id'),
+        Index('idx_audit_logs_ip', 'ip_address'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
     )
 
 
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from ..core.config import settings
 from ..core.db import get_db
 from ..schemas.audit import AuditLogIn, AuditLogOut, AuditLogSearchIn, AuditStatsIn, AuditStatsOut, AuditReportIn, AuditReportOut
 from ..services.audit_service import AuditService
+from ..services.audit_ingest import BufferFullError, audit_row, ingest_buffer, parse_audit_batch
 from datetime import datetime, timedelta
 
 router = APIRouter(prefix="/audit", tags=["audit"])
@@ -15,6 +17,34 @@ def create_audit_log(log_data: AuditLogIn, db: Session = Depends(get_db)):
     return service.log_action(log_data)
 
 
+@router.post("/logs/batch", status_code=202)
+async def ingest_audit_logs(request: Request):
+    """
+    Accepts a JSON array or NDJSON (``Content-Type: application/x-ndjson``) of audit events.
+    Events are queued and written in batches; 429 with Retry-After while the queue is full.
+    """
+    body = await request.body()
+    try:
+        items = parse_audit_batch(body, request.headers.get("content-type", ""))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Evento de auditoria inválido: {e}")
+    if len(items) > settings.audit_batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Lote muito grande. Máximo {settings.audit_batch_max_items} eventos"
+        )
+    
+    try:
+        accepted = ingest_buffer.offer([audit_row(item) for item in items])
+    except BufferFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail="Fila de auditoria cheia, tente novamente",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    return {"accepted": accepted}
+
+
 @router.get("/logs/{log_id}", response_model=AuditLogOut)
 def get_audit_log(log_id: int, db: Session = Depends(get_db)):
     service = AuditService(db)
@@ -53,6 +53,11 @@ class AuditLogIn(BaseModel):
     log_level: LogLevel = LogLevel.INFO
 
 
+class AuditLogBatchItem(AuditLogIn):
+    # When the event happened; defaults to the time it was received
+    created_at: Optional[datetime] = None
+
+
 class AuditLogOut(BaseModel):
     id: int
     user_id: str
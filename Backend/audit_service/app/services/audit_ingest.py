@@ -0,0 +1,194 @@
+import logging
+import math
+import threading
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.exc import DataError, IntegrityError
+
+from ..core.config import settings
+from ..core.db import engine
+from ..models.audit import AuditLog
+from ..schemas.audit import AuditLogBatchItem
+
+logger = logging.getLogger(__name__)
+
+_batch_adapter = TypeAdapter(List[AuditLogBatchItem])
+
+
+class BufferFullError(Exception):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Audit ingestion buffer is full")
+        self.retry_after = retry_after
+
+
+def parse_audit_batch(body: bytes, content_type: str) -> List[AuditLogBatchItem]:
+    """
+    Parse a JSON array or NDJSON (one event per line) body. Raises ValueError naming the
+    offending event.
+    """
+    if "ndjson" in content_type or "jsonlines" in content_type:
+        items = []
+        for line_number, line in enumerate(body.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                items.append(AuditLogBatchItem.model_validate_json(line))
+            except ValidationError as e:
+                raise ValueError(f"linha {line_number}: {e.errors()[0]['msg']}")
+        return items
+
+    try:
+        return _batch_adapter.validate_json(body)
+    except ValidationError as e:
+        error = e.errors()[0]
+        raise ValueError(f"evento {'.'.join(str(part) for part in error['loc'])}: {error['msg']}")
+
+
+def audit_row(item: AuditLogBatchItem) -> Dict[str, Any]:
+    row = item.model_dump()
+    # Events sent later by a buffering client keep the time they happened
+    row["created_at"] = row["created_at"] or datetime.utcnow()
+    return row
+
+
+class AuditIngestBuffer:
+    """
+    In-process queue of audit rows, written by a background thread with multi-row INSERTs.
+
+    - a write happens when ``batch_size`` rows are waiting or ``flush_interval`` seconds have
+      passed, whichever comes first
+    - ``offer`` accepts a whole request or nothing: if it does not fit in ``max_pending`` rows it
+      raises BufferFullError, and the endpoint answers 429 so clients back off
+    - rows leave the queue only after they were committed; a failed write is retried
+    - ``stop()`` writes everything still queued
+    """
+
+    def __init__(self, engine, table, batch_size: int, flush_interval: float, max_pending: int) -> None:
+        self.engine = engine
+        self.table = table
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: deque = deque()
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        # The worker and stop() may both flush
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self.accepted = 0
+        self.rejected = 0
+        self.written = 0
+        self.batches = 0
+        self.errors = 0
+        self.dropped = 0
+
+    def offer(self, rows: List[Dict[str, Any]]) -> int:
+        with self._lock:
+            if len(self._pending) + len(rows) > self.max_pending:
+                self.rejected += len(rows)
+                raise BufferFullError(max(1, math.ceil(self.flush_interval)))
+            self._pending.extend(rows)
+            self.accepted += len(rows)
+            if len(self._pending) >= self.batch_size:
+                self._ready.notify()
+        return len(rows)
+
+    def flush(self) -> int:
+        """Write all queued rows in batches of ``batch_size``; returns how many were written."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = list(islice(self._pending, self.batch_size))
+                if not batch:
+                    return written
+                count = len(batch)
+                try:
+                    with self.engine.begin() as conn:
+                        conn.execute(self.table.insert(), batch)
+                except (DataError, IntegrityError):
+                    # One bad event (e.g. unknown tenant_id) must not block the queue
+                    count = self._write_each(batch)
+                with self._lock:
+                    for _ in batch:
+                        self._pending.popleft()
+                written += count
+                self.written += count
+                self.batches += 1
+
+    def _write_each(self, batch: List[Dict[str, Any]]) -> int:
+        written = 0
+        for row in batch:
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(self.table.insert(), row)
+                written += 1
+            except (DataError, IntegrityError) as e:
+                self.dropped += 1
+                logger.warning(f"Audit event dropped: {e.orig}")
+        return written
+
+    def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name="audit-ingest-flush", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._lock:
+            self._ready.notify()
+        if self._worker is not None:
+            self._worker.join(timeout=30)
+            self._worker = None
+        self.flush()
+
+    def _run(self) -> None:
+        backoff = self.flush_interval
+        while not self._stop.is_set():
+            with self._lock:
+                if len(self._pending) < self.batch_size:
+                    self._ready.wait(self.flush_interval)
+            if self._stop.is_set():
+                break
+            try:
+                self.flush()
+                backoff = self.flush_interval
+            except Exception as e:
+                # Rows stay queued; new requests get 429 once the queue fills up
+                self.errors += 1
+                logger.warning(f"Audit batch insert failed: {e}; retrying in {backoff:.0f}s")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 60.0)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "pending": pending,
+            "max_pending": self.max_pending,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "written": self.written,
+            "batches": self.batches,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "running": self._worker is not None and self._worker.is_alive(),
+        }
+
+
+ingest_buffer = AuditIngestBuffer(
+    engine,
+    AuditLog.__table__,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval,
+    max_pending=settings.audit_max_pending
+)
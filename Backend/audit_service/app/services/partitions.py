@@ -0,0 +1,288 @@
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PARENT = "audit_logs"
+DEFAULT_PARTITION = f"{PARENT}_default"
+_PARTITION_NAME = re.compile(rf"^{PARENT}_y(\d{{4}})m(\d{{2}})$")
+# One maintainer at a time across replicas
+_LOCK = "SELECT pg_advisory_xact_lock(hashtext('audit_logs_partitions'))"
+
+ARCHIVE_FORMATS = ("ndjson", "parquet")
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_y{month.year:04d}m{month.month:02d}"
+
+
+def is_partitioned(engine) -> bool:
+    if engine.dialect.name != "postgresql":
+        return False
+    with engine.connect() as conn:
+        kind = conn.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": PARENT}
+        ).scalar()
+    return kind == "p"
+
+
+def list_partitions(conn) -> Dict[date, str]:
+    """Monthly partitions currently attached, by first day of the month."""
+    names = conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass(:parent)"
+    ), {"parent": PARENT}).scalars()
+    partitions = {}
+    for name in names:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+    return partitions
+
+
+def ensure_partitions(engine, months_ahead: Optional[int] = None, since: Optional[date] = None) -> List[str]:
+    """
+    Create the monthly partitions from ``since`` (default: this month) up to ``months_ahead``
+    months from now, plus the default partition for rows outside every range.
+    """
+    months_ahead = settings.audit_partition_months_ahead if months_ahead is None else months_ahead
+    current = month_start(datetime.utcnow().date())
+    month = month_start(since) if since else current
+    last = add_months(current, months_ahead)
+    created = []
+    with engine.begin() as conn:
+        conn.execute(text(_LOCK))
+        existing = list_partitions(conn)
+        conn.execute(text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT} DEFAULT"))
+        while month <= last:
+            if month not in existing:
+                _create_partition(conn, month)
+                created.append(partition_name(month))
+            month = add_months(month, 1)
+    if created:
+        logger.info(f"Audit partitions created: {', '.join(created)}")
+    return created
+
+
+def _create_partition(conn, month: date) -> None:
+    name = partition_name(month)
+    bounds = {"start": month, "end": add_months(month, 1)}
+    values = f"FOR VALUES FROM ('{bounds['start'].isoformat()}') TO ('{bounds['end'].isoformat()}')"
+    in_default = conn.execute(text(
+        f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end)"
+    ), bounds).scalar()
+    if not in_default:
+        conn.execute(text(f"CREATE TABLE {name} PARTITION OF {PARENT} {values}"))
+        return
+    # Rows for this month already landed in the default partition (events sent with an older
+    # or future created_at): move them into the new partition before attaching it
+    conn.execute(text(f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    conn.execute(text(
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end "
+        f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+    ), bounds)
+    conn.execute(text(f"ALTER TABLE {PARENT} ATTACH PARTITION {name} {values}"))
+
+
+def _archive_rows(rows, path: Path, archive_format: str) -> int:
+    count = 0
+    if archive_format == "ndjson":
+        with gzip.open(path, "wt", encoding="utf-8") as out:
+            for row in rows:
+                out.write(json.dumps(dict(row._mapping), default=str) + "\n")
+                count += 1
+        return count
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet archives require pyarrow (pip install pyarrow)")
+    writer = None
+    try:
+        while True:
+            chunk = rows.fetchmany(10000)
+            if not chunk:
+                break
+            # JSON columns are kept as text so every chunk has the same schema
+            records = [
+                {key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                 for key, value in row._mapping.items()}
+                for row in chunk
+            ]
+            table = pa.Table.from_pylist(records)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression="zstd")
+            writer.write_table(table.cast(writer.schema))
+            count += len(records)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def _export(conn, query: str, params: Dict[str, Any], path: Path, archive_format: str) -> int:
+    if archive_format not in ARCHIVE_FORMATS:
+        raise ValueError(f"Unknown audit archive format: {archive_format}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+    rows = conn.execute(text(query).execution_options(stream_results=True, yield_per=10000), params)
+    count = _archive_rows(rows, partial, archive_format)
+    os.replace(partial, path)
+    logger.info(f"Audit rows archived to {path} ({count} rows)")
+    return count
+
+
+def _suffix(archive_format: str) -> str:
+    return ".ndjson.gz" if archive_format == "ndjson" else ".parquet"
+
+
+def _detached_partitions(conn) -> Dict[date, str]:
+    # Left behind by a retention run that failed between detaching and dropping
+    names = conn.execute(text(
+        "SELECT c.relname FROM pg_class c WHERE c.relkind = 'r' AND c.relname ~ :pattern "
+        "AND NOT EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = c.oid)"
+    ), {"pattern": _PARTITION_NAME.pattern}).scalars()
+    return {date(int(m.group(1)), int(m.group(2)), 1): m.group(0) for m in map(_PARTITION_NAME.match, names)}
+
+
+def apply_retention(engine, retention_months: Optional[int] = None, archive_dir: Optional[str] = None,
+                    archive_format: Optional[str] = None) -> List[str]:
+    """
+    Drop the monthly partitions entirely older than ``retention_months`` (0 keeps everything),
+    exporting each one first when ``archive_dir`` is set. Old rows that landed in the default
+    partition are deleted (and archived) with them.
+    """
+    retention_months = settings.audit_retention_months if retention_months is None else retention_months
+    archive_dir = settings.audit_archive_path if archive_dir is None else archive_dir
+    archive_format = archive_format or settings.audit_archive_format
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(datetime.utcnow().date()), -retention_months)
+
+    # Detach first: from then on no late event can be routed into the partition, so the
+    # archive is complete. A failed export leaves the detached table for the next run.
+    with engine.begin() as conn:
+        conn.execute(text(_LOCK))
+        for month, name in sorted(list_partitions(conn).items()):
+            if month < cutoff:
+                conn.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+    dropped = []
+    with engine.connect() as conn:
+        detached = sorted((month, name) for month, name in _detached_partitions(conn).items() if month < cutoff)
+    for month, name in detached:
+        with engine.begin() as conn:
+            if archive_dir and conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM {name})")).scalar():
+                path = Path(archive_dir) / f"{name}{_suffix(archive_format)}"
+                _export(conn, f"SELECT * FROM {name} ORDER BY created_at, id", {}, path, archive_format)
+            conn.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+
+    # Repeatable read: the DELETE removes exactly the rows the export saw
+    with engine.connect().execution_options(isolation_level="REPEATABLE READ") as conn:
+        with conn.begin():
+            stale = {"cutoff": cutoff}
+            if archive_dir:
+                stamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+                path = Path(archive_dir) / f"{DEFAULT_PARTITION}_before_{cutoff.isoformat()}_{stamp}{_suffix(archive_format)}"
+                has_rows = conn.execute(
+                    text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE created_at < :cutoff)"), stale
+                ).scalar()
+                if has_rows:
+                    _export(
+                        conn,
+                        f"SELECT * FROM {DEFAULT_PARTITION} WHERE created_at < :cutoff ORDER BY created_at, id",
+                        stale,
+                        path,
+                        archive_format
+                    )
+            conn.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE created_at < :cutoff"), stale)
+
+    if dropped:
+        logger.info(f"Audit partitions dropped by retention: {', '.join(dropped)}")
+    return dropped
+
+
+class PartitionMaintainer:
+    """
+    Background thread that keeps future partitions created and applies retention every
+    ``interval`` seconds. Does nothing when ``audit_logs`` is not a partitioned table (SQLite,
+    or a database not yet migrated with scripts/audit_partitions.py).
+    """
+
+    def __init__(self, engine, interval: Optional[float] = None) -> None:
+        self.engine = engine
+        self.interval = settings.audit_partition_check_interval if interval is None else interval
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self.last_run: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    def run_once(self) -> None:
+        if not is_partitioned(self.engine):
+            return
+        ensure_partitions(self.engine)
+        apply_retention(self.engine)
+        self.last_run = datetime.utcnow()
+
+    def start(self) -> None:
+        if self._worker is not None:
+            return
+        if self.engine.dialect.name == "postgresql" and not is_partitioned(self.engine):
+            logger.warning(
+                f"{PARENT} is not partitioned; run python -m audit_service.scripts.audit_partitions migrate"
+            )
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name="audit-partitions", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout=30)
+            self._worker = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning(f"Audit partition maintenance failed: {e}")
+            self._stop.wait(self.interval)
+
+    def stats(self) -> Dict[str, Any]:
+        partitions: List[str] = []
+        if is_partitioned(self.engine):
+            with self.engine.connect() as conn:
+                partitions = [name for _, name in sorted(list_partitions(conn).items())]
+        return {
+            "partitions": partitions,
+            "retention_months": settings.audit_retention_months,
+            "last_run": self.last_run,
+            "last_error": self.last_error,
+            "running": self._worker is not None and self._worker.is_alive(),
+        }
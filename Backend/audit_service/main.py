@@ -1,15 +1,39 @@
 from fastapi import FastAPI
 from .app.core.db import engine, Base
 from .app.routers import audit
+from .app.services.audit_ingest import ingest_buffer
+from .app.services.partitions import PartitionMaintainer, ensure_partitions, is_partitioned
 
-# Create tables
+# Create tables (audit_logs is partitioned by month; inserts need the partitions to exist)
 Base.metadata.create_all(bind=engine)
+if is_partitioned(engine):
+    ensure_partitions(engine)
+partition_maintainer = PartitionMaintainer(engine)
 
 app = FastAPI(title="Audit Service", version="1.0.0")
 
 # Include routers
 app.include_router(audit.router, prefix="/api")
 
+@app.on_event("startup")
+def start_audit_ingest():
+    ingest_buffer.start()
+    partition_maintainer.start()
+
+@app.on_event("shutdown")
+def drain_audit_ingest():
+    # Writes the events still queued before the process exits
+    ingest_buffer.stop()
+    partition_maintainer.stop()
+
+@app.get("/metrics/ingest")
+def ingest_metrics():
+    return ingest_buffer.stats()
+
+@app.get("/metrics/partitions")
+def partition_metrics():
+    return partition_maintainer.stats()
+
 @app.get("/health")
 def health_check():
     return {"status": "ok", "service": "Audit Service"}
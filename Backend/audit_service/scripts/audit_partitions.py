@@ -0,0 +1,106 @@
+"""
+Partition maintenance for audit_logs.
+
+``migrate`` converts a database created before partitioning. The plain audit_logs table is
+renamed to audit_logs_legacy and the partitioned table is created in its place, with one
+partition per month from the oldest row on. Rows are then copied month by month, each month
+in its own transaction, and the id sequence continues after the highest copied id. The legacy
+table is kept until ``--drop-legacy``. Stop the audit service while this runs.
+
+``maintain`` runs once what the service does periodically: creates the partitions for the
+coming months and applies AUDIT_RETENTION_MONTHS, archiving to AUDIT_ARCHIVE_PATH if set.
+
+Usage (from Backend/):
+    python -m audit_service.scripts.audit_partitions migrate [--drop-legacy]
+    python -m audit_service.scripts.audit_partitions maintain --retention-months 24 --archive-path /backups/audit
+"""
+import argparse
+
+from sqlalchemy import text
+
+from ..app.core.db import Base, engine
+from ..app.models.audit import AuditLog
+from ..app.services.partitions import (
+    PARENT, add_months, apply_retention, ensure_partitions, is_partitioned, month_start
+)
+
+LEGACY = f"{PARENT}_legacy"
+
+
+def migrate(drop_legacy: bool) -> None:
+    if is_partitioned(engine):
+        print(f"{PARENT} is already partitioned")
+    else:
+        with engine.begin() as conn:
+            if conn.execute(text("SELECT to_regclass(:name)"), {"name": PARENT}).scalar():
+                # The constraint and sequence keep their names after a table rename; free them
+                # for the new table
+                conn.execute(text(f"ALTER TABLE {PARENT} RENAME TO {LEGACY}"))
+                conn.execute(text(f"ALTER TABLE {LEGACY} RENAME CONSTRAINT {PARENT}_pkey TO {LEGACY}_pkey"))
+                conn.execute(text(f"ALTER SEQUENCE IF EXISTS {PARENT}_id_seq RENAME TO {LEGACY}_id_seq"))
+                for (index,) in conn.execute(text(
+                    "SELECT indexname FROM pg_indexes WHERE tablename = :table AND indexname <> :pkey"
+                ), {"table": LEGACY, "pkey": f"{LEGACY}_pkey"}):
+                    conn.execute(text(f'ALTER INDEX "{index}" RENAME TO "legacy_{index}"'))
+        Base.metadata.create_all(bind=engine, tables=[AuditLog.__table__])
+
+    with engine.connect() as conn:
+        if not conn.execute(text("SELECT to_regclass(:name)"), {"name": LEGACY}).scalar():
+            ensure_partitions(engine)
+            return
+        oldest, newest = conn.execute(text(f"SELECT min(created_at), max(created_at) FROM {LEGACY}")).one()
+
+    ensure_partitions(engine, since=oldest.date() if oldest else None)
+    columns = ", ".join(column.name for column in AuditLog.__table__.columns)
+    # Rows without created_at cannot be partitioned; they keep their id and get the oldest date
+    select_columns = columns.replace("created_at", "coalesce(created_at, :oldest) AS created_at")
+    if oldest:
+        month = month_start(oldest.date())
+        while month <= month_start(newest.date()):
+            with engine.begin() as conn:
+                copied = conn.execute(text(
+                    f"INSERT INTO {PARENT} ({columns}) SELECT {select_columns} FROM {LEGACY} "
+                    f"WHERE coalesce(created_at, :oldest) >= :start AND coalesce(created_at, :oldest) < :end "
+                    f"AND NOT EXISTS (SELECT 1 FROM {PARENT} p WHERE p.id = {LEGACY}.id "
+                    f"AND p.created_at = coalesce({LEGACY}.created_at, :oldest))"
+                ), {"oldest": oldest, "start": month, "end": add_months(month, 1)}).rowcount
+            print(f"{month:%Y-%m}: {copied} rows")
+            month = add_months(month, 1)
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{PARENT}', 'id'), "
+            f"greatest((SELECT coalesce(max(id), 0) FROM {PARENT}), 1))"
+        ))
+        if drop_legacy:
+            conn.execute(text(f"DROP TABLE {LEGACY}"))
+            print(f"{LEGACY} dropped")
+        else:
+            print(f"{LEGACY} kept; drop it once the copy is verified (--drop-legacy)")
+
+
+def maintain(retention_months, archive_path, archive_format) -> None:
+    created = ensure_partitions(engine)
+    dropped = apply_retention(engine, retention_months, archive_path, archive_format)
+    print(f"created: {', '.join(created) or '-'}; dropped: {', '.join(dropped) or '-'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = commands.add_parser("migrate")
+    migrate_parser.add_argument("--drop-legacy", action="store_true")
+    maintain_parser = commands.add_parser("maintain")
+    maintain_parser.add_argument("--retention-months", type=int, default=None)
+    maintain_parser.add_argument("--archive-path", default=None)
+    maintain_parser.add_argument("--archive-format", choices=("ndjson", "parquet"), default=None)
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        migrate(args.drop_legacy)
+    else:
+        maintain(args.retention_months, args.archive_path, args.archive_format)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,10 @@
-import psycopg2
+from shared.db_pool import ConnectionPool
+from shared.tenant_cache import TenantCache
 from .config import settings
 
-
-def get_conn():
-    return psycopg2.connect(settings.database_url)
-
-
-
-
+pool = ConnectionPool(settings.database_url)
+tenant_cache = TenantCache()
 
 
+def get_conn():
+    return pool.connection()
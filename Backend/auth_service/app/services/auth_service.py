@@ -3,6 +3,7 @@ import jwt
 import json
 from fastapi import HTTPException
 from ..core.config import settings
+from ..core.db import tenant_cache
 from ..repositories.user_repository import get_user_by_email, get_tenant_by_id, get_super_admin_by_email
 
 
@@ -16,13 +17,11 @@ def authenticate(email: str, password: str, tenant_id: int | None = None) -> dic
     if user_password != password or not is_active:
         raise HTTPException(status_code=401, detail='Credenciais inválidas')
     
-    # Verificar se o tenant está ativo
-    tenant_row = get_tenant_by_id(user_tenant_id)
-    if not tenant_row:
+    # Verificar se o tenant está ativo (cache com o tema já decodificado)
+    tenant = tenant_cache.get(user_tenant_id, get_tenant_by_id) if user_tenant_id is not None else None
+    if not tenant or not tenant.is_active:
         raise HTTPException(status_code=401, detail='Condomínio não encontrado ou inativo')
     
-    tenant_id, tenant_name, tenant_cnpj, tenant_theme_config = tenant_row
-    
     # Parse permissions
     permissions = []
     if permissions_json:
@@ -40,14 +39,6 @@ def authenticate(email: str, password: str, tenant_id: int | None = None) -> dic
     }
     token = jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
     
-    # Parse theme config
-    theme_config = None
-    if tenant_theme_config:
-        try:
-            theme_config = json.loads(tenant_theme_config)
-        except json.JSONDecodeError:
-            theme_config = None
-    
     return {
         'access_token': token,
         'token_type': 'bearer',
@@ -61,10 +52,10 @@ def authenticate(email: str, password: str, tenant_id: int | None = None) -> dic
             'is_active': is_active
         },
         'tenant': {
-            'id': tenant_id,
-            'name': tenant_name,
-            'cnpj': tenant_cnpj,
-            'theme_config': theme_config
+            'id': tenant.id,
+            'name': tenant.name,
+            'cnpj': tenant.cnpj,
+            'theme_config': tenant.theme_config
         }
     }
 
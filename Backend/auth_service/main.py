@@ -1,11 +1,33 @@
 
 from fastapi import FastAPI
 from app.routers.auth import router as auth_router
+from app.core.config import settings
+from app.core.db import pool, tenant_cache
+from shared.db_pool import PoolScopeMiddleware
 
 app = FastAPI(title='Auth Service')
 
+app.add_middleware(PoolScopeMiddleware, pool=pool)
+
 app.include_router(auth_router)
 
 @app.get('/health')
 def health():
     return {'status': 'ok'}
+
+@app.get('/metrics/db-pool')
+def db_pool_metrics():
+    return pool.stats()
+
+@app.get('/metrics/tenant-cache')
+def tenant_cache_metrics():
+    return tenant_cache.stats()
+
+@app.on_event('startup')
+def listen_tenant_changes():
+    tenant_cache.listen(settings.database_url)
+
+@app.on_event('shutdown')
+def close_db_pool():
+    tenant_cache.stop()
+    pool.close()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Enum as SQLEnum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
@@ -29,6 +29,11 @@ class Budget(Base):
     items = relationship("BudgetItem", back_populates="budget", cascade="all, delete-orphan")
     history = relationship("BudgetHistory", back_populates="budget", cascade="all, delete-orphan")
 
+    # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+    __table_args__ = (
+        Index('idx_budgets_created_id', 'created_at', 'id'),
+    )
+
 
 class BudgetItem(Base):
     __tablename__ = "budget_items"
@@ -3,6 +3,8 @@ from typing import List, Optional
 from ..models.budgets import Budget, BudgetItem, BudgetHistory
 from ..schemas.budgets import BudgetIn, BudgetUpdate, BudgetHistoryIn
 from datetime import datetime
+from ...shared.pagination import Page, keyset_page
+from ...shared.aggregates import grouped_stats
 
 
 class BudgetRepository:
@@ -52,7 +54,13 @@ class BudgetRepository:
     def get_budget(self, budget_id: int) -> Optional[Budget]:
         return self.db.query(Budget).filter(Budget.id == budget_id).first()
 
-    def list_budgets(self, budget_type: Optional[str] = None, status: Optional[str] = None) -> List[Budget]:
+    def list_budgets(self, budget_type: Optional[str] = None, status: Optional[str] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        return keyset_page(self._budgets_query(budget_type, status), Budget.created_at, Budget.id, cursor, limit)
+
+    def find_budgets(self, budget_type: Optional[str] = None, status: Optional[str] = None) -> List[Budget]:
+        return self._budgets_query(budget_type, status).order_by(Budget.created_at.desc()).all()
+
+    def _budgets_query(self, budget_type: Optional[str] = None, status: Optional[str] = None):
         query = self.db.query(Budget)
         
         if budget_type:
@@ -60,7 +68,7 @@ class BudgetRepository:
         if status:
             query = query.filter(Budget.status == status)
             
-        return query.order_by(Budget.created_at.desc()).all()
+        return query
 
     def update_budget(self, budget_id: int, update_data: BudgetUpdate) -> Optional[Budget]:
         db_budget = self.get_budget(budget_id)
@@ -164,16 +172,15 @@ class BudgetRepository:
             Budget.created_at <= end_date
         )
         
-        total_budgets = query.count()
-        total_amount = query.with_entities(Budget.total_amount).all()
-        total_amount = sum([amount[0] for amount in total_amount])
-        
-        status_breakdown = {}
-        type_breakdown = {}
-        
-        for budget in query.all():
-            status_breakdown[budget.status] = status_breakdown.get(budget.status, 0) + 1
-            type_breakdown[budget.budget_type] = type_breakdown.get(budget.budget_type, 0) + 1
+        stats = grouped_stats(
+            query,
+            {"status": Budget.status, "type": Budget.budget_type},
+            sums={"amount": Budget.total_amount}
+        )
+        total_budgets = stats["total"]
+        total_amount = stats["sums"]["amount"]
+        status_breakdown = stats["breakdowns"]["status"]
+        type_breakdown = stats["breakdowns"]["type"]
         
         return {
             "total_budgets": total_budgets,
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.db import get_db
 from ..schemas.budgets import BudgetIn, BudgetOut, BudgetUpdate, BudgetHistoryIn
 from ..services.budget_service import BudgetService
 from datetime import datetime
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/budgets", tags=["budgets"])
 
@@ -17,12 +18,15 @@ def create_budget(budget_data: BudgetIn, db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[BudgetOut])
 def list_budgets(
+    response: Response,
     budget_type: Optional[str] = None,
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = BudgetService(db)
-    return service.list_budgets(budget_type, status)
+    return set_next_cursor(response, service.list_budgets(budget_type, status, cursor, limit))
 
 
 @router.get("/{budget_id}", response_model=BudgetOut)
@@ -3,6 +3,7 @@ from typing import List, Optional
 from ..repositories.budget_repository import BudgetRepository
 from ..schemas.budgets import BudgetIn, BudgetOut, BudgetUpdate, BudgetHistoryIn
 from datetime import datetime
+from ...shared.pagination import Page
 
 
 class BudgetService:
@@ -19,9 +20,9 @@ class BudgetService:
             return BudgetOut.from_orm(budget)
         return None
 
-    def list_budgets(self, budget_type: Optional[str] = None, status: Optional[str] = None) -> List[BudgetOut]:
-        budgets = self.repository.list_budgets(budget_type, status)
-        return [BudgetOut.from_orm(budget) for budget in budgets]
+    def list_budgets(self, budget_type: Optional[str] = None, status: Optional[str] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        page = self.repository.list_budgets(budget_type, status, cursor, limit)
+        return Page([BudgetOut.from_orm(budget) for budget in page.items], page.next_cursor)
 
     def update_budget(self, budget_id: int, update_data: BudgetUpdate) -> Optional[BudgetOut]:
         budget = self.repository.update_budget(budget_id, update_data)
@@ -72,13 +73,13 @@ class BudgetService:
         return self.repository.get_budget_stats(start_date, end_date)
 
     def get_pending_budgets(self) -> List[BudgetOut]:
-        return self.list_budgets(status="pending")
+        return [BudgetOut.from_orm(budget) for budget in self.repository.find_budgets(status="pending")]
 
     def get_approved_budgets(self) -> List[BudgetOut]:
-        return self.list_budgets(status="approved")
+        return [BudgetOut.from_orm(budget) for budget in self.repository.find_budgets(status="approved")]
 
     def get_budgets_by_type(self, budget_type: str) -> List[BudgetOut]:
-        return self.list_budgets(budget_type=budget_type)
+        return [BudgetOut.from_orm(budget) for budget in self.repository.find_budgets(budget_type=budget_type)]
 
     def get_budgets_by_supplier(self, supplier_name: str) -> List[BudgetOut]:
         budgets = self.repository.db.query(self.repository.Budget).filter(
@@ -10,6 +10,10 @@ class Settings(BaseSettings):
     tenant_id: Optional[int] = None
     upload_path: str = "./uploads"
     max_file_size: int = 10485760  # 10MB
+    upload_chunk_size: int = 1048576  # uploads and downloads are streamed in blocks of this size
+    blob_storage: str = "local"  # content-addressed store backend (see file_storage.BLOB_BACKENDS)
+    blob_storage_path: str = "./uploads/blobs"
+    counter_flush_interval: float = 5.0  # seconds between batched counter/view writes
     
     class Config:
         env_file = ".env"
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, LargeBinary
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, LargeBinary, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
+from ...shared.search import search_vector_column, search_vector_index, trigram_index
 from ..schemas.documents import DocumentType, DocumentStatus
 
 
@@ -16,6 +17,8 @@ class Document(Base):
     file_name = Column(String(255), nullable=False)
     file_size = Column(Integer, nullable=False)
     mime_type = Column(String(100), nullable=False)
+    content_hash = Column(String(64))  # SHA-256 of the file, also used as the download ETag
+    blob_hash = Column(String(64), ForeignKey("document_blobs.sha256"))  # None for files saved before the blob store
     version = Column(String(20), default="1.0")
     status = Column(SQLEnum(DocumentStatus), default=DocumentStatus.DRAFT)
     is_public = Column(Boolean, default=True)
@@ -34,6 +37,26 @@ class Document(Base):
     # Relationships
     history = relationship("DocumentHistory", back_populates="document", cascade="all, delete-orphan")
 
+    # Busca textual (shared/search.py): tsvector em português + trigramas para substring
+    search_vector = search_vector_column(('title', 'A'), ('description', 'B'), ('file_name', 'C'))
+
+    __table_args__ = (
+        # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+        Index('idx_documents_created_id', 'created_at', 'id'),
+        search_vector_index('idx_documents_search'),
+        trigram_index('idx_documents_title_trgm', 'title'),
+        trigram_index('idx_documents_file_name_trgm', 'file_name'),
+    )
+
+
+class DocumentBlob(Base):
+    __tablename__ = "document_blobs"
+
+    sha256 = Column(String(64), primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)  # documents pointing at this blob
+    created_at = Column(DateTime, default=datetime.utcnow)
+
 
 class DocumentHistory(Base):
     __tablename__ = "document_history"
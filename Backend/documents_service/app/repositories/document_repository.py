@@ -1,16 +1,76 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
 from typing import List, Optional
-from ..models.documents import Document, DocumentHistory
-from ..schemas.documents import DocumentIn, DocumentUpdate, DocumentHistoryIn, DocumentApprovalIn, DocumentRejectionIn, DocumentSearchIn
+from ..models.documents import Document, DocumentBlob, DocumentHistory
+from ..schemas.documents import DocumentIn, DocumentOut, DocumentUpdate, DocumentHistoryIn, DocumentApprovalIn, DocumentRejectionIn, DocumentSearchIn
 from datetime import datetime
 import os
+from ...shared.pagination import Page, keyset_page
+from ...shared.query_shaping import project
+from ...shared.search import ranked_page, text_search
+from ..services.file_storage import BlobStore, StagedBlob, get_blob_store
+from ..core.db import counters
 
 
 class DocumentRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, blob_store: Optional[BlobStore] = None):
         self.db = db
+        self.blob_store = blob_store or get_blob_store()
 
-    def create_document(self, document_data: DocumentIn) -> Document:
+    def _acquire_blob(self, staged: StagedBlob) -> None:
+        # One more reference; the upsert keeps the blob row locked until commit, so a delete
+        # dropping the last reference waits for us (or we wait for it and store the blob again)
+        self.db.execute(
+            insert(DocumentBlob)
+            .values(sha256=staged.sha256, size=staged.size, ref_count=1, created_at=datetime.utcnow())
+            .on_conflict_do_update(
+                index_elements=[DocumentBlob.sha256],
+                set_={"ref_count": DocumentBlob.ref_count + 1}
+            )
+        )
+        self.blob_store.commit(staged)
+
+    def _release_blob(self, sha256: str) -> Optional[int]:
+        """Drops one reference; returns the blob size when it was the last one, else None."""
+        blob = self.db.query(DocumentBlob).filter(DocumentBlob.sha256 == sha256).with_for_update().first()
+        if not blob:
+            return None
+        blob.ref_count -= 1
+        if blob.ref_count > 0:
+            return None
+        # Last reference: only the row goes now, the data is removed once this commits
+        size = blob.size
+        self.db.delete(blob)
+        self.db.flush()
+        return size
+
+    def remove_unreferenced_blob(self, sha256: str, size: int) -> bool:
+        """
+        Delete the data of a blob that has no ``document_blobs`` row, and commit.
+
+        A placeholder row claims the hash first: an upload of the same content waits on it and,
+        once we are done, creates its row and stores the blob again. If a row already exists the
+        blob is referenced again and the data stays. Returns whether the data was deleted.
+        """
+        claimed = self.db.execute(
+            insert(DocumentBlob)
+            .values(sha256=sha256, size=size, ref_count=0, created_at=datetime.utcnow())
+            .on_conflict_do_nothing(index_elements=[DocumentBlob.sha256])
+            .returning(DocumentBlob.sha256)
+        ).first()
+        if claimed:
+            self.blob_store.delete(sha256)
+            self.db.query(DocumentBlob).filter(DocumentBlob.sha256 == sha256).delete()
+        self.db.commit()
+        return bool(claimed)
+
+    def create_document(self, document_data: DocumentIn, staged: Optional[StagedBlob] = None) -> Document:
+        if staged is not None:
+            self._acquire_blob(staged)
+            document_data.file_path = self.blob_store.locator(staged.sha256)
+            document_data.file_size = staged.size
+            document_data.content_hash = staged.sha256
+        
         db_document = Document(
             title=document_data.title,
             description=document_data.description,
@@ -18,6 +78,8 @@ class DocumentRepository:
             file_path=document_data.file_path,
             file_name=document_data.file_name,
             file_size=document_data.file_size,
+            content_hash=document_data.content_hash,
+            blob_hash=staged.sha256 if staged is not None else None,
             mime_type=document_data.mime_type,
             version=document_data.version,
             is_public=document_data.is_public,
@@ -52,7 +114,28 @@ class DocumentRepository:
                       status: Optional[str] = None,
                       unit_id: Optional[int] = None,
                       created_by: Optional[str] = None,
-                      is_public: Optional[bool] = None) -> List[Document]:
+                      is_public: Optional[bool] = None,
+                      cursor: Optional[str] = None,
+                      limit: Optional[int] = None) -> Page:
+        query = project(self._documents_query(document_type, status, unit_id, created_by, is_public), DocumentOut)
+        return keyset_page(query, Document.created_at, Document.id, cursor, limit)
+
+    def find_documents(self, 
+                       document_type: Optional[str] = None,
+                       status: Optional[str] = None,
+                       unit_id: Optional[int] = None,
+                       created_by: Optional[str] = None,
+                       is_public: Optional[bool] = None) -> List:
+        # Read-only listings return rows with DocumentOut's columns, not entities
+        query = project(self._documents_query(document_type, status, unit_id, created_by, is_public), DocumentOut)
+        return query.order_by(Document.created_at.desc()).all()
+
+    def _documents_query(self, 
+                         document_type: Optional[str] = None,
+                         status: Optional[str] = None,
+                         unit_id: Optional[int] = None,
+                         created_by: Optional[str] = None,
+                         is_public: Optional[bool] = None):
         query = self.db.query(Document)
         
         if document_type:
@@ -66,17 +149,15 @@ class DocumentRepository:
         if is_public is not None:
             query = query.filter(Document.is_public == is_public)
             
-        return query.order_by(Document.created_at.desc()).all()
+        return query
 
-    def search_documents(self, search_data: DocumentSearchIn) -> List[Document]:
+    def _search_query(self, search_data: DocumentSearchIn):
         query = self.db.query(Document)
+        rank = None
         
         if search_data.query:
-            query = query.filter(
-                (Document.title.ilike(f"%{search_data.query}%")) |
-                (Document.description.ilike(f"%{search_data.query}%")) |
-                (Document.file_name.ilike(f"%{search_data.query}%"))
-            )
+            match, rank = text_search(Document.search_vector, search_data.query, [Document.title, Document.file_name])
+            query = query.filter(match)
         
         if search_data.document_type:
             query = query.filter(Document.document_type == search_data.document_type)
@@ -100,7 +181,18 @@ class DocumentRepository:
             for tag in search_data.tags:
                 query = query.filter(Document.tags.contains([tag]))
         
-        return query.order_by(Document.created_at.desc()).all()
+        return query, rank
+
+    def search_documents(self, search_data: DocumentSearchIn) -> List:
+        query, _ = self._search_query(search_data)
+        return project(query, DocumentOut).order_by(Document.created_at.desc()).all()
+
+    def search_documents_page(self, search_data: DocumentSearchIn, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        # Com texto: por relevância; só com filtros: do mais recente para o mais antigo
+        query, rank = self._search_query(search_data)
+        if rank is None:
+            return keyset_page(project(query, DocumentOut), Document.created_at, Document.id, cursor, limit)
+        return ranked_page(query, rank, Document.id, cursor, limit)
 
     def update_document(self, document_id: int, update_data: DocumentUpdate) -> Optional[Document]:
         db_document = self.get_document(document_id)
@@ -267,29 +359,52 @@ class DocumentRepository:
         self.db.refresh(db_document)
         return db_document
 
-    def increment_download_count(self, document_id: int) -> Optional[Document]:
-        db_document = self.get_document(document_id)
-        if not db_document:
-            return None
-        
-        db_document.download_count += 1
-        self.db.commit()
-        self.db.refresh(db_document)
-        return db_document
+    def increment_download_count(self, document_id: int) -> None:
+        # Buffered; written together with the other pending downloads on the next flush
+        counters.increment(Document.__table__.c.download_count, document_id)
 
     def delete_document(self, document_id: int) -> bool:
         db_document = self.get_document(document_id)
         if not db_document:
             return False
         
-        # Delete physical file
-        if os.path.exists(db_document.file_path):
-            os.remove(db_document.file_path)
-        
+        blob_hash = db_document.blob_hash
+        file_path = db_document.file_path
         self.db.delete(db_document)
+        self.db.flush()
+        
+        released_size = self._release_blob(blob_hash) if blob_hash else None
         self.db.commit()
+        
+        # Files go only after the commit: if it fails, the document still has its data
+        if released_size is not None:
+            # The hash may have been uploaded again in the meantime; that upload keeps the data
+            self.remove_unreferenced_blob(blob_hash, released_size)
+        elif not blob_hash and os.path.exists(file_path):
+            # Files saved before the blob store belong to a single document
+            os.remove(file_path)
         return True
 
+    def move_to_blob_store(self, document_id: int, staged: StagedBlob) -> Optional[Document]:
+        """
+        Point a document saved before the blob store at ``staged`` (its file, already hashed)
+        """
+        db_document = self.get_document(document_id)
+        if not db_document or db_document.blob_hash:
+            self.blob_store.discard(staged)
+            return None
+        
+        old_path = db_document.file_path
+        self._acquire_blob(staged)
+        db_document.blob_hash = staged.sha256
+        db_document.content_hash = staged.sha256
+        db_document.file_path = self.blob_store.locator(staged.sha256)
+        self.db.commit()
+        
+        if os.path.exists(old_path):
+            os.remove(old_path)
+        return db_document
+
     def get_document_history(self, document_id: int) -> List[DocumentHistory]:
         return self.db.query(DocumentHistory).filter(
             DocumentHistory.document_id == document_id
@@ -310,33 +425,43 @@ class DocumentRepository:
         self.db.refresh(db_history)
         return db_history
 
-    def get_documents_by_type(self, document_type: str) -> List[Document]:
-        return self.db.query(Document).filter(
+    def get_documents_by_type(self, document_type: str) -> List:
+        return project(self.db.query(Document), DocumentOut).filter(
             Document.document_type == document_type
         ).order_by(Document.created_at.desc()).all()
 
-    def get_documents_by_status(self, status: str) -> List[Document]:
-        return self.db.query(Document).filter(
+    def get_documents_by_status(self, status: str) -> List:
+        return project(self.db.query(Document), DocumentOut).filter(
             Document.status == status
         ).order_by(Document.created_at.desc()).all()
 
-    def get_public_documents(self) -> List[Document]:
-        return self.db.query(Document).filter(
+    def get_public_documents(self) -> List:
+        return project(self.db.query(Document), DocumentOut).filter(
             Document.is_public == True,
             Document.status == "published"
         ).order_by(Document.created_at.desc()).all()
 
-    def get_pending_approval_documents(self) -> List[Document]:
-        return self.db.query(Document).filter(
+    def get_pending_approval_documents(self) -> List:
+        return project(self.db.query(Document), DocumentOut).filter(
             Document.status == "pending_approval"
         ).order_by(Document.created_at.asc()).all()
 
-    def get_expired_documents(self) -> List[Document]:
-        return self.db.query(Document).filter(
+    def get_expired_documents(self) -> List:
+        return project(self.db.query(Document), DocumentOut).filter(
             Document.expires_at < datetime.utcnow(),
             Document.status != "archived"
         ).order_by(Document.expires_at.asc()).all()
 
+    def get_most_downloaded_documents(self, limit: int = 10) -> List:
+        return project(self.db.query(Document), DocumentOut).order_by(
+            Document.download_count.desc(), Document.id.desc()
+        ).limit(limit).all()
+
+    def get_recent_documents(self, limit: int = 10) -> List:
+        return project(self.db.query(Document), DocumentOut).order_by(
+            Document.created_at.desc(), Document.id.desc()
+        ).limit(limit).all()
+
     def get_documents_stats(self, start_date: datetime, end_date: datetime) -> dict:
         query = self.db.query(Document).filter(
             Document.created_at >= start_date,
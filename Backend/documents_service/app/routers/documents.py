@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from urllib.parse import quote
+from ..core.config import settings
 from ..core.db import get_db
 from ..schemas.documents import DocumentIn, DocumentOut, DocumentUpdate, DocumentHistoryIn, DocumentApprovalIn, DocumentRejectionIn, DocumentSearchIn
 from ..services.document_service import DocumentService
+from ..services.file_storage import DocumentFile, FileTooLargeError
 from datetime import datetime
 import os
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
@@ -27,12 +32,9 @@ def create_document(
 ):
     service = DocumentService(db)
     
-    # Validate file size (10MB limit)
-    if file.size > 10 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="Arquivo muito grande. Máximo 10MB")
-    
-    # Read file content
-    file_content = file.file.read()
+    # Reject early when the client declared the size; the streamed copy enforces it otherwise
+    if file.size is not None and file.size > settings.max_file_size:
+        raise _file_too_large()
     
     # Parse tags
     tags_list = None
@@ -51,9 +53,10 @@ def create_document(
         title=title,
         description=description,
         document_type=document_type,
+        file_path="",  # set once the file is stored
         file_name=file.filename,
-        file_size=file.size,
-        mime_type=file.content_type,
+        file_size=0,
+        mime_type=file.content_type or "application/octet-stream",
         version=version,
         is_public=is_public,
         requires_approval=requires_approval,
@@ -63,29 +66,43 @@ def create_document(
         created_by=created_by
     )
     
-    return service.create_document(document_data, file_content)
+    try:
+        return service.create_document(document_data, file.file)
+    except FileTooLargeError:
+        raise _file_too_large()
+
+
+def _file_too_large() -> HTTPException:
+    max_mb = round(settings.max_file_size / (1024 * 1024), 1)
+    return HTTPException(status_code=400, detail=f"Arquivo muito grande. Máximo {max_mb:g}MB")
 
 
 @router.get("/", response_model=List[DocumentOut])
 def list_documents(
+    response: Response,
     document_type: Optional[str] = None,
     status: Optional[str] = None,
     unit_id: Optional[int] = None,
     created_by: Optional[str] = None,
     is_public: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = DocumentService(db)
-    return service.list_documents(document_type, status, unit_id, created_by, is_public)
+    return set_next_cursor(response, service.list_documents(document_type, status, unit_id, created_by, is_public, cursor, limit))
 
 
 @router.post("/search", response_model=List[DocumentOut])
 def search_documents(
     search_data: DocumentSearchIn,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = DocumentService(db)
-    return service.search_documents(search_data)
+    return set_next_cursor(response, service.search_documents(search_data, cursor, limit))
 
 
 @router.get("/{document_id}", response_model=DocumentOut)
@@ -98,19 +115,86 @@ def get_document(document_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{document_id}/download")
-def download_document(document_id: int, db: Session = Depends(get_db)):
+def download_document(document_id: int, request: Request, db: Session = Depends(get_db)):
     service = DocumentService(db)
-    result = service.download_document(document_id)
-    if not result:
+    document_file = service.get_document_file(document_id)
+    if not document_file:
         raise HTTPException(status_code=404, detail="Documento não encontrado")
     
-    file_content, file_name, mime_type = result
+    headers = {
+        "Content-Disposition": f"attachment; filename*=UTF-8''{quote(document_file.file_name)}",
+        "ETag": document_file.etag,
+        "Accept-Ranges": "bytes"
+    }
+    if _etag_matches(request.headers.get("if-none-match"), document_file.etag):
+        return Response(status_code=304, headers={"ETag": document_file.etag})
+    
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == document_file.etag):
+        byte_range = _parse_range(range_header, document_file.size)
+    
+    # Viewers fetch large PDFs in many ranges; count a download once, at its first byte
+    if byte_range is None or byte_range[0] == 0:
+        service.record_download(document_id)
     
-    from fastapi.responses import Response
-    return Response(
-        content=file_content,
-        media_type=mime_type,
-        headers={"Content-Disposition": f"attachment; filename={file_name}"}
+    if byte_range is None and document_file.path:
+        return FileResponse(
+            document_file.path,
+            media_type=document_file.mime_type,
+            headers=headers
+        )
+    return _range_response(document_file, byte_range, headers)
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    # If-None-Match uses weak comparison: W/"x" matches "x"
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    wanted = etag[2:] if etag.startswith("W/") else etag
+    return any(
+        (tag.strip()[2:] if tag.strip().startswith("W/") else tag.strip()) == wanted
+        for tag in header.split(",")
+    )
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single ``bytes=start-end`` range into inclusive offsets. Returns None when the header
+    should be ignored (other units, multiple ranges, malformed) so the whole file is sent.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first == "":
+            # Suffix range: the last N bytes
+            start, end = max(0, size - int(last)), size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        raise HTTPException(status_code=416, detail="Intervalo inválido", headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
+def _range_response(document_file: DocumentFile, byte_range: Optional[Tuple[int, int]], headers: dict) -> StreamingResponse:
+    # Without a range: the whole file, for stores that have no local path
+    start, end = byte_range or (0, document_file.size - 1)
+    headers = {**headers, "Content-Length": str(end - start + 1)}
+    if byte_range:
+        headers["Content-Range"] = f"bytes {start}-{end}/{document_file.size}"
+    return StreamingResponse(
+        document_file.reader(start, end, settings.upload_chunk_size),
+        status_code=206 if byte_range else 200,
+        media_type=document_file.mime_type,
+        headers=headers
     )
 
 
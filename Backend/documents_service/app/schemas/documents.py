@@ -36,6 +36,7 @@ class DocumentIn(BaseModel):
     file_name: str
     file_size: int
     mime_type: str
+    content_hash: Optional[str] = None
     version: str = "1.0"
     is_public: bool = True
     requires_approval: bool = False
@@ -54,6 +55,7 @@ class DocumentOut(BaseModel):
     file_name: str
     file_size: int
     mime_type: str
+    content_hash: Optional[str] = None
     version: str
     status: DocumentStatus
     is_public: bool
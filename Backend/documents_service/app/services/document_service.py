@@ -1,35 +1,30 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
+from ..core.config import settings
 from ..repositories.document_repository import DocumentRepository
 from ..schemas.documents import DocumentIn, DocumentOut, DocumentUpdate, DocumentHistoryIn, DocumentApprovalIn, DocumentRejectionIn, DocumentSearchIn
 from datetime import datetime
 import os
 import shutil
-from pathlib import Path
+from functools import partial
+from ...shared.pagination import Page
+from .file_storage import DocumentFile, file_etag, iter_file
 
 
 class DocumentService:
     def __init__(self, db: Session):
         self.repository = DocumentRepository(db)
 
-    def create_document(self, document_data: DocumentIn, file_content: bytes) -> DocumentOut:
-        # Create upload directory if it doesn't exist
-        upload_dir = Path("uploads")
-        upload_dir.mkdir(exist_ok=True)
-        
-        # Generate unique filename
-        file_extension = Path(document_data.file_name).suffix
-        unique_filename = f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{document_data.file_name}"
-        file_path = upload_dir / unique_filename
-        
-        # Save file
-        with open(file_path, "wb") as f:
-            f.write(file_content)
-        
-        # Update document data with actual file path
-        document_data.file_path = str(file_path)
-        
-        document = self.repository.create_document(document_data)
+    def create_document(self, document_data: DocumentIn, source: BinaryIO) -> DocumentOut:
+        # Stream the upload in blocks while hashing it; memory use does not depend on the file size.
+        # Identical content uploaded again is stored once and shared by reference.
+        blob_store = self.repository.blob_store
+        staged = blob_store.stage(source, settings.max_file_size, settings.upload_chunk_size)
+        try:
+            document = self.repository.create_document(document_data, staged)
+        except Exception:
+            blob_store.discard(staged)
+            raise
         return DocumentOut.from_orm(document)
 
     def get_document(self, document_id: int) -> Optional[DocumentOut]:
@@ -43,13 +38,15 @@ class DocumentService:
                       status: Optional[str] = None,
                       unit_id: Optional[int] = None,
                       created_by: Optional[str] = None,
-                      is_public: Optional[bool] = None) -> List[DocumentOut]:
-        documents = self.repository.list_documents(document_type, status, unit_id, created_by, is_public)
-        return [DocumentOut.from_orm(document) for document in documents]
+                      is_public: Optional[bool] = None,
+                      cursor: Optional[str] = None,
+                      limit: Optional[int] = None) -> Page:
+        page = self.repository.list_documents(document_type, status, unit_id, created_by, is_public, cursor, limit)
+        return Page([DocumentOut.from_orm(document) for document in page.items], page.next_cursor)
 
-    def search_documents(self, search_data: DocumentSearchIn) -> List[DocumentOut]:
-        documents = self.repository.search_documents(search_data)
-        return [DocumentOut.from_orm(document) for document in documents]
+    def search_documents(self, search_data: DocumentSearchIn, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        page = self.repository.search_documents_page(search_data, cursor, limit)
+        return Page([DocumentOut.from_orm(document) for document in page.items], page.next_cursor)
 
     def update_document(self, document_id: int, update_data: DocumentUpdate) -> Optional[DocumentOut]:
         document = self.repository.update_document(document_id, update_data)
@@ -81,23 +78,37 @@ class DocumentService:
             return DocumentOut.from_orm(document)
         return None
 
-    def download_document(self, document_id: int) -> Optional[tuple]:
+    def get_document_file(self, document_id: int) -> Optional[DocumentFile]:
         document = self.repository.get_document(document_id)
         if not document:
             return None
         
-        # Increment download count
-        self.repository.increment_download_count(document_id)
+        if document.blob_hash:
+            blob_store = self.repository.blob_store
+            return DocumentFile(
+                file_name=document.file_name,
+                mime_type=document.mime_type,
+                size=document.file_size,
+                etag=f'"{document.blob_hash}"',
+                path=blob_store.local_path(document.blob_hash),
+                reader=partial(blob_store.iter_range, document.blob_hash)
+            )
         
-        # Check if file exists
+        # Files saved before the blob store: check if file exists
         if not os.path.exists(document.file_path):
             return None
         
-        # Read file content
-        with open(document.file_path, "rb") as f:
-            file_content = f.read()
-        
-        return file_content, document.file_name, document.mime_type
+        return DocumentFile(
+            file_name=document.file_name,
+            mime_type=document.mime_type,
+            size=os.path.getsize(document.file_path),
+            etag=file_etag(document.file_path, document.content_hash),
+            path=document.file_path,
+            reader=partial(iter_file, document.file_path)
+        )
+
+    def record_download(self, document_id: int) -> None:
+        self.repository.increment_download_count(document_id)
 
     def delete_document(self, document_id: int) -> bool:
         return self.repository.delete_document(document_id)
@@ -154,11 +165,11 @@ class DocumentService:
         return self.repository.get_documents_stats(start_date, end_date)
 
     def get_documents_by_creator(self, created_by: str) -> List[DocumentOut]:
-        documents = self.repository.list_documents(created_by=created_by)
+        documents = self.repository.find_documents(created_by=created_by)
         return [DocumentOut.from_orm(document) for document in documents]
 
     def get_documents_by_unit(self, unit_id: int) -> List[DocumentOut]:
-        documents = self.repository.list_documents(unit_id=unit_id)
+        documents = self.repository.find_documents(unit_id=unit_id)
         return [DocumentOut.from_orm(document) for document in documents]
 
     def get_documents_by_tags(self, tags: List[str]) -> List[DocumentOut]:
@@ -167,15 +178,11 @@ class DocumentService:
         return [DocumentOut.from_orm(document) for document in documents]
 
     def get_most_downloaded_documents(self, limit: int = 10) -> List[DocumentOut]:
-        documents = self.repository.db.query(self.repository.Document).order_by(
-            self.repository.Document.download_count.desc()
-        ).limit(limit).all()
+        documents = self.repository.get_most_downloaded_documents(limit)
         return [DocumentOut.from_orm(document) for document in documents]
 
     def get_recent_documents(self, limit: int = 10) -> List[DocumentOut]:
-        documents = self.repository.db.query(self.repository.Document).order_by(
-            self.repository.Document.created_at.desc()
-        ).limit(limit).all()
+        documents = self.repository.get_recent_documents(limit)
         return [DocumentOut.from_orm(document) for document in documents]
 
     def get_documents_by_date_range(self, start_date: datetime, end_date: datetime) -> List[DocumentOut]:
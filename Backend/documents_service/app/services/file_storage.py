@@ -0,0 +1,209 @@
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, NamedTuple, Optional
+
+from ..core.config import settings
+
+
+class FileTooLargeError(Exception):
+    def __init__(self, max_size: int) -> None:
+        super().__init__(f"File exceeds {max_size} bytes")
+        self.max_size = max_size
+
+
+class StagedBlob(NamedTuple):
+    sha256: str
+    size: int
+    temp_path: str
+
+
+class DocumentFile(NamedTuple):
+    file_name: str
+    mime_type: str
+    size: int
+    etag: str
+    path: Optional[str]  # local file, served with FileResponse when available
+    reader: Callable[[int, int, int], Iterator[bytes]]  # (start, end inclusive, chunk_size)
+
+
+def stream_to_temp(source: BinaryIO, directory: Path, max_size: int, chunk_size: int) -> StagedBlob:
+    """
+    Copy ``source`` to a temporary file in ``directory`` in ``chunk_size`` blocks, hashing and
+    counting as it goes. The temporary file is removed if the copy fails or exceeds ``max_size``.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".upload-")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise FileTooLargeError(max_size)
+                digest.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        _remove(tmp_path)
+        raise
+    return StagedBlob(digest.hexdigest(), size, tmp_path)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class BlobStore(ABC):
+    """
+    Content-addressed storage: a blob is written once and afterwards known only by its SHA-256.
+
+    Uploads are staged first (hash and size computed while streaming), then ``commit`` makes the
+    staged data available under its hash, or just drops it when that content is already stored.
+    Reference counting lives in the database (``document_blobs``); the store never decides on
+    its own when a blob can be removed.
+    """
+
+    @abstractmethod
+    def stage(self, source: BinaryIO, max_size: int, chunk_size: int) -> StagedBlob:
+        ...
+
+    @abstractmethod
+    def commit(self, staged: StagedBlob) -> None:
+        ...
+
+    @abstractmethod
+    def discard(self, staged: StagedBlob) -> None:
+        ...
+
+    @abstractmethod
+    def exists(self, sha256: str) -> bool:
+        ...
+
+    @abstractmethod
+    def delete(self, sha256: str) -> None:
+        ...
+
+    @abstractmethod
+    def size(self, sha256: str) -> int:
+        ...
+
+    @abstractmethod
+    def locator(self, sha256: str) -> str:
+        """
+        Where the blob lives, stored in ``Document.file_path`` for reference
+        """
+
+    @abstractmethod
+    def iter_range(self, sha256: str, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+        ...
+
+    @abstractmethod
+    def iter_hashes(self, older_than: float) -> Iterator[str]:
+        """
+        Hashes of blobs stored before the ``older_than`` timestamp, for the orphan sweep
+        """
+
+    def local_path(self, sha256: str) -> Optional[str]:
+        # Stores backed by the local filesystem return a path so downloads can use sendfile
+        return None
+
+
+class LocalBlobStore(BlobStore):
+    """
+    Blobs under ``root/ab/cd/<sha256>``; staging files under ``root/.staging``
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = Path(root)
+        self.staging = self.root / ".staging"
+
+    def _path(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256[2:4] / sha256
+
+    def stage(self, source: BinaryIO, max_size: int, chunk_size: int) -> StagedBlob:
+        return stream_to_temp(source, self.staging, max_size, chunk_size)
+
+    def commit(self, staged: StagedBlob) -> None:
+        path = self._path(staged.sha256)
+        if path.exists():
+            _remove(staged.temp_path)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staged.temp_path, path)
+
+    def discard(self, staged: StagedBlob) -> None:
+        _remove(staged.temp_path)
+
+    def exists(self, sha256: str) -> bool:
+        return self._path(sha256).exists()
+
+    def delete(self, sha256: str) -> None:
+        _remove(str(self._path(sha256)))
+
+    def size(self, sha256: str) -> int:
+        return self._path(sha256).stat().st_size
+
+    def locator(self, sha256: str) -> str:
+        return str(self._path(sha256))
+
+    def iter_range(self, sha256: str, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+        return iter_file(str(self._path(sha256)), start, end, chunk_size)
+
+    def iter_hashes(self, older_than: float) -> Iterator[str]:
+        for path in self.root.glob("??/??/*"):
+            if path.stat().st_mtime < older_than:
+                yield path.name
+
+    def local_path(self, sha256: str) -> Optional[str]:
+        return str(self._path(sha256))
+
+
+# BLOB_STORAGE selects the backend; an S3-compatible store registers itself here
+BLOB_BACKENDS: Dict[str, Callable[[], BlobStore]] = {
+    "local": lambda: LocalBlobStore(settings.blob_storage_path),
+}
+
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    global _blob_store
+    if _blob_store is None:
+        try:
+            factory = BLOB_BACKENDS[settings.blob_storage]
+        except KeyError:
+            raise ValueError(f"Unknown BLOB_STORAGE backend: {settings.blob_storage}")
+        _blob_store = factory()
+    return _blob_store
+
+
+def file_etag(path: str, content_hash: Optional[str]) -> str:
+    # Documents uploaded before hashing get a weak validator from size and mtime
+    if content_hash:
+        return f'"{content_hash}"'
+    stat = os.stat(path)
+    return f'W/"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def iter_file(path: str, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+    """
+    Yield bytes ``start``..``end`` (inclusive) of ``path`` in ``chunk_size`` blocks
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
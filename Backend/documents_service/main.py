@@ -1,15 +1,43 @@
 from fastapi import FastAPI
-from .app.core.db import engine, Base
+from sqlalchemy import text
+from .app.core.db import engine, Base, counters
 from .app.routers import documents
+from .app.models.documents import Document
+from .shared.search import install_search_extensions, upgrade_search_schema
+from .shared.statement_budget import install_statement_budget
 
-# Create tables
+# Create tables (as extensões de busca precisam existir antes das colunas/índices)
+install_search_extensions(engine)
 Base.metadata.create_all(bind=engine)
+upgrade_search_schema(engine, Document.__table__)
+# Tables created before uploads were hashed and stored by content
+with engine.begin() as conn:
+    conn.execute(text("ALTER TABLE documents ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)"))
+    conn.execute(text(
+        "ALTER TABLE documents ADD COLUMN IF NOT EXISTS blob_hash VARCHAR(64) REFERENCES document_blobs(sha256)"
+    ))
 
 app = FastAPI(title="Documents Service", version="1.0.0")
 
+# N+1 detector, only when SQL_STATEMENT_BUDGET is set (tests/CI)
+install_statement_budget(app, engine)
+
 # Include routers
 app.include_router(documents.router, prefix="/api")
 
+@app.on_event("startup")
+def start_counter_flush():
+    counters.start()
+
+@app.on_event("shutdown")
+def drain_counters():
+    # Writes whatever is still buffered before the process exits
+    counters.stop()
+
+@app.get("/metrics/counters")
+def counter_metrics():
+    return counters.stats()
+
 @app.get("/health")
 def health_check():
     return {"status": "ok", "service": "Documents Service"}
@@ -0,0 +1,86 @@
+"""
+Maintenance for the content-addressed document store.
+
+``migrate`` moves documents uploaded before the blob store (``blob_hash`` NULL, one file per
+document under UPLOAD_PATH) into it: each file is hashed, stored once per content and the
+document row is pointed at the blob. Files that are missing on disk are reported and skipped.
+
+``sweep`` removes blobs that no ``document_blobs`` row references. They are left behind only
+when a request crashes between placing the blob and committing its row, or between deleting
+the last document that used it and removing the data. Only blobs older than ``--min-age`` are
+considered, which keeps in-flight uploads safe.
+
+Usage (from Backend/):
+    python -m documents_service.scripts.blob_maintenance migrate
+    python -m documents_service.scripts.blob_maintenance sweep --min-age 3600
+"""
+import argparse
+import os
+import time
+
+from ..app.core.config import settings
+from ..app.core.db import SessionLocal
+from ..app.models.documents import Document
+from ..app.repositories.document_repository import DocumentRepository
+
+
+def migrate(batch_size: int) -> None:
+    db = SessionLocal()
+    try:
+        repository = DocumentRepository(db)
+        moved = missing = 0
+        last_id = 0
+        while True:
+            rows = db.query(Document.id, Document.file_path).filter(
+                Document.blob_hash.is_(None),
+                Document.id > last_id
+            ).order_by(Document.id).limit(batch_size).all()
+            if not rows:
+                break
+            for document_id, file_path in rows:
+                last_id = document_id
+                if not os.path.exists(file_path):
+                    print(f"document {document_id}: missing file {file_path}")
+                    missing += 1
+                    continue
+                with open(file_path, "rb") as source:
+                    # Old uploads may exceed today's MAX_FILE_SIZE; they are moved as they are
+                    staged = repository.blob_store.stage(source, float("inf"), settings.upload_chunk_size)
+                if repository.move_to_blob_store(document_id, staged):
+                    moved += 1
+        print(f"{moved} documents moved, {missing} missing files")
+    finally:
+        db.close()
+
+
+def sweep(min_age: int) -> None:
+    db = SessionLocal()
+    try:
+        repository = DocumentRepository(db)
+        blob_store = repository.blob_store
+        removed = 0
+        for sha256 in blob_store.iter_hashes(time.time() - min_age):
+            if repository.remove_unreferenced_blob(sha256, blob_store.size(sha256)):
+                removed += 1
+        print(f"{removed} orphaned blobs removed")
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = commands.add_parser("migrate")
+    migrate_parser.add_argument("--batch-size", type=int, default=500)
+    sweep_parser = commands.add_parser("sweep")
+    sweep_parser.add_argument("--min-age", type=int, default=3600, help="seconds")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        migrate(args.batch_size)
+    else:
+        sweep(args.min_age)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Date, Float, ForeignKey, Enum as SQLEnum, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, Date, Float, ForeignKey, Enum as SQLEnum, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
@@ -32,6 +32,11 @@ class Employee(Base):
     # Relationships
     history = relationship("EmployeeHistory", back_populates="employee", cascade="all, delete-orphan")
 
+    # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+    __table_args__ = (
+        Index('idx_employees_created_id', 'created_at', 'id'),
+    )
+
 
 class EmployeeHistory(Base):
     __tablename__ = "employee_history"
@@ -3,6 +3,8 @@ from typing import List, Optional
 from ..models.employees import Employee, EmployeeHistory
 from ..schemas.employees import EmployeeIn, EmployeeUpdate, EmployeeHistoryIn, EmployeeTerminationIn, EmployeePromotionIn
 from datetime import datetime, date
+from ...shared.pagination import Page, keyset_page
+from ...shared.aggregates import grouped_stats
 
 
 class EmployeeRepository:
@@ -53,7 +55,23 @@ class EmployeeRepository:
                       status: Optional[str] = None,
                       position: Optional[str] = None,
                       department: Optional[str] = None,
-                      unit_id: Optional[int] = None) -> List[Employee]:
+                      unit_id: Optional[int] = None,
+                      cursor: Optional[str] = None,
+                      limit: Optional[int] = None) -> Page:
+        return keyset_page(self._employees_query(status, position, department, unit_id), Employee.created_at, Employee.id, cursor, limit)
+
+    def find_employees(self, 
+                       status: Optional[str] = None,
+                       position: Optional[str] = None,
+                       department: Optional[str] = None,
+                       unit_id: Optional[int] = None) -> List[Employee]:
+        return self._employees_query(status, position, department, unit_id).order_by(Employee.name.asc()).all()
+
+    def _employees_query(self, 
+                         status: Optional[str] = None,
+                         position: Optional[str] = None,
+                         department: Optional[str] = None,
+                         unit_id: Optional[int] = None):
         query = self.db.query(Employee)
         
         if status:
@@ -65,7 +83,7 @@ class EmployeeRepository:
         if unit_id:
             query = query.filter(Employee.unit_id == unit_id)
             
-        return query.order_by(Employee.name.asc()).all()
+        return query
 
     def update_employee(self, employee_id: int, update_data: EmployeeUpdate) -> Optional[Employee]:
         db_employee = self.get_employee(employee_id)
@@ -297,16 +315,15 @@ class EmployeeRepository:
             Employee.hire_date <= end_date
         )
         
-        total_employees = query.count()
-        
-        position_breakdown = {}
-        department_breakdown = {}
-        status_breakdown = {}
-        
-        for employee in query.all():
-            position_breakdown[employee.position] = position_breakdown.get(employee.position, 0) + 1
-            department_breakdown[employee.department] = department_breakdown.get(employee.department, 0) + 1
-            status_breakdown[employee.status] = status_breakdown.get(employee.status, 0) + 1
+        stats = grouped_stats(query, {
+            "position": Employee.position,
+            "department": Employee.department,
+            "status": Employee.status
+        })
+        total_employees = stats["total"]
+        position_breakdown = stats["breakdowns"]["position"]
+        department_breakdown = stats["breakdowns"]["department"]
+        status_breakdown = stats["breakdowns"]["status"]
         
         return {
             "total_employees": total_employees,
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.db import get_db
 from ..schemas.employees import EmployeeIn, EmployeeOut, EmployeeUpdate, EmployeeHistoryIn, EmployeeTerminationIn, EmployeePromotionIn
 from ..services.employee_service import EmployeeService
 from datetime import datetime, date
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/employees", tags=["employees"])
 
@@ -20,14 +21,17 @@ def create_employee(employee_data: EmployeeIn, created_by: str = "Sistema", db:
 
 @router.get("/", response_model=List[EmployeeOut])
 def list_employees(
+    response: Response,
     status: Optional[str] = None,
     position: Optional[str] = None,
     department: Optional[str] = None,
     unit_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = EmployeeService(db)
-    return service.list_employees(status, position, department, unit_id)
+    return set_next_cursor(response, service.list_employees(status, position, department, unit_id, cursor, limit))
 
 
 @router.get("/{employee_id}", response_model=EmployeeOut)
@@ -3,6 +3,7 @@ from typing import List, Optional
 from ..repositories.employee_repository import EmployeeRepository
 from ..schemas.employees import EmployeeIn, EmployeeOut, EmployeeUpdate, EmployeeHistoryIn, EmployeeTerminationIn, EmployeePromotionIn
 from datetime import datetime, date
+from ...shared.pagination import Page
 
 
 class EmployeeService:
@@ -34,9 +35,11 @@ class EmployeeService:
                       status: Optional[str] = None,
                       position: Optional[str] = None,
                       department: Optional[str] = None,
-                      unit_id: Optional[int] = None) -> List[EmployeeOut]:
-        employees = self.repository.list_employees(status, position, department, unit_id)
-        return [EmployeeOut.from_orm(employee) for employee in employees]
+                      unit_id: Optional[int] = None,
+                      cursor: Optional[str] = None,
+                      limit: Optional[int] = None) -> Page:
+        page = self.repository.list_employees(status, position, department, unit_id, cursor, limit)
+        return Page([EmployeeOut.from_orm(employee) for employee in page.items], page.next_cursor)
 
     def update_employee(self, employee_id: int, update_data: EmployeeUpdate, changed_by: str = "Sistema") -> Optional[EmployeeOut]:
         employee = self.repository.update_employee(employee_id, update_data)
@@ -115,17 +118,17 @@ class EmployeeService:
         return self.repository.get_employees_stats(start_date, end_date)
 
     def get_employees_by_status(self, status: str) -> List[EmployeeOut]:
-        employees = self.repository.list_employees(status=status)
+        employees = self.repository.find_employees(status=status)
         return [EmployeeOut.from_orm(employee) for employee in employees]
 
     def get_employees_by_unit(self, unit_id: int) -> List[EmployeeOut]:
-        employees = self.repository.list_employees(unit_id=unit_id)
+        employees = self.repository.find_employees(unit_id=unit_id)
         return [EmployeeOut.from_orm(employee) for employee in employees]
 
     def search_employees(self, search_term: str) -> List[EmployeeOut]:
         # This would need to be implemented in the repository
         # For now, we'll use a simple approach
-        employees = self.repository.list_employees()
+        employees = self.repository.find_employees()
         filtered_employees = []
         
         for employee in employees:
@@ -8,6 +8,9 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     tenant_id: Optional[int] = None
+    reminder_batch_size: int = 200  # reminders claimed and sent per batch
+    reminder_check_interval: float = 60.0  # seconds between scheduler passes
+    notifications_service_url: str = "http://notifications_service:8020"
     
     class Config:
         env_file = ".env"
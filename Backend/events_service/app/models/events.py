@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
@@ -25,10 +25,21 @@ class Event(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     created_by = Column(String(255), nullable=False)
+    # When the reminder is due (kept by the repository) and when it was sent (or claimed)
+    remind_at = Column(DateTime)
+    reminder_sent_at = Column(DateTime)
 
     # Relationships
     history = relationship("EventHistory", back_populates="event", cascade="all, delete-orphan")
 
+    # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+    __table_args__ = (
+        Index('idx_events_created_id', 'created_at', 'id'),
+        # Pending reminders only: a scheduler pass reads just the due ones
+        Index('idx_events_remind_at', 'remind_at', 'id', postgresql_where=reminder_sent_at.is_(None),
+              sqlite_where=reminder_sent_at.is_(None)),
+    )
+
 
 class EventHistory(Base):
     __tablename__ = "event_history"
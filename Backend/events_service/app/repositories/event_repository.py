@@ -3,6 +3,8 @@ from typing import List, Optional
 from ..models.events import Event, EventHistory
 from ..schemas.events import EventIn, EventUpdate, EventHistoryIn
 from datetime import datetime, timedelta
+from ...shared.pagination import Page, keyset_page
+from ...shared.aggregates import grouped_stats
 
 
 class EventRepository:
@@ -26,6 +28,7 @@ class EventRepository:
             unit_id=event_data.unit_id,
             created_by=event_data.organizer
         )
+        self._schedule_reminder(db_event)
         
         self.db.add(db_event)
         self.db.flush()  # Get the ID
@@ -50,7 +53,9 @@ class EventRepository:
                    event_type: Optional[str] = None, 
                    priority: Optional[str] = None,
                    start_date: Optional[datetime] = None,
-                   end_date: Optional[datetime] = None) -> List[Event]:
+                   end_date: Optional[datetime] = None,
+                   cursor: Optional[str] = None,
+                   limit: Optional[int] = None) -> Page:
         query = self.db.query(Event)
         
         if event_type:
@@ -62,7 +67,7 @@ class EventRepository:
         if end_date:
             query = query.filter(Event.end_date <= end_date)
             
-        return query.order_by(Event.start_date.asc()).all()
+        return keyset_page(query, Event.created_at, Event.id, cursor, limit)
 
     def get_upcoming_events(self, days_ahead: int = 30) -> List[Event]:
         today = datetime.utcnow()
@@ -87,6 +92,7 @@ class EventRepository:
         update_dict = update_data.dict(exclude_unset=True)
         for field, value in update_dict.items():
             setattr(db_event, field, value)
+        self._schedule_reminder(db_event)
         
         db_event.updated_at = datetime.utcnow()
         
@@ -146,14 +152,10 @@ class EventRepository:
             Event.end_date <= end_date
         )
         
-        total_events = query.count()
-        
-        type_breakdown = {}
-        priority_breakdown = {}
-        
-        for event in query.all():
-            type_breakdown[event.event_type] = type_breakdown.get(event.event_type, 0) + 1
-            priority_breakdown[event.priority] = priority_breakdown.get(event.priority, 0) + 1
+        stats = grouped_stats(query, {"type": Event.event_type, "priority": Event.priority})
+        total_events = stats["total"]
+        type_breakdown = stats["breakdowns"]["type"]
+        priority_breakdown = stats["breakdowns"]["priority"]
         
         return {
             "total_events": total_events,
@@ -162,11 +164,23 @@ class EventRepository:
         }
 
     def get_events_requiring_reminder(self) -> List[Event]:
-        today = datetime.utcnow()
+        """Upcoming events whose reminder is due and not sent yet (served by idx_events_remind_at)."""
+        now = datetime.utcnow()
         return self.db.query(Event).filter(
-            Event.reminder_days.isnot(None),
-            Event.start_date >= today,
-            Event.start_date <= today + timedelta(days=Event.reminder_days)
-        ).all()
-
-
+            Event.reminder_sent_at.is_(None),
+            Event.remind_at <= now,
+            Event.start_date >= now
+        ).order_by(Event.remind_at.asc(), Event.id.asc()).all()
+
+    def get_events_by_ids(self, event_ids: List[int]) -> List[Event]:
+        return self.db.query(Event).filter(Event.id.in_(event_ids)).all()
+
+    @staticmethod
+    def _schedule_reminder(event: Event) -> None:
+        remind_at = None
+        if event.reminder_days is not None and event.start_date is not None:
+            remind_at = event.start_date - timedelta(days=event.reminder_days)
+        if remind_at != event.remind_at:
+            # New date, new reminder (even if the previous one was already sent)
+            event.remind_at = remind_at
+            event.reminder_sent_at = None
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.db import get_db
 from ..schemas.events import EventIn, EventOut, EventUpdate, EventHistoryIn
 from ..services.event_service import EventService
 from datetime import datetime
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/events", tags=["events"])
 
@@ -17,10 +18,13 @@ def create_event(event_data: EventIn, db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[EventOut])
 def list_events(
+    response: Response,
     event_type: Optional[str] = None,
     priority: Optional[str] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = EventService(db)
@@ -40,7 +44,7 @@ def list_events(
         except ValueError:
             raise HTTPException(status_code=400, detail="Formato de data de fim inválido")
     
-    return service.list_events(event_type, priority, start_dt, end_dt)
+    return set_next_cursor(response, service.list_events(event_type, priority, start_dt, end_dt, cursor, limit))
 
 
 @router.get("/{event_id}", response_model=EventOut)
@@ -3,6 +3,7 @@ from typing import List, Optional
 from ..repositories.event_repository import EventRepository
 from ..schemas.events import EventIn, EventOut, EventUpdate, EventHistoryIn
 from datetime import datetime, timedelta
+from ...shared.pagination import Page
 
 
 class EventService:
@@ -23,9 +24,11 @@ class EventService:
                    event_type: Optional[str] = None, 
                    priority: Optional[str] = None,
                    start_date: Optional[datetime] = None,
-                   end_date: Optional[datetime] = None) -> List[EventOut]:
-        events = self.repository.list_events(event_type, priority, start_date, end_date)
-        return [EventOut.from_orm(event) for event in events]
+                   end_date: Optional[datetime] = None,
+                   cursor: Optional[str] = None,
+                   limit: Optional[int] = None) -> Page:
+        page = self.repository.list_events(event_type, priority, start_date, end_date, cursor, limit)
+        return Page([EventOut.from_orm(event) for event in page.items], page.next_cursor)
 
     def get_upcoming_events(self, days_ahead: int = 30) -> List[EventOut]:
         events = self.repository.get_upcoming_events(days_ahead)
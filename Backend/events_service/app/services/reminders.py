@@ -0,0 +1,53 @@
+from typing import List
+
+from ..core.config import settings
+from ..core.db import SessionLocal, engine
+from ..models.events import Event
+from ..repositories.event_repository import EventRepository
+from ...shared.reminders import Reminder, ReminderScheduler, post_bulk_reminder
+
+
+def _post_reminder(event: Event, recipients: List[str], key: str) -> bool:
+    """Hand one event reminder to the notifications service; False means try again later."""
+    payload = {
+        "recipient_emails": recipients,
+        "subject": f"Lembrete: {event.title} - {event.start_date.strftime('%d/%m/%Y')}",
+        "message": (
+            f"Lembrete do evento {event.title}\n"
+            f"Data: {event.start_date.strftime('%d/%m/%Y às %H:%M')}\n"
+            f"Local: {event.location or '-'}"
+        ),
+        "priority": event.priority.value if event.priority else "medium",
+        "unit_id": event.unit_id,
+        "created_by": "events_service",
+    }
+    return post_bulk_reminder(settings.notifications_service_url, payload, "event_reminder", key)
+
+
+def send_event_reminders(reminders: List[Reminder]) -> List[int]:
+    """Batched sender for the scheduler: loads the claimed events in one query."""
+    keys = {reminder.id: reminder.key for reminder in reminders}
+    db = SessionLocal()
+    try:
+        events = EventRepository(db).get_events_by_ids(list(keys))
+    finally:
+        db.close()
+
+    # Deleted in the meantime: nothing to send
+    handled = [event_id for event_id in keys if event_id not in {event.id for event in events}]
+    for event in events:
+        recipients = [attendee for attendee in event.attendees or [] if "@" in attendee]
+        if not recipients or _post_reminder(event, recipients, keys[event.id]):
+            handled.append(event.id)
+    return handled
+
+
+reminder_scheduler = ReminderScheduler(
+    engine,
+    Event.__table__,
+    "start_date",
+    send_event_reminders,
+    kind="event",
+    batch_size=settings.reminder_batch_size,
+    interval=settings.reminder_check_interval
+)
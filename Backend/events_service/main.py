@@ -1,15 +1,36 @@
 from fastapi import FastAPI
+from sqlalchemy import text
 from .app.core.db import engine, Base
 from .app.routers import events
+from .app.models.events import Event
+from .app.services.reminders import reminder_scheduler
+from .shared.reminders import upgrade_reminder_schema
 
 # Create tables
 Base.metadata.create_all(bind=engine)
+# Tables created before reminders were scheduled per row
+upgrade_reminder_schema(engine, Event.__table__, backfill=text(
+    "UPDATE events SET remind_at = start_date - reminder_days * interval '1 day' "
+    "WHERE reminder_days IS NOT NULL AND start_date > (now() AT TIME ZONE 'utc')"
+))
 
 app = FastAPI(title="Events Service", version="1.0.0")
 
 # Include routers
 app.include_router(events.router, prefix="/api")
 
+@app.on_event("startup")
+def start_reminders():
+    reminder_scheduler.start()
+
+@app.on_event("shutdown")
+def stop_reminders():
+    reminder_scheduler.stop()
+
+@app.get("/metrics/reminders")
+def reminder_metrics():
+    return reminder_scheduler.stats()
+
 @app.get("/health")
 def health_check():
     return {"status": "ok", "service": "Events Service"}
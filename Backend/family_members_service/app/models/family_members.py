@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, Date, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, Date, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
+from ...shared.search import search_vector_column, search_vector_index, trigram_index
 from ..schemas.family_members import RelationshipType, Gender, MaritalStatus
 
 
@@ -41,6 +42,18 @@ class FamilyMember(Base):
     history = relationship("FamilyMemberHistory", back_populates="member", cascade="all, delete-orphan")
     documents = relationship("FamilyMemberDocument", back_populates="member", cascade="all, delete-orphan")
 
+    # Busca textual (shared/search.py): tsvector em português + trigramas para substring
+    search_vector = search_vector_column(('name', 'A'), ('occupation', 'B'), ('city', 'C'))
+
+    __table_args__ = (
+        # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+        Index('idx_family_members_created_id', 'created_at', 'id'),
+        search_vector_index('idx_family_members_search'),
+        trigram_index('idx_family_members_name_trgm', 'name'),
+        trigram_index('idx_family_members_city_trgm', 'city'),
+        trigram_index('idx_family_members_occupation_trgm', 'occupation'),
+    )
+
 
 class FamilyMemberHistory(Base):
     __tablename__ = "family_member_history"
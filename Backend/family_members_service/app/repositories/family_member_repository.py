@@ -1,10 +1,21 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc, extract
+from sqlalchemy import and_, or_, func, desc, extract, cast, tuple_, Integer
+from sqlalchemy.dialects.postgresql import array
 from typing import List, Optional, Dict, Any
 from ..models.family_members import FamilyMember, FamilyMemberHistory, FamilyMemberDocument
 from ..schemas.family_members import FamilyMemberIn, FamilyMemberUpdate, FamilyMemberHistoryIn, FamilyMemberSearchIn, FamilyMemberDocumentIn
 from datetime import datetime, date
 import json
+from ...shared.pagination import Page, keyset_page, page_from_rows, page_size
+from ...shared.search import contains, ranked_page, similarity, text_search
+
+# Faixas etárias das estatísticas: width_bucket(idade, limites) devolve 1..7 dentro delas
+AGE_BUCKET_BOUNDS = [0, 13, 18, 26, 36, 51, 66, 101]
+AGE_BUCKET_LABELS = ["0-12", "13-17", "18-25", "26-35", "36-50", "51-65", "66+"]
+
+
+def _member_summary(member) -> Dict[str, Any]:
+    return {"id": member.id, "name": member.name, "unit_id": member.unit_id}
 
 
 class FamilyMemberRepository:
@@ -76,7 +87,9 @@ class FamilyMemberRepository:
                            marital_status: Optional[str] = None,
                            is_emergency_contact: Optional[bool] = None,
                            is_authorized_visitor: Optional[bool] = None,
-                           is_resident: Optional[bool] = None) -> List[FamilyMember]:
+                           is_resident: Optional[bool] = None,
+                           cursor: Optional[str] = None,
+                           limit: Optional[int] = None) -> Page:
         query = self.db.query(FamilyMember)
         
         if unit_id:
@@ -96,13 +109,19 @@ class FamilyMemberRepository:
         if is_resident is not None:
             query = query.filter(FamilyMember.is_resident == is_resident)
             
-        return query.order_by(desc(FamilyMember.created_at)).all()
+        return keyset_page(query, FamilyMember.created_at, FamilyMember.id, cursor, limit)
 
-    def search_family_members(self, search_data: FamilyMemberSearchIn) -> List[FamilyMember]:
+    def _search_query(self, search_data: FamilyMemberSearchIn):
         query = self.db.query(FamilyMember)
+        rank = None
         
+        if search_data.query:
+            match, rank = text_search(FamilyMember.search_vector, search_data.query, [FamilyMember.name])
+            query = query.filter(match)
         if search_data.name:
-            query = query.filter(FamilyMember.name.ilike(f"%{search_data.name}%"))
+            query = query.filter(contains(FamilyMember.name, search_data.name))
+            if rank is None:
+                rank = similarity(FamilyMember.name, search_data.name)
         if search_data.cpf:
             query = query.filter(FamilyMember.cpf == search_data.cpf)
         if search_data.rg:
@@ -124,14 +143,25 @@ class FamilyMemberRepository:
         if search_data.main_resident_id:
             query = query.filter(FamilyMember.main_resident_id == search_data.main_resident_id)
         if search_data.city:
-            query = query.filter(FamilyMember.city.ilike(f"%{search_data.city}%"))
+            query = query.filter(contains(FamilyMember.city, search_data.city))
         if search_data.state:
             query = query.filter(FamilyMember.state == search_data.state)
         if search_data.occupation:
-            query = query.filter(FamilyMember.occupation.ilike(f"%{search_data.occupation}%"))
+            query = query.filter(contains(FamilyMember.occupation, search_data.occupation))
             
+        return query, rank
+
+    def search_family_members(self, search_data: FamilyMemberSearchIn) -> List[FamilyMember]:
+        query, _ = self._search_query(search_data)
         return query.order_by(desc(FamilyMember.created_at)).all()
 
+    def search_family_members_page(self, search_data: FamilyMemberSearchIn, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        # Com texto (query/nome): por relevância; só com filtros: do mais recente para o mais antigo
+        query, rank = self._search_query(search_data)
+        if rank is None:
+            return keyset_page(query, FamilyMember.created_at, FamilyMember.id, cursor, limit)
+        return ranked_page(query, rank, FamilyMember.id, cursor, limit)
+
     def update_family_member(self, member_id: int, update_data: FamilyMemberUpdate) -> Optional[FamilyMember]:
         db_member = self.get_family_member(member_id)
         if not db_member:
@@ -266,7 +296,7 @@ class FamilyMemberRepository:
 
     def get_family_members_by_city(self, city: str) -> List[FamilyMember]:
         return self.db.query(FamilyMember).filter(
-            FamilyMember.city.ilike(f"%{city}%")
+            contains(FamilyMember.city, city)
         ).order_by(desc(FamilyMember.created_at)).all()
 
     def get_family_members_by_state(self, state: str) -> List[FamilyMember]:
@@ -276,7 +306,7 @@ class FamilyMemberRepository:
 
     def get_family_members_by_occupation(self, occupation: str) -> List[FamilyMember]:
         return self.db.query(FamilyMember).filter(
-            FamilyMember.occupation.ilike(f"%{occupation}%")
+            contains(FamilyMember.occupation, occupation)
         ).order_by(desc(FamilyMember.created_at)).all()
 
     def get_recent_family_members(self, limit: int = 10) -> List[FamilyMember]:
@@ -284,124 +314,115 @@ class FamilyMemberRepository:
             desc(FamilyMember.created_at)
         ).limit(limit).all()
 
-    def get_family_member_stats(self) -> Dict[str, Any]:
-        total_members = self.db.query(FamilyMember).count()
-        
-        residents = self.db.query(FamilyMember).filter(FamilyMember.is_resident == True).count()
-        non_residents = total_members - residents
-        
-        emergency_contacts = self.db.query(FamilyMember).filter(FamilyMember.is_emergency_contact == True).count()
-        authorized_visitors = self.db.query(FamilyMember).filter(FamilyMember.is_authorized_visitor == True).count()
-        
-        # Relationship breakdown
-        relationship_breakdown = {}
-        relationship_counts = self.db.query(
-            FamilyMember.relationship_type, 
-            func.count(FamilyMember.id)
-        ).group_by(FamilyMember.relationship_type).all()
-        
-        for relationship, count in relationship_counts:
-            relationship_breakdown[relationship] = count
-        
-        # Gender breakdown
-        gender_breakdown = {}
-        gender_counts = self.db.query(
-            FamilyMember.gender, 
-            func.count(FamilyMember.id)
-        ).group_by(FamilyMember.gender).all()
-        
-        for gender, count in gender_counts:
-            gender_breakdown[gender] = count
-        
-        # Marital status breakdown
-        marital_status_breakdown = {}
-        marital_status_counts = self.db.query(
-            FamilyMember.marital_status, 
-            func.count(FamilyMember.id)
-        ).group_by(FamilyMember.marital_status).all()
-        
-        for marital_status, count in marital_status_counts:
-            marital_status_breakdown[marital_status] = count
-        
-        # Age breakdown
-        age_breakdown = {}
-        current_date = date.today()
-        
-        # Calculate age groups
-        age_groups = [
-            (0, 12, "0-12"),
-            (13, 17, "13-17"),
-            (18, 25, "18-25"),
-            (26, 35, "26-35"),
-            (36, 50, "36-50"),
-            (51, 65, "51-65"),
-            (66, 100, "66+")
-        ]
-        
-        for min_age, max_age, group_name in age_groups:
-            min_birth_date = date(current_date.year - max_age, current_date.month, current_date.day)
-            max_birth_date = date(current_date.year - min_age, current_date.month, current_date.day)
-            
-            count = self.db.query(FamilyMember).filter(
-                and_(
-                    FamilyMember.birth_date >= min_birth_date,
-                    FamilyMember.birth_date <= max_birth_date
+    def get_family_member_stats(self, include_members: bool = False, members_limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Todas as contagens saem de um único SELECT com GROUPING SETS: a linha do conjunto ()
+        traz os totais e as faixas etárias (agregados com FILTER) e as demais linhas trazem
+        cada quebra. ``members_by_relationship`` só é montado com ``include_members`` e traz
+        a primeira página de cada parentesco (continuação em ``list_members_by_relationship``).
+        """
+        relationship, gender = FamilyMember.relationship_type, FamilyMember.gender
+        marital_status, unit_id = FamilyMember.marital_status, FamilyMember.unit_id
+
+        age = cast(func.date_part('year', func.age(FamilyMember.birth_date)), Integer)
+        age_bucket = func.width_bucket(age, array(AGE_BUCKET_BOUNDS))
+        count_if = lambda condition: func.count(FamilyMember.id).filter(condition)
+
+        rows = self.db.query(
+            func.grouping(relationship, gender, marital_status, unit_id),
+            relationship, gender, marital_status, unit_id,
+            func.count(FamilyMember.id),
+            count_if(FamilyMember.is_resident == True),
+            count_if(FamilyMember.is_emergency_contact == True),
+            count_if(FamilyMember.is_authorized_visitor == True),
+            *[count_if(age_bucket == bucket) for bucket in range(1, len(AGE_BUCKET_LABELS) + 1)]
+        ).group_by(
+            func.grouping_sets(tuple_(relationship), tuple_(gender), tuple_(marital_status), tuple_(unit_id), tuple_())
+        ).all()
+
+        stats = {
+            "total_members": 0,
+            "residents": 0,
+            "non_residents": 0,
+            "emergency_contacts": 0,
+            "authorized_visitors": 0,
+            "relationship_breakdown": {},
+            "gender_breakdown": {},
+            "marital_status_breakdown": {},
+            "age_breakdown": {label: 0 for label in AGE_BUCKET_LABELS},
+            "unit_breakdown": {}
+        }
+        # GROUPING(relationship, gender, marital_status, unit_id): bit 1 = coluna agregada
+        for grouping, rel, gen, marital, unit, total, residents, emergency, authorized, *ages in rows:
+            if grouping == 0b0111:
+                stats["relationship_breakdown"][rel] = total
+            elif grouping == 0b1011:
+                stats["gender_breakdown"][gen] = total
+            elif grouping == 0b1101:
+                stats["marital_status_breakdown"][marital] = total
+            elif grouping == 0b1110:
+                stats["unit_breakdown"][str(unit)] = total
+            else:
+                stats.update(
+                    total_members=total,
+                    residents=residents,
+                    non_residents=total - residents,
+                    emergency_contacts=emergency,
+                    authorized_visitors=authorized,
+                    age_breakdown=dict(zip(AGE_BUCKET_LABELS, ages))
                 )
-            ).count()
-            
-            age_breakdown[group_name] = count
-        
-        # Unit breakdown
-        unit_breakdown = {}
-        unit_counts = self.db.query(
-            FamilyMember.unit_id, 
-            func.count(FamilyMember.id)
-        ).group_by(FamilyMember.unit_id).all()
-        
-        for unit_id, count in unit_counts:
-            unit_breakdown[str(unit_id)] = count
-        
-        # Recent members
-        recent_members = self.get_recent_family_members(5)
-        recent_data = [
+
+        stats["recent_members"] = [
             {
                 "id": member.id,
                 "name": member.name,
                 "relationship_type": member.relationship_type,
                 "created_at": member.created_at
             }
-            for member in recent_members
+            for member in self.db.query(
+                FamilyMember.id, FamilyMember.name, FamilyMember.relationship_type, FamilyMember.created_at
+            ).order_by(desc(FamilyMember.created_at)).limit(5).all()
         ]
-        
-        # Members by relationship
-        members_by_relationship = {}
-        for relationship in relationship_breakdown.keys():
-            members = self.db.query(FamilyMember).filter(
-                FamilyMember.relationship_type == relationship
-            ).all()
-            members_by_relationship[relationship] = [
-                {
-                    "id": member.id,
-                    "name": member.name,
-                    "unit_id": member.unit_id
-                }
-                for member in members
-            ]
-        
-        return {
-            "total_members": total_members,
-            "residents": residents,
-            "non_residents": non_residents,
-            "emergency_contacts": emergency_contacts,
-            "authorized_visitors": authorized_visitors,
-            "relationship_breakdown": relationship_breakdown,
-            "gender_breakdown": gender_breakdown,
-            "marital_status_breakdown": marital_status_breakdown,
-            "age_breakdown": age_breakdown,
-            "unit_breakdown": unit_breakdown,
-            "recent_members": recent_data,
-            "members_by_relationship": members_by_relationship
-        }
+
+        stats["members_by_relationship"] = {}
+        stats["members_next_cursors"] = {}
+        if include_members:
+            for rel, page in self._first_member_pages(members_limit).items():
+                stats["members_by_relationship"][rel] = page.items
+                if page.next_cursor:
+                    stats["members_next_cursors"][rel] = page.next_cursor
+        return stats
+
+    def _first_member_pages(self, limit: Optional[int] = None) -> Dict[Any, Page]:
+        # Primeira página de cada parentesco em um só SELECT (ROW_NUMBER por parentesco)
+        size = page_size(limit)
+        ranked = self.db.query(
+            FamilyMember.id, FamilyMember.name, FamilyMember.unit_id,
+            FamilyMember.relationship_type, FamilyMember.created_at,
+            func.row_number().over(
+                partition_by=FamilyMember.relationship_type,
+                order_by=(FamilyMember.created_at.desc().nulls_first(), FamilyMember.id.desc())
+            ).label("rn")
+        ).subquery()
+        rows = self.db.query(ranked).filter(ranked.c.rn <= size + 1).order_by(
+            ranked.c.relationship_type, ranked.c.rn
+        ).all()
+
+        grouped: Dict[Any, list] = {}
+        for row in rows:
+            grouped.setdefault(row.relationship_type, []).append(row)
+        pages = {}
+        for rel, members in grouped.items():
+            page = page_from_rows(members, size, lambda r: (r.created_at, r.id))
+            pages[rel] = Page([_member_summary(m) for m in page.items], page.next_cursor)
+        return pages
+
+    def list_members_by_relationship(self, relationship_type: str, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        query = self.db.query(
+            FamilyMember.id, FamilyMember.name, FamilyMember.unit_id, FamilyMember.created_at
+        ).filter(FamilyMember.relationship_type == relationship_type)
+        page = keyset_page(query, FamilyMember.created_at, FamilyMember.id, cursor, limit)
+        return Page([_member_summary(m) for m in page.items], page.next_cursor)
 
     def get_family_tree(self, main_resident_id: int) -> Dict[str, Any]:
         # Get main resident
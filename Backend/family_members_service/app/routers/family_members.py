@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.db import get_db
@@ -6,10 +6,11 @@ from ..schemas.family_members import (
     FamilyMemberIn, FamilyMemberOut, FamilyMemberUpdate, 
     FamilyMemberHistoryIn, FamilyMemberHistoryOut, 
     FamilyMemberSearchIn, FamilyMemberStatsOut, FamilyTreeOut,
-    FamilyMemberDocumentIn, FamilyMemberDocumentOut
+    FamilyMemberDocumentIn, FamilyMemberDocumentOut, RelationshipType
 )
 from ..services.family_member_service import FamilyMemberService
 from datetime import date
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/family-members", tags=["family-members"])
 
@@ -22,6 +23,7 @@ def create_family_member(member_data: FamilyMemberIn, created_by: str = "Sistema
 
 @router.get("/", response_model=List[FamilyMemberOut])
 def list_family_members(
+    response: Response,
     unit_id: Optional[int] = None,
     main_resident_id: Optional[int] = None,
     relationship_type: Optional[str] = None,
@@ -30,19 +32,27 @@ def list_family_members(
     is_emergency_contact: Optional[bool] = None,
     is_authorized_visitor: Optional[bool] = None,
     is_resident: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = FamilyMemberService(db)
-    return service.list_family_members(
+    return set_next_cursor(response, service.list_family_members(
         unit_id, main_resident_id, relationship_type, gender, marital_status,
-        is_emergency_contact, is_authorized_visitor, is_resident
-    )
+        is_emergency_contact, is_authorized_visitor, is_resident, cursor, limit
+    ))
 
 
 @router.post("/search", response_model=List[FamilyMemberOut])
-def search_family_members(search_data: FamilyMemberSearchIn, db: Session = Depends(get_db)):
+def search_family_members(
+    search_data: FamilyMemberSearchIn,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
     service = FamilyMemberService(db)
-    return service.search_family_members(search_data)
+    return set_next_cursor(response, service.search_family_members(search_data, cursor, limit))
 
 
 @router.get("/{member_id}", response_model=FamilyMemberOut)
@@ -203,10 +213,27 @@ def get_recent_family_members(limit: int = Query(10, ge=1, le=100), db: Session
     return service.get_recent_family_members(limit)
 
 
-@router.get("/stats/summary")
-def get_family_member_stats(db: Session = Depends(get_db)):
+@router.get("/stats/summary", response_model=FamilyMemberStatsOut)
+def get_family_member_stats(
+    include_members: bool = False,
+    members_limit: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
+    service = FamilyMemberService(db)
+    return service.get_family_member_stats(include_members, members_limit)
+
+
+@router.get("/stats/members/{relationship_type}")
+def list_members_by_relationship(
+    relationship_type: RelationshipType,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
+    # Continuação de members_by_relationship: cursor vem de members_next_cursors
     service = FamilyMemberService(db)
-    return service.get_family_member_stats()
+    return set_next_cursor(response, service.list_members_by_relationship(relationship_type, cursor, limit))
 
 
 @router.get("/family-tree/{main_resident_id}")
@@ -144,6 +144,7 @@ class FamilyMemberHistoryOut(BaseModel):
 
 
 class FamilyMemberSearchIn(BaseModel):
+    query: Optional[str] = None  # Busca livre em nome, profissão e cidade, ordenada por relevância
     name: Optional[str] = None
     cpf: Optional[str] = None
     rg: Optional[str] = None
@@ -172,7 +173,9 @@ class FamilyMemberStatsOut(BaseModel):
     age_breakdown: dict
     unit_breakdown: dict
     recent_members: List[dict]
-    members_by_relationship: dict
+    # Preenchidos só com include_members=true (primeira página de cada parentesco)
+    members_by_relationship: dict = {}
+    members_next_cursors: dict = {}
 
 
 class FamilyTreeOut(BaseModel):
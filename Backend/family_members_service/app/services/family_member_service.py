@@ -8,6 +8,7 @@ from ..schemas.family_members import (
     FamilyMemberDocumentIn, FamilyMemberDocumentOut
 )
 from datetime import datetime, date
+from ...shared.pagination import Page
 
 
 class FamilyMemberService:
@@ -50,16 +51,18 @@ class FamilyMemberService:
                            marital_status: Optional[str] = None,
                            is_emergency_contact: Optional[bool] = None,
                            is_authorized_visitor: Optional[bool] = None,
-                           is_resident: Optional[bool] = None) -> List[FamilyMemberOut]:
-        members = self.repository.list_family_members(
+                           is_resident: Optional[bool] = None,
+                           cursor: Optional[str] = None,
+                           limit: Optional[int] = None) -> Page:
+        page = self.repository.list_family_members(
             unit_id, main_resident_id, relationship_type, gender, marital_status,
-            is_emergency_contact, is_authorized_visitor, is_resident
+            is_emergency_contact, is_authorized_visitor, is_resident, cursor, limit
         )
-        return [FamilyMemberOut.from_orm(member) for member in members]
+        return Page([FamilyMemberOut.from_orm(member) for member in page.items], page.next_cursor)
 
-    def search_family_members(self, search_data: FamilyMemberSearchIn) -> List[FamilyMemberOut]:
-        members = self.repository.search_family_members(search_data)
-        return [FamilyMemberOut.from_orm(member) for member in members]
+    def search_family_members(self, search_data: FamilyMemberSearchIn, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        page = self.repository.search_family_members_page(search_data, cursor, limit)
+        return Page([FamilyMemberOut.from_orm(member) for member in page.items], page.next_cursor)
 
     def update_family_member(self, member_id: int, update_data: FamilyMemberUpdate, changed_by: str = "Sistema") -> Optional[FamilyMemberOut]:
         member = self.repository.update_family_member(member_id, update_data)
@@ -130,10 +133,13 @@ class FamilyMemberService:
         members = self.repository.get_recent_family_members(limit)
         return [FamilyMemberOut.from_orm(member) for member in members]
 
-    def get_family_member_stats(self) -> FamilyMemberStatsOut:
-        stats = self.repository.get_family_member_stats()
+    def get_family_member_stats(self, include_members: bool = False, members_limit: Optional[int] = None) -> FamilyMemberStatsOut:
+        stats = self.repository.get_family_member_stats(include_members, members_limit)
         return FamilyMemberStatsOut(**stats)
 
+    def list_members_by_relationship(self, relationship_type: str, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        return self.repository.list_members_by_relationship(relationship_type, cursor, limit)
+
     def get_family_tree(self, main_resident_id: int) -> FamilyTreeOut:
         tree_data = self.repository.get_family_tree(main_resident_id)
         return FamilyTreeOut(**tree_data)
@@ -1,9 +1,13 @@
 from fastapi import FastAPI
 from .app.core.db import engine, Base
 from .app.routers import family_members
+from .app.models.family_members import FamilyMember
+from .shared.search import install_search_extensions, upgrade_search_schema
 
-# Create tables
+# Create tables (as extensões de busca precisam existir antes das colunas/índices)
+install_search_extensions(engine)
 Base.metadata.create_all(bind=engine)
+upgrade_search_schema(engine, FamilyMember.__table__)
 
 app = FastAPI(title="Family Members Service", version="1.0.0")
 
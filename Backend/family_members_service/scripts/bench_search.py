@@ -0,0 +1,160 @@
+"""
+Benchmark da busca textual: ILIKE '%termo%' (sequential scan) contra pg_trgm + tsvector.
+
+Gera uma tabela temporária com ``--rows`` membros sintéticos (nome, cidade, profissão),
+mede cada termo com a busca antiga (ILIKE em todas as colunas) e, depois de criar a coluna
+``search_vector`` e os índices GIN de shared/search.py, com a busca nova (ranqueada). As duas
+buscam a primeira página (LIMIT ``--page``). Mostra mediana das ``--repeat`` execuções e o nó
+principal do plano.
+
+Uso (a partir de Backend/, DATABASE_URL apontando para um PostgreSQL com pg_trgm/unaccent):
+    python -m family_members_service.scripts.bench_search --rows 1000000
+"""
+import argparse
+import os
+import statistics
+import time
+
+import psycopg2
+from sqlalchemy import cast, column, select, table
+from sqlalchemy.dialects import postgresql
+
+from ..shared.search import SEARCH_CONFIG, SEARCH_DDL, text_search
+
+FIRST_NAMES = ['Ana', 'João', 'Maria', 'José', 'Antônio', 'Francisca', 'Conceição', 'Luís', 'Joaquina',
+               'Sebastião', 'Fátima', 'Márcio', 'Letícia', 'Otávio', 'Helena', 'Raimundo', 'Cecília', 'Caio']
+LAST_NAMES = ['Silva', 'Santos', 'Oliveira', 'Souza', 'Lima', 'Pereira', 'Araújo', 'Gonçalves', 'Brandão',
+              'Conceição', 'Magalhães', 'Assunção', 'Rodrigues', 'Damasceno', 'Loureiro', 'Falcão']
+CITIES = ['São Paulo', 'Belém', 'Goiânia', 'Maceió', 'Florianópolis', 'Vitória', 'Niterói', 'Brasília',
+          'Ribeirão Preto', 'São José dos Campos', 'Jundiaí', 'Petrópolis']
+OCCUPATIONS = ['Engenheira civil', 'Médico', 'Professora', 'Advogado', 'Eletricista', 'Analista de sistemas',
+               'Enfermeira', 'Contador', 'Arquiteta', 'Estudante', 'Aposentado', 'Farmacêutica']
+
+# (descrição, termo)
+TERMS = [
+    ('nome raro', 'Joaquina'),
+    ('sobrenome comum', 'Silva'),
+    ('sem acento', 'conceicao'),
+    ('profissão (radical)', 'engenheiro'),
+    ('cidade', 'São José'),
+    ('sem resultado', 'Xenofonte'),
+]
+
+TABLE = 'bench_family_search'
+
+
+def _array(values) -> str:
+    return 'ARRAY[' + ', '.join("'" + v.replace("'", "''") + "'" for v in values) + ']'
+
+
+def _populate(cur, rows: int) -> None:
+    cur.execute(f"""
+        CREATE TEMP TABLE {TABLE} (
+            id SERIAL PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            city VARCHAR(100),
+            occupation VARCHAR(255),
+            created_at TIMESTAMP NOT NULL
+        )""")
+    cur.execute('SELECT setseed(0.42)')
+    first, last = _array(FIRST_NAMES), _array(LAST_NAMES)
+    cur.execute(f"""
+        INSERT INTO {TABLE} (name, city, occupation, created_at)
+        SELECT f[1 + floor(random() * array_length(f, 1))::int] || ' ' ||
+               l[1 + floor(random() * array_length(l, 1))::int] || ' ' ||
+               l[1 + floor(random() * array_length(l, 1))::int],
+               c[1 + floor(random() * array_length(c, 1))::int],
+               o[1 + floor(random() * array_length(o, 1))::int],
+               now() - random() * interval '5 years'
+          FROM generate_series(1, %s),
+               (SELECT {first} AS f, {last} AS l, {_array(CITIES)} AS c, {_array(OCCUPATIONS)} AS o) arrays
+    """, (rows,))
+    # Nome raro de verdade: só algumas linhas
+    cur.execute(f"UPDATE {TABLE} SET name = replace(name, 'Joaquina', 'Ana') WHERE name LIKE 'Joaquina%' AND id % 500 <> 0")
+    cur.execute(f'CREATE INDEX ON {TABLE} (created_at, id)')
+    cur.execute(f'ANALYZE {TABLE}')
+
+
+def _add_search_indexes(cur) -> float:
+    # Mesmas definições de FamilyMember (search_vector_column / trigram_index)
+    started = time.perf_counter()
+    for statement in SEARCH_DDL:
+        cur.execute(statement)
+    vector = ' || '.join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce({name}, '')), '{weight}')"
+        for name, weight in (('name', 'A'), ('occupation', 'B'), ('city', 'C'))
+    )
+    cur.execute(f'ALTER TABLE {TABLE} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED')
+    cur.execute(f'CREATE INDEX ON {TABLE} USING gin (search_vector)')
+    for name in ('name', 'city', 'occupation'):
+        cur.execute(f'CREATE INDEX ON {TABLE} USING gin (f_unaccent({name}) gin_trgm_ops)')
+    cur.execute(f'ANALYZE {TABLE}')
+    return time.perf_counter() - started
+
+
+OLD_QUERY = f"""
+    SELECT id FROM {TABLE}
+     WHERE name ILIKE %(pattern)s OR city ILIKE %(pattern)s OR occupation ILIKE %(pattern)s
+     ORDER BY created_at DESC, id DESC
+     LIMIT %(page)s"""
+
+_bench = table(TABLE, column('id'), column('name'), column('search_vector', postgresql.TSVECTOR))
+
+
+def _search_sql(term: str, page: int) -> str:
+    # SQL que FamilyMemberRepository gera para FamilyMemberSearchIn(query=term) (text_search + ranked_page)
+    match, rank = text_search(_bench.c.search_vector, term, [_bench.c.name])
+    rank = cast(rank, postgresql.DOUBLE_PRECISION).label('search_rank')
+    statement = select(_bench.c.id, rank).where(match).order_by(rank.desc(), _bench.c.id.desc()).limit(page)
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True}))
+
+
+def _measure(cur, sql: str, params: dict, repeat: int):
+    timings = []
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cur.execute(sql, params)
+        rows = len(cur.fetchall())
+        timings.append(time.perf_counter() - started)
+    cur.execute('EXPLAIN ' + sql, params)
+    plan = [line for (line,) in cur.fetchall()]
+    scan = next((line.strip(' ->') for line in plan if 'Scan' in line), plan[0]).split('  (')[0]
+    return statistics.median(timings) * 1000, rows, scan
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', default=os.getenv('DATABASE_URL', ''))
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--page', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(args.database_url)
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        started = time.perf_counter()
+        _populate(cur, args.rows)
+        print(f'{args.rows} linhas geradas em {time.perf_counter() - started:.1f}s')
+
+        def params(term):
+            return {'term': term, 'pattern': f'%{term}%', 'page': args.page}
+
+        before = {term: _measure(cur, OLD_QUERY, params(term), args.repeat) for _, term in TERMS}
+        print(f'índices de busca criados em {_add_search_indexes(cur):.1f}s')
+        after = {term: _measure(cur, _search_sql(term, args.page), {}, args.repeat) for _, term in TERMS}
+
+        print(f'\n{"termo":32}{"ILIKE ms":>10}{"linhas":>8}{"busca ms":>10}{"linhas":>8}  plano (ILIKE -> busca)')
+        for label, term in TERMS:
+            (old_ms, old_rows, old_scan), (new_ms, new_rows, new_scan) = before[term], after[term]
+            print(f'{label + " (" + term + ")":32}{old_ms:>10.1f}{old_rows:>8}{new_ms:>10.1f}{new_rows:>8}  '
+                  f'{old_scan} -> {new_scan}')
+    finally:
+        cur.execute(f'DROP TABLE IF EXISTS {TABLE}')
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
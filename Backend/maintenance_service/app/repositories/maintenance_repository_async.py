@@ -0,0 +1,70 @@
+from typing import Optional
+from shared.async_db import to_db_timestamp
+from shared.pagination import Page, decode_cursor, fetch_limit, list_size, page_from_rows
+from ..core.db import async_pool
+
+# Consultas fixas em constantes: cada uma é preparada uma vez por conexão pelo asyncpg
+LIST_ORDERS = '''SELECT id, unit_id, title, description, priority, category,
+                 requested_by, status, expected_date, assigned_to, completed_date, created_at
+                 FROM maintenance_orders ORDER BY created_at DESC, id DESC LIMIT $1'''
+LIST_ORDERS_AFTER = '''SELECT id, unit_id, title, description, priority, category,
+                       requested_by, status, expected_date, assigned_to, completed_date, created_at
+                       FROM maintenance_orders WHERE (created_at, id) < ($2, $3)
+                       ORDER BY created_at DESC, id DESC LIMIT $1'''
+# Cursor numa linha com created_at NULL (vêm primeiro no DESC): as outras NULL de id menor e depois as datadas
+LIST_ORDERS_AFTER_NULL = '''SELECT id, unit_id, title, description, priority, category,
+                            requested_by, status, expected_date, assigned_to, completed_date, created_at
+                            FROM maintenance_orders WHERE (created_at IS NOT NULL OR id < $2)
+                            ORDER BY created_at DESC, id DESC LIMIT $1'''
+GET_ORDER = '''SELECT id, unit_id, title, description, priority, category,
+               requested_by, status, expected_date, assigned_to, completed_date, created_at
+               FROM maintenance_orders WHERE id=$1'''
+INSERT_ORDER = '''INSERT INTO maintenance_orders (unit_id, title, description,
+                  priority, category, requested_by, status, expected_date)
+                  VALUES ($1, $2, $3, $4, $5, $6, 'open', $7) RETURNING id'''
+# Campos nulos mantêm o valor atual, como no UPDATE dinâmico do repositório síncrono
+UPDATE_ORDER = '''UPDATE maintenance_orders SET status = COALESCE($1, status),
+                  assigned_to = COALESCE($2, assigned_to),
+                  completed_date = COALESCE($3, completed_date)
+                  WHERE id = $4'''
+DELETE_ORDER = 'DELETE FROM maintenance_orders WHERE id=$1'
+
+
+async def list_maintenance_orders(cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    size = list_size(limit, cursor)
+    position = decode_cursor(cursor)
+    async with async_pool.connection() as conn:
+        if position is None:
+            rows = await conn.fetch(LIST_ORDERS, fetch_limit(size))
+        elif position[0] is None:
+            rows = await conn.fetch(LIST_ORDERS_AFTER_NULL, fetch_limit(size), position[1])
+        else:
+            rows = await conn.fetch(LIST_ORDERS_AFTER, fetch_limit(size), *position)
+    return page_from_rows(rows, size, lambda r: (r[11], r[0]))
+
+
+async def get_maintenance_order(order_id: int) -> Optional[tuple]:
+    async with async_pool.connection() as conn:
+        return await conn.fetchrow(GET_ORDER, order_id)
+
+
+async def create_maintenance_order(unit_id: int, title: str, description: str,
+                                   priority: str, category: str, requested_by: int,
+                                   expected_date=None) -> int:
+    async with async_pool.connection() as conn:
+        return await conn.fetchval(INSERT_ORDER, unit_id, title, description, priority, category,
+                                   requested_by, to_db_timestamp(expected_date))
+
+
+async def update_maintenance_order(order_id: int, status: str = None,
+                                   assigned_to: str = None, completed_date=None) -> None:
+    if not (status or assigned_to or completed_date):
+        return
+    async with async_pool.connection() as conn:
+        await conn.execute(UPDATE_ORDER, status or None, assigned_to or None,
+                           to_db_timestamp(completed_date), order_id)
+
+
+async def delete_maintenance_order(order_id: int) -> None:
+    async with async_pool.connection() as conn:
+        await conn.execute(DELETE_ORDER, order_id)
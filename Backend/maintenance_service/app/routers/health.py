@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
 from shared import auth_client
+from shared.pagination import set_next_cursor
 from ..schemas.maintenance import MaintenanceIn, MaintenanceOut, MaintenanceUpdate
 from ..services.maintenance_service import list_maintenance_orders, get_maintenance_order, create_maintenance_order, assign_maintenance_order, complete_maintenance_order, delete_maintenance_order
 
@@ -19,8 +20,8 @@ def info():
 
 
 @router.get('/maintenance', response_model=List[MaintenanceOut], dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
-def list_maintenance_orders_ep():
-    return list_maintenance_orders()
+def list_maintenance_orders_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1)):
+    return set_next_cursor(response, list_maintenance_orders(cursor, limit))
 
 
 @router.get('/maintenance/{order_id}', response_model=MaintenanceOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
 from shared import auth_client
+from shared.pagination import set_next_cursor
 from ..services import maintenance_service as svc
 
 
@@ -8,8 +9,8 @@ router = APIRouter(prefix='/maintenance', tags=['maintenance'])
 
 
 @router.get('', dependencies=[Depends(auth_client.get_current_user)])
-def list_orders_ep():
-    return svc.list_maintenance_orders()
+def list_orders_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1)):
+    return set_next_cursor(response, svc.list_maintenance_orders(cursor, limit))
 
 
 @router.post('', dependencies=[Depends(auth_client.get_current_user)])
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
+from shared import auth_client
+from shared.pagination import set_next_cursor
+from ..schemas.maintenance import MaintenanceIn, MaintenanceOut
+from ..services import maintenance_service_async as svc
+
+
+# Mesmas rotas de app/routers/health.py, em async def sobre o pool asyncpg (DB_DRIVER=asyncpg)
+router = APIRouter(prefix='', tags=['maintenance'])
+
+
+@router.get('/health')
+async def health():
+    return {'status': 'ok'}
+
+
+@router.get('/info')
+async def info():
+    return {'service': 'Maintenance Service'}
+
+
+@router.get('/maintenance', response_model=List[MaintenanceOut], dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def list_maintenance_orders_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1)):
+    return set_next_cursor(response, await svc.list_maintenance_orders(cursor, limit))
+
+
+@router.get('/maintenance/{order_id}', response_model=MaintenanceOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def get_maintenance_order_ep(order_id: int):
+    return await svc.get_maintenance_order(order_id)
+
+
+@router.post('/maintenance', response_model=MaintenanceOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def create_maintenance_order_ep(order: MaintenanceIn):
+    return await svc.create_maintenance_order(order.unit_id, order.title, order.description,
+                                              order.priority, order.category, order.requested_by,
+                                              order.expected_date)
+
+
+@router.post('/maintenance/{order_id}/assign', response_model=MaintenanceOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def assign_maintenance_order_ep(order_id: int, assigned_to: str):
+    return await svc.assign_maintenance_order(order_id, assigned_to)
+
+
+@router.post('/maintenance/{order_id}/complete', response_model=MaintenanceOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def complete_maintenance_order_ep(order_id: int):
+    return await svc.complete_maintenance_order(order_id)
+
+
+@router.delete('/maintenance/{order_id}', dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def delete_maintenance_order_ep(order_id: int):
+    return await svc.delete_maintenance_order(order_id)
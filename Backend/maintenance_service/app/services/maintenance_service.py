@@ -1,26 +1,27 @@
 from fastapi import HTTPException
 from datetime import datetime
+from shared.pagination import Page
 from ..repositories import maintenance_repository as repo
 
 
-def list_maintenance_orders():
-    rows = repo.list_maintenance_orders()
-    return [{
+def row_to_order(r):
+    return {
         'id': r[0], 'unit_id': r[1], 'title': r[2], 'description': r[3],
         'priority': r[4], 'category': r[5], 'requested_by': r[6], 'status': r[7],
         'expected_date': r[8], 'assigned_to': r[9], 'completed_date': r[10], 'created_at': r[11]
-    } for r in rows]
+    }
+
+
+def list_maintenance_orders(cursor: str = None, limit: int = None) -> Page:
+    page = repo.list_maintenance_orders(cursor, limit)
+    return Page([row_to_order(r) for r in page.items], page.next_cursor)
 
 
 def get_maintenance_order(order_id: int):
     row = repo.get_maintenance_order(order_id)
     if not row:
         raise HTTPException(status_code=404, detail='Maintenance order not found')
-    return {
-        'id': row[0], 'unit_id': row[1], 'title': row[2], 'description': row[3],
-        'priority': row[4], 'category': row[5], 'requested_by': row[6], 'status': row[7],
-        'expected_date': row[8], 'assigned_to': row[9], 'completed_date': row[10], 'created_at': row[11]
-    }
+    return row_to_order(row)
 
 
 def create_maintenance_order(unit_id: int, title: str, description: str, 
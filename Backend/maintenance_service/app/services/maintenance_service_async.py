@@ -0,0 +1,55 @@
+from fastapi import HTTPException
+from datetime import datetime
+from shared.pagination import Page
+from ..repositories import maintenance_repository_async as repo
+from .maintenance_service import row_to_order
+
+
+async def list_maintenance_orders(cursor: str = None, limit: int = None) -> Page:
+    page = await repo.list_maintenance_orders(cursor, limit)
+    return Page([row_to_order(r) for r in page.items], page.next_cursor)
+
+
+async def get_maintenance_order(order_id: int):
+    row = await repo.get_maintenance_order(order_id)
+    if not row:
+        raise HTTPException(status_code=404, detail='Maintenance order not found')
+    return row_to_order(row)
+
+
+async def create_maintenance_order(unit_id: int, title: str, description: str,
+                                   priority: str, category: str, requested_by: int,
+                                   expected_date=None):
+    try:
+        order_id = await repo.create_maintenance_order(unit_id, title, description,
+                                                       priority, category, requested_by, expected_date)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await get_maintenance_order(order_id)
+
+
+async def assign_maintenance_order(order_id: int, assigned_to: str):
+    order = await get_maintenance_order(order_id)
+    if order['status'] != 'open':
+        raise HTTPException(status_code=400, detail='Order is not open for assignment')
+
+    await repo.update_maintenance_order(order_id, status='assigned', assigned_to=assigned_to)
+    return await get_maintenance_order(order_id)
+
+
+async def complete_maintenance_order(order_id: int):
+    order = await get_maintenance_order(order_id)
+    if order['status'] not in ['assigned', 'in_progress']:
+        raise HTTPException(status_code=400, detail='Order is not assigned or in progress')
+
+    await repo.update_maintenance_order(order_id, status='completed', completed_date=datetime.now())
+    return await get_maintenance_order(order_id)
+
+
+async def delete_maintenance_order(order_id: int):
+    order = await get_maintenance_order(order_id)
+    if order['status'] in ['completed']:
+        raise HTTPException(status_code=400, detail='Cannot delete completed order')
+
+    await repo.delete_maintenance_order(order_id)
+    return {'message': 'Maintenance order deleted successfully'}
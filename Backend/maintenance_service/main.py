@@ -1,9 +1,32 @@
-
 from fastapi import FastAPI
-from app.routers.health import router as health_router
-from app.routers.maintenance import router as maintenance_router
+from app.core.config import settings
+from app.core.db import pool, async_pool
+from shared.db_pool import PoolScopeMiddleware
 
 app = FastAPI(title='Maintenance Service')
 
-app.include_router(health_router)
-app.include_router(maintenance_router)
+if settings.db_driver == 'asyncpg':
+    from app.routers.maintenance_async import router as maintenance_async_router
+
+    app.include_router(maintenance_async_router)
+else:
+    from app.routers.health import router as health_router
+    from app.routers.maintenance import router as maintenance_router
+
+    app.add_middleware(PoolScopeMiddleware, pool=pool)
+    app.include_router(health_router)
+    app.include_router(maintenance_router)
+
+@app.get('/metrics/db-pool')
+def db_pool_metrics():
+    return (async_pool if settings.db_driver == 'asyncpg' else pool).stats()
+
+@app.on_event('startup')
+async def open_async_pool():
+    if settings.db_driver == 'asyncpg':
+        await async_pool.open()
+
+@app.on_event('shutdown')
+async def close_db_pools():
+    await async_pool.close()
+    pool.close()
@@ -8,11 +8,16 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     tenant_id: Optional[int] = None
+    reminder_batch_size: int = 200  # reminders claimed and sent per batch
+    reminder_check_interval: float = 60.0  # seconds between scheduler passes
+    meeting_reminder_hours: int = 24  # how long before scheduled_date the reminder goes out
+    notifications_service_url: str = "http://notifications_service:8020"  # reminders go out through its bulk endpoint
     smtp_host: str = "smtp.gmail.com"
     smtp_port: int = 587
     smtp_username: str = ""
     smtp_password: str = ""
     smtp_from_email: str = ""
+    smtp_bcc_batch_size: int = 50  # recipients per message in bulk sends (provider limit)
     
     class Config:
         env_file = ".env"
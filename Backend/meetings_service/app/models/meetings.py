@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, Float
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
@@ -28,12 +28,23 @@ class Meeting(Base):
     started_at = Column(DateTime)
     ended_at = Column(DateTime)
     actual_attendees = Column(JSON)  # List of strings
+    # When the reminder is due (kept by the repository) and when it was sent (or claimed)
+    remind_at = Column(DateTime)
+    reminder_sent_at = Column(DateTime)
 
     # Relationships
     history = relationship("MeetingHistory", back_populates="meeting", cascade="all, delete-orphan")
     invitations = relationship("MeetingInvitation", back_populates="meeting", cascade="all, delete-orphan")
     minutes = relationship("MeetingMinutes", back_populates="meeting", cascade="all, delete-orphan")
 
+    # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+    __table_args__ = (
+        Index('idx_meetings_created_id', 'created_at', 'id'),
+        # Pending reminders only: a scheduler pass reads just the due ones
+        Index('idx_meetings_remind_at', 'remind_at', 'id', postgresql_where=reminder_sent_at.is_(None),
+              sqlite_where=reminder_sent_at.is_(None)),
+    )
+
 
 class MeetingHistory(Base):
     __tablename__ = "meeting_history"
@@ -58,7 +69,7 @@ class MeetingInvitation(Base):
     name = Column(String(255), nullable=False)
     role = Column(String(100))
     sent_at = Column(DateTime, default=datetime.utcnow)
-    status = Column(String(50), default="sent")  # sent, delivered, opened, responded
+    status = Column(String(50), default="sent")  # sent, failed, delivered, opened, responded
 
     # Relationships
     meeting = relationship("Meeting", back_populates="invitations")
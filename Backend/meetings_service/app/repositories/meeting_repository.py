@@ -1,8 +1,12 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..models.meetings import Meeting, MeetingHistory, MeetingInvitation, MeetingMinutes
-from ..schemas.meetings import MeetingIn, MeetingUpdate, MeetingHistoryIn, MeetingInvitationIn, MeetingMinutesIn
+from ..schemas.meetings import MeetingStatus, MeetingIn, MeetingOut, MeetingUpdate, MeetingHistoryIn, MeetingInvitationIn, MeetingMinutesIn
+from ..core.config import settings
 from datetime import datetime, timedelta
+from ...shared.pagination import Page, keyset_page
+from ...shared.query_shaping import project
+from ...shared.aggregates import grouped_stats
 
 
 class MeetingRepository:
@@ -25,6 +29,7 @@ class MeetingRepository:
             unit_id=meeting_data.unit_id,
             created_by=meeting_data.organizer
         )
+        self._schedule_reminder(db_meeting)
         
         self.db.add(db_meeting)
         self.db.flush()  # Get the ID
@@ -42,14 +47,34 @@ class MeetingRepository:
         self.db.refresh(db_meeting)
         return db_meeting
 
-    def get_meeting(self, meeting_id: int) -> Optional[Meeting]:
-        return self.db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    def get_meeting(self, meeting_id: int, *options) -> Optional[Meeting]:
+        """``options``: loader options for what the caller reads next, e.g. ``joinedload(Meeting.invitations)``"""
+        return self.db.query(Meeting).options(*options).filter(Meeting.id == meeting_id).first()
 
     def list_meetings(self, 
                      meeting_type: Optional[str] = None, 
                      status: Optional[str] = None,
                      start_date: Optional[datetime] = None,
-                     end_date: Optional[datetime] = None) -> List[Meeting]:
+                     end_date: Optional[datetime] = None,
+                     cursor: Optional[str] = None,
+                     limit: Optional[int] = None) -> Page:
+        query = project(self._meetings_query(meeting_type, status, start_date, end_date), MeetingOut)
+        return keyset_page(query, Meeting.created_at, Meeting.id, cursor, limit)
+
+    def find_meetings(self, 
+                      meeting_type: Optional[str] = None, 
+                      status: Optional[str] = None,
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None) -> List:
+        # Read-only listings return rows with MeetingOut's columns, not entities
+        query = project(self._meetings_query(meeting_type, status, start_date, end_date), MeetingOut)
+        return query.order_by(Meeting.scheduled_date.asc()).all()
+
+    def _meetings_query(self, 
+                        meeting_type: Optional[str] = None, 
+                        status: Optional[str] = None,
+                        start_date: Optional[datetime] = None,
+                        end_date: Optional[datetime] = None):
         query = self.db.query(Meeting)
         
         if meeting_type:
@@ -61,20 +86,20 @@ class MeetingRepository:
         if end_date:
             query = query.filter(Meeting.scheduled_date <= end_date)
             
-        return query.order_by(Meeting.scheduled_date.asc()).all()
+        return query
 
-    def get_upcoming_meetings(self, days_ahead: int = 30) -> List[Meeting]:
+    def get_upcoming_meetings(self, days_ahead: int = 30) -> List:
         today = datetime.utcnow()
         future_date = today + timedelta(days=days_ahead)
         
-        return self.db.query(Meeting).filter(
+        return project(self.db.query(Meeting), MeetingOut).filter(
             Meeting.scheduled_date >= today,
             Meeting.scheduled_date <= future_date,
             Meeting.status.in_(["scheduled", "in_progress"])
         ).order_by(Meeting.scheduled_date.asc()).all()
 
-    def get_meetings_by_organizer(self, organizer: str) -> List[Meeting]:
-        return self.db.query(Meeting).filter(
+    def get_meetings_by_organizer(self, organizer: str) -> List:
+        return project(self.db.query(Meeting), MeetingOut).filter(
             Meeting.organizer == organizer
         ).order_by(Meeting.scheduled_date.desc()).all()
 
@@ -86,6 +111,7 @@ class MeetingRepository:
         update_dict = update_data.dict(exclude_unset=True)
         for field, value in update_dict.items():
             setattr(db_meeting, field, value)
+        self._schedule_reminder(db_meeting)
         
         db_meeting.updated_at = datetime.utcnow()
         
@@ -108,6 +134,7 @@ class MeetingRepository:
             return None
         
         db_meeting.status = "in_progress"
+        self._schedule_reminder(db_meeting)
         db_meeting.started_at = datetime.utcnow()
         db_meeting.updated_at = datetime.utcnow()
         
@@ -130,6 +157,7 @@ class MeetingRepository:
             return None
         
         db_meeting.status = "completed"
+        self._schedule_reminder(db_meeting)
         db_meeting.ended_at = datetime.utcnow()
         db_meeting.updated_at = datetime.utcnow()
         
@@ -155,6 +183,7 @@ class MeetingRepository:
             return None
         
         db_meeting.status = "cancelled"
+        self._schedule_reminder(db_meeting)
         db_meeting.updated_at = datetime.utcnow()
         
         # Add history entry
@@ -179,6 +208,29 @@ class MeetingRepository:
         self.db.commit()
         return True
 
+    def get_meetings_requiring_reminder(self) -> List:
+        """Upcoming meetings whose reminder is due and not sent yet (served by idx_meetings_remind_at)."""
+        now = datetime.utcnow()
+        return project(self.db.query(Meeting), MeetingOut).filter(
+            Meeting.reminder_sent_at.is_(None),
+            Meeting.remind_at <= now,
+            Meeting.scheduled_date >= now
+        ).order_by(Meeting.remind_at.asc(), Meeting.id.asc()).all()
+
+    def get_meetings_by_ids(self, meeting_ids: List[int], *options) -> List[Meeting]:
+        return self.db.query(Meeting).options(*options).filter(Meeting.id.in_(meeting_ids)).all()
+
+    @staticmethod
+    def _schedule_reminder(meeting: Meeting) -> None:
+        remind_at = None
+        # Only meetings still to happen get a reminder; status is None before the insert applies the default
+        if meeting.status in (None, MeetingStatus.SCHEDULED) and meeting.scheduled_date is not None:
+            remind_at = meeting.scheduled_date - timedelta(hours=settings.meeting_reminder_hours)
+        if remind_at != meeting.remind_at:
+            # New date, new reminder (even if the previous one was already sent)
+            meeting.remind_at = remind_at
+            meeting.reminder_sent_at = None
+
     def get_meeting_history(self, meeting_id: int) -> List[MeetingHistory]:
         return self.db.query(MeetingHistory).filter(
             MeetingHistory.meeting_id == meeting_id
@@ -210,6 +262,21 @@ class MeetingRepository:
         self.db.refresh(db_invitation)
         return db_invitation
 
+    def create_invitations(self, meeting_id: int, invitations: List[dict]) -> int:
+        """Insert every invitation of a meeting with a single executemany and one commit."""
+        now = datetime.utcnow()
+        rows = [dict(invitation, meeting_id=meeting_id, sent_at=now, status="sent") for invitation in invitations]
+        self.db.bulk_insert_mappings(MeetingInvitation, rows)
+        self.db.commit()
+        return len(rows)
+
+    def mark_invitations_failed(self, meeting_id: int, emails: List[str]) -> None:
+        self.db.query(MeetingInvitation).filter(
+            MeetingInvitation.meeting_id == meeting_id,
+            MeetingInvitation.email.in_(emails)
+        ).update({MeetingInvitation.status: "failed"}, synchronize_session=False)
+        self.db.commit()
+
     def get_meeting_invitations(self, meeting_id: int) -> List[MeetingInvitation]:
         return self.db.query(MeetingInvitation).filter(
             MeetingInvitation.meeting_id == meeting_id
@@ -241,14 +308,10 @@ class MeetingRepository:
             Meeting.scheduled_date <= end_date
         )
         
-        total_meetings = query.count()
-        
-        type_breakdown = {}
-        status_breakdown = {}
-        
-        for meeting in query.all():
-            type_breakdown[meeting.meeting_type] = type_breakdown.get(meeting.meeting_type, 0) + 1
-            status_breakdown[meeting.status] = status_breakdown.get(meeting.status, 0) + 1
+        stats = grouped_stats(query, {"type": Meeting.meeting_type, "status": Meeting.status})
+        total_meetings = stats["total"]
+        type_breakdown = stats["breakdowns"]["type"]
+        status_breakdown = stats["breakdowns"]["status"]
         
         return {
             "total_meetings": total_meetings,
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.db import get_db
 from ..schemas.meetings import MeetingIn, MeetingOut, MeetingUpdate, MeetingHistoryIn, MeetingInvitationIn, MeetingMinutesIn
 from ..services.meeting_service import MeetingService
 from datetime import datetime
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/meetings", tags=["meetings"])
 
@@ -17,10 +18,13 @@ def create_meeting(meeting_data: MeetingIn, db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[MeetingOut])
 def list_meetings(
+    response: Response,
     meeting_type: Optional[str] = None,
     status: Optional[str] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = MeetingService(db)
@@ -40,7 +44,7 @@ def list_meetings(
         except ValueError:
             raise HTTPException(status_code=400, detail="Formato de data de fim inválido")
     
-    return service.list_meetings(meeting_type, status, start_dt, end_dt)
+    return set_next_cursor(response, service.list_meetings(meeting_type, status, start_dt, end_dt, cursor, limit))
 
 
 @router.get("/{meeting_id}", response_model=MeetingOut)
@@ -4,11 +4,16 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 from typing import List, Optional
+from pathlib import Path
 from ..core.config import settings
+from ...shared.templates import jinja_environment, render_email
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Compiled on first use and kept for the life of the process
+templates = jinja_environment(str(Path(__file__).resolve().parent.parent / "templates"))
+
 
 class EmailService:
     def __init__(self):
@@ -18,26 +23,43 @@ class EmailService:
         self.smtp_password = settings.smtp_password
         self.from_email = settings.smtp_from_email
 
-    def send_email(self, to_emails: List[str], subject: str, body: str, html_body: Optional[str] = None) -> bool:
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
         try:
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.from_email
-            msg['To'] = ', '.join(to_emails)
-            msg['Subject'] = subject
+            server.ehlo()
+            if server.has_extn('starttls'):
+                server.starttls()
+                server.ehlo()
+            if self.smtp_username:
+                server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            # Handshake or login failed: do not leave the socket open
+            server.close()
+            raise
+        return server
+
+    def _build_message(self, to_header: str, subject: str, body: str, html_body: Optional[str] = None) -> MIMEMultipart:
+        msg = MIMEMultipart('alternative')
+        msg['From'] = self.from_email
+        msg['To'] = to_header
+        msg['Subject'] = subject
+
+        # Add text body
+        text_part = MIMEText(body, 'plain', 'utf-8')
+        msg.attach(text_part)
+
+        # Add HTML body if provided
+        if html_body:
+            html_part = MIMEText(html_body, 'html', 'utf-8')
+            msg.attach(html_part)
+        return msg
 
-            # Add text body
-            text_part = MIMEText(body, 'plain', 'utf-8')
-            msg.attach(text_part)
-
-            # Add HTML body if provided
-            if html_body:
-                html_part = MIMEText(html_body, 'html', 'utf-8')
-                msg.attach(html_part)
+    def send_email(self, to_emails: List[str], subject: str, body: str, html_body: Optional[str] = None) -> bool:
+        try:
+            msg = self._build_message(', '.join(to_emails), subject, body, html_body)
 
             # Connect to SMTP server
-            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-            server.starttls()
-            server.login(self.smtp_username, self.smtp_password)
+            server = self._connect()
 
             # Send email
             server.send_message(msg)
@@ -50,154 +72,73 @@ class EmailService:
             logger.error(f"Failed to send email: {str(e)}")
             return False
 
-    def send_meeting_invitation(self, meeting_data: dict, attendee_emails: List[str]) -> bool:
-        subject = f"Convite para Reunião: {meeting_data['title']}"
-        
-        body = f"""
-        Prezado(a) Morador(a),
-
-        Você está convidado(a) para participar da reunião:
-
-        Título: {meeting_data['title']}
-        Data: {meeting_data['scheduled_date'].strftime('%d/%m/%Y às %H:%M')}
-        Local: {meeting_data['location']}
-        Organizador: {meeting_data['organizer']}
-
-        Descrição:
-        {meeting_data['description']}
-
-        Pauta:
-        {chr(10).join([f"- {item}" for item in meeting_data['agenda_items']])}
-
-        Atenciosamente,
-        Administração do Condomínio
+    def send_bulk_email(self, to_emails: List[str], subject: str, body: str, html_body: Optional[str] = None) -> List[str]:
         """
+        Send the same message to many recipients over a single SMTP session.
 
-        html_body = f"""
-        <html>
-        <body>
-            <h2>Convite para Reunião</h2>
-            <p>Prezado(a) Morador(a),</p>
-            <p>Você está convidado(a) para participar da reunião:</p>
-            
-            <div style="background-color: #f5f5f5; padding: 15px; border-radius: 5px; margin: 10px 0;">
-                <h3>{meeting_data['title']}</h3>
-                <p><strong>Data:</strong> {meeting_data['scheduled_date'].strftime('%d/%m/%Y às %H:%M')}</p>
-                <p><strong>Local:</strong> {meeting_data['location']}</p>
-                <p><strong>Organizador:</strong> {meeting_data['organizer']}</p>
-            </div>
-            
-            <p><strong>Descrição:</strong></p>
-            <p>{meeting_data['description']}</p>
-            
-            <p><strong>Pauta:</strong></p>
-            <ul>
-                {''.join([f'<li>{item}</li>' for item in meeting_data['agenda_items']])}
-            </ul>
-            
-            <p>Atenciosamente,<br>Administração do Condomínio</p>
-        </body>
-        </html>
+        Recipients only go in the envelope (BCC), ``smtp_bcc_batch_size`` per message: nobody sees
+        the other addresses and the provider's per-message recipient limit is respected. A dropped
+        connection is reopened once. Returns the recipients that were not accepted.
         """
-
-        return self.send_email(attendee_emails, subject, body, html_body)
+        recipients = list(dict.fromkeys(to_emails))
+        size = max(1, settings.smtp_bcc_batch_size)
+        batches = [recipients[i:i + size] for i in range(0, len(recipients), size)]
+        msg = self._build_message('undisclosed-recipients:;', subject, body, html_body)
+        failed: List[str] = []
+        server = None
+        try:
+            for index, batch in enumerate(batches):
+                for attempt in (1, 2):
+                    try:
+                        if server is None:
+                            server = self._connect()
+                        failed.extend(server.send_message(msg, to_addrs=batch))
+                    except smtplib.SMTPRecipientsRefused as e:
+                        failed.extend(e.recipients)
+                    except smtplib.SMTPResponseException as e:
+                        if e.smtp_code == 421 and attempt == 1:
+                            # Service closing the channel: same as a lost connection.
+                            # A 421 greeting (SMTPConnectError) arrives before there is a session.
+                            if server is not None:
+                                server.close()
+                            server = None
+                            continue
+                        logger.error(f"Bulk email batch refused: {e.smtp_code} {e.smtp_error!r}")
+                        failed.extend(batch)
+                    except OSError as e:
+                        # Connection lost (or never opened): retry the batch once on a new session
+                        if server is not None:
+                            server.close()
+                        server = None
+                        if attempt == 1:
+                            continue
+                        logger.error(f"Failed to send bulk email: {str(e)}")
+                        for remaining in batches[index:]:
+                            failed.extend(remaining)
+                        return failed
+                    break
+        finally:
+            if server is not None:
+                try:
+                    server.quit()
+                except Exception:
+                    server.close()
+
+        logger.info(f"Email sent to {len(recipients) - len(failed)} of {len(recipients)} recipients "
+                    f"in {len(batches)} messages")
+        return failed
+
+    def send_meeting_invitation(self, meeting_data: dict, attendee_emails: List[str]) -> List[str]:
+        """Returns the attendees the invitation could not be delivered to."""
+        email = render_email(templates, "meeting_invitation.jinja", {"meeting": meeting_data})
+        return self.send_bulk_email(attendee_emails, email.subject, email.text, email.html)
 
     def send_meeting_reminder(self, meeting_data: dict, attendee_emails: List[str]) -> bool:
-        subject = f"Lembrete: Reunião {meeting_data['title']} - {meeting_data['scheduled_date'].strftime('%d/%m/%Y')}"
-        
-        body = f"""
-        Prezado(a) Morador(a),
-
-        Este é um lembrete sobre a reunião:
-
-        Título: {meeting_data['title']}
-        Data: {meeting_data['scheduled_date'].strftime('%d/%m/%Y às %H:%M')}
-        Local: {meeting_data['location']}
-
-        Não se esqueça de participar!
-
-        Atenciosamente,
-        Administração do Condomínio
-        """
-
-        html_body = f"""
-        <html>
-        <body>
-            <h2>Lembrete de Reunião</h2>
-            <p>Prezado(a) Morador(a),</p>
-            <p>Este é um lembrete sobre a reunião:</p>
-            
-            <div style="background-color: #fff3cd; padding: 15px; border-radius: 5px; margin: 10px 0; border-left: 4px solid #ffc107;">
-                <h3>{meeting_data['title']}</h3>
-                <p><strong>Data:</strong> {meeting_data['scheduled_date'].strftime('%d/%m/%Y às %H:%M')}</p>
-                <p><strong>Local:</strong> {meeting_data['location']}</p>
-            </div>
-            
-            <p><strong>Não se esqueça de participar!</strong></p>
-            
-            <p>Atenciosamente,<br>Administração do Condomínio</p>
-        </body>
-        </html>
-        """
-
-        return self.send_email(attendee_emails, subject, body, html_body)
+        email = render_email(templates, "meeting_reminder.jinja", {"meeting": meeting_data})
+        failed = self.send_bulk_email(attendee_emails, email.subject, email.text, email.html)
+        return len(failed) < len(attendee_emails)
 
     def send_meeting_minutes(self, meeting_data: dict, minutes_data: dict, attendee_emails: List[str]) -> bool:
-        subject = f"Ata da Reunião: {meeting_data['title']} - {meeting_data['scheduled_date'].strftime('%d/%m/%Y')}"
-        
-        body = f"""
-        Prezado(a) Morador(a),
-
-        Segue em anexo a ata da reunião:
-
-        Título: {meeting_data['title']}
-        Data: {meeting_data['scheduled_date'].strftime('%d/%m/%Y às %H:%M')}
-        Local: {meeting_data['location']}
-
-        Resumo da Ata:
-        {minutes_data['content']}
-
-        Decisões Tomadas:
-        {chr(10).join([f"- {decision}" for decision in minutes_data['decisions']])}
-
-        Itens de Ação:
-        {chr(10).join([f"- {item}" for item in minutes_data['action_items']])}
-
-        Atenciosamente,
-        Administração do Condomínio
-        """
-
-        html_body = f"""
-        <html>
-        <body>
-            <h2>Ata da Reunião</h2>
-            <p>Prezado(a) Morador(a),</p>
-            <p>Segue a ata da reunião:</p>
-            
-            <div style="background-color: #f5f5f5; padding: 15px; border-radius: 5px; margin: 10px 0;">
-                <h3>{meeting_data['title']}</h3>
-                <p><strong>Data:</strong> {meeting_data['scheduled_date'].strftime('%d/%m/%Y às %H:%M')}</p>
-                <p><strong>Local:</strong> {meeting_data['location']}</p>
-            </div>
-            
-            <h3>Resumo da Ata:</h3>
-            <p>{minutes_data['content']}</p>
-            
-            <h3>Decisões Tomadas:</h3>
-            <ul>
-                {''.join([f'<li>{decision}</li>' for decision in minutes_data['decisions']])}
-            </ul>
-            
-            <h3>Itens de Ação:</h3>
-            <ul>
-                {''.join([f'<li>{item}</li>' for item in minutes_data['action_items']])}
-            </ul>
-            
-            <p>Atenciosamente,<br>Administração do Condomínio</p>
-        </body>
-        </html>
-        """
-
-        return self.send_email(attendee_emails, subject, body, html_body)
-
-
+        email = render_email(templates, "meeting_minutes.jinja", {"meeting": meeting_data, "minutes": minutes_data})
+        failed = self.send_bulk_email(attendee_emails, email.subject, email.text, email.html)
+        return len(failed) < len(attendee_emails)
@@ -1,9 +1,11 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
+from ..models.meetings import Meeting
 from ..repositories.meeting_repository import MeetingRepository
-from ..schemas.meetings import MeetingIn, MeetingOut, MeetingUpdate, MeetingHistoryIn, MeetingInvitationIn, MeetingMinutesIn
+from ..schemas.meetings import MeetingIn, MeetingOut, MeetingUpdate, MeetingHistoryIn, MeetingMinutesIn
 from ..services.email_service import EmailService
-from datetime import datetime, timedelta
+from datetime import datetime
+from ...shared.pagination import Page
 
 
 class MeetingService:
@@ -25,9 +27,11 @@ class MeetingService:
                      meeting_type: Optional[str] = None, 
                      status: Optional[str] = None,
                      start_date: Optional[datetime] = None,
-                     end_date: Optional[datetime] = None) -> List[MeetingOut]:
-        meetings = self.repository.list_meetings(meeting_type, status, start_date, end_date)
-        return [MeetingOut.from_orm(meeting) for meeting in meetings]
+                     end_date: Optional[datetime] = None,
+                     cursor: Optional[str] = None,
+                     limit: Optional[int] = None) -> Page:
+        page = self.repository.list_meetings(meeting_type, status, start_date, end_date, cursor, limit)
+        return Page([MeetingOut.from_orm(meeting) for meeting in page.items], page.next_cursor)
 
     def get_upcoming_meetings(self, days_ahead: int = 30) -> List[MeetingOut]:
         meetings = self.repository.get_upcoming_meetings(days_ahead)
@@ -93,15 +97,12 @@ class MeetingService:
         if not meeting:
             return False
         
-        # Create invitation records
-        for email in attendee_emails:
-            invitation_data = MeetingInvitationIn(
-                meeting_id=meeting_id,
-                email=email,
-                name=email.split('@')[0],  # Use email prefix as name
-                role="attendee"
-            )
-            self.repository.create_invitation(invitation_data)
+        # Create invitation records (one INSERT for all attendees, one commit)
+        attendee_emails = list(dict.fromkeys(attendee_emails))
+        self.repository.create_invitations(meeting_id, [
+            {"email": email, "name": email.split('@')[0], "role": "attendee"}  # Use email prefix as name
+            for email in attendee_emails
+        ])
         
         # Send email invitations
         meeting_data = {
@@ -113,16 +114,19 @@ class MeetingService:
             "agenda_items": meeting.agenda_items
         }
         
-        return self.email_service.send_meeting_invitation(meeting_data, attendee_emails)
+        failed = self.email_service.send_meeting_invitation(meeting_data, attendee_emails)
+        if failed:
+            self.repository.mark_invitations_failed(meeting_id, failed)
+        return len(failed) < len(attendee_emails)
 
     def send_reminders(self, meeting_id: int) -> bool:
-        meeting = self.repository.get_meeting(meeting_id)
+        # Meeting and invitations in one query
+        meeting = self.repository.get_meeting(meeting_id, joinedload(Meeting.invitations))
         if not meeting:
             return False
         
         # Get attendee emails from invitations
-        invitations = self.repository.get_meeting_invitations(meeting_id)
-        attendee_emails = [inv.email for inv in invitations]
+        attendee_emails = [inv.email for inv in meeting.invitations]
         
         if not attendee_emails:
             return False
@@ -164,15 +168,14 @@ class MeetingService:
         return None
 
     def send_minutes(self, meeting_id: int) -> bool:
-        meeting = self.repository.get_meeting(meeting_id)
+        meeting = self.repository.get_meeting(meeting_id, joinedload(Meeting.invitations))
         minutes = self.repository.get_meeting_minutes(meeting_id)
         
         if not meeting or not minutes:
             return False
         
         # Get attendee emails from invitations
-        invitations = self.repository.get_meeting_invitations(meeting_id)
-        attendee_emails = [inv.email for inv in invitations]
+        attendee_emails = [inv.email for inv in meeting.invitations]
         
         if not attendee_emails:
             return False
@@ -195,16 +198,7 @@ class MeetingService:
         return self.repository.get_meetings_stats(start_date, end_date)
 
     def get_meetings_requiring_reminder(self) -> List[MeetingOut]:
-        # Get meetings scheduled for tomorrow
-        tomorrow = datetime.utcnow() + timedelta(days=1)
-        start_of_day = tomorrow.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = tomorrow.replace(hour=23, minute=59, second=59, microsecond=999999)
-        
-        meetings = self.repository.list_meetings(
-            start_date=start_of_day,
-            end_date=end_of_day
-        )
-        
+        meetings = self.repository.get_meetings_requiring_reminder()
         return [MeetingOut.from_orm(meeting) for meeting in meetings]
 
     def get_today_meetings(self) -> List[MeetingOut]:
@@ -212,7 +206,7 @@ class MeetingService:
         start_of_day = datetime.combine(today, datetime.min.time())
         end_of_day = datetime.combine(today, datetime.max.time())
         
-        meetings = self.repository.list_meetings(
+        meetings = self.repository.find_meetings(
             start_date=start_of_day,
             end_date=end_of_day
         )
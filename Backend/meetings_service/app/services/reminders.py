@@ -0,0 +1,60 @@
+from typing import List
+
+from sqlalchemy.orm import selectinload
+
+from ..core.config import settings
+from ..core.db import SessionLocal, engine
+from ..models.meetings import Meeting
+from ..repositories.meeting_repository import MeetingRepository
+from ..services.email_service import templates
+from ...shared.reminders import Reminder, ReminderScheduler, post_bulk_reminder
+from ...shared.templates import render_email
+
+
+def send_meeting_reminders(reminders: List[Reminder]) -> List[int]:
+    """
+    Batched sender for the scheduler: the claimed meetings and their invitations are loaded
+    with two queries (selectinload), then each reminder is handed to the notifications service,
+    which records one notification per recipient and idempotency key and skips resends.
+    """
+    keys = {reminder.id: reminder.key for reminder in reminders}
+    db = SessionLocal()
+    try:
+        meetings = MeetingRepository(db).get_meetings_by_ids(list(keys), selectinload(Meeting.invitations))
+        attendee_emails = {meeting.id: [invitation.email for invitation in meeting.invitations] for meeting in meetings}
+    finally:
+        db.close()
+
+    # Deleted in the meantime: nothing to send
+    handled = [meeting_id for meeting_id in keys if meeting_id not in {meeting.id for meeting in meetings}]
+    for meeting in meetings:
+        recipients = attendee_emails.get(meeting.id)
+        if not recipients:
+            handled.append(meeting.id)
+            continue
+        meeting_data = {
+            "title": meeting.title,
+            "scheduled_date": meeting.scheduled_date,
+            "location": meeting.location
+        }
+        email = render_email(templates, "meeting_reminder.jinja", {"meeting": meeting_data})
+        payload = {
+            "recipient_emails": recipients,
+            "subject": email.subject,
+            "message": email.html,
+            "created_by": "meetings_service",
+        }
+        if post_bulk_reminder(settings.notifications_service_url, payload, "meeting_reminder", keys[meeting.id]):
+            handled.append(meeting.id)
+    return handled
+
+
+reminder_scheduler = ReminderScheduler(
+    engine,
+    Meeting.__table__,
+    "scheduled_date",
+    send_meeting_reminders,
+    kind="meeting",
+    batch_size=settings.reminder_batch_size,
+    interval=settings.reminder_check_interval
+)
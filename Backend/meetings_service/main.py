@@ -1,15 +1,41 @@
 from fastapi import FastAPI
+from sqlalchemy import text
 from .app.core.db import engine, Base
+from .app.core.config import settings
 from .app.routers import meetings
+from .app.models.meetings import Meeting
+from .app.services.reminders import reminder_scheduler
+from .shared.reminders import upgrade_reminder_schema
+from .shared.statement_budget import install_statement_budget
 
 # Create tables
 Base.metadata.create_all(bind=engine)
+# Tables created before reminders were scheduled per row
+upgrade_reminder_schema(engine, Meeting.__table__, backfill=text(
+    "UPDATE meetings SET remind_at = scheduled_date - :hours * interval '1 hour' "
+    "WHERE status = 'SCHEDULED' AND scheduled_date > (now() AT TIME ZONE 'utc')"
+).bindparams(hours=settings.meeting_reminder_hours))
 
 app = FastAPI(title="Meetings Service", version="1.0.0")
 
+# N+1 detector, only when SQL_STATEMENT_BUDGET is set (tests/CI)
+install_statement_budget(app, engine)
+
 # Include routers
 app.include_router(meetings.router, prefix="/api")
 
+@app.on_event("startup")
+def start_reminders():
+    reminder_scheduler.start()
+
+@app.on_event("shutdown")
+def stop_reminders():
+    reminder_scheduler.stop()
+
+@app.get("/metrics/reminders")
+def reminder_metrics():
+    return reminder_scheduler.stats()
+
 @app.get("/health")
 def health_check():
     return {"status": "ok", "service": "Meetings Service"}
@@ -0,0 +1,46 @@
+# Estatísticas calculadas no banco (GROUP BY / SUM) para os endpoints de stats dos serviços
+from typing import Any, Dict, Mapping, Optional
+
+from sqlalchemy import func, tuple_
+
+
+def grouped_stats(query, dimensions: Mapping[str, Any], sums: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Conta as linhas de ``query`` (já filtrada) no total e por coluna de ``dimensions``, e soma as
+    colunas de ``sums``, num único SELECT com GROUPING SETS: nenhuma entidade é carregada.
+
+    Devolve ``{'total': n, 'sums': {nome: soma}, 'breakdowns': {nome: {valor: contagem}}}``, com
+    as chaves de ``dimensions``/``sums``. Os valores das quebras são os mesmos que o ORM devolve
+    (enums continuam enums); somas de conjuntos vazios são 0.
+    """
+    columns = list(dimensions.values())
+    sums = sums or {}
+    aggregates = [func.count()] + [func.coalesce(func.sum(column), 0) for column in sums.values()]
+    stats: Dict[str, Any] = {
+        'total': 0,
+        'sums': {name: 0 for name in sums},
+        'breakdowns': {name: {} for name in dimensions},
+    }
+    if not columns:
+        row = query.with_entities(*aggregates).order_by(None).one()
+        stats['total'], stats['sums'] = row[0], dict(zip(sums, row[1:]))
+        return stats
+
+    rows = query.with_entities(func.grouping(*columns), *columns, *aggregates).group_by(
+        func.grouping_sets(*[tuple_(column) for column in columns], tuple_())
+    ).order_by(None).all()
+
+    # GROUPING(c1, ..., cn): bit 1 = coluna agregada; a linha da quebra i só tem o bit de ci zerado
+    everything = (1 << len(columns)) - 1
+    dimension_by_grouping = {everything ^ (1 << (len(columns) - 1 - i)): i for i in range(len(columns))}
+    names = list(dimensions)
+    for row in rows:
+        grouping, values = row[0], row[1:len(columns) + 1]
+        count, totals = row[len(columns) + 1], row[len(columns) + 2:]
+        if grouping == everything:
+            stats['total'] = count
+            stats['sums'] = dict(zip(sums, totals))
+        else:
+            index = dimension_by_grouping[grouping]
+            stats['breakdowns'][names[index]][values[index]] = count
+    return stats
@@ -0,0 +1,235 @@
+# Lembretes agendados por linha (eventos, reuniões): remind_at materializado e enviado uma única vez
+import json
+import logging
+import threading
+import urllib.error
+import urllib.request
+from collections import namedtuple
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from pydantic.networks import validate_email
+from sqlalchemy import func, inspect, select, text, tuple_, update
+from sqlalchemy.schema import CreateColumn, CreateIndex
+
+logger = logging.getLogger(__name__)
+
+BULK_NOTIFICATIONS_PATH = '/api/notifications/bulk'
+
+# key: chave de idempotência do lembrete (tipo, id e horário); muda se o horário mudar.
+# O notifications_service grava uma notificação por chave e destinatário (ver post_bulk_reminder)
+Reminder = namedtuple('Reminder', 'id remind_at starts_at key')
+
+SendBatch = Callable[[List[Reminder]], Iterable[int]]
+
+
+def reminder_key(kind: str, row_id: int, remind_at: datetime) -> str:
+    # Curta e só com letras, dígitos e '-': cabe em notifications.related_entity_id (String(100))
+    return f'{kind}-{row_id}-{remind_at:%Y%m%dT%H%M%S}'
+
+
+def valid_recipients(emails: Iterable[str], key: str) -> List[str]:
+    """Endereços que o ``EmailStr`` do notifications_service aceita; os inválidos ficam de fora."""
+    valid = []
+    for email in emails:
+        try:
+            validate_email(email)
+        except ValueError:
+            logger.warning(f'Lembrete {key}: destinatário inválido ignorado: {email!r}')
+            continue
+        valid.append(email)
+    return valid
+
+
+def post_bulk_reminder(base_url: str, payload: Dict[str, Any], related_entity_type: str, key: str,
+                       timeout: float = 10) -> bool:
+    """
+    Entrega o lembrete ao ``POST /api/notifications/bulk``; False = tentar de novo na próxima passada.
+
+    A chave vai em ``related_entity_type``/``related_entity_id``: o notifications_service ignora os
+    destinatários que já têm notificação com a mesma chave, então reenviar depois de um timeout
+    (o lote pode ter sido gravado) não duplica o e-mail. Destinatários inválidos são filtrados
+    antes, para que um endereço ruim não derrube o lote com 422; sem nenhum válido, não há o que
+    enviar. Qualquer resposta de erro deixa o lembrete pendente.
+    """
+    recipients = valid_recipients(payload['recipient_emails'], key)
+    if not recipients:
+        return True
+    body = {**payload, 'recipient_emails': recipients,
+            'related_entity_type': related_entity_type, 'related_entity_id': key}
+    request = urllib.request.Request(
+        base_url.rstrip('/') + BULK_NOTIFICATIONS_PATH,
+        data=json.dumps(body, default=str).encode(),
+        method='POST',
+        headers={'Content-Type': 'application/json'}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout):
+            return True
+    except urllib.error.HTTPError as e:
+        logger.warning(f'Lembrete {key} não entregue ({e.code}): {e.read()[:500]!r}')
+    except (urllib.error.URLError, OSError) as e:
+        logger.warning(f'notifications_service indisponível: {e}')
+    return False
+
+
+def upgrade_reminder_schema(engine, table, backfill=None) -> None:
+    """
+    Tabelas criadas antes dos lembretes por linha: acrescenta ``remind_at``/``reminder_sent_at`` e
+    os índices que faltarem. ``backfill`` (um ``text(...)``) preenche ``remind_at`` das linhas
+    existentes e só roda quando a coluna acabou de ser criada.
+    """
+    if engine.dialect.name != 'postgresql':
+        return
+    with engine.begin() as conn:
+        existing = {column['name'] for column in inspect(conn).get_columns(table.name)}
+        for name in ('remind_at', 'reminder_sent_at'):
+            column = CreateColumn(table.c[name]).compile(dialect=conn.dialect)
+            conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {column}'))
+        for index in table.indexes:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+        if backfill is not None and 'remind_at' not in existing:
+            conn.execute(backfill)
+
+
+class ReminderScheduler:
+    """Envia os lembretes vencidos de ``table`` numa thread, a cada ``interval`` segundos.
+
+    - a tabela tem ``remind_at`` (quando lembrar; NULL = sem lembrete) e ``reminder_sent_at``
+      (NULL = pendente), com índice parcial em ``(remind_at, id) WHERE reminder_sent_at IS NULL``:
+      cada passada lê só os lembretes vencidos, nunca a tabela inteira
+    - os vencidos são reservados em lotes de ``batch_size`` (``FOR UPDATE SKIP LOCKED``, marcando
+      ``reminder_sent_at``) antes de enviar, então duas réplicas nunca enviam o mesmo lembrete (se
+      o processo cair durante o envio, o lembrete reservado não é reenviado); dentro da passada um cursor ``(remind_at, id)`` avança de lote em lote
+    - ``send_batch(lembretes)`` devolve os ids tratados (enviados ou sem destinatário); os demais
+      são liberados e tentados de novo na próxima passada
+    - lembretes cujo ``starts_column`` já passou são descartados sem envio
+    - quem altera a data da linha recalcula ``remind_at`` e zera ``reminder_sent_at``: o novo
+      horário gera uma nova chave (``Reminder.key``) e um novo envio
+    """
+
+    def __init__(self, engine, table, starts_column: str, send_batch: SendBatch, kind: Optional[str] = None,
+                 batch_size: int = 200, interval: float = 60.0) -> None:
+        self.engine = engine
+        self.table = table
+        self.starts_column = table.c[starts_column]
+        self.send_batch = send_batch
+        self.kind = kind or table.name
+        self.batch_size = batch_size
+        self.interval = interval
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self.passes = 0
+        self.claimed = 0
+        self.sent = 0
+        self.skipped = 0
+        self.failed = 0
+        self.last_run: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    def _claim(self, now: datetime, after: Optional[tuple]) -> List[Reminder]:
+        table = self.table
+        query = select(table.c.id, table.c.remind_at, self.starts_column).where(
+            table.c.reminder_sent_at.is_(None),
+            table.c.remind_at <= now
+        )
+        if after is not None:
+            query = query.where(tuple_(table.c.remind_at, table.c.id) > tuple_(*after))
+        query = query.order_by(table.c.remind_at, table.c.id).limit(self.batch_size).with_for_update(skip_locked=True)
+        with self.engine.begin() as conn:
+            rows = conn.execute(query).all()
+            if rows:
+                conn.execute(
+                    update(table).where(table.c.id.in_([row[0] for row in rows])).values(reminder_sent_at=now)
+                )
+        return [Reminder(row_id, remind_at, starts_at, reminder_key(self.kind, row_id, remind_at))
+                for row_id, remind_at, starts_at in rows]
+
+    def _release(self, reminders: List[Reminder], claimed_at: datetime) -> None:
+        table = self.table
+        with self.engine.begin() as conn:
+            # Só desfaz a própria reserva: a linha pode ter sido reagendada durante o envio
+            conn.execute(update(table).where(
+                table.c.id.in_([reminder.id for reminder in reminders]),
+                table.c.reminder_sent_at == claimed_at
+            ).values(reminder_sent_at=None))
+
+    def run_once(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Uma passada: envia todos os lembretes vencidos até ``now``."""
+        now = now or datetime.utcnow()
+        results = {'claimed': 0, 'sent': 0, 'skipped': 0, 'failed': 0}
+        after = None
+        while True:
+            claimed = self._claim(now, after)
+            if not claimed:
+                break
+            after = (claimed[-1].remind_at, claimed[-1].id)
+            due = [reminder for reminder in claimed if reminder.starts_at is None or reminder.starts_at > now]
+            try:
+                handled = set(self.send_batch(due)) if due else set()
+            except Exception as e:
+                logger.warning(f'Falha ao enviar lembretes de {self.kind}: {e}')
+                handled = set()
+            failed = [reminder for reminder in due if reminder.id not in handled]
+            if failed:
+                self._release(failed, now)
+            results['claimed'] += len(claimed)
+            results['skipped'] += len(claimed) - len(due)
+            results['sent'] += len(due) - len(failed)
+            results['failed'] += len(failed)
+            # Encerrando: o restante fica para a próxima passada (de outra réplica ou no reinício)
+            if len(claimed) < self.batch_size or self._stop.is_set():
+                break
+        self.passes += 1
+        for name, count in results.items():
+            setattr(self, name, getattr(self, name) + count)
+        self.last_run = now
+        return results
+
+    def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name=f'{self.kind}-reminders', daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout=30)
+            self._worker = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                results = self.run_once()
+                self.last_error = None
+                if results['claimed']:
+                    logger.info(f'Lembretes de {self.kind}: {results}')
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning(f'Passada de lembretes de {self.kind} falhou: {e}')
+            self._stop.wait(self.interval)
+
+    def due_count(self, now: Optional[datetime] = None) -> int:
+        table = self.table
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(table).where(
+                table.c.reminder_sent_at.is_(None),
+                table.c.remind_at <= (now or datetime.utcnow())
+            )).scalar()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'due': self.due_count(),
+            'batch_size': self.batch_size,
+            'interval': self.interval,
+            'passes': self.passes,
+            'claimed': self.claimed,
+            'sent': self.sent,
+            'skipped': self.skipped,
+            'failed': self.failed,
+            'last_run': self.last_run,
+            'last_error': self.last_error,
+            'running': self._worker is not None and self._worker.is_alive(),
+        }
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
@@ -29,6 +29,11 @@ class Minutes(Base):
     # Relationships
     history = relationship("MinutesHistory", back_populates="minutes", cascade="all, delete-orphan")
 
+    # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+    __table_args__ = (
+        Index('idx_minutes_created_id', 'created_at', 'id'),
+    )
+
 
 class MinutesHistory(Base):
     __tablename__ = "minutes_history"
@@ -1,8 +1,10 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..models.minutes import Minutes, MinutesHistory
-from ..schemas.minutes import MinutesIn, MinutesUpdate, MinutesHistoryIn, MinutesApprovalIn, MinutesRejectionIn
+from ..schemas.minutes import MinutesIn, MinutesOut, MinutesUpdate, MinutesHistoryIn, MinutesApprovalIn, MinutesRejectionIn
 from datetime import datetime
+from ...shared.pagination import Page, keyset_page
+from ...shared.query_shaping import project
 
 
 class MinutesRepository:
@@ -49,7 +51,26 @@ class MinutesRepository:
                     status: Optional[str] = None,
                     unit_id: Optional[int] = None,
                     start_date: Optional[datetime] = None,
-                    end_date: Optional[datetime] = None) -> List[Minutes]:
+                    end_date: Optional[datetime] = None,
+                    cursor: Optional[str] = None,
+                    limit: Optional[int] = None) -> Page:
+        query = project(self._minutes_query(status, unit_id, start_date, end_date), MinutesOut)
+        return keyset_page(query, Minutes.created_at, Minutes.id, cursor, limit)
+
+    def find_minutes(self, 
+                     status: Optional[str] = None,
+                     unit_id: Optional[int] = None,
+                     start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None) -> List:
+        # Read-only listings return rows with MinutesOut's columns, not entities
+        query = project(self._minutes_query(status, unit_id, start_date, end_date), MinutesOut)
+        return query.order_by(Minutes.created_at.desc()).all()
+
+    def _minutes_query(self, 
+                       status: Optional[str] = None,
+                       unit_id: Optional[int] = None,
+                       start_date: Optional[datetime] = None,
+                       end_date: Optional[datetime] = None):
         query = self.db.query(Minutes)
         
         if status:
@@ -61,7 +82,7 @@ class MinutesRepository:
         if end_date:
             query = query.filter(Minutes.created_at <= end_date)
             
-        return query.order_by(Minutes.created_at.desc()).all()
+        return query
 
     def update_minutes(self, minutes_id: int, update_data: MinutesUpdate) -> Optional[Minutes]:
         db_minutes = self.get_minutes(minutes_id)
@@ -180,18 +201,18 @@ class MinutesRepository:
         self.db.refresh(db_history)
         return db_history
 
-    def get_minutes_by_creator(self, created_by: str) -> List[Minutes]:
-        return self.db.query(Minutes).filter(
+    def get_minutes_by_creator(self, created_by: str) -> List:
+        return project(self.db.query(Minutes), MinutesOut).filter(
             Minutes.created_by == created_by
         ).order_by(Minutes.created_at.desc()).all()
 
-    def get_pending_approval_minutes(self) -> List[Minutes]:
-        return self.db.query(Minutes).filter(
+    def get_pending_approval_minutes(self) -> List:
+        return project(self.db.query(Minutes), MinutesOut).filter(
             Minutes.status == "pending_approval"
         ).order_by(Minutes.created_at.asc()).all()
 
-    def get_published_minutes(self) -> List[Minutes]:
-        return self.db.query(Minutes).filter(
+    def get_published_minutes(self) -> List:
+        return project(self.db.query(Minutes), MinutesOut).filter(
             Minutes.status == "published"
         ).order_by(Minutes.created_at.desc()).all()
 
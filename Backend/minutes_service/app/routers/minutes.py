@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.db import get_db
 from ..schemas.minutes import MinutesIn, MinutesOut, MinutesUpdate, MinutesHistoryIn, MinutesApprovalIn, MinutesRejectionIn
 from ..services.minutes_service import MinutesService
 from datetime import datetime
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/minutes", tags=["minutes"])
 
@@ -17,10 +18,13 @@ def create_minutes(minutes_data: MinutesIn, db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[MinutesOut])
 def list_minutes(
+    response: Response,
     status: Optional[str] = None,
     unit_id: Optional[int] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = MinutesService(db)
@@ -40,7 +44,7 @@ def list_minutes(
         except ValueError:
             raise HTTPException(status_code=400, detail="Formato de data de fim inválido")
     
-    return service.list_minutes(status, unit_id, start_dt, end_dt)
+    return set_next_cursor(response, service.list_minutes(status, unit_id, start_dt, end_dt, cursor, limit))
 
 
 @router.get("/{minutes_id}", response_model=MinutesOut)
@@ -4,6 +4,7 @@ from ..repositories.minutes_repository import MinutesRepository
 from ..schemas.minutes import MinutesIn, MinutesOut, MinutesUpdate, MinutesHistoryIn, MinutesApprovalIn, MinutesRejectionIn
 from ..services.email_service import EmailService
 from datetime import datetime
+from ...shared.pagination import Page
 
 
 class MinutesService:
@@ -31,9 +32,11 @@ class MinutesService:
                     status: Optional[str] = None,
                     unit_id: Optional[int] = None,
                     start_date: Optional[datetime] = None,
-                    end_date: Optional[datetime] = None) -> List[MinutesOut]:
-        minutes = self.repository.list_minutes(status, unit_id, start_date, end_date)
-        return [MinutesOut.from_orm(minutes) for minutes in minutes]
+                    end_date: Optional[datetime] = None,
+                    cursor: Optional[str] = None,
+                    limit: Optional[int] = None) -> Page:
+        page = self.repository.list_minutes(status, unit_id, start_date, end_date, cursor, limit)
+        return Page([MinutesOut.from_orm(minutes) for minutes in page.items], page.next_cursor)
 
     def update_minutes(self, minutes_id: int, update_data: MinutesUpdate) -> Optional[MinutesOut]:
         minutes = self.repository.update_minutes(minutes_id, update_data)
@@ -153,23 +156,23 @@ class MinutesService:
         return self.email_service.send_minutes_rejection_notification(minutes_data, minutes.created_by, reason)
 
     def get_draft_minutes(self) -> List[MinutesOut]:
-        minutes = self.repository.list_minutes(status="draft")
+        minutes = self.repository.find_minutes(status="draft")
         return [MinutesOut.from_orm(minutes) for minutes in minutes]
 
     def get_approved_minutes(self) -> List[MinutesOut]:
-        minutes = self.repository.list_minutes(status="approved")
+        minutes = self.repository.find_minutes(status="approved")
         return [MinutesOut.from_orm(minutes) for minutes in minutes]
 
     def get_rejected_minutes(self) -> List[MinutesOut]:
-        minutes = self.repository.list_minutes(status="rejected")
+        minutes = self.repository.find_minutes(status="rejected")
         return [MinutesOut.from_orm(minutes) for minutes in minutes]
 
     def get_minutes_by_status(self, status: str) -> List[MinutesOut]:
-        minutes = self.repository.list_minutes(status=status)
+        minutes = self.repository.find_minutes(status=status)
         return [MinutesOut.from_orm(minutes) for minutes in minutes]
 
     def get_minutes_by_unit(self, unit_id: int) -> List[MinutesOut]:
-        minutes = self.repository.list_minutes(unit_id=unit_id)
+        minutes = self.repository.find_minutes(unit_id=unit_id)
         return [MinutesOut.from_orm(minutes) for minutes in minutes]
 
 
@@ -1,12 +1,16 @@
 from fastapi import FastAPI
 from .app.core.db import engine, Base
 from .app.routers import minutes
+from .shared.statement_budget import install_statement_budget
 
 # Create tables
 Base.metadata.create_all(bind=engine)
 
 app = FastAPI(title="Minutes Service", version="1.0.0")
 
+# N+1 detector, only when SQL_STATEMENT_BUDGET is set (tests/CI)
+install_statement_budget(app, engine)
+
 # Include routers
 app.include_router(minutes.router, prefix="/api")
 
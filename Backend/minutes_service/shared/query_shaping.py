@@ -0,0 +1,27 @@
+# Listagens só de leitura: seleciona apenas as colunas do schema de saída, sem montar entidades
+from typing import List
+
+
+def schema_columns(model, schema) -> List:
+    """Colunas de ``model`` expostas por ``schema``, mais a chave primária."""
+    fields = getattr(schema, 'model_fields', None) or schema.__fields__
+    mapper = model.__mapper__
+    keys = set(mapper.columns.keys())
+    columns = [getattr(model, name) for name in fields if name in keys]
+    for column in mapper.primary_key:
+        if column.key not in fields:
+            columns.append(getattr(model, column.key))
+    return columns
+
+
+def project(query, schema):
+    """
+    Troca a entidade de ``query`` pelas colunas de ``schema``; filtros e ordenação ficam como estão.
+
+    As linhas voltam como ``Row``: nada entra no identity map, não há estado de sessão nem lazy
+    load possível, e colunas que a resposta não usa (tsvector, hashes) nem saem do banco.
+    ``schema.from_orm(row)`` e ``keyset_page`` continuam funcionando sobre elas. Só para leitura:
+    quem vai alterar as linhas precisa das entidades.
+    """
+    model = query.column_descriptions[0]['entity']
+    return query.with_entities(*schema_columns(model, schema))
@@ -8,6 +8,7 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     tenant_id: Optional[int] = None
+    counter_flush_interval: float = 5.0  # seconds between batched counter/view writes
     
     class Config:
         env_file = ".env"
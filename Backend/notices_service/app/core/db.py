@@ -2,12 +2,16 @@ from sqlalchemy import create_engine, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from ...shared.counter_buffer import CounterBuffer
 
 engine = create_engine(settings.database_url, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 metadata = MetaData()
 
+# View counts and view records are buffered in memory and written in batches (started in main.py)
+counters = CounterBuffer(engine, settings.counter_flush_interval)
+
 def get_db():
     db = SessionLocal()
     try:
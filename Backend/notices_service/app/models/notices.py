@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
+from ...shared.search import search_vector_column, search_vector_index, trigram_index
 from ..schemas.notices import NoticeType, NoticePriority, NoticeStatus
 
 
@@ -30,6 +31,16 @@ class Notice(Base):
     history = relationship("NoticeHistory", back_populates="notice", cascade="all, delete-orphan")
     views = relationship("NoticeView", back_populates="notice", cascade="all, delete-orphan")
 
+    # Busca textual (shared/search.py): tsvector em português + trigramas para substring
+    search_vector = search_vector_column(('title', 'A'), ('tags::text', 'A'), ('content', 'B'))
+
+    __table_args__ = (
+        # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+        Index('idx_notices_created_id', 'created_at', 'id'),
+        search_vector_index('idx_notices_search'),
+        trigram_index('idx_notices_title_trgm', 'title'),
+    )
+
 
 class NoticeHistory(Base):
     __tablename__ = "notice_history"
@@ -63,6 +74,11 @@ class NoticeBoard(Base):
     # Relationships
     notices = relationship("Notice", backref="board")
 
+    # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+    __table_args__ = (
+        Index('idx_notice_boards_created_id', 'created_at', 'id'),
+    )
+
 
 class NoticeView(Base):
     __tablename__ = "notice_views"
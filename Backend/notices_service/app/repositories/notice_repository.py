@@ -3,6 +3,10 @@ from typing import List, Optional
 from ..models.notices import Notice, NoticeHistory, NoticeBoard, NoticeView
 from ..schemas.notices import NoticeIn, NoticeUpdate, NoticeHistoryIn, NoticeBoardIn, NoticeBoardUpdate, NoticeViewIn
 from datetime import datetime, timedelta
+from ..core.db import counters
+from ...shared.pagination import Page, keyset_page
+from ...shared.aggregates import grouped_stats
+from ...shared.search import ranked_page, text_search
 
 
 class NoticeRepository:
@@ -49,7 +53,27 @@ class NoticeRepository:
                     status: Optional[str] = None,
                     is_public: Optional[bool] = None,
                     unit_id: Optional[int] = None,
-                    is_pinned: Optional[bool] = None) -> List[Notice]:
+                    is_pinned: Optional[bool] = None,
+                    cursor: Optional[str] = None,
+                    limit: Optional[int] = None) -> Page:
+        return keyset_page(self._notices_query(notice_type, priority, status, is_public, unit_id, is_pinned), Notice.created_at, Notice.id, cursor, limit)
+
+    def find_notices(self, 
+                     notice_type: Optional[str] = None,
+                     priority: Optional[str] = None,
+                     status: Optional[str] = None,
+                     is_public: Optional[bool] = None,
+                     unit_id: Optional[int] = None,
+                     is_pinned: Optional[bool] = None) -> List[Notice]:
+        return self._notices_query(notice_type, priority, status, is_public, unit_id, is_pinned).order_by(Notice.is_pinned.desc(), Notice.priority.desc(), Notice.created_at.desc()).all()
+
+    def _notices_query(self, 
+                       notice_type: Optional[str] = None,
+                       priority: Optional[str] = None,
+                       status: Optional[str] = None,
+                       is_public: Optional[bool] = None,
+                       unit_id: Optional[int] = None,
+                       is_pinned: Optional[bool] = None):
         query = self.db.query(Notice)
         
         if notice_type:
@@ -65,7 +89,7 @@ class NoticeRepository:
         if is_pinned is not None:
             query = query.filter(Notice.is_pinned == is_pinned)
             
-        return query.order_by(Notice.is_pinned.desc(), Notice.priority.desc(), Notice.created_at.desc()).all()
+        return query
 
     def get_public_notices(self) -> List[Notice]:
         return self.db.query(Notice).filter(
@@ -87,12 +111,10 @@ class NoticeRepository:
             Notice.status == "published"
         ).order_by(Notice.expiry_date.desc()).all()
 
-    def search_notices(self, search_term: str) -> List[Notice]:
-        return self.db.query(Notice).filter(
-            (Notice.title.ilike(f"%{search_term}%")) |
-            (Notice.content.ilike(f"%{search_term}%")) |
-            (Notice.tags.contains([search_term]))
-        ).order_by(Notice.created_at.desc()).all()
+    def search_notices(self, search_term: str, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        # Tags entram no search_vector; título também casa por substring (trigramas)
+        match, rank = text_search(Notice.search_vector, search_term, [Notice.title])
+        return ranked_page(self.db.query(Notice).filter(match), rank, Notice.id, cursor, limit)
 
     def update_notice(self, notice_id: int, update_data: NoticeUpdate) -> Optional[Notice]:
         db_notice = self.get_notice(notice_id)
@@ -257,27 +279,20 @@ class NoticeRepository:
         self.db.refresh(db_notice)
         return db_notice
 
-    def increment_view_count(self, notice_id: int) -> Optional[Notice]:
-        db_notice = self.get_notice(notice_id)
-        if not db_notice:
-            return None
-        
-        db_notice.view_count += 1
-        self.db.commit()
-        self.db.refresh(db_notice)
-        return db_notice
+    def increment_view_count(self, notice_id: int) -> None:
+        # Buffered; written together with the other pending views on the next flush
+        counters.increment(Notice.__table__.c.view_count, notice_id)
 
-    def record_view(self, view_data: NoticeViewIn) -> NoticeView:
-        db_view = NoticeView(
-            notice_id=view_data.notice_id,
-            viewer_id=view_data.viewer_id,
-            viewer_ip=view_data.viewer_ip
-        )
-        
-        self.db.add(db_view)
-        self.db.commit()
-        self.db.refresh(db_view)
-        return db_view
+    def pending_view_count(self, notice_id: int) -> int:
+        return counters.pending(Notice.__table__.c.view_count, notice_id)
+
+    def record_view(self, view_data: NoticeViewIn) -> None:
+        counters.add_event(NoticeView.__table__, {
+            "notice_id": view_data.notice_id,
+            "viewer_id": view_data.viewer_id,
+            "viewer_ip": view_data.viewer_ip,
+            "viewed_at": datetime.utcnow()
+        })
 
     def delete_notice(self, notice_id: int) -> bool:
         db_notice = self.get_notice(notice_id)
@@ -335,16 +350,15 @@ class NoticeRepository:
             Notice.created_at <= end_date
         )
         
-        total_notices = query.count()
-        
-        type_breakdown = {}
-        priority_breakdown = {}
-        status_breakdown = {}
-        
-        for notice in query.all():
-            type_breakdown[notice.notice_type] = type_breakdown.get(notice.notice_type, 0) + 1
-            priority_breakdown[notice.priority] = priority_breakdown.get(notice.priority, 0) + 1
-            status_breakdown[notice.status] = status_breakdown.get(notice.status, 0) + 1
+        stats = grouped_stats(query, {
+            "type": Notice.notice_type,
+            "priority": Notice.priority,
+            "status": Notice.status
+        })
+        total_notices = stats["total"]
+        type_breakdown = stats["breakdowns"]["type"]
+        priority_breakdown = stats["breakdowns"]["priority"]
+        status_breakdown = stats["breakdowns"]["status"]
         
         return {
             "total_notices": total_notices,
@@ -372,7 +386,13 @@ class NoticeRepository:
     def get_notice_board(self, board_id: int) -> Optional[NoticeBoard]:
         return self.db.query(NoticeBoard).filter(NoticeBoard.id == board_id).first()
 
-    def list_notice_boards(self, is_active: Optional[bool] = None, unit_id: Optional[int] = None) -> List[NoticeBoard]:
+    def list_notice_boards(self, is_active: Optional[bool] = None, unit_id: Optional[int] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        return keyset_page(self._notice_boards_query(is_active, unit_id), NoticeBoard.created_at, NoticeBoard.id, cursor, limit)
+
+    def find_notice_boards(self, is_active: Optional[bool] = None, unit_id: Optional[int] = None) -> List[NoticeBoard]:
+        return self._notice_boards_query(is_active, unit_id).order_by(NoticeBoard.created_at.desc()).all()
+
+    def _notice_boards_query(self, is_active: Optional[bool] = None, unit_id: Optional[int] = None):
         query = self.db.query(NoticeBoard)
         
         if is_active is not None:
@@ -380,7 +400,7 @@ class NoticeRepository:
         if unit_id:
             query = query.filter(NoticeBoard.unit_id == unit_id)
             
-        return query.order_by(NoticeBoard.created_at.desc()).all()
+        return query
 
     def update_notice_board(self, board_id: int, update_data: NoticeBoardUpdate) -> Optional[NoticeBoard]:
         db_board = self.get_notice_board(board_id)
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.db import get_db
 from ..schemas.notices import NoticeIn, NoticeOut, NoticeUpdate, NoticeHistoryIn, NoticeBoardIn, NoticeBoardOut, NoticeBoardUpdate, NoticeViewIn
 from ..services.notice_service import NoticeService
 from datetime import datetime
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/notices", tags=["notices"])
 
@@ -17,16 +18,19 @@ def create_notice(notice_data: NoticeIn, created_by: str = "Sistema", db: Sessio
 
 @router.get("/", response_model=List[NoticeOut])
 def list_notices(
+    response: Response,
     notice_type: Optional[str] = None,
     priority: Optional[str] = None,
     status: Optional[str] = None,
     is_public: Optional[bool] = None,
     unit_id: Optional[int] = None,
     is_pinned: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = NoticeService(db)
-    return service.list_notices(notice_type, priority, status, is_public, unit_id, is_pinned)
+    return set_next_cursor(response, service.list_notices(notice_type, priority, status, is_public, unit_id, is_pinned, cursor, limit))
 
 
 @router.get("/public")
@@ -47,10 +51,16 @@ def get_expired_notices(db: Session = Depends(get_db)):
     return service.get_expired_notices()
 
 
-@router.get("/search/{search_term}")
-def search_notices(search_term: str, db: Session = Depends(get_db)):
+@router.get("/search/{search_term}", response_model=List[NoticeOut])
+def search_notices(
+    search_term: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
     service = NoticeService(db)
-    return service.search_notices(search_term)
+    return set_next_cursor(response, service.search_notices(search_term, cursor, limit))
 
 
 @router.get("/{notice_id}", response_model=NoticeOut)
@@ -266,12 +276,15 @@ def create_notice_board(board_data: NoticeBoardIn, created_by: str = "Sistema",
 
 @router.get("/boards/", response_model=List[NoticeBoardOut])
 def list_notice_boards(
+    response: Response,
     is_active: Optional[bool] = None,
     unit_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = NoticeService(db)
-    return service.list_notice_boards(is_active, unit_id)
+    return set_next_cursor(response, service.list_notice_boards(is_active, unit_id, cursor, limit))
 
 
 @router.get("/boards/{board_id}", response_model=NoticeBoardOut)
@@ -3,6 +3,7 @@ from typing import List, Optional
 from ..repositories.notice_repository import NoticeRepository
 from ..schemas.notices import NoticeIn, NoticeOut, NoticeUpdate, NoticeHistoryIn, NoticeBoardIn, NoticeBoardOut, NoticeBoardUpdate, NoticeViewIn
 from datetime import datetime, timedelta
+from ...shared.pagination import Page
 
 
 class NoticeService:
@@ -25,9 +26,11 @@ class NoticeService:
                     status: Optional[str] = None,
                     is_public: Optional[bool] = None,
                     unit_id: Optional[int] = None,
-                    is_pinned: Optional[bool] = None) -> List[NoticeOut]:
-        notices = self.repository.list_notices(notice_type, priority, status, is_public, unit_id, is_pinned)
-        return [NoticeOut.from_orm(notice) for notice in notices]
+                    is_pinned: Optional[bool] = None,
+                    cursor: Optional[str] = None,
+                    limit: Optional[int] = None) -> Page:
+        page = self.repository.list_notices(notice_type, priority, status, is_public, unit_id, is_pinned, cursor, limit)
+        return Page([NoticeOut.from_orm(notice) for notice in page.items], page.next_cursor)
 
     def get_public_notices(self) -> List[NoticeOut]:
         notices = self.repository.get_public_notices()
@@ -41,9 +44,9 @@ class NoticeService:
         notices = self.repository.get_expired_notices()
         return [NoticeOut.from_orm(notice) for notice in notices]
 
-    def search_notices(self, search_term: str) -> List[NoticeOut]:
-        notices = self.repository.search_notices(search_term)
-        return [NoticeOut.from_orm(notice) for notice in notices]
+    def search_notices(self, search_term: str, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        page = self.repository.search_notices(search_term, cursor, limit)
+        return Page([NoticeOut.from_orm(notice) for notice in page.items], page.next_cursor)
 
     def update_notice(self, notice_id: int, update_data: NoticeUpdate, changed_by: str = "Sistema") -> Optional[NoticeOut]:
         notice = self.repository.update_notice(notice_id, update_data)
@@ -76,12 +79,12 @@ class NoticeService:
         return None
 
     def view_notice(self, notice_id: int, viewer_id: Optional[str] = None, viewer_ip: Optional[str] = None) -> Optional[NoticeOut]:
-        # Increment view count
-        notice = self.repository.increment_view_count(notice_id)
+        notice = self.repository.get_notice(notice_id)
         if not notice:
             return None
         
-        # Record view
+        # Increment view count and record view (both buffered, no write per request)
+        self.repository.increment_view_count(notice_id)
         view_data = NoticeViewIn(
             notice_id=notice_id,
             viewer_id=viewer_id,
@@ -89,7 +92,9 @@ class NoticeService:
         )
         self.repository.record_view(view_data)
         
-        return NoticeOut.from_orm(notice)
+        notice_out = NoticeOut.from_orm(notice)
+        notice_out.view_count += self.repository.pending_view_count(notice_id)
+        return notice_out
 
     def delete_notice(self, notice_id: int) -> bool:
         return self.repository.delete_notice(notice_id)
@@ -142,7 +147,7 @@ class NoticeService:
         return self.repository.get_notices_stats(start_date, end_date)
 
     def get_notices_by_unit(self, unit_id: int) -> List[NoticeOut]:
-        notices = self.repository.list_notices(unit_id=unit_id)
+        notices = self.repository.find_notices(unit_id=unit_id)
         return [NoticeOut.from_orm(notice) for notice in notices]
 
     def get_recent_notices(self, limit: int = 10) -> List[NoticeOut]:
@@ -158,7 +163,7 @@ class NoticeService:
         return [NoticeOut.from_orm(notice) for notice in notices]
 
     def get_notices_by_date_range(self, start_date: datetime, end_date: datetime) -> List[NoticeOut]:
-        notices = self.repository.list_notices()
+        notices = self.repository.find_notices()
         filtered_notices = []
         
         for notice in notices:
@@ -168,19 +173,19 @@ class NoticeService:
         return [NoticeOut.from_orm(notice) for notice in filtered_notices]
 
     def get_urgent_notices(self) -> List[NoticeOut]:
-        notices = self.repository.list_notices(priority="urgent", status="published")
+        notices = self.repository.find_notices(priority="urgent", status="published")
         return [NoticeOut.from_orm(notice) for notice in notices]
 
     def get_emergency_notices(self) -> List[NoticeOut]:
-        notices = self.repository.list_notices(notice_type="emergency", status="published")
+        notices = self.repository.find_notices(notice_type="emergency", status="published")
         return [NoticeOut.from_orm(notice) for notice in notices]
 
     def get_maintenance_notices(self) -> List[NoticeOut]:
-        notices = self.repository.list_notices(notice_type="maintenance", status="published")
+        notices = self.repository.find_notices(notice_type="maintenance", status="published")
         return [NoticeOut.from_orm(notice) for notice in notices]
 
     def get_social_notices(self) -> List[NoticeOut]:
-        notices = self.repository.list_notices(notice_type="social", status="published")
+        notices = self.repository.find_notices(notice_type="social", status="published")
         return [NoticeOut.from_orm(notice) for notice in notices]
 
     # Notice Board methods
@@ -194,9 +199,9 @@ class NoticeService:
             return NoticeBoardOut.from_orm(board)
         return None
 
-    def list_notice_boards(self, is_active: Optional[bool] = None, unit_id: Optional[int] = None) -> List[NoticeBoardOut]:
-        boards = self.repository.list_notice_boards(is_active, unit_id)
-        return [NoticeBoardOut.from_orm(board) for board in boards]
+    def list_notice_boards(self, is_active: Optional[bool] = None, unit_id: Optional[int] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        page = self.repository.list_notice_boards(is_active, unit_id, cursor, limit)
+        return Page([NoticeBoardOut.from_orm(board) for board in page.items], page.next_cursor)
 
     def update_notice_board(self, board_id: int, update_data: NoticeBoardUpdate) -> Optional[NoticeBoardOut]:
         board = self.repository.update_notice_board(board_id, update_data)
@@ -208,10 +213,10 @@ class NoticeService:
         return self.repository.delete_notice_board(board_id)
 
     def get_active_notice_boards(self) -> List[NoticeBoardOut]:
-        boards = self.repository.list_notice_boards(is_active=True)
+        boards = self.repository.find_notice_boards(is_active=True)
         return [NoticeBoardOut.from_orm(board) for board in boards]
 
     def get_notice_boards_by_unit(self, unit_id: int) -> List[NoticeBoardOut]:
-        boards = self.repository.list_notice_boards(unit_id=unit_id)
+        boards = self.repository.find_notice_boards(unit_id=unit_id)
         return [NoticeBoardOut.from_orm(board) for board in boards]
 
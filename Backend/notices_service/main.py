@@ -1,15 +1,32 @@
 from fastapi import FastAPI
-from .app.core.db import engine, Base
+from .app.core.db import engine, Base, counters
 from .app.routers import notices
+from .app.models.notices import Notice
+from .shared.search import install_search_extensions, upgrade_search_schema
 
-# Create tables
+# Create tables (as extensões de busca precisam existir antes das colunas/índices)
+install_search_extensions(engine)
 Base.metadata.create_all(bind=engine)
+upgrade_search_schema(engine, Notice.__table__)
 
 app = FastAPI(title="Notices Service", version="1.0.0")
 
 # Include routers
 app.include_router(notices.router, prefix="/api")
 
+@app.on_event("startup")
+def start_counter_flush():
+    counters.start()
+
+@app.on_event("shutdown")
+def drain_counters():
+    # Writes whatever is still buffered before the process exits
+    counters.stop()
+
+@app.get("/metrics/counters")
+def counter_metrics():
+    return counters.stats()
+
 @app.get("/health")
 def health_check():
     return {"status": "ok", "service": "Notices Service"}
@@ -0,0 +1,186 @@
+# Contadores (downloads, visualizações) e eventos acumulados em memória e gravados em lote
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Integer, bindparam, column, update, values
+from sqlalchemy.exc import IntegrityError
+
+logger = logging.getLogger(__name__)
+
+
+class CounterBuffer:
+    """Agrega incrementos de contadores e linhas de eventos e grava tudo de tempos em tempos.
+
+    - ``increment(Modelo.__table__.c.coluna, id)`` soma no buffer; o ``flush`` aplica, por coluna,
+      um único ``UPDATE tabela SET coluna = coluna + v.delta FROM (VALUES ...) v`` com os ids em
+      ordem (sem disputa de lock por requisição; linhas já apagadas são ignoradas). Fora do
+      PostgreSQL (SQLite) é o mesmo UPDATE por id, num executemany
+    - ``add_event(tabela, linha)`` guarda a linha; o ``flush`` insere todas com um executemany
+    - ``start()`` grava a cada ``interval`` segundos numa thread; ``stop()`` esvazia o buffer
+    - se a gravação falhar, os valores voltam ao buffer para a próxima tentativa
+    """
+
+    def __init__(self, engine, interval: Optional[float] = None, max_events: Optional[int] = None) -> None:
+        self.engine = engine
+        self.interval = interval if interval is not None else float(os.getenv('COUNTER_FLUSH_INTERVAL', '5'))
+        # Com muitos eventos pendentes o flush é antecipado
+        self.max_events = max_events if max_events is not None else int(os.getenv('COUNTER_MAX_PENDING_EVENTS', '5000'))
+        self._counters: Dict[Any, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self._events: Dict[Any, List[dict]] = defaultdict(list)
+        self._pending_events = 0
+        self._lock = threading.Lock()
+        # Um flush por vez (timer, limite de eventos e stop podem coincidir)
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self.flushes = 0
+        self.rows_updated = 0
+        self.events_written = 0
+        self.events_dropped = 0
+        self.errors = 0
+
+    def increment(self, counter_column, row_id: int, delta: int = 1) -> None:
+        with self._lock:
+            self._counters[counter_column][row_id] += delta
+
+    def pending(self, counter_column, row_id: int) -> int:
+        """Incrementos ainda não gravados, para somar ao valor lido do banco."""
+        with self._lock:
+            return self._counters.get(counter_column, {}).get(row_id, 0)
+
+    def add_event(self, table, row: dict) -> None:
+        with self._lock:
+            self._events[table].append(row)
+            self._pending_events += 1
+            full = self._pending_events >= self.max_events
+        if full:
+            self._wake.set()
+
+    # -- gravação ------------------------------------------------------------
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                counters, self._counters = self._counters, defaultdict(lambda: defaultdict(int))
+                events, self._events = self._events, defaultdict(list)
+                self._pending_events = 0
+            if not counters and not events:
+                return
+            self.flushes += 1
+            for counter_column, deltas in counters.items():
+                self._flush_counter(counter_column, deltas)
+            for table, rows in events.items():
+                self._flush_events(table, rows)
+
+    def _flush_counter(self, counter_column, deltas: Dict[int, int]) -> None:
+        deltas = {row_id: delta for row_id, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        table = counter_column.table
+        # Ids em ordem: dois processos gravando o mesmo lote travam as linhas na mesma sequência
+        rows = sorted(deltas.items())
+        if self.engine.dialect.name == 'postgresql':
+            batch = values(column('id', Integer), column('delta', Integer), name='counter_deltas').data(rows)
+            statement = (
+                update(table)
+                .where(table.c.id == batch.c.id)
+                .values({counter_column.name: counter_column + batch.c.delta})
+            )
+            params = None
+        else:
+            # O SQLite não aceita UPDATE ... FROM (VALUES ...) AS v(colunas)
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam('row_id'))
+                .values({counter_column.name: counter_column + bindparam('delta')})
+            )
+            params = [{'row_id': row_id, 'delta': delta} for row_id, delta in rows]
+        try:
+            with self.engine.begin() as conn:
+                self.rows_updated += conn.execute(statement, params).rowcount
+        except Exception as e:
+            logger.warning(f'Falha ao gravar {table.name}.{counter_column.name}: {e}; tentando no próximo flush')
+            self.errors += 1
+            with self._lock:
+                for row_id, delta in deltas.items():
+                    self._counters[counter_column][row_id] += delta
+
+    def _flush_events(self, table, rows: List[dict]) -> None:
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(table.insert(), rows)
+            self.events_written += len(rows)
+            return
+        except IntegrityError:
+            # Alguma linha aponta para um registro apagado nesse meio tempo: grava uma a uma
+            pass
+        except Exception as e:
+            logger.warning(f'Falha ao gravar eventos em {table.name}: {e}; tentando no próximo flush')
+            self.errors += 1
+            self._requeue(table, rows)
+            return
+        for row in rows:
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(table.insert(), row)
+                self.events_written += 1
+            except IntegrityError:
+                self.events_dropped += 1
+
+    def _requeue(self, table, rows: List[dict]) -> None:
+        with self._lock:
+            # Banco fora do ar por muito tempo: descarta os mais antigos em vez de crescer sem limite
+            room = max(self.max_events * 10 - self._pending_events, 0)
+            kept = rows[-room:] if room else []
+            self.events_dropped += len(rows) - len(kept)
+            self._events[table][:0] = kept
+            self._pending_events += len(kept)
+
+    # -- thread de gravação --------------------------------------------------
+
+    def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name='counter-buffer-flush', daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Para a thread e grava o que ainda estiver no buffer."""
+        self._stop.set()
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join(timeout=30)
+            self._worker = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f'Flush dos contadores falhou: {e}')
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending_increments = sum(len(deltas) for deltas in self._counters.values())
+            pending_events = self._pending_events
+        return {
+            'interval': self.interval,
+            'pending_rows': pending_increments,
+            'pending_events': pending_events,
+            'flushes': self.flushes,
+            'rows_updated': self.rows_updated,
+            'events_written': self.events_written,
+            'events_dropped': self.events_dropped,
+            'errors': self.errors,
+            'running': self._worker is not None and self._worker.is_alive(),
+        }
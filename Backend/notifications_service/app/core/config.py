@@ -16,9 +16,24 @@ class Settings(BaseSettings):
     smtp_password: str = ""
     smtp_use_tls: bool = True
     smtp_use_ssl: bool = False
+    smtp_timeout: float = 30.0
+
+    # Bulk delivery (pooled SMTP sessions)
+    smtp_pool_size: int = 4
+    smtp_bulk_workers: int = 4
+    smtp_messages_per_session: int = 100
+    smtp_session_max_idle: float = 30.0
+
+    # Queue worker
+    queue_batch_size: int = 200
+    queue_poll_interval: float = 2.0
+    queue_lease_seconds: int = 300
+    queue_retry_base_seconds: int = 60
+    queue_retry_max_seconds: int = 3600
     
     # Email templates
     email_templates_path: str = "templates"
+    template_cache_size: int = 128  # compiled templates kept in memory (LRU)
     
     class Config:
         env_file = ".env"
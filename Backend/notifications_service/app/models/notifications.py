@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, Float
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, Float, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
@@ -37,6 +37,14 @@ class Notification(Base):
     # Relationships
     queue_entries = relationship("NotificationQueue", back_populates="notification", cascade="all, delete-orphan")
 
+    # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+    __table_args__ = (
+        Index('idx_notifications_created_id', 'created_at', 'id'),
+        # Idempotência dos envios em lote: uma notificação por entidade relacionada e destinatário
+        Index('uq_notifications_related_recipient', 'related_entity_type', 'related_entity_id', 'recipient_email',
+              unique=True),
+    )
+
 
 class EmailTemplate(Base):
     __tablename__ = "email_templates"
@@ -53,6 +61,11 @@ class EmailTemplate(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+    __table_args__ = (
+        Index('idx_email_templates_created_id', 'created_at', 'id'),
+    )
+
 
 class NotificationQueue(Base):
     __tablename__ = "notification_queue"
@@ -70,6 +83,11 @@ class NotificationQueue(Base):
     # Relationships
     notification = relationship("Notification", back_populates="queue_entries")
 
+    # Claiming due entries (status, next_retry_at) by the queue worker
+    __table_args__ = (
+        Index('idx_notification_queue_claim', 'status', 'next_retry_at'),
+    )
+
 
 class NotificationLog(Base):
     __tablename__ = "notification_logs"
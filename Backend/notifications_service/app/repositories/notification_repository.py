@@ -1,12 +1,33 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc
-from typing import List, Optional, Dict, Any
+from sqlalchemy import and_, or_, func, desc, case, update
+from typing import List, NamedTuple, Optional, Dict, Any, Sequence, Set
 from ..models.notifications import Notification, EmailTemplate, NotificationQueue, NotificationLog
 from ..schemas.notifications import (
-    NotificationIn, NotificationUpdate, NotificationSearchIn, 
-    EmailTemplateIn, EmailTemplateUpdate, NotificationQueueIn
+    NotificationIn, NotificationOut, NotificationUpdate, NotificationSearchIn, 
+    EmailTemplateIn, EmailTemplateOut, EmailTemplateUpdate, NotificationQueueIn, NotificationQueueOut, NotificationPriority
 )
+from ..core.config import settings
 from datetime import datetime, timedelta
+from ...shared.pagination import Page, keyset_page
+from ...shared.query_shaping import project
+
+
+class ClaimedNotification(NamedTuple):
+    queue_id: int
+    retry_count: int
+    notification_id: int
+    recipient_email: str
+    recipient_name: Optional[str]
+    subject: str
+    message: str
+
+
+def retry_backoff(retry_count: int) -> timedelta:
+    """
+    Exponential backoff before the next attempt: base, 2x base, 4x base... up to the configured maximum
+    """
+    seconds = settings.queue_retry_base_seconds * (2 ** max(0, retry_count - 1))
+    return timedelta(seconds=min(seconds, settings.queue_retry_max_seconds))
 
 
 class NotificationRepository:
@@ -56,6 +77,148 @@ class NotificationRepository:
         self.db.refresh(db_notification)
         return db_notification
 
+    def create_notifications(self, notifications_data: List[NotificationIn], leased: bool = False) -> List[Notification]:
+        """
+        Create many notifications (with queue and log entries) in a single transaction
+
+        ``leased``: the caller sends them right away, so the queue entries are created already
+        leased (as ``claim_queue_batch`` would) and no worker picks them up meanwhile; the caller
+        settles them with ``record_delivery_results``. If it dies first, the lease expires and the
+        worker sends them.
+        """
+        next_retry_at = datetime.utcnow() + timedelta(seconds=settings.queue_lease_seconds) if leased else None
+        db_notifications = [
+            Notification(**notification_data.dict())
+            for notification_data in notifications_data
+        ]
+        self.db.add_all(db_notifications)
+        self.db.flush()  # Get the IDs
+
+        for db_notification in db_notifications:
+            self.db.add(NotificationQueue(
+                notification_id=db_notification.id,
+                priority=db_notification.priority,
+                next_retry_at=next_retry_at
+            ))
+            self.db.add(NotificationLog(
+                notification_id=db_notification.id,
+                action="created",
+                description="Notificação criada"
+            ))
+
+        ids = [db_notification.id for db_notification in db_notifications]
+        self.db.commit()
+        # The commit expired every instance: reload them with one SELECT instead of one per row on first access
+        self.db.query(Notification).filter(Notification.id.in_(ids)).all()
+        return db_notifications
+
+    def get_notified_recipients(self, related_entity_type: str, related_entity_id: str) -> Set[str]:
+        """Recipients that already have a notification for this related entity"""
+        rows = self.db.query(Notification.recipient_email).filter(
+            Notification.related_entity_type == related_entity_type,
+            Notification.related_entity_id == related_entity_id
+        ).all()
+        return {row[0] for row in rows}
+
+    def claim_queue_batch(self, limit: int, statuses: Sequence[str] = ("pending", "failed")) -> List[ClaimedNotification]:
+        """
+        Claim due queue entries for sending; safe to run from several workers at once.
+
+        Rows are picked with ``FOR UPDATE SKIP LOCKED`` (entries locked by another worker are
+        skipped instead of waited on) and leased by pushing ``next_retry_at`` forward before the
+        commit, so they stay invisible to other workers while being sent. If the worker dies,
+        the entries become due again once the lease expires.
+        """
+        now = datetime.utcnow()
+        # Compared through the column so the values bind as the enum type (a bare string fails on PostgreSQL)
+        priority_rank = case(
+            (NotificationQueue.priority == NotificationPriority.URGENT, 3),
+            (NotificationQueue.priority == NotificationPriority.HIGH, 2),
+            (NotificationQueue.priority == NotificationPriority.LOW, 0),
+            else_=1
+        )
+        rows = self.db.query(
+            NotificationQueue.id,
+            NotificationQueue.retry_count,
+            Notification.id,
+            Notification.recipient_email,
+            Notification.recipient_name,
+            Notification.subject,
+            Notification.message
+        ).join(
+            Notification, Notification.id == NotificationQueue.notification_id
+        ).filter(
+            NotificationQueue.status.in_(statuses),
+            NotificationQueue.retry_count < NotificationQueue.max_retries,
+            or_(NotificationQueue.next_retry_at.is_(None), NotificationQueue.next_retry_at <= now),
+            Notification.status.in_(["pending", "failed"]),
+            or_(Notification.scheduled_at.is_(None), Notification.scheduled_at <= now),
+            or_(Notification.expires_at.is_(None), Notification.expires_at > now)
+        ).order_by(
+            priority_rank.desc(),
+            NotificationQueue.next_retry_at.asc().nullsfirst(),
+            NotificationQueue.id.asc()
+        ).limit(limit).with_for_update(of=NotificationQueue, skip_locked=True).all()
+
+        if rows:
+            self.db.query(NotificationQueue).filter(NotificationQueue.id.in_([row[0] for row in rows])).update(
+                {NotificationQueue.next_retry_at: now + timedelta(seconds=settings.queue_lease_seconds),
+                 NotificationQueue.updated_at: now},
+                synchronize_session=False
+            )
+        self.db.commit()
+        return [ClaimedNotification(*row) for row in rows]
+
+    def record_delivery_results(self, results: Dict[int, Optional[str]]) -> None:
+        """
+        Mark notifications as sent (``None``) or failed (error message) in a single transaction
+        """
+        now = datetime.utcnow()
+        sent_ids = [notification_id for notification_id, error in results.items() if error is None]
+        failed = {notification_id: error for notification_id, error in results.items() if error is not None}
+
+        if sent_ids:
+            self.db.query(Notification).filter(Notification.id.in_(sent_ids)).update(
+                {Notification.status: "sent", Notification.sent_at: now, Notification.updated_at: now},
+                synchronize_session=False
+            )
+            self.db.query(NotificationQueue).filter(NotificationQueue.notification_id.in_(sent_ids)).update(
+                {NotificationQueue.status: "sent", NotificationQueue.next_retry_at: None,
+                 NotificationQueue.updated_at: now},
+                synchronize_session=False
+            )
+
+        if failed:
+            queue_rows = self.db.query(
+                NotificationQueue.id, NotificationQueue.retry_count, NotificationQueue.max_retries
+            ).filter(NotificationQueue.notification_id.in_(list(failed))).all()
+            self.db.bulk_update_mappings(NotificationQueue, [
+                {
+                    "id": queue_id,
+                    "status": "failed",
+                    "retry_count": retry_count + 1,
+                    # Exhausted entries keep no retry time and are never claimed again
+                    "next_retry_at": now + retry_backoff(retry_count + 1) if retry_count + 1 < max_retries else None,
+                    "updated_at": now
+                }
+                for queue_id, retry_count, max_retries in queue_rows
+            ])
+            self.db.bulk_update_mappings(Notification, [
+                {"id": notification_id, "status": "failed", "failed_at": now,
+                 "failure_reason": error, "updated_at": now}
+                for notification_id, error in failed.items()
+            ])
+
+        self.db.add_all([
+            NotificationLog(
+                notification_id=notification_id,
+                action="sent" if error is None else "failed",
+                description="Notificação enviada com sucesso" if error is None else f"Erro ao enviar notificação: {error}"
+            )
+            for notification_id, error in results.items()
+        ])
+        self.db.commit()
+
     def get_notification(self, notification_id: int) -> Optional[Notification]:
         return self.db.query(Notification).filter(Notification.id == notification_id).first()
 
@@ -66,8 +229,11 @@ class NotificationRepository:
                           template_type: Optional[str] = None,
                           tenant_id: Optional[int] = None,
                           unit_id: Optional[int] = None,
-                          user_id: Optional[str] = None) -> List[Notification]:
-        query = self.db.query(Notification)
+                          user_id: Optional[str] = None,
+                          cursor: Optional[str] = None,
+                          limit: Optional[int] = None) -> Page:
+        # Read-only listings return rows with the *Out schema's columns, not entities
+        query = project(self.db.query(Notification), NotificationOut)
         
         if status:
             query = query.filter(Notification.status == status)
@@ -84,10 +250,10 @@ class NotificationRepository:
         if user_id:
             query = query.filter(Notification.user_id == user_id)
             
-        return query.order_by(desc(Notification.created_at)).all()
+        return keyset_page(query, Notification.created_at, Notification.id, cursor, limit)
 
-    def search_notifications(self, search_data: NotificationSearchIn) -> List[Notification]:
-        query = self.db.query(Notification)
+    def search_notifications(self, search_data: NotificationSearchIn) -> List:
+        query = project(self.db.query(Notification), NotificationOut)
         
         if search_data.recipient_email:
             query = query.filter(Notification.recipient_email.ilike(f"%{search_data.recipient_email}%"))
@@ -149,8 +315,8 @@ class NotificationRepository:
         self.db.commit()
         return True
 
-    def get_pending_notifications(self, limit: int = 100) -> List[Notification]:
-        return self.db.query(Notification).filter(
+    def get_pending_notifications(self, limit: int = 100) -> List:
+        return project(self.db.query(Notification), NotificationOut).filter(
             Notification.status == "pending",
             or_(
                 Notification.scheduled_at.is_(None),
@@ -158,17 +324,48 @@ class NotificationRepository:
             )
         ).order_by(Notification.priority.desc(), Notification.created_at.asc()).limit(limit).all()
 
-    def get_failed_notifications(self, limit: int = 100) -> List[Notification]:
-        return self.db.query(Notification).filter(
+    def get_failed_notifications(self, limit: int = 100) -> List:
+        return project(self.db.query(Notification), NotificationOut).filter(
             Notification.status == "failed"
         ).order_by(Notification.created_at.desc()).limit(limit).all()
 
-    def get_expired_notifications(self) -> List[Notification]:
-        return self.db.query(Notification).filter(
+    def get_expired_notifications(self) -> List:
+        return project(self.db.query(Notification), NotificationOut).filter(
             Notification.expires_at < datetime.utcnow(),
             Notification.status == "pending"
         ).all()
 
+    def cancel_expired_notifications(self) -> int:
+        """
+        Cancel every pending notification past its expiry: one UPDATE ... RETURNING and one batch of
+        log entries, whatever the number of rows. Only the rows this UPDATE changed are logged and
+        counted, so a notification sent or cancelled concurrently is left alone.
+        """
+        now = datetime.utcnow()
+        expired_ids = self.db.execute(
+            update(Notification)
+            .where(Notification.expires_at < now, Notification.status == "pending")
+            .values({Notification.status: "cancelled", Notification.updated_at: now})
+            .returning(Notification.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        if not expired_ids:
+            self.db.commit()
+            return 0
+
+        self.db.bulk_insert_mappings(NotificationLog, [
+            log
+            for notification_id in expired_ids
+            for log in (
+                {"notification_id": notification_id, "action": "updated",
+                 "description": "Notificação atualizada: status", "details": {"status": "cancelled"}},
+                {"notification_id": notification_id, "action": "expired",
+                 "description": "Notificação expirada e cancelada", "details": None},
+            )
+        ])
+        self.db.commit()
+        return len(expired_ids)
+
     def get_notification_logs(self, notification_id: int) -> List[NotificationLog]:
         return self.db.query(NotificationLog).filter(
             NotificationLog.notification_id == notification_id
@@ -284,13 +481,20 @@ class NotificationRepository:
             EmailTemplate.is_active == True
         ).first()
 
-    def list_email_templates(self, is_active: Optional[bool] = None) -> List[EmailTemplate]:
-        query = self.db.query(EmailTemplate)
+    def get_email_template_version(self, template_type: str):
+        """(id, updated_at) of the active template, without loading its content"""
+        return self.db.query(EmailTemplate.id, EmailTemplate.updated_at).filter(
+            EmailTemplate.template_type == template_type,
+            EmailTemplate.is_active == True
+        ).first()
+
+    def list_email_templates(self, is_active: Optional[bool] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        query = project(self.db.query(EmailTemplate), EmailTemplateOut)
         
         if is_active is not None:
             query = query.filter(EmailTemplate.is_active == is_active)
             
-        return query.order_by(desc(EmailTemplate.created_at)).all()
+        return keyset_page(query, EmailTemplate.created_at, EmailTemplate.id, cursor, limit)
 
     def update_email_template(self, template_id: int, update_data: EmailTemplateUpdate) -> Optional[EmailTemplate]:
         db_template = self.get_email_template(template_id)
@@ -317,8 +521,8 @@ class NotificationRepository:
         return True
 
     # Notification Queue methods
-    def get_queue_entries(self, status: Optional[str] = None, limit: int = 100) -> List[NotificationQueue]:
-        query = self.db.query(NotificationQueue)
+    def get_queue_entries(self, status: Optional[str] = None, limit: int = 100) -> List:
+        query = project(self.db.query(NotificationQueue), NotificationQueueOut)
         
         if status:
             query = query.filter(NotificationQueue.status == status)
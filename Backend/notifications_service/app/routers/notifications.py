@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.db import get_db
@@ -9,6 +9,7 @@ from ..schemas.notifications import (
 )
 from ..services.notification_service import NotificationService
 from datetime import datetime, timedelta
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
@@ -28,6 +29,7 @@ def send_bulk_notifications(bulk_data: BulkNotificationIn, db: Session = Depends
 
 @router.get("/", response_model=List[NotificationOut])
 def list_notifications(
+    response: Response,
     status: Optional[str] = None,
     notification_type: Optional[str] = None,
     priority: Optional[str] = None,
@@ -35,12 +37,14 @@ def list_notifications(
     tenant_id: Optional[int] = None,
     unit_id: Optional[int] = None,
     user_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = NotificationService(db)
-    return service.list_notifications(
-        status, notification_type, priority, template_type, tenant_id, unit_id, user_id
-    )
+    return set_next_cursor(response, service.list_notifications(
+        status, notification_type, priority, template_type, tenant_id, unit_id, user_id, cursor, limit
+    ))
 
 
 @router.post("/search", response_model=List[NotificationOut])
@@ -245,9 +249,9 @@ def create_email_template(template_data: EmailTemplateIn, created_by: str = "Sis
 
 
 @router.get("/templates/", response_model=List[EmailTemplateOut])
-def list_email_templates(is_active: Optional[bool] = None, db: Session = Depends(get_db)):
+def list_email_templates(response: Response, is_active: Optional[bool] = None, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1), db: Session = Depends(get_db)):
     service = NotificationService(db)
-    return service.list_email_templates(is_active)
+    return set_next_cursor(response, service.list_email_templates(is_active, cursor, limit))
 
 
 @router.get("/templates/{template_id}", response_model=EmailTemplateOut)
@@ -4,12 +4,44 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import List, Optional, Dict, Any
+from email.message import Message
+from typing import List, Optional, Dict, Any, Tuple
 from ..core.config import settings
+from .smtp_delivery import BulkDeliveryEngine, DeliveryResult, SMTPSessionPool
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+_bulk_engine: Optional[BulkDeliveryEngine] = None
+_bulk_engine_lock = threading.Lock()
+
+
+def get_bulk_engine() -> BulkDeliveryEngine:
+    """
+    Process-wide bulk engine, so pooled SMTP sessions survive across requests
+    """
+    global _bulk_engine
+    if _bulk_engine is None:
+        with _bulk_engine_lock:
+            if _bulk_engine is None:
+                pool = SMTPSessionPool(
+                    EmailService().connect,
+                    max_size=settings.smtp_pool_size,
+                    max_messages=settings.smtp_messages_per_session,
+                    max_idle=settings.smtp_session_max_idle,
+                )
+                _bulk_engine = BulkDeliveryEngine(pool, workers=settings.smtp_bulk_workers)
+    return _bulk_engine
+
+
+def close_bulk_engine() -> None:
+    global _bulk_engine
+    with _bulk_engine_lock:
+        if _bulk_engine is not None:
+            _bulk_engine.pool.close()
+            _bulk_engine = None
+
 
 class EmailService:
     def __init__(self):
@@ -19,6 +51,69 @@ class EmailService:
         self.smtp_password = settings.smtp_password
         self.smtp_use_tls = settings.smtp_use_tls
         self.smtp_use_ssl = settings.smtp_use_ssl
+        self.smtp_timeout = settings.smtp_timeout
+
+    def connect(self) -> smtplib.SMTP:
+        """
+        Open an SMTP connection, negotiate TLS and authenticate
+        """
+        if self.smtp_use_ssl:
+            context = ssl.create_default_context()
+            server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, context=context, timeout=self.smtp_timeout)
+        else:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.smtp_timeout)
+        try:
+            if self.smtp_use_tls and not self.smtp_use_ssl:
+                server.starttls()
+            if self.smtp_username:
+                server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def build_message(self,
+                      to_email: str,
+                      subject: str,
+                      html_content: str,
+                      text_content: Optional[str] = None,
+                      from_name: Optional[str] = None,
+                      attachments: Optional[List[str]] = None) -> MIMEMultipart:
+        """
+        Build a MIME message with HTML and optional text content
+        """
+        # Create message
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = f"{from_name or 'Sistema'} <{self.smtp_username}>"
+        msg['To'] = to_email
+
+        # Add text content
+        if text_content:
+            text_part = MIMEText(text_content, 'plain', 'utf-8')
+            msg.attach(text_part)
+
+        # Add HTML content
+        html_part = MIMEText(html_content, 'html', 'utf-8')
+        msg.attach(html_part)
+
+        # Add attachments
+        if attachments:
+            for attachment_path in attachments:
+                try:
+                    with open(attachment_path, "rb") as attachment:
+                        part = MIMEBase('application', 'octet-stream')
+                        part.set_payload(attachment.read())
+                        encoders.encode_base64(part)
+                        part.add_header(
+                            'Content-Disposition',
+                            f'attachment; filename= {attachment_path.split("/")[-1]}'
+                        )
+                        msg.attach(part)
+                except Exception as e:
+                    logger.error(f"Error attaching file {attachment_path}: {str(e)}")
+
+        return msg
 
     def send_email(self, 
                    to_email: str, 
@@ -31,49 +126,11 @@ class EmailService:
         Send an email with HTML and optional text content
         """
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = f"{from_name or 'Sistema'} <{self.smtp_username}>"
-            msg['To'] = to_email
-
-            # Add text content
-            if text_content:
-                text_part = MIMEText(text_content, 'plain', 'utf-8')
-                msg.attach(text_part)
-
-            # Add HTML content
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            msg.attach(html_part)
-
-            # Add attachments
-            if attachments:
-                for attachment_path in attachments:
-                    try:
-                        with open(attachment_path, "rb") as attachment:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(attachment.read())
-                            encoders.encode_base64(part)
-                            part.add_header(
-                                'Content-Disposition',
-                                f'attachment; filename= {attachment_path.split("/")[-1]}'
-                            )
-                            msg.attach(part)
-                    except Exception as e:
-                        logger.error(f"Error attaching file {attachment_path}: {str(e)}")
+            msg = self.build_message(to_email, subject, html_content, text_content, from_name, attachments)
 
             # Send email
-            if self.smtp_use_ssl:
-                context = ssl.create_default_context()
-                with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, context=context) as server:
-                    server.login(self.smtp_username, self.smtp_password)
-                    server.send_message(msg)
-            else:
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    if self.smtp_use_tls:
-                        server.starttls()
-                    server.login(self.smtp_username, self.smtp_password)
-                    server.send_message(msg)
+            with self.connect() as server:
+                server.send_message(msg)
 
             logger.info(f"Email sent successfully to {to_email}")
             return True
@@ -82,6 +139,12 @@ class EmailService:
             logger.error(f"Error sending email to {to_email}: {str(e)}")
             return False
 
+    def deliver_bulk(self, messages: List[Tuple[str, Message]]) -> List[DeliveryResult]:
+        """
+        Send prebuilt ``(recipient, message)`` pairs over the pooled SMTP sessions
+        """
+        return get_bulk_engine().deliver(messages)
+
     def send_bulk_email(self, 
                        to_emails: List[str], 
                        subject: str, 
@@ -92,24 +155,11 @@ class EmailService:
         """
         Send bulk emails to multiple recipients
         """
-        results = {}
-        
-        for email in to_emails:
-            try:
-                success = self.send_email(
-                    to_email=email,
-                    subject=subject,
-                    html_content=html_content,
-                    text_content=text_content,
-                    from_name=from_name,
-                    attachments=attachments
-                )
-                results[email] = success
-            except Exception as e:
-                logger.error(f"Error sending bulk email to {email}: {str(e)}")
-                results[email] = False
-        
-        return results
+        messages = [
+            (email, self.build_message(email, subject, html_content, text_content, from_name, attachments))
+            for email in to_emails
+        ]
+        return {result.recipient: result.success for result in self.deliver_bulk(messages)}
 
     def send_template_email(self, 
                            to_email: str, 
@@ -308,15 +358,8 @@ class EmailService:
         Test SMTP connection
         """
         try:
-            if self.smtp_use_ssl:
-                context = ssl.create_default_context()
-                with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, context=context) as server:
-                    server.login(self.smtp_username, self.smtp_password)
-            else:
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                    if self.smtp_use_tls:
-                        server.starttls()
-                    server.login(self.smtp_username, self.smtp_password)
+            with self.connect() as server:
+                server.noop()
             
             logger.info("SMTP connection test successful")
             return True
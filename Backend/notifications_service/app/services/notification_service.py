@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from ..repositories.notification_repository import NotificationRepository
 from ..services.email_service import EmailService
 from ..schemas.notifications import (
@@ -7,11 +7,21 @@ from ..schemas.notifications import (
     EmailTemplateIn, EmailTemplateOut, EmailTemplateUpdate, 
     NotificationStatsOut, BulkNotificationIn, NotificationQueueOut
 )
+from ..core.config import settings
 from datetime import datetime, timedelta
 import logging
+from ...shared.pagination import Page
+from ...shared.templates import CompiledEmail, RenderedEmail, TemplateCache
 
 logger = logging.getLogger(__name__)
 
+# Compiled email templates, shared by every request of the process
+template_cache = TemplateCache(settings.template_cache_size)
+
+
+def _template_key(template_type) -> str:
+    return getattr(template_type, "value", template_type)
+
 
 class NotificationService:
     def __init__(self, db: Session):
@@ -35,11 +45,13 @@ class NotificationService:
                           template_type: Optional[str] = None,
                           tenant_id: Optional[int] = None,
                           unit_id: Optional[int] = None,
-                          user_id: Optional[str] = None) -> List[NotificationOut]:
-        notifications = self.repository.list_notifications(
-            status, notification_type, priority, template_type, tenant_id, unit_id, user_id
+                          user_id: Optional[str] = None,
+                          cursor: Optional[str] = None,
+                          limit: Optional[int] = None) -> Page:
+        page = self.repository.list_notifications(
+            status, notification_type, priority, template_type, tenant_id, unit_id, user_id, cursor, limit
         )
-        return [NotificationOut.from_orm(notification) for notification in notifications]
+        return Page([NotificationOut.from_orm(notification) for notification in page.items], page.next_cursor)
 
     def search_notifications(self, search_data: NotificationSearchIn) -> List[NotificationOut]:
         notifications = self.repository.search_notifications(search_data)
@@ -133,16 +145,14 @@ class NotificationService:
         Send a notification using a template
         """
         try:
-            # Get template
-            template = self.repository.get_email_template_by_type(template_type)
+            # Get compiled template
+            template = self.get_compiled_template(template_type)
             if not template:
                 logger.error(f"Template {template_type} not found")
                 return False
             
             # Replace variables in template
-            subject = template.subject.format(**template_data)
-            html_content = template.html_content.format(**template_data)
-            text_content = template.text_content.format(**template_data) if template.text_content else None
+            subject, html_content, text_content = template.render(template_data)
             
             # Send email
             success = self.email_service.send_email(
@@ -173,86 +183,144 @@ class NotificationService:
 
     def send_bulk_notifications(self, bulk_data: BulkNotificationIn) -> Dict[str, bool]:
         """
-        Send bulk notifications
+        Send bulk notifications over the pooled SMTP delivery engine
+
+        With ``related_entity_type``/``related_entity_id`` set the request is idempotent: recipients
+        that already have a notification for that entity are skipped (reported as successful), so
+        a caller retrying after a timeout does not send the same e-mail twice. A concurrent copy of
+        the request is rejected by the unique index on (type, id, recipient).
         """
+        names = bulk_data.recipient_names or []
+        emails = bulk_data.recipient_emails
+        indexes = list(range(len(emails)))
         results = {}
-        
-        for i, email in enumerate(bulk_data.recipient_emails):
-            try:
-                # Create individual notification
-                notification_data = NotificationIn(
-                    recipient_email=email,
-                    recipient_name=bulk_data.recipient_names[i] if bulk_data.recipient_names and i < len(bulk_data.recipient_names) else None,
-                    subject=bulk_data.subject,
-                    message=bulk_data.message,
-                    notification_type=bulk_data.notification_type,
-                    priority=bulk_data.priority,
-                    template_type=bulk_data.template_type,
-                    template_data=bulk_data.template_data,
-                    scheduled_at=bulk_data.scheduled_at,
-                    expires_at=bulk_data.expires_at,
-                    tenant_id=bulk_data.tenant_id,
-                    unit_id=bulk_data.unit_id,
-                    user_id=bulk_data.user_id,
-                    related_entity_type=bulk_data.related_entity_type,
-                    related_entity_id=bulk_data.related_entity_id,
-                    attachments=bulk_data.attachments,
-                    created_by=bulk_data.created_by
-                )
-                
-                notification = self.repository.create_notification(notification_data)
-                success = self.send_notification(notification.id)
-                results[email] = success
-                
-            except Exception as e:
-                logger.error(f"Error creating bulk notification for {email}: {str(e)}")
-                results[email] = False
-        
+        if bulk_data.related_entity_type and bulk_data.related_entity_id:
+            notified = self.repository.get_notified_recipients(bulk_data.related_entity_type, bulk_data.related_entity_id)
+            results = {email: True for email in emails if email in notified}
+            # First occurrence of each recipient not notified yet
+            first = {}
+            for i, email in enumerate(emails):
+                if email not in notified:
+                    first.setdefault(email, i)
+            indexes = list(first.values())
+            if not indexes:
+                return results
+        rendered = self._render_bulk_template(bulk_data, names)
+        notifications_data = [
+            NotificationIn(
+                recipient_email=emails[i],
+                recipient_name=names[i] if i < len(names) else None,
+                subject=rendered[i].subject if rendered else bulk_data.subject,
+                message=rendered[i].html if rendered else bulk_data.message,
+                notification_type=bulk_data.notification_type,
+                priority=bulk_data.priority,
+                template_type=bulk_data.template_type,
+                template_data=bulk_data.template_data,
+                scheduled_at=bulk_data.scheduled_at,
+                expires_at=bulk_data.expires_at,
+                tenant_id=bulk_data.tenant_id,
+                unit_id=bulk_data.unit_id,
+                user_id=bulk_data.user_id,
+                related_entity_type=bulk_data.related_entity_type,
+                related_entity_id=bulk_data.related_entity_id,
+                attachments=bulk_data.attachments,
+                created_by=bulk_data.created_by
+            )
+            for i in indexes
+        ]
+        # Sent inline below: leased so the queue worker does not send them too
+        notifications = self.repository.create_notifications(notifications_data, leased=True)
+
+        messages = [
+            (notification.recipient_email, self.email_service.build_message(
+                to_email=notification.recipient_email,
+                subject=notification.subject,
+                html_content=notification.message,
+                text_content=rendered[i].text if rendered else None,
+                from_name=notification.recipient_name or "Sistema"
+            ))
+            for i, notification in zip(indexes, notifications)
+        ]
+        deliveries = self.email_service.deliver_bulk(messages)
+
+        self.repository.record_delivery_results({
+            notification.id: None if delivery.success else (delivery.error or "Falha ao enviar email")
+            for notification, delivery in zip(notifications, deliveries)
+        })
+
+        for delivery in deliveries:
+            if not delivery.success:
+                logger.error(f"Error sending bulk notification to {delivery.recipient}: {delivery.error}")
+            results[delivery.recipient] = results.get(delivery.recipient, True) and delivery.success
         return results
 
-    def process_pending_notifications(self, limit: int = 100) -> Dict[str, int]:
+    def _render_bulk_template(self, bulk_data: BulkNotificationIn, names: List[str]) -> Optional[List[RenderedEmail]]:
         """
-        Process pending notifications
+        Per-recipient render of the bulk template (template_data plus recipient_email and
+        recipient_name); None keeps the plain subject/message of the request
         """
-        pending_notifications = self.repository.get_pending_notifications(limit)
-        
+        if not bulk_data.template_type:
+            return None
+        contexts = [
+            {
+                **(bulk_data.template_data or {}),
+                "recipient_email": email,
+                "recipient_name": names[i] if i < len(names) else ""
+            }
+            for i, email in enumerate(bulk_data.recipient_emails)
+        ]
+        try:
+            rendered = self.render_template_batch(bulk_data.template_type, contexts)
+        except (KeyError, IndexError, AttributeError, ValueError) as e:
+            logger.error(f"Error rendering template {_template_key(bulk_data.template_type)}: {str(e)}")
+            return None
+        if rendered is None:
+            logger.error(f"Template {_template_key(bulk_data.template_type)} not found")
+        return rendered
+
+    def dispatch_queue_batch(self, limit: int = 100, statuses: Sequence[str] = ("pending", "failed")) -> Dict[str, int]:
+        """
+        Claim a batch of due queue entries, send them over the pooled SMTP engine
+        and record every outcome in one commit
+        """
+        claimed = self.repository.claim_queue_batch(limit, statuses)
         results = {
-            "processed": 0,
+            "processed": len(claimed),
             "sent": 0,
             "failed": 0
         }
-        
-        for notification in pending_notifications:
-            results["processed"] += 1
-            
-            if self.send_notification(notification.id):
-                results["sent"] += 1
-            else:
-                results["failed"] += 1
-        
+        if not claimed:
+            return results
+
+        messages = [
+            (entry.recipient_email, self.email_service.build_message(
+                to_email=entry.recipient_email,
+                subject=entry.subject,
+                html_content=entry.message,
+                from_name=entry.recipient_name or "Sistema"
+            ))
+            for entry in claimed
+        ]
+        deliveries = self.email_service.deliver_bulk(messages)
+
+        outcome = {}
+        for entry, delivery in zip(claimed, deliveries):
+            outcome[entry.notification_id] = None if delivery.success else (delivery.error or "Falha ao enviar email")
+            results["sent" if delivery.success else "failed"] += 1
+        self.repository.record_delivery_results(outcome)
         return results
 
+    def process_pending_notifications(self, limit: int = 100) -> Dict[str, int]:
+        """
+        Process pending notifications
+        """
+        return self.dispatch_queue_batch(limit, ("pending",))
+
     def retry_failed_notifications(self, limit: int = 100) -> Dict[str, int]:
         """
-        Retry failed notifications
+        Retry failed notifications whose backoff has elapsed
         """
-        failed_notifications = self.repository.get_failed_notifications(limit)
-        
-        results = {
-            "processed": 0,
-            "sent": 0,
-            "failed": 0
-        }
-        
-        for notification in failed_notifications:
-            results["processed"] += 1
-            
-            if self.send_notification(notification.id):
-                results["sent"] += 1
-            else:
-                results["failed"] += 1
-        
-        return results
+        return self.dispatch_queue_batch(limit, ("failed",))
 
     def get_notification_logs(self, notification_id: int) -> List[Dict[str, Any]]:
         logs = self.repository.get_notification_logs(notification_id)
@@ -344,19 +412,53 @@ class NotificationService:
             return EmailTemplateOut.from_orm(template)
         return None
 
-    def list_email_templates(self, is_active: Optional[bool] = None) -> List[EmailTemplateOut]:
-        templates = self.repository.list_email_templates(is_active)
-        return [EmailTemplateOut.from_orm(template) for template in templates]
+    def list_email_templates(self, is_active: Optional[bool] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        page = self.repository.list_email_templates(is_active, cursor, limit)
+        return Page([EmailTemplateOut.from_orm(template) for template in page.items], page.next_cursor)
 
     def update_email_template(self, template_id: int, update_data: EmailTemplateUpdate) -> Optional[EmailTemplateOut]:
+        previous = self.repository.get_email_template(template_id)
+        previous_type = _template_key(previous.template_type) if previous else None
         template = self.repository.update_email_template(template_id, update_data)
         if template:
+            # The type itself may have changed: drop both
+            template_cache.invalidate(previous_type)
+            template_cache.invalidate(_template_key(template.template_type))
             return EmailTemplateOut.from_orm(template)
         return None
 
     def delete_email_template(self, template_id: int) -> bool:
+        template = self.repository.get_email_template(template_id)
+        if template:
+            template_cache.invalidate(_template_key(template.template_type))
         return self.repository.delete_email_template(template_id)
 
+    def get_compiled_template(self, template_type: str) -> Optional[CompiledEmail]:
+        """
+        Active template of the type, compiled once per version: each send only reads the
+        row's (id, updated_at), the content is loaded and parsed again only after it changes
+        """
+        version = self.repository.get_email_template_version(template_type)
+        if not version:
+            return None
+
+        def compile_template() -> Optional[CompiledEmail]:
+            template = self.repository.get_email_template_by_type(template_type)
+            if not template:
+                return None
+            return CompiledEmail(template.subject, template.html_content, template.text_content)
+
+        return template_cache.get(_template_key(template_type), tuple(version), compile_template)
+
+    def render_template_batch(self, template_type: str, contexts: List[Dict[str, Any]]) -> Optional[List[RenderedEmail]]:
+        """
+        Render one template for many recipients; None when there is no active template
+        """
+        template = self.get_compiled_template(template_type)
+        if not template:
+            return None
+        return template.render_many(contexts)
+
     def test_email_connection(self) -> bool:
         """
         Test email service connection
@@ -371,46 +473,11 @@ class NotificationService:
         """
         Process notification queue
         """
-        queue_entries = self.repository.get_queue_entries("pending", limit)
-        
-        results = {
-            "processed": 0,
-            "sent": 0,
-            "failed": 0
-        }
-        
-        for entry in queue_entries:
-            results["processed"] += 1
-            
-            if self.send_notification(entry.notification_id):
-                results["sent"] += 1
-                # Update queue entry status
-                self.repository.update_queue_entry(entry.id, {"status": "sent"})
-            else:
-                results["failed"] += 1
-                # Increment retry count
-                self.repository.increment_retry_count(entry.id)
-        
-        return results
+        return self.dispatch_queue_batch(limit)
 
     def cleanup_expired_notifications(self) -> int:
         """
         Clean up expired notifications
         """
-        expired_notifications = self.repository.get_expired_notifications()
-        count = 0
-        
-        for notification in expired_notifications:
-            if self.repository.update_notification(
-                notification.id, 
-                NotificationUpdate(status="cancelled")
-            ):
-                count += 1
-                self.repository.add_notification_log(
-                    notification.id, 
-                    "expired", 
-                    "Notificação expirada e cancelada"
-                )
-        
-        return count
+        return self.repository.cancel_expired_notifications()
 
@@ -0,0 +1,193 @@
+import math
+import smtplib
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.message import Message
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _connection_lost(error: OSError) -> bool:
+    """
+    Whether the session is unusable after ``error`` (as opposed to a refused recipient/message)
+    """
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        # 421: service not available, closing transmission channel
+        return error.smtp_code == 421
+    return not isinstance(error, smtplib.SMTPException)
+
+
+def _describe(error: OSError) -> str:
+    if isinstance(error, smtplib.SMTPRecipientsRefused) and error.recipients:
+        code, message = next(iter(error.recipients.values()))
+        return f"{code} {message.decode(errors='replace')}"
+    if isinstance(error, smtplib.SMTPResponseException):
+        message = error.smtp_error
+        if isinstance(message, bytes):
+            message = message.decode(errors='replace')
+        return f"{error.smtp_code} {message}"
+    return str(error)
+
+
+class DeliveryResult(NamedTuple):
+    recipient: str
+    success: bool
+    error: Optional[str] = None
+    attempts: int = 1
+
+
+class _Session:
+    __slots__ = ('smtp', 'sent', 'last_used')
+
+    def __init__(self, smtp: smtplib.SMTP) -> None:
+        self.smtp = smtp
+        self.sent = 0
+        self.last_used = time.monotonic()
+
+
+class SMTPSessionPool:
+    """
+    Bounded pool of authenticated SMTP sessions.
+
+    - at most ``max_size`` connections are open at once (provider connection limit)
+    - a session is reused until it has sent ``max_messages`` messages, then it is closed with QUIT
+    - sessions idle for more than ``max_idle`` seconds are checked with NOOP before reuse
+    """
+
+    def __init__(self, connect: Callable[[], smtplib.SMTP], max_size: int = 4,
+                 max_messages: int = 100, max_idle: float = 30.0) -> None:
+        self._connect = connect
+        self.max_size = max_size
+        self.max_messages = max_messages
+        self.max_idle = max_idle
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle: deque = deque()
+        self._closed = False
+        self.opened = 0
+
+    def _open(self) -> _Session:
+        session = _Session(self._connect())
+        with self._lock:
+            self.opened += 1
+        return session
+
+    def _usable(self, session: _Session) -> bool:
+        if time.monotonic() - session.last_used < self.max_idle:
+            return True
+        try:
+            return session.smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    def _discard(self, session: _Session) -> None:
+        try:
+            session.smtp.quit()
+        except Exception:
+            try:
+                session.smtp.close()
+            except Exception:
+                pass
+
+    def reconnect(self, session: _Session) -> None:
+        """
+        Replace a broken connection in place, keeping the caller's pool slot
+        """
+        self._discard(session)
+        fresh = self._open()
+        session.smtp, session.sent, session.last_used = fresh.smtp, 0, fresh.last_used
+
+    @contextmanager
+    def session(self):
+        self._slots.acquire()
+        session = None
+        broken = False
+        try:
+            while session is None:
+                with self._lock:
+                    candidate = self._idle.pop() if self._idle else None
+                if candidate is None:
+                    session = self._open()
+                elif self._usable(candidate):
+                    session = candidate
+                else:
+                    self._discard(candidate)
+            yield session
+        except Exception:
+            broken = True
+            raise
+        finally:
+            if session is not None:
+                session.last_used = time.monotonic()
+                if broken or self._closed or session.sent >= self.max_messages:
+                    self._discard(session)
+                else:
+                    with self._lock:
+                        self._idle.append(session)
+            self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for session in idle:
+            self._discard(session)
+
+
+class BulkDeliveryEngine:
+    """
+    Sends many messages over pooled SMTP sessions with ``workers`` threads in parallel.
+
+    Messages are split into batches; each batch is sent back-to-back over a single session,
+    so a connection pays for TCP/TLS/AUTH once and then only MAIL/RCPT/DATA per message.
+    """
+
+    def __init__(self, pool: SMTPSessionPool, workers: int = 4) -> None:
+        self.pool = pool
+        self.workers = max(1, workers)
+
+    def _batch_size(self, total: int) -> int:
+        return max(1, min(self.pool.max_messages, math.ceil(total / self.workers)))
+
+    def _send_batch(self, batch: Sequence[Tuple[str, Message]]) -> List[DeliveryResult]:
+        results = []
+        try:
+            with self.pool.session() as session:
+                for recipient, message in batch:
+                    for attempt in (1, 2):
+                        try:
+                            session.smtp.send_message(message, to_addrs=[recipient])
+                            session.sent += 1
+                            results.append(DeliveryResult(recipient, True, None, attempt))
+                            break
+                        except OSError as e:
+                            if attempt == 1 and _connection_lost(e):
+                                # Connection dropped mid-batch: reconnect and retry once
+                                self.pool.reconnect(session)
+                                continue
+                            results.append(DeliveryResult(recipient, False, _describe(e), attempt))
+                            break
+        except Exception as e:
+            # Could not (re)connect: everything not yet attempted fails with the same reason
+            logger.error(f"SMTP session failed: {str(e)}")
+            results.extend(DeliveryResult(recipient, False, str(e), 1) for recipient, _ in batch[len(results):])
+        return results
+
+    def deliver(self, messages: Sequence[Tuple[str, Message]]) -> List[DeliveryResult]:
+        """
+        Send ``(recipient, message)`` pairs and return one result per pair, in input order
+        """
+        if not messages:
+            return []
+        size = self._batch_size(len(messages))
+        batches = [messages[i:i + size] for i in range(0, len(messages), size)]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(batches))) as executor:
+            return [result for batch in executor.map(self._send_batch, batches) for result in batch]
@@ -1,15 +1,43 @@
+import logging
 from fastapi import FastAPI
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateIndex
 from .app.core.db import engine, Base
+from .app.models.notifications import Notification
 from .app.routers import notifications
+from .app.services.email_service import close_bulk_engine
+from .app.services.notification_service import template_cache
+from .shared.statement_budget import install_statement_budget
 
 # Create tables
 Base.metadata.create_all(bind=engine)
+# Tables created before bulk sends were idempotent get the unique index too
+try:
+    with engine.begin() as conn:
+        for index in Notification.__table__.indexes:
+            if index.name == "uq_notifications_related_recipient":
+                conn.execute(CreateIndex(index, if_not_exists=True))
+except IntegrityError as e:
+    # Duplicates from before the index: bulk sends still skip notified recipients, only the
+    # guard against two concurrent copies of the same request is missing
+    logging.getLogger(__name__).warning(f"uq_notifications_related_recipient not created: {e}")
 
 app = FastAPI(title="Notifications Service", version="1.0.0")
 
+# N+1 detector, only when SQL_STATEMENT_BUDGET is set (tests/CI)
+install_statement_budget(app, engine)
+
 # Include routers
 app.include_router(notifications.router, prefix="/api")
 
+@app.on_event("shutdown")
+def close_smtp_sessions():
+    close_bulk_engine()
+
+@app.get("/metrics/templates")
+def template_metrics():
+    return template_cache.stats()
+
 @app.get("/health")
 def health_check():
     return {"status": "ok", "service": "Notifications Service"}
@@ -0,0 +1,86 @@
+"""
+Benchmark of the bulk SMTP delivery engine against a local aiosmtpd stand-in.
+
+Compares the old path (one connection per message, sent serially) with
+``BulkDeliveryEngine`` (pooled sessions, several messages per session, parallel workers).
+The stand-in adds artificial latency to the connection handshake and to each DATA
+command to approximate a remote provider; recipients containing "reject" are refused
+so per-recipient failures show up in the report.
+
+Usage (from Backend/):
+    pip install aiosmtpd
+    python -m notifications_service.scripts.bench_bulk_smtp --recipients 2000 --workers 4
+"""
+import argparse
+import smtplib
+import time
+from email.mime.text import MIMEText
+
+from ..app.services.smtp_delivery import BulkDeliveryEngine, SMTPSessionPool
+from ..shared.bench_smtp import SlowSMTPHandler, slow_smtp_server
+
+
+def _message(recipient: str) -> MIMEText:
+    msg = MIMEText('<p>Aviso do condomínio</p>', 'html', 'utf-8')
+    msg['Subject'] = 'Aviso'
+    msg['From'] = 'Sistema <sistema@condominio.local>'
+    msg['To'] = recipient
+    return msg
+
+
+def _serial(host: str, port: int, messages) -> int:
+    sent = 0
+    for recipient, message in messages:
+        try:
+            with smtplib.SMTP(host, port) as server:
+                server.send_message(message, to_addrs=[recipient])
+            sent += 1
+        except smtplib.SMTPException:
+            pass
+    return sent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--recipients', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--per-session', type=int, default=100)
+    parser.add_argument('--handshake-ms', type=float, default=150.0)
+    parser.add_argument('--data-ms', type=float, default=5.0)
+    parser.add_argument('--serial-sample', type=int, default=50,
+                        help='recipients sent through the old serial path (extrapolated)')
+    args = parser.parse_args()
+
+    handler = SlowSMTPHandler(args.handshake_ms / 1000, args.data_ms / 1000)
+    with slow_smtp_server(handler) as (host, port):
+        recipients = [
+            f'{"reject" if i % 500 == 499 else "morador"}{i}@condominio.local'
+            for i in range(args.recipients)
+        ]
+        messages = [(recipient, _message(recipient)) for recipient in recipients]
+
+        sample = messages[:args.serial_sample]
+        started = time.perf_counter()
+        _serial(host, port, sample)
+        serial_per_msg = (time.perf_counter() - started) / max(1, len(sample))
+
+        pool = SMTPSessionPool(lambda: smtplib.SMTP(host, port), max_size=args.workers,
+                               max_messages=args.per_session)
+        engine = BulkDeliveryEngine(pool, workers=args.workers)
+        started = time.perf_counter()
+        results = engine.deliver(messages)
+        elapsed = time.perf_counter() - started
+        pool.close()
+
+        failed = [r for r in results if not r.success]
+        print(f'recipients           {args.recipients}')
+        print(f'serial (estimated)   {serial_per_msg * args.recipients:8.2f}s  ({serial_per_msg * 1000:.1f} ms/msg)')
+        print(f'bulk engine          {elapsed:8.2f}s  ({elapsed / args.recipients * 1000:.1f} ms/msg)')
+        print(f'connections opened   {pool.opened}')
+        print(f'delivered / failed   {len(results) - len(failed)} / {len(failed)}')
+        for result in failed[:5]:
+            print(f'  {result.recipient}: {result.error}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# Detector de N+1: conta os comandos SQL de cada requisição e falha acima do limite (modo de teste)
+import logging
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Limite padrão de comandos por requisição; 0 desliga (produção). Ligado em testes/CI.
+SQL_STATEMENT_BUDGET = int(os.getenv('SQL_STATEMENT_BUDGET', '0'))
+
+# Header com o total de comandos da requisição (só com o detector ligado)
+STATEMENTS_HEADER = 'X-SQL-Statements'
+
+_current: ContextVar[Optional['StatementCounter']] = ContextVar('sql_statement_counter', default=None)
+
+
+class StatementCounter:
+    def __init__(self, limit: Optional[int] = None) -> None:
+        self.limit = limit
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def exceeded(self) -> bool:
+        return bool(self.limit) and self.count > self.limit
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    counter = _current.get()
+    if counter is not None:
+        counter.statements.append(statement)
+
+
+def watch_engine(engine) -> None:
+    """Passa a contar os comandos de ``engine`` (um ``executemany`` conta como um)."""
+    if not event.contains(engine, 'before_cursor_execute', _count_statement):
+        event.listen(engine, 'before_cursor_execute', _count_statement)
+
+
+@contextmanager
+def count_statements(limit: Optional[int] = None) -> Iterator[StatementCounter]:
+    """Conta os comandos executados dentro do bloco (engines registradas com ``watch_engine``)."""
+    counter = StatementCounter(limit)
+    token = _current.set(counter)
+    try:
+        yield counter
+    finally:
+        _current.reset(token)
+
+
+def statement_budget(limit: int):
+    """
+    Dependência de rota que troca o limite da requisição, para endpoints que legitimamente
+    executam mais comandos: ``dependencies=[Depends(statement_budget(30))]``.
+    """
+    def set_budget() -> None:
+        counter = _current.get()
+        if counter is not None:
+            counter.limit = limit
+    return set_budget
+
+
+def install_statement_budget(app, engine, limit: int = SQL_STATEMENT_BUDGET) -> None:
+    """
+    Com ``limit`` > 0, toda requisição que executar mais comandos que o limite responde 500
+    com os comandos executados: um N+1 (um SELECT por item da lista) quebra o teste em vez de
+    passar despercebido. Sem limite, não instala nada.
+    """
+    if not limit:
+        return
+    from fastapi.responses import JSONResponse
+
+    watch_engine(engine)
+
+    @app.middleware('http')
+    async def enforce_statement_budget(request, call_next):
+        # A thread das rotas síncronas herda o contexto: o contador é o mesmo objeto
+        with count_statements(limit) as counter:
+            response = await call_next(request)
+        if counter.exceeded:
+            logger.error(
+                f'{request.method} {request.url.path}: {counter.count} comandos SQL (limite {counter.limit})\n'
+                + '\n'.join(counter.statements)
+            )
+            return JSONResponse(status_code=500, headers={STATEMENTS_HEADER: str(counter.count)}, content={
+                'detail': f'Requisição executou {counter.count} comandos SQL (limite {counter.limit})',
+                'statements': counter.statements,
+            })
+        response.headers[STATEMENTS_HEADER] = str(counter.count)
+        return response
@@ -0,0 +1,78 @@
+"""
+Standalone worker for the notification queue.
+
+Each iteration claims up to ``QUEUE_BATCH_SIZE`` due entries (``FOR UPDATE SKIP LOCKED``),
+sends them over the pooled SMTP engine and records the results in one commit. Several
+worker processes can run against the same database; throughput scales with their number
+(up to the SMTP provider's connection limit, SMTP_POOL_SIZE per process).
+
+Usage (from Backend/):
+    python -m notifications_service.worker
+    python -m notifications_service.worker --once --batch-size 500
+"""
+import argparse
+import logging
+import signal
+import time
+
+from .app.core.config import settings
+from .app.core.db import SessionLocal
+from .app.services.email_service import close_bulk_engine
+from .app.services.notification_service import NotificationService
+
+logger = logging.getLogger("notifications_worker")
+
+
+class QueueWorker:
+    def __init__(self, batch_size: int, poll_interval: float) -> None:
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.running = True
+
+    def stop(self, *_) -> None:
+        # Finish the batch in flight, then exit
+        self.running = False
+
+    def run_once(self) -> dict:
+        db = SessionLocal()
+        try:
+            return NotificationService(db).dispatch_queue_batch(self.batch_size)
+        except Exception:
+            db.rollback()
+            logger.exception("Error dispatching notification batch")
+            return {"processed": 0, "sent": 0, "failed": 0}
+        finally:
+            db.close()
+
+    def run(self) -> None:
+        while self.running:
+            results = self.run_once()
+            if results["processed"]:
+                logger.info(f"Batch dispatched: {results}")
+            # A full batch means there is probably more work waiting: claim again right away
+            if results["processed"] < self.batch_size:
+                time.sleep(self.poll_interval)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Notification queue worker")
+    parser.add_argument("--batch-size", type=int, default=settings.queue_batch_size)
+    parser.add_argument("--poll-interval", type=float, default=settings.queue_poll_interval)
+    parser.add_argument("--once", action="store_true", help="dispatch a single batch and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    worker = QueueWorker(args.batch_size, args.poll_interval)
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    try:
+        if args.once:
+            logger.info(f"Batch dispatched: {worker.run_once()}")
+        else:
+            worker.run()
+    finally:
+        close_bulk_engine()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ import os
 class Settings:
     def __init__(self) -> None:
         self.database_url: str = os.getenv('DATABASE_URL', '')
+        self.report_batch_workers: int = int(os.getenv('REPORT_BATCH_WORKERS', '4'))
+        self.export_batch_size: int = int(os.getenv('EXPORT_BATCH_SIZE', '5000'))
 
 
 settings = Settings()
@@ -1,20 +1,8 @@
-import psycopg2
+from shared.db_pool import ConnectionPool
 from .config import settings
 
-
-def get_conn():
-    return psycopg2.connect(settings.database_url)
-
-
-
-
-
-
-
-
-
-
-
-
+pool = ConnectionPool(settings.database_url)
 
 
+def get_conn():
+    return pool.connection()
@@ -0,0 +1,49 @@
+import uuid
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import datetime
+from ..core.db import get_conn
+
+
+# dataset -> (colunas exportadas, tabela, coluna de data usada no filtro/ordenação)
+EXPORTS: Dict[str, Tuple[List[str], str, str]] = {
+    'reservations': (
+        ['id', 'unit_id', 'area', 'start_time', 'end_time', 'status', 'created_at'],
+        'reservations', 'start_time',
+    ),
+    'visitors': (
+        ['id', 'unit_id', 'name', 'document', 'visit_date', 'expected_duration', 'purpose',
+         'contact_phone', 'status', 'check_in', 'check_out', 'created_at'],
+        'visitors', 'visit_date',
+    ),
+    'maintenance': (
+        ['id', 'unit_id', 'title', 'description', 'priority', 'category', 'requested_by', 'status',
+         'expected_date', 'assigned_to', 'completed_date', 'created_at'],
+        'maintenance_orders', 'created_at',
+    ),
+}
+
+
+def stream_rows(dataset: str, start_date: datetime, end_date: datetime,
+                tenant_id: Optional[int], batch_size: int) -> Iterator[List[Tuple]]:
+    """Lê o dataset em lotes de ``batch_size`` por um cursor nomeado (do lado do servidor).
+
+    Só um lote fica em memória por vez, independentemente do total de linhas.
+    """
+    columns, table, date_column = EXPORTS[dataset]
+    sql = f'SELECT {", ".join(columns)} FROM {table} WHERE {date_column} BETWEEN %(start)s AND %(end)s'
+    if tenant_id is not None:
+        sql += ' AND tenant_id = %(tenant_id)s'
+    sql += f' ORDER BY {date_column}, id'
+
+    with get_conn() as conn:
+        cur = conn.cursor(name=f'export_{dataset}_{uuid.uuid4().hex}')
+        try:
+            cur.execute(sql, {'start': start_date, 'end': end_date, 'tenant_id': tenant_id})
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            cur.close()
+            conn.rollback()
@@ -1,35 +1,56 @@
 from typing import List, Tuple, Dict, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 from ..core.db import get_conn
 
 
+def _rollup_window(start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    """Parâmetros para combinar rollups diários com as pontas parciais do período.
+
+    Dias inteiramente contidos em [start_date, end_date] vêm de ``*_daily_counts`` (``first_day`` até
+    ``last_day``, exclusivo); o que sobra nas pontas é contado direto na tabela bruta.
+    """
+    first_day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    if first_day < start_date:
+        first_day += timedelta(days=1)
+    last_day = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    if last_day < first_day:
+        last_day = first_day
+    return {'start': start_date, 'end': end_date, 'first_day': first_day.date(), 'last_day': last_day.date()}
+
+
 def get_visitor_stats(start_date: datetime, end_date: datetime) -> Dict[str, Any]:
-    conn = get_conn()
-    cur = conn.cursor()
-    
-    # Total visitors
-    cur.execute('''SELECT COUNT(*) FROM visitors 
-                   WHERE visit_date BETWEEN %s AND %s''', (start_date, end_date))
-    total_visitors = cur.fetchone()[0]
-    
-    # Visitors by status
-    cur.execute('''SELECT status, COUNT(*) FROM visitors 
-                   WHERE visit_date BETWEEN %s AND %s 
-                   GROUP BY status''', (start_date, end_date))
-    status_counts = dict(cur.fetchall())
-    
-    # Visitors by unit
-    cur.execute('''SELECT u.block, u.number, COUNT(v.id) as visitor_count
-                   FROM visitors v
-                   JOIN units u ON v.unit_id = u.id
-                   WHERE v.visit_date BETWEEN %s AND %s
-                   GROUP BY u.block, u.number
-                   ORDER BY visitor_count DESC''', (start_date, end_date))
-    unit_stats = [{'block': r[0], 'number': r[1], 'count': r[2]} for r in cur.fetchall()]
-    
-    cur.close()
-    conn.close()
-    
+    # Uma única consulta: total, por status e por unidade saem de GROUPING SETS sobre o rollup diário
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute('''WITH src AS (
+                           SELECT status, unit_id, count FROM visitor_daily_counts
+                           WHERE day >= %(first_day)s AND day < %(last_day)s
+                           UNION ALL
+                           SELECT status, unit_id, 1 FROM visitors
+                           WHERE visit_date BETWEEN %(start)s AND %(end)s
+                             AND (visit_date < %(first_day)s OR visit_date >= %(last_day)s)
+                       )
+                       SELECT GROUPING(s.status), GROUPING(s.unit_id), s.status, s.unit_id, u.block, u.number, SUM(s.count)
+                       FROM src s
+                       LEFT JOIN units u ON s.unit_id = u.id
+                       GROUP BY GROUPING SETS ((), (s.status), (s.unit_id, u.block, u.number))
+                       HAVING SUM(s.count) <> 0''',
+                    _rollup_window(start_date, end_date))
+        rows = cur.fetchall()
+        cur.close()
+
+    total_visitors = 0
+    status_counts = {}
+    unit_stats = []
+    for g_status, g_unit, status, unit_id, block, number, count in rows:
+        if g_status and g_unit:
+            total_visitors = count
+        elif not g_status:
+            status_counts[status] = count
+        elif unit_id is not None:
+            unit_stats.append({'block': block, 'number': number, 'count': count})
+    unit_stats.sort(key=lambda r: r['count'], reverse=True)
+
     return {
         'total_visitors': total_visitors,
         'status_breakdown': status_counts,
@@ -38,35 +59,38 @@ def get_visitor_stats(start_date: datetime, end_date: datetime) -> Dict[str, Any
 
 
 def get_maintenance_stats(start_date: datetime, end_date: datetime) -> Dict[str, Any]:
-    conn = get_conn()
-    cur = conn.cursor()
-    
-    # Total maintenance orders
-    cur.execute('''SELECT COUNT(*) FROM maintenance_orders 
-                   WHERE created_at BETWEEN %s AND %s''', (start_date, end_date))
-    total_orders = cur.fetchone()[0]
-    
-    # Orders by status
-    cur.execute('''SELECT status, COUNT(*) FROM maintenance_orders 
-                   WHERE created_at BETWEEN %s AND %s 
-                   GROUP BY status''', (start_date, end_date))
-    status_counts = dict(cur.fetchall())
-    
-    # Orders by category
-    cur.execute('''SELECT category, COUNT(*) FROM maintenance_orders 
-                   WHERE created_at BETWEEN %s AND %s 
-                   GROUP BY category''', (start_date, end_date))
-    category_counts = dict(cur.fetchall())
-    
-    # Orders by priority
-    cur.execute('''SELECT priority, COUNT(*) FROM maintenance_orders 
-                   WHERE created_at BETWEEN %s AND %s 
-                   GROUP BY priority''', (start_date, end_date))
-    priority_counts = dict(cur.fetchall())
-    
-    cur.close()
-    conn.close()
-    
+    # GROUPING(status, category, priority) é uma máscara de bits: 3 = por status, 5 = por categoria,
+    # 6 = por prioridade e 7 = total geral
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute('''WITH src AS (
+                           SELECT status, category, priority, count FROM maintenance_daily_counts
+                           WHERE day >= %(first_day)s AND day < %(last_day)s
+                           UNION ALL
+                           SELECT status, category, priority, 1 FROM maintenance_orders
+                           WHERE created_at BETWEEN %(start)s AND %(end)s
+                             AND (created_at < %(first_day)s OR created_at >= %(last_day)s)
+                       )
+                       SELECT GROUPING(status, category, priority), status, category, priority, SUM(count)
+                       FROM src
+                       GROUP BY GROUPING SETS ((), (status), (category), (priority))
+                       HAVING SUM(count) <> 0''',
+                    _rollup_window(start_date, end_date))
+        rows = cur.fetchall()
+        cur.close()
+
+    total_orders = 0
+    status_counts, category_counts, priority_counts = {}, {}, {}
+    for grouping, status, category, priority, count in rows:
+        if grouping == 7:
+            total_orders = count
+        elif grouping == 3:
+            status_counts[status] = count
+        elif grouping == 5:
+            category_counts[category] = count
+        elif grouping == 6:
+            priority_counts[priority] = count
+
     return {
         'total_orders': total_orders,
         'status_breakdown': status_counts,
@@ -76,29 +100,35 @@ def get_maintenance_stats(start_date: datetime, end_date: datetime) -> Dict[str,
 
 
 def get_reservation_stats(start_date: datetime, end_date: datetime) -> Dict[str, Any]:
-    conn = get_conn()
-    cur = conn.cursor()
-    
-    # Total reservations
-    cur.execute('''SELECT COUNT(*) FROM reservations 
-                   WHERE start_time BETWEEN %s AND %s''', (start_date, end_date))
-    total_reservations = cur.fetchone()[0]
-    
-    # Reservations by status
-    cur.execute('''SELECT status, COUNT(*) FROM reservations 
-                   WHERE start_time BETWEEN %s AND %s 
-                   GROUP BY status''', (start_date, end_date))
-    status_counts = dict(cur.fetchall())
-    
-    # Reservations by area
-    cur.execute('''SELECT area, COUNT(*) FROM reservations 
-                   WHERE start_time BETWEEN %s AND %s 
-                   GROUP BY area''', (start_date, end_date))
-    area_counts = dict(cur.fetchall())
-    
-    cur.close()
-    conn.close()
-    
+    # GROUPING(status, area): 1 = por status, 2 = por área, 3 = total geral
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute('''WITH src AS (
+                           SELECT status, area, count FROM reservation_daily_counts
+                           WHERE day >= %(first_day)s AND day < %(last_day)s
+                           UNION ALL
+                           SELECT status, area, 1 FROM reservations
+                           WHERE start_time BETWEEN %(start)s AND %(end)s
+                             AND (start_time < %(first_day)s OR start_time >= %(last_day)s)
+                       )
+                       SELECT GROUPING(status, area), status, area, SUM(count)
+                       FROM src
+                       GROUP BY GROUPING SETS ((), (status), (area))
+                       HAVING SUM(count) <> 0''',
+                    _rollup_window(start_date, end_date))
+        rows = cur.fetchall()
+        cur.close()
+
+    total_reservations = 0
+    status_counts, area_counts = {}, {}
+    for grouping, status, area, count in rows:
+        if grouping == 3:
+            total_reservations = count
+        elif grouping == 1:
+            status_counts[status] = count
+        elif grouping == 2:
+            area_counts[area] = count
+
     return {
         'total_reservations': total_reservations,
         'status_breakdown': status_counts,
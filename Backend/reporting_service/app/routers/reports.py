@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from datetime import datetime
 from io import StringIO
 import csv
 from shared import auth_client
+from ..schemas.reports import ReportBatchRequest
 from ..services import report_service as svc
+from ..services import export_service
 
 
 router = APIRouter(prefix='/reports', tags=['reports'])
@@ -18,6 +20,15 @@ def generate_report_ep(payload: dict):
     return svc.generate_report(report_type, start_date, end_date)
 
 
+@router.post('/generate-batch', dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+def generate_report_batch_ep(request: ReportBatchRequest):
+    try:
+        reports = svc.generate_reports(request.report_types, request.start_date, request.end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {'reports': reports}
+
+
 @router.get('/reservations/export', response_class=PlainTextResponse, dependencies=[Depends(auth_client.get_current_user)])
 def export_reservations_csv(start_date: str, end_date: str):
     sd = datetime.fromisoformat(start_date)
@@ -33,3 +44,16 @@ def export_reservations_csv(start_date: str, end_date: str):
     return output.getvalue()
 
 
+@router.get('/{dataset}/export/stream')
+def stream_export(dataset: str, start_date: datetime, end_date: datetime,
+                  format: str = Query('csv', pattern='^(csv|ndjson)$'), gzip: bool = False,
+                  auth=Depends(auth_client.require_role(['admin','sindico','super_admin']))):
+    # Exportação linha a linha (reservations, visitors, maintenance) sem montar o arquivo em memória
+    try:
+        chunks = export_service.export_stream(dataset, format, start_date, end_date, auth.get('tenant_id'), gzip)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    headers = {'Content-Disposition': f'attachment; filename="{dataset}_{start_date.date()}_{end_date.date()}.{format}"'}
+    if gzip:
+        headers['Content-Encoding'] = 'gzip'
+    return StreamingResponse(chunks, media_type=export_service.FORMATS[format], headers=headers)
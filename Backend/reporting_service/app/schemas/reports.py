@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
@@ -10,6 +10,12 @@ class ReportRequest(BaseModel):
     filters: Optional[Dict[str, Any]] = {}
 
 
+class ReportBatchRequest(BaseModel):
+    report_types: List[str]
+    start_date: datetime
+    end_date: datetime
+
+
 class ReportOut(BaseModel):
     id: int
     report_type: str
@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+from ..core.config import settings
+from ..repositories import export_repository as repo
+
+FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+def _csv_chunks(columns: List[str], batches: Iterable[List[Tuple]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def _ndjson_chunks(columns: List[str], batches: Iterable[List[Tuple]]) -> Iterator[bytes]:
+    for rows in batches:
+        yield ''.join(json.dumps(dict(zip(columns, row)), default=str, ensure_ascii=False) + '\n' for row in rows).encode('utf-8')
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: container gzip
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_stream(dataset: str, fmt: str, start_date: datetime, end_date: datetime,
+                  tenant_id: Optional[int], gzip: bool = False) -> Iterator[bytes]:
+    """Gera o arquivo de exportação em pedaços, um lote do cursor por vez."""
+    if dataset not in repo.EXPORTS:
+        raise ValueError(f"Unknown export dataset: {dataset}")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    columns = repo.EXPORTS[dataset][0]
+    batches = repo.stream_rows(dataset, start_date, end_date, tenant_id, settings.export_batch_size)
+    chunks = _csv_chunks(columns, batches) if fmt == 'csv' else _ndjson_chunks(columns, batches)
+    return _gzip_chunks(chunks) if gzip else chunks
@@ -1,4 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import List
+from ..core.config import settings
+from ..core.db import pool
 from ..repositories import report_repository as repo
 
 
@@ -66,28 +70,36 @@ def generate_financial_report(start_date: datetime, end_date: datetime):
     }
 
 
-def generate_report(report_type: str, start_date: datetime, end_date: datetime):
-    if report_type == 'visitors':
-        return generate_visitor_report(start_date, end_date)
-    elif report_type == 'maintenance':
-        return generate_maintenance_report(start_date, end_date)
-    elif report_type == 'reservations':
-        return generate_reservation_report(start_date, end_date)
-    elif report_type == 'financial':
-        return generate_financial_report(start_date, end_date)
-    else:
-        raise ValueError(f"Unknown report type: {report_type}")
-
-
-
-
-
-
-
-
-
-
-
-
+REPORT_GENERATORS = {
+    'visitors': generate_visitor_report,
+    'maintenance': generate_maintenance_report,
+    'reservations': generate_reservation_report,
+    'financial': generate_financial_report,
+}
 
 
+def generate_report(report_type: str, start_date: datetime, end_date: datetime):
+    generator = REPORT_GENERATORS.get(report_type)
+    if generator is None:
+        raise ValueError(f"Unknown report type: {report_type}")
+    return generator(start_date, end_date)
+
+
+def _generate_in_own_scope(report_type: str, start_date: datetime, end_date: datetime):
+    # Threads do executor não herdam o request_scope da requisição: cada relatório pega a sua conexão
+    with pool.request_scope():
+        return generate_report(report_type, start_date, end_date)
+
+
+def generate_reports(report_types: List[str], start_date: datetime, end_date: datetime):
+    """Gera vários relatórios em paralelo (um por thread, cada um com uma conexão do pool)."""
+    unknown = [t for t in report_types if t not in REPORT_GENERATORS]
+    if unknown:
+        raise ValueError(f"Unknown report type: {', '.join(unknown)}")
+    report_types = list(dict.fromkeys(report_types))
+    if not report_types:
+        return []
+    workers = max(1, min(len(report_types), settings.report_batch_workers))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='report') as executor:
+        futures = [executor.submit(_generate_in_own_scope, t, start_date, end_date) for t in report_types]
+        return [f.result() for f in futures]
@@ -2,8 +2,20 @@
 from fastapi import FastAPI
 from app.routers.health import router as health_router
 from app.routers.reports import router as reports_router
+from app.core.db import pool
+from shared.db_pool import PoolScopeMiddleware
 
 app = FastAPI(title='Reporting Service')
 
+app.add_middleware(PoolScopeMiddleware, pool=pool)
+
 app.include_router(health_router)
 app.include_router(reports_router)
+
+@app.get('/metrics/db-pool')
+def db_pool_metrics():
+    return pool.stats()
+
+@app.on_event('shutdown')
+def close_db_pool():
+    pool.close()
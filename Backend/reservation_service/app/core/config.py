@@ -4,6 +4,11 @@ import os
 class Settings:
     def __init__(self) -> None:
         self.database_url: str = os.getenv('DATABASE_URL', '')
+        # 'psycopg2' (rotas def + pool síncrono) ou 'asyncpg' (rotas async def + pool asyncpg)
+        self.db_driver: str = os.getenv('DB_DRIVER', 'psycopg2')
+        # Índice de disponibilidade em memória (ver app/services/availability_index.py)
+        self.availability_refresh_seconds: int = int(os.getenv('AVAILABILITY_REFRESH_SECONDS', '300'))
+        self.availability_history_days: int = int(os.getenv('AVAILABILITY_HISTORY_DAYS', '30'))
 
 
 settings = Settings()
@@ -1,68 +1,134 @@
 from typing import List, Tuple, Optional
+from psycopg2 import errors
+from shared.pagination import Page, after_position, decode_cursor, fetch_limit, list_size, page_from_rows
 from ..core.db import get_conn
 
 
-def list_all() -> List[Tuple]:
-    conn = get_conn(); cur = conn.cursor()
-    cur.execute('SELECT id,unit_id,area,start_time,end_time,status FROM reservations ORDER BY start_time DESC')
-    rows = cur.fetchall(); cur.close(); conn.close()
-    return rows
+class ReservationConflict(Exception):
+    """Outra reserva ativa ocupa a mesma área no mesmo horário."""
 
 
-def list_by_owner(owner_id: int) -> List[Tuple]:
-    conn = get_conn(); cur = conn.cursor()
-    cur.execute('SELECT id,unit_id,area,start_time,end_time,status FROM reservations WHERE unit_id IN (SELECT id FROM units WHERE owner_id=%s) ORDER BY start_time DESC', (owner_id,))
-    rows = cur.fetchall(); cur.close(); conn.close()
-    return rows
+def _list_page(conditions: List[str], params: list, cursor: Optional[str], limit: Optional[int]) -> Page:
+    size = list_size(limit, cursor)
+    position = decode_cursor(cursor)
+    if position:
+        condition, after_params = after_position(position)
+        conditions = conditions + [condition]
+        params = params + after_params
+    where = f"WHERE {' AND '.join(conditions)} " if conditions else ''
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute(f'SELECT id,unit_id,area,start_time,end_time,status,created_at FROM reservations {where}ORDER BY created_at DESC, id DESC LIMIT %s',
+                    (*params, fetch_limit(size)))
+        rows = cur.fetchall(); cur.close()
+    return page_from_rows(rows, size, lambda r: (r[6], r[0]))
+
+
+def list_all(tenant_id: Optional[int] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    if tenant_id is None:
+        return _list_page([], [], cursor, limit)
+    return _list_page(['tenant_id=%s'], [tenant_id], cursor, limit)
+
+
+def list_by_owner(owner_id: int, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    return _list_page(['unit_id IN (SELECT id FROM units WHERE owner_id=%s)'], [owner_id], cursor, limit)
 
 
 def get_unit_owner_id(unit_id: int) -> Optional[int]:
-    conn = get_conn(); cur = conn.cursor()
-    cur.execute('SELECT owner_id FROM units WHERE id=%s', (unit_id,))
-    rr = cur.fetchone(); cur.close(); conn.close()
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute('SELECT owner_id FROM units WHERE id=%s', (unit_id,))
+        rr = cur.fetchone(); cur.close()
     return rr[0] if rr else None
 
 
-def has_conflict(area: str, start_time, end_time) -> bool:
-    conn = get_conn(); cur = conn.cursor()
-    cur.execute("""SELECT id FROM reservations
-                 WHERE area=%s AND status!='cancelled' AND NOT (end_time <= %s OR start_time >= %s)""",
-                (area, start_time, end_time))
-    conflict = cur.fetchone(); cur.close(); conn.close()
+def has_conflict(tenant_id: Optional[int], area: str, start_time, end_time) -> bool:
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""SELECT id FROM reservations
+                     WHERE tenant_id IS NOT DISTINCT FROM %s AND area=%s AND status!='cancelled' AND tsrange(start_time, end_time) && tsrange(%s::timestamp, %s::timestamp)""",
+                    (tenant_id, area, start_time, end_time))
+        conflict = cur.fetchone(); cur.close()
     return bool(conflict)
 
 
-def count_upcoming_for_unit(unit_id: int) -> int:
-    conn = get_conn(); cur = conn.cursor()
-    cur.execute("""SELECT COUNT(*) FROM reservations WHERE unit_id=%s AND status!='cancelled'
-                 AND start_time >= now() AND start_time <= now() + interval '30 days'""",
-                (unit_id,))
-    cnt = cur.fetchone()[0]; cur.close(); conn.close()
-    return cnt
+def list_active_since(since) -> List[Tuple]:
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("SELECT id,tenant_id,area,start_time,end_time FROM reservations WHERE status!='cancelled' AND end_time >= %s", (since,))
+        rows = cur.fetchall(); cur.close()
+    return rows
+
+
+def list_active_between(tenant_id: Optional[int], area: str, start_time, end_time) -> List[Tuple]:
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute("""SELECT id,start_time,end_time FROM reservations
+                     WHERE tenant_id IS NOT DISTINCT FROM %s AND area=%s AND status!='cancelled' AND tsrange(start_time, end_time) && tsrange(%s::timestamp, %s::timestamp)""",
+                    (tenant_id, area, start_time, end_time))
+        rows = cur.fetchall(); cur.close()
+    return rows
 
 
-def insert(unit_id: int, area: str, start_time, end_time, status: str) -> int:
-    conn = get_conn(); cur = conn.cursor()
-    try:
-        cur.execute('INSERT INTO reservations (unit_id, area, start_time, end_time, status) VALUES (%s,%s,%s,%s,%s) RETURNING id', (unit_id, area, start_time, end_time, status))
-        rid = cur.fetchone()[0]; conn.commit(); return rid
-    except Exception as e:
-        conn.rollback(); raise e
-    finally:
-        cur.close(); conn.close()
+def book(unit_id: int, area: str, start_time, end_time, status: str,
+         max_upcoming: int, required_owner_id=None) -> Tuple[bool, Optional[int], bool, int, Optional[int], Optional[int]]:
+    """Verifica dono, conflito e cota e insere a reserva num único comando (uma ida ao banco).
+
+    Retorna (unidade_existe, owner_id, conflito, reservas_nos_proximos_30_dias, id_inserido, tenant_id).
+    ``id_inserido`` é None quando alguma verificação falhou. Reservas concorrentes que passem
+    pela checagem ao mesmo tempo são barradas pela constraint ``reservations_no_overlap``.
+    """
+    with get_conn() as conn:
+        cur = conn.cursor()
+        try:
+            cur.execute("""
+                WITH unit AS (
+                    SELECT id, tenant_id, owner_id FROM units WHERE id=%(unit_id)s
+                ), conflict AS (
+                    SELECT 1 FROM reservations r, unit u
+                    WHERE r.tenant_id IS NOT DISTINCT FROM u.tenant_id AND r.area=%(area)s AND r.status!='cancelled'
+                      AND tsrange(r.start_time, r.end_time) && tsrange(%(start_time)s::timestamp, %(end_time)s::timestamp)
+                    LIMIT 1
+                ), upcoming AS (
+                    SELECT COUNT(*) AS n FROM reservations WHERE unit_id=%(unit_id)s AND status!='cancelled'
+                      AND start_time >= now() AND start_time <= now() + interval '30 days'
+                ), ins AS (
+                    INSERT INTO reservations (tenant_id, unit_id, area, start_time, end_time, status)
+                    SELECT u.tenant_id, u.id, %(area)s, %(start_time)s::timestamp, %(end_time)s::timestamp, %(status)s
+                    FROM unit u
+                    WHERE (%(owner_id)s::int IS NULL OR u.owner_id=%(owner_id)s::int)
+                      AND NOT EXISTS (SELECT 1 FROM conflict)
+                      AND (SELECT n FROM upcoming) < %(max_upcoming)s
+                    RETURNING id
+                )
+                SELECT EXISTS (SELECT 1 FROM unit), (SELECT owner_id FROM unit),
+                       EXISTS (SELECT 1 FROM conflict), (SELECT n FROM upcoming), (SELECT id FROM ins),
+                       (SELECT tenant_id FROM unit)""",
+                {'unit_id': unit_id, 'area': area, 'start_time': start_time, 'end_time': end_time,
+                 'status': status, 'max_upcoming': max_upcoming, 'owner_id': required_owner_id})
+            row = cur.fetchone(); conn.commit()
+            return row
+        except errors.ExclusionViolation:
+            conn.rollback(); raise ReservationConflict()
+        except Exception as e:
+            conn.rollback(); raise e
+        finally:
+            cur.close()
 
 
 def get_unit_id_and_status(res_id: int) -> Optional[Tuple[int, str]]:
-    conn = get_conn(); cur = conn.cursor()
-    cur.execute('SELECT unit_id,status FROM reservations WHERE id=%s', (res_id,))
-    r = cur.fetchone(); cur.close(); conn.close()
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute('SELECT unit_id,status FROM reservations WHERE id=%s', (res_id,))
+        r = cur.fetchone(); cur.close()
     return (r[0], r[1]) if r else None
 
 
 def set_status(res_id: int, status: str) -> None:
-    conn = get_conn(); cur = conn.cursor()
-    cur.execute('UPDATE reservations SET status=%s WHERE id=%s', (status, res_id))
-    conn.commit(); cur.close(); conn.close()
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute('UPDATE reservations SET status=%s WHERE id=%s', (status, res_id))
+        conn.commit(); cur.close()
 
 
 
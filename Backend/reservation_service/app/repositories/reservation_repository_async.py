@@ -0,0 +1,123 @@
+from typing import List, Optional, Tuple
+from shared.async_db import to_db_timestamp
+from shared.pagination import Page, decode_cursor, fetch_limit, list_size, page_from_rows
+from ..core.db import async_pool
+from .reservation_repository import ReservationConflict
+
+# Consultas fixas em constantes: cada uma é preparada uma vez por conexão pelo asyncpg
+# Listagens paginadas: $1 = LIMIT, depois os filtros e por último a posição do cursor (created_at, id).
+# As variantes _AFTER_NULL recebem só o id: cursor numa linha com created_at NULL (vêm primeiro no DESC).
+_LIST = 'SELECT id,unit_id,area,start_time,end_time,status,created_at FROM reservations'
+_PAGE = ' ORDER BY created_at DESC, id DESC LIMIT $1'
+LIST_ALL = _LIST + _PAGE
+LIST_ALL_AFTER = _LIST + ' WHERE (created_at, id) < ($2, $3)' + _PAGE
+LIST_ALL_AFTER_NULL = _LIST + ' WHERE (created_at IS NOT NULL OR id < $2)' + _PAGE
+LIST_TENANT = _LIST + ' WHERE tenant_id=$2' + _PAGE
+LIST_TENANT_AFTER = _LIST + ' WHERE tenant_id=$2 AND (created_at, id) < ($3, $4)' + _PAGE
+LIST_TENANT_AFTER_NULL = _LIST + ' WHERE tenant_id=$2 AND (created_at IS NOT NULL OR id < $3)' + _PAGE
+LIST_BY_OWNER = _LIST + ' WHERE unit_id IN (SELECT id FROM units WHERE owner_id=$2)' + _PAGE
+LIST_BY_OWNER_AFTER = _LIST + ' WHERE unit_id IN (SELECT id FROM units WHERE owner_id=$2) AND (created_at, id) < ($3, $4)' + _PAGE
+LIST_BY_OWNER_AFTER_NULL = _LIST + ' WHERE unit_id IN (SELECT id FROM units WHERE owner_id=$2) AND (created_at IS NOT NULL OR id < $3)' + _PAGE
+GET_UNIT_OWNER = 'SELECT owner_id FROM units WHERE id=$1'
+HAS_CONFLICT = """SELECT id FROM reservations
+                  WHERE tenant_id IS NOT DISTINCT FROM $1::int AND area=$2 AND status!='cancelled'
+                    AND tsrange(start_time, end_time) && tsrange($3::timestamp, $4::timestamp)
+                  LIMIT 1"""
+LIST_ACTIVE_SINCE = "SELECT id,tenant_id,area,start_time,end_time FROM reservations WHERE status!='cancelled' AND end_time >= $1"
+LIST_ACTIVE_BETWEEN = """SELECT id,start_time,end_time FROM reservations
+                         WHERE tenant_id IS NOT DISTINCT FROM $1::int AND area=$2 AND status!='cancelled'
+                           AND tsrange(start_time, end_time) && tsrange($3::timestamp, $4::timestamp)"""
+BOOK = """
+    WITH unit AS (
+        SELECT id, tenant_id, owner_id FROM units WHERE id=$1
+    ), conflict AS (
+        SELECT 1 FROM reservations r, unit u
+        WHERE r.tenant_id IS NOT DISTINCT FROM u.tenant_id AND r.area=$2 AND r.status!='cancelled'
+          AND tsrange(r.start_time, r.end_time) && tsrange($3::timestamp, $4::timestamp)
+        LIMIT 1
+    ), upcoming AS (
+        SELECT COUNT(*) AS n FROM reservations WHERE unit_id=$1 AND status!='cancelled'
+          AND start_time >= now() AND start_time <= now() + interval '30 days'
+    ), ins AS (
+        INSERT INTO reservations (tenant_id, unit_id, area, start_time, end_time, status)
+        SELECT u.tenant_id, u.id, $2, $3::timestamp, $4::timestamp, $5
+        FROM unit u
+        WHERE ($7::int IS NULL OR u.owner_id=$7::int)
+          AND NOT EXISTS (SELECT 1 FROM conflict)
+          AND (SELECT n FROM upcoming) < $6
+        RETURNING id
+    )
+    SELECT EXISTS (SELECT 1 FROM unit), (SELECT owner_id FROM unit),
+           EXISTS (SELECT 1 FROM conflict), (SELECT n FROM upcoming), (SELECT id FROM ins),
+           (SELECT tenant_id FROM unit)"""
+GET_UNIT_ID_AND_STATUS = 'SELECT unit_id,status FROM reservations WHERE id=$1'
+SET_STATUS = 'UPDATE reservations SET status=$1 WHERE id=$2'
+
+
+async def _fetch_page(sql: str, sql_after: str, sql_after_null: str, args: tuple, cursor: Optional[str], limit: Optional[int]) -> Page:
+    size = list_size(limit, cursor)
+    position = decode_cursor(cursor)
+    async with async_pool.connection() as conn:
+        if position is None:
+            rows = await conn.fetch(sql, fetch_limit(size), *args)
+        elif position[0] is None:
+            rows = await conn.fetch(sql_after_null, fetch_limit(size), *args, position[1])
+        else:
+            rows = await conn.fetch(sql_after, fetch_limit(size), *args, *position)
+    return page_from_rows(rows, size, lambda r: (r[6], r[0]))
+
+
+async def list_all(tenant_id: Optional[int] = None, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    if tenant_id is None:
+        return await _fetch_page(LIST_ALL, LIST_ALL_AFTER, LIST_ALL_AFTER_NULL, (), cursor, limit)
+    return await _fetch_page(LIST_TENANT, LIST_TENANT_AFTER, LIST_TENANT_AFTER_NULL, (int(tenant_id),), cursor, limit)
+
+
+async def list_by_owner(owner_id: int, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    return await _fetch_page(LIST_BY_OWNER, LIST_BY_OWNER_AFTER, LIST_BY_OWNER_AFTER_NULL, (int(owner_id),), cursor, limit)
+
+
+async def get_unit_owner_id(unit_id: int) -> Optional[int]:
+    async with async_pool.connection() as conn:
+        return await conn.fetchval(GET_UNIT_OWNER, unit_id)
+
+
+async def has_conflict(tenant_id: Optional[int], area: str, start_time, end_time) -> bool:
+    async with async_pool.connection() as conn:
+        row = await conn.fetchrow(HAS_CONFLICT, tenant_id, area, to_db_timestamp(start_time), to_db_timestamp(end_time))
+    return row is not None
+
+
+async def list_active_since(since) -> List:
+    async with async_pool.connection() as conn:
+        return await conn.fetch(LIST_ACTIVE_SINCE, to_db_timestamp(since))
+
+
+async def list_active_between(tenant_id: Optional[int], area: str, start_time, end_time) -> List:
+    async with async_pool.connection() as conn:
+        return await conn.fetch(LIST_ACTIVE_BETWEEN, tenant_id, area, to_db_timestamp(start_time), to_db_timestamp(end_time))
+
+
+async def book(unit_id: int, area: str, start_time, end_time, status: str,
+               max_upcoming: int, required_owner_id=None) -> Tuple:
+    """Mesmo comando único de ``reservation_repository.book``, executado pelo asyncpg."""
+    import asyncpg
+    owner_id = int(required_owner_id) if required_owner_id is not None else None
+    async with async_pool.connection() as conn:
+        try:
+            return tuple(await conn.fetchrow(
+                BOOK, unit_id, area, to_db_timestamp(start_time), to_db_timestamp(end_time),
+                status, max_upcoming, owner_id))
+        except asyncpg.exceptions.ExclusionViolationError:
+            raise ReservationConflict()
+
+
+async def get_unit_id_and_status(res_id: int) -> Optional[Tuple[int, str]]:
+    async with async_pool.connection() as conn:
+        r = await conn.fetchrow(GET_UNIT_ID_AND_STATUS, res_id)
+    return (r[0], r[1]) if r else None
+
+
+async def set_status(res_id: int, status: str) -> None:
+    async with async_pool.connection() as conn:
+        await conn.execute(SET_STATUS, status, res_id)
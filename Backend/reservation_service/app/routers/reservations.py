@@ -1,16 +1,18 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
+from datetime import date
 from shared import auth_client
+from shared.pagination import set_next_cursor
 from ..schemas.reservations import ReservationIn, ReservationOut
-from ..services.reservation_service import list_reservations, create_reservation, cancel_reservation, is_time_range_available
+from ..services.reservation_service import list_reservations, create_reservation, cancel_reservation, is_time_range_available, get_day_slots, get_week_grid
 
 
 router = APIRouter(prefix='/reservations', tags=['reservations'])
 
 
 @router.get('', response_model=List[ReservationOut])
-def list_reservations_ep(auth=Depends(auth_client.get_current_user)):
-    return list_reservations(auth)
+def list_reservations_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1), auth=Depends(auth_client.get_current_user)):
+    return set_next_cursor(response, list_reservations(auth, cursor, limit))
 
 
 @router.post('', response_model=ReservationOut)
@@ -34,10 +36,20 @@ def check_availability(area: str, start_time: str, end_time: str, auth=Depends(a
         return { 'available': False, 'detail': 'Invalid datetime format. Use ISO 8601' }
     if et <= st:
         return { 'available': False, 'detail': 'end_time must be after start_time' }
-    available = is_time_range_available(area, st, et)
+    available = is_time_range_available(auth['tenant_id'], area, st, et)
     return { 'available': available }
 
 
+@router.get('/availability/slots')
+def availability_slots(area: str, day: date, auth=Depends(auth_client.get_current_user)):
+    return get_day_slots(auth['tenant_id'], area, day)
+
+
+@router.get('/availability/week')
+def availability_week(area: str, start: date, slot_minutes: int = Query(60, ge=15, le=1440), auth=Depends(auth_client.get_current_user)):
+    return get_week_grid(auth['tenant_id'], area, start, slot_minutes)
+
+
 
 
 
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
+from datetime import date
+from shared import auth_client
+from shared.pagination import set_next_cursor
+from ..schemas.reservations import ReservationIn, ReservationOut
+from ..services.reservation_service_async import list_reservations, create_reservation, cancel_reservation, is_time_range_available, get_day_slots, get_week_grid
+
+
+# Mesmas rotas de app/routers/reservations.py, em async def sobre o pool asyncpg (DB_DRIVER=asyncpg)
+router = APIRouter(prefix='/reservations', tags=['reservations'])
+
+
+@router.get('', response_model=List[ReservationOut])
+async def list_reservations_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1), auth=Depends(auth_client.get_current_user)):
+    return set_next_cursor(response, await list_reservations(auth, cursor, limit))
+
+
+@router.post('', response_model=ReservationOut)
+async def create_reservation_ep(r: ReservationIn, auth=Depends(auth_client.get_current_user)):
+    return await create_reservation(r.unit_id, r.area, r.start_time, r.end_time, auth)
+
+
+@router.post('/{res_id}/cancel')
+async def cancel_reservation_ep(res_id: int, auth=Depends(auth_client.get_current_user)):
+    return await cancel_reservation(res_id, auth)
+
+
+@router.get('/availability')
+async def check_availability(area: str, start_time: str, end_time: str, auth=Depends(auth_client.get_current_user)):
+    # Parsers defer to Pydantic in a full schema, but accept ISO strings here
+    from datetime import datetime
+    try:
+        st = datetime.fromisoformat(start_time)
+        et = datetime.fromisoformat(end_time)
+    except Exception:
+        return { 'available': False, 'detail': 'Invalid datetime format. Use ISO 8601' }
+    if et <= st:
+        return { 'available': False, 'detail': 'end_time must be after start_time' }
+    available = await is_time_range_available(auth['tenant_id'], area, st, et)
+    return { 'available': available }
+
+
+@router.get('/availability/slots')
+async def availability_slots(area: str, day: date, auth=Depends(auth_client.get_current_user)):
+    return await get_day_slots(auth['tenant_id'], area, day)
+
+
+@router.get('/availability/week')
+async def availability_week(area: str, start: date, slot_minutes: int = Query(60, ge=15, le=1440), auth=Depends(auth_client.get_current_user)):
+    return await get_week_grid(auth['tenant_id'], area, start, slot_minutes)
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, field_validator
 from datetime import datetime
+from ..services.availability_index import to_naive_utc
 
 
 class ReservationIn(BaseModel):
@@ -8,6 +9,11 @@ class ReservationIn(BaseModel):
     start_time: datetime
     end_time: datetime
 
+    @field_validator('start_time', 'end_time')
+    def as_naive_utc(cls, v):
+        # Mesma normalização do banco; comparar datetime com e sem fuso levantaria TypeError (500, não 422)
+        return to_naive_utc(v)
+
     @field_validator('end_time')
     def end_after_start(cls, v, info):
         values = info.data
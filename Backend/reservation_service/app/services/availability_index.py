@@ -0,0 +1,140 @@
+import bisect
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Interval = Tuple[datetime, datetime]
+# (tenant_id, area): a sobreposição de reservas é proibida por condomínio
+AreaKey = Tuple[Optional[int], str]
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """As colunas de reserva são ``timestamp`` sem fuso (gravadas em UTC); normaliza entradas com fuso."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class AreaIntervals:
+    """Intervalos [início, fim) de uma área, ordenados pelo início.
+
+    ``max_len`` é a maior duração já vista: qualquer intervalo que sobreponha [s, e) começa em
+    (s - max_len, e), então uma consulta custa duas buscas binárias mais os candidatos nessa faixa.
+    """
+
+    __slots__ = ('starts', 'items', 'max_len')
+
+    def __init__(self) -> None:
+        self.starts: List[datetime] = []
+        self.items: List[Tuple[datetime, datetime, int]] = []
+        self.max_len = timedelta(0)
+
+    def add(self, res_id: int, start: datetime, end: datetime) -> None:
+        pos = bisect.bisect_right(self.starts, start)
+        self.starts.insert(pos, start)
+        self.items.insert(pos, (start, end, res_id))
+        if end - start > self.max_len:
+            self.max_len = end - start
+
+    def remove(self, res_id: int, start: datetime) -> None:
+        pos = bisect.bisect_left(self.starts, start)
+        while pos < len(self.items) and self.starts[pos] == start:
+            if self.items[pos][2] == res_id:
+                del self.starts[pos]
+                del self.items[pos]
+                return
+            pos += 1
+
+    def _candidates(self, start: datetime, end: datetime):
+        lo = bisect.bisect_right(self.starts, start - self.max_len) if self.max_len else bisect.bisect_left(self.starts, start)
+        hi = bisect.bisect_left(self.starts, end)
+        for i in range(lo, hi):
+            item = self.items[i]
+            if item[1] > start:
+                yield item
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        return next(self._candidates(start, end), None) is not None
+
+    def busy(self, start: datetime, end: datetime) -> List[Interval]:
+        """Intervalos ocupados dentro de [start, end), recortados e mesclados."""
+        merged: List[List[datetime]] = []
+        for s, e, _ in self._candidates(start, end):
+            s, e = max(s, start), min(e, end)
+            if merged and s <= merged[-1][1]:
+                if e > merged[-1][1]:
+                    merged[-1][1] = e
+            else:
+                merged.append([s, e])
+        return [(s, e) for s, e in merged]
+
+
+def free_from_busy(busy: List[Interval], start: datetime, end: datetime) -> List[Interval]:
+    free = []
+    cursor = start
+    for s, e in busy:
+        if s > cursor:
+            free.append((cursor, s))
+        cursor = max(cursor, e)
+    if cursor < end:
+        free.append((cursor, end))
+    return free
+
+
+class AvailabilityIndex:
+    """Índice em memória das reservas não canceladas, por condomínio e área.
+
+    A chave é ``(tenant_id, area)``, a mesma da checagem de sobreposição em ``book``: áreas de
+    mesmo nome em condomínios diferentes não se misturam. Cobre as reservas que terminam a partir
+    de ``horizon``; consultas anteriores a ele devem ir ao banco. É um atalho de leitura: quem
+    garante que não há sobreposição é a constraint ``reservations_no_overlap`` no banco.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._areas: Dict[AreaKey, AreaIntervals] = {}
+        self._by_id: Dict[int, Tuple[AreaKey, datetime]] = {}
+        self.horizon: Optional[datetime] = None
+        self.loaded_at: Optional[datetime] = None
+
+    def load(self, rows: Iterable[Tuple[int, Optional[int], str, datetime, datetime]], horizon: datetime) -> None:
+        areas: Dict[AreaKey, AreaIntervals] = {}
+        by_id: Dict[int, Tuple[AreaKey, datetime]] = {}
+        for res_id, tenant_id, area, start, end in rows:
+            key = (tenant_id, area)
+            areas.setdefault(key, AreaIntervals()).add(res_id, start, end)
+            by_id[res_id] = (key, start)
+        with self._lock:
+            self._areas = areas
+            self._by_id = by_id
+            self.horizon = horizon
+            self.loaded_at = datetime.utcnow()
+
+    def add(self, res_id: int, tenant_id: Optional[int], area: str, start: datetime, end: datetime) -> None:
+        start, end = to_naive_utc(start), to_naive_utc(end)
+        key = (tenant_id, area)
+        with self._lock:
+            if self.horizon is None or end < self.horizon or res_id in self._by_id:
+                return
+            self._areas.setdefault(key, AreaIntervals()).add(res_id, start, end)
+            self._by_id[res_id] = (key, start)
+
+    def remove(self, res_id: int) -> None:
+        with self._lock:
+            entry = self._by_id.pop(res_id, None)
+            if entry is not None:
+                key, start = entry
+                self._areas[key].remove(res_id, start)
+
+    def covers(self, start: datetime) -> bool:
+        return self.horizon is not None and start >= self.horizon
+
+    def overlaps(self, tenant_id: Optional[int], area: str, start: datetime, end: datetime) -> bool:
+        with self._lock:
+            intervals = self._areas.get((tenant_id, area))
+            return intervals.overlaps(start, end) if intervals else False
+
+    def busy(self, tenant_id: Optional[int], area: str, start: datetime, end: datetime) -> List[Interval]:
+        with self._lock:
+            intervals = self._areas.get((tenant_id, area))
+            return intervals.busy(start, end) if intervals else []
@@ -1,25 +1,53 @@
+from datetime import date, datetime, time, timedelta
 from fastapi import HTTPException
+from ..core.config import settings
+from shared.pagination import Page
 from ..repositories import reservation_repository as repo
+from .availability_index import AreaIntervals, AvailabilityIndex, free_from_busy, to_naive_utc
 
+MAX_UPCOMING_PER_UNIT = 2
 
-def list_reservations(caller: dict):
+availability = AvailabilityIndex()
+
+
+def row_to_reservation(r):
+    return {'id':r[0],'unit_id':r[1],'area':r[2],'start_time':r[3],'end_time':r[4],'status':r[5]}
+
+
+def list_reservations(caller: dict, cursor: str = None, limit: int = None) -> Page:
     if caller['role'] in ('admin','sindico'):
-        rows = repo.list_all()
+        page = repo.list_all(caller.get('tenant_id'), cursor, limit)
     else:
-        rows = repo.list_by_owner(caller['id'])
-    return [{'id':r[0],'unit_id':r[1],'area':r[2],'start_time':r[3],'end_time':r[4],'status':r[5]} for r in rows]
+        page = repo.list_by_owner(caller['id'], cursor, limit)
+    return Page([row_to_reservation(r) for r in page.items], page.next_cursor)
 
 
-def create_reservation(unit_id: int, area: str, start_time, end_time, caller: dict):
-    if caller['role'] == 'morador':
-        owner_id = repo.get_unit_owner_id(unit_id)
-        if owner_id != caller['id']:
+def required_owner_for(caller: dict):
+    return caller['id'] if caller['role'] == 'morador' else None
+
+
+def resolve_booking(result, required_owner_id) -> int:
+    """Converte o resultado de ``book`` no id da reserva ou no erro HTTP correspondente."""
+    unit_found, owner_id, conflict, upcoming, rid, _ = result
+    if rid is None:
+        if required_owner_id is not None and (not unit_found or str(owner_id) != str(required_owner_id)):
             raise HTTPException(status_code=403, detail='Forbidden: cannot reserve for this unit')
-    if repo.has_conflict(area, start_time, end_time):
-        raise HTTPException(status_code=409, detail='Conflict: area already reserved for this time range')
-    if repo.count_upcoming_for_unit(unit_id) >= 2:
+        if conflict:
+            raise HTTPException(status_code=409, detail='Conflict: area already reserved for this time range')
+        if not unit_found:
+            raise HTTPException(status_code=404, detail='Unit not found')
         raise HTTPException(status_code=400, detail='Reservation limit reached for this unit (2 in 30 days)')
-    rid = repo.insert(unit_id, area, start_time, end_time, 'confirmed')
+    return rid
+
+
+def create_reservation(unit_id: int, area: str, start_time, end_time, caller: dict):
+    required_owner_id = required_owner_for(caller)
+    try:
+        result = repo.book(unit_id, area, start_time, end_time, 'confirmed', MAX_UPCOMING_PER_UNIT, required_owner_id)
+    except repo.ReservationConflict:
+        raise HTTPException(status_code=409, detail='Conflict: area already reserved for this time range')
+    rid = resolve_booking(result, required_owner_id)
+    availability.add(rid, result[5], area, start_time, end_time)
     return {'id': rid, 'unit_id': unit_id, 'area': area, 'start_time': start_time, 'end_time': end_time, 'status': 'confirmed'}
 
 
@@ -30,14 +58,105 @@ def cancel_reservation(res_id: int, caller: dict):
     unit_id, _ = info
     if caller['role'] not in ('admin','sindico'):
         owner_id = repo.get_unit_owner_id(unit_id)
-        if owner_id != caller['id']:
+        if str(owner_id) != str(caller['id']):
             raise HTTPException(status_code=403, detail='Forbidden')
     repo.set_status(res_id, 'cancelled')
+    availability.remove(res_id)
     return {'status':'cancelled'}
 
 
-def is_time_range_available(area: str, start_time, end_time) -> bool:
-    return not repo.has_conflict(area, start_time, end_time)
+def availability_horizon() -> datetime:
+    return datetime.combine(datetime.utcnow().date(), time.min) - timedelta(days=settings.availability_history_days)
+
+
+def availability_stale() -> bool:
+    loaded_at = availability.loaded_at
+    return loaded_at is None or (datetime.utcnow() - loaded_at).total_seconds() > settings.availability_refresh_seconds
+
+
+def load_availability():
+    horizon = availability_horizon()
+    availability.load(repo.list_active_since(horizon), horizon)
+
+
+def _ensure_availability():
+    if availability_stale():
+        load_availability()
+
+
+def _busy_intervals(tenant_id, area: str, start: datetime, end: datetime):
+    _ensure_availability()
+    if availability.covers(start):
+        return availability.busy(tenant_id, area, start, end)
+    # Período anterior ao que está em memória: monta um índice só com as reservas do intervalo
+    return busy_from_rows(repo.list_active_between(tenant_id, area, start, end), start, end)
+
+
+def busy_from_rows(rows, start: datetime, end: datetime):
+    intervals = AreaIntervals()
+    for res_id, s, e in rows:
+        intervals.add(res_id, s, e)
+    return intervals.busy(start, end)
+
+
+def is_time_range_available(tenant_id, area: str, start_time, end_time) -> bool:
+    start, end = to_naive_utc(start_time), to_naive_utc(end_time)
+    _ensure_availability()
+    if availability.covers(start):
+        return not availability.overlaps(tenant_id, area, start, end)
+    return not repo.has_conflict(tenant_id, area, start, end)
+
+
+def day_range(day: date):
+    start = datetime.combine(day, time.min)
+    return start, start + timedelta(days=1)
+
+
+def week_range(week_start: date):
+    start = datetime.combine(week_start, time.min)
+    return start, start + timedelta(days=7)
+
+
+def get_day_slots(tenant_id, area: str, day: date):
+    start, end = day_range(day)
+    return build_day_slots(area, day, _busy_intervals(tenant_id, area, start, end))
+
+
+def get_week_grid(tenant_id, area: str, week_start: date, slot_minutes: int):
+    start, end = week_range(week_start)
+    return build_week_grid(area, week_start, slot_minutes, _busy_intervals(tenant_id, area, start, end))
+
+
+def build_day_slots(area: str, day: date, busy):
+    start, end = day_range(day)
+    return {
+        'area': area,
+        'date': day,
+        'busy': [{'start_time': s, 'end_time': e} for s, e in busy],
+        'free': [{'start_time': s, 'end_time': e} for s, e in free_from_busy(busy, start, end)],
+    }
+
+
+def build_week_grid(area: str, week_start: date, slot_minutes: int, busy):
+    start, _ = week_range(week_start)
+    step = timedelta(minutes=slot_minutes)
+
+    days = []
+    i = 0
+    for d in range(7):
+        day_start = start + timedelta(days=d)
+        day_end = day_start + timedelta(days=1)
+        slots = []
+        slot_start = day_start
+        while slot_start < day_end:
+            slot_end = min(slot_start + step, day_end)
+            while i < len(busy) and busy[i][1] <= slot_start:
+                i += 1
+            taken = i < len(busy) and busy[i][0] < slot_end
+            slots.append({'start_time': slot_start, 'end_time': slot_end, 'status': 'busy' if taken else 'free'})
+            slot_start = slot_end
+        days.append({'date': day_start.date(), 'slots': slots})
+    return {'area': area, 'week_start': week_start, 'slot_minutes': slot_minutes, 'days': days}
 
 
 
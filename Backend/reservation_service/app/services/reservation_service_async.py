@@ -0,0 +1,79 @@
+from datetime import date, datetime
+from fastapi import HTTPException
+from shared.pagination import Page
+from ..repositories import reservation_repository_async as repo
+from ..repositories.reservation_repository import ReservationConflict
+from .availability_index import to_naive_utc
+from .reservation_service import (
+    MAX_UPCOMING_PER_UNIT, availability, availability_horizon, availability_stale, build_day_slots,
+    build_week_grid, busy_from_rows, day_range, required_owner_for, resolve_booking, row_to_reservation,
+    week_range,
+)
+
+
+async def list_reservations(caller: dict, cursor: str = None, limit: int = None) -> Page:
+    if caller['role'] in ('admin','sindico'):
+        page = await repo.list_all(caller.get('tenant_id'), cursor, limit)
+    else:
+        page = await repo.list_by_owner(caller['id'], cursor, limit)
+    return Page([row_to_reservation(r) for r in page.items], page.next_cursor)
+
+
+async def create_reservation(unit_id: int, area: str, start_time, end_time, caller: dict):
+    required_owner_id = required_owner_for(caller)
+    try:
+        result = await repo.book(unit_id, area, start_time, end_time, 'confirmed', MAX_UPCOMING_PER_UNIT, required_owner_id)
+    except ReservationConflict:
+        raise HTTPException(status_code=409, detail='Conflict: area already reserved for this time range')
+    rid = resolve_booking(result, required_owner_id)
+    availability.add(rid, result[5], area, start_time, end_time)
+    return {'id': rid, 'unit_id': unit_id, 'area': area, 'start_time': start_time, 'end_time': end_time, 'status': 'confirmed'}
+
+
+async def cancel_reservation(res_id: int, caller: dict):
+    info = await repo.get_unit_id_and_status(res_id)
+    if not info:
+        raise HTTPException(status_code=404, detail='Reservation not found')
+    unit_id, _ = info
+    if caller['role'] not in ('admin','sindico'):
+        owner_id = await repo.get_unit_owner_id(unit_id)
+        if str(owner_id) != str(caller['id']):
+            raise HTTPException(status_code=403, detail='Forbidden')
+    await repo.set_status(res_id, 'cancelled')
+    availability.remove(res_id)
+    return {'status':'cancelled'}
+
+
+async def load_availability():
+    horizon = availability_horizon()
+    availability.load(await repo.list_active_since(horizon), horizon)
+
+
+async def _ensure_availability():
+    if availability_stale():
+        await load_availability()
+
+
+async def _busy_intervals(tenant_id, area: str, start: datetime, end: datetime):
+    await _ensure_availability()
+    if availability.covers(start):
+        return availability.busy(tenant_id, area, start, end)
+    return busy_from_rows(await repo.list_active_between(tenant_id, area, start, end), start, end)
+
+
+async def is_time_range_available(tenant_id, area: str, start_time, end_time) -> bool:
+    start, end = to_naive_utc(start_time), to_naive_utc(end_time)
+    await _ensure_availability()
+    if availability.covers(start):
+        return not availability.overlaps(tenant_id, area, start, end)
+    return not await repo.has_conflict(tenant_id, area, start, end)
+
+
+async def get_day_slots(tenant_id, area: str, day: date):
+    start, end = day_range(day)
+    return build_day_slots(area, day, await _busy_intervals(tenant_id, area, start, end))
+
+
+async def get_week_grid(tenant_id, area: str, week_start: date, slot_minutes: int):
+    start, end = week_range(week_start)
+    return build_week_grid(area, week_start, slot_minutes, await _busy_intervals(tenant_id, area, start, end))
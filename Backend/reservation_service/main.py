@@ -1,11 +1,39 @@
-
 from fastapi import FastAPI
-from app.routers.reservations import router as reservations_router
+from app.core.config import settings
+from app.core.db import pool, async_pool
+from shared.db_pool import PoolScopeMiddleware
 
 app = FastAPI(title='Reservation Service')
 
+if settings.db_driver == 'asyncpg':
+    from app.routers.reservations_async import router as reservations_router
+else:
+    from app.routers.reservations import router as reservations_router
+
+    app.add_middleware(PoolScopeMiddleware, pool=pool)
+
 app.include_router(reservations_router)
 
 @app.get('/health')
 def health():
     return {'status': 'ok'}
+
+@app.get('/metrics/db-pool')
+def db_pool_metrics():
+    return (async_pool if settings.db_driver == 'asyncpg' else pool).stats()
+
+@app.on_event('startup')
+async def warm_availability_index():
+    if settings.db_driver == 'asyncpg':
+        from app.services.reservation_service_async import load_availability
+        await async_pool.open()
+        await load_availability()
+    else:
+        from starlette.concurrency import run_in_threadpool
+        from app.services.reservation_service import load_availability
+        await run_in_threadpool(load_availability)
+
+@app.on_event('shutdown')
+async def close_db_pools():
+    await async_pool.close()
+    pool.close()
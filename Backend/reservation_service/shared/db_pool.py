@@ -0,0 +1,338 @@
+# Pool de conexões psycopg2 compartilhado pelos serviços de SQL puro
+import os
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+import psycopg2
+from psycopg2 import extensions
+from starlette.concurrency import run_in_threadpool
+
+
+class PoolTimeout(Exception):
+    """Nenhuma conexão ficou livre dentro do tempo limite do pool."""
+
+
+class _Entry:
+    __slots__ = ('conn', 'created_at', 'last_used')
+
+    def __init__(self, conn) -> None:
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class _LatencyWindow:
+    """Janela com as últimas amostras de latência (segundos) para percentis."""
+
+    def __init__(self, size: int = 1024) -> None:
+        self._samples = deque(maxlen=size)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> Dict[str, float]:
+        ordered = sorted(self._samples)
+
+        def pct(p: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+        return {
+            'count': self.count,
+            'avg_ms': (self.total / self.count * 1000) if self.count else 0.0,
+            'p50_ms': pct(0.50) * 1000,
+            'p95_ms': pct(0.95) * 1000,
+            'p99_ms': pct(0.99) * 1000,
+            'max_ms': self.max * 1000,
+        }
+
+
+class _RequestScope:
+    __slots__ = ('entry', 'checked_out_at')
+
+    def __init__(self) -> None:
+        self.entry: Optional[_Entry] = None
+        self.checked_out_at = 0.0
+
+
+_request_scope: ContextVar[Optional[_RequestScope]] = ContextVar('db_pool_request_scope', default=None)
+
+
+class ConnectionPool:
+    """Pool limitado e thread-safe de conexões psycopg2.
+
+    - no máximo ``max_size`` conexões abertas; quem pedir além disso espera até ``timeout``
+    - conexões paradas há mais de ``health_check_after`` segundos passam por um ``SELECT 1``
+    - conexões mais velhas que ``max_lifetime`` (ou ociosas além de ``max_idle``) são recicladas
+    - dentro de ``request_scope()`` todas as chamadas a ``connection()`` reutilizam a mesma conexão
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_lifetime: Optional[float] = None,
+        max_idle: Optional[float] = None,
+        health_check_after: Optional[float] = None,
+    ) -> None:
+        self.dsn = dsn
+        self.min_size = min_size if min_size is not None else int(os.getenv('DB_POOL_MIN_SIZE', '1'))
+        self.max_size = max_size if max_size is not None else int(os.getenv('DB_POOL_MAX_SIZE', '10'))
+        self.timeout = timeout if timeout is not None else float(os.getenv('DB_POOL_TIMEOUT', '10'))
+        self.max_lifetime = max_lifetime if max_lifetime is not None else float(os.getenv('DB_POOL_MAX_LIFETIME', '1800'))
+        self.max_idle = max_idle if max_idle is not None else float(os.getenv('DB_POOL_MAX_IDLE', '300'))
+        self.health_check_after = (
+            health_check_after if health_check_after is not None
+            else float(os.getenv('DB_POOL_HEALTH_CHECK_AFTER', '30'))
+        )
+
+        self._cond = threading.Condition(threading.Lock())
+        self._idle: deque = deque()
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._closed = False
+
+        self._wait = _LatencyWindow()
+        self._hold = _LatencyWindow()
+        self._counters = {
+            'created': 0,
+            'recycled': 0,
+            'health_check_failures': 0,
+            'discarded': 0,
+            'timeouts': 0,
+        }
+
+    # -- ciclo de vida das conexões ---------------------------------------
+
+    def _connect(self) -> _Entry:
+        conn = psycopg2.connect(self.dsn)
+        with self._cond:
+            self._counters['created'] += 1
+        return _Entry(conn)
+
+    def _close_entry(self, entry: _Entry, counter: str) -> None:
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._counters[counter] += 1
+            self._cond.notify()
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return (now - entry.created_at) > self.max_lifetime or (now - entry.last_used) > self.max_idle
+
+    def _healthy(self, entry: _Entry, now: float) -> bool:
+        if entry.conn.closed:
+            return False
+        if (now - entry.last_used) < self.health_check_after:
+            return True
+        try:
+            cur = entry.conn.cursor()
+            cur.execute('SELECT 1')
+            cur.close()
+            entry.conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _acquire(self) -> _Entry:
+        started = time.monotonic()
+        deadline = started + self.timeout
+        while True:
+            entry = None
+            create = False
+            with self._cond:
+                if self._closed:
+                    raise PoolTimeout('Pool de conexões encerrado')
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._counters['timeouts'] += 1
+                        raise PoolTimeout(f'Nenhuma conexão livre após {self.timeout:.1f}s (max_size={self.max_size})')
+                    self._waiting += 1
+                    try:
+                        self._cond.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+                if self._idle:
+                    entry = self._idle.pop()
+                else:
+                    self._size += 1
+                    create = True
+                self._in_use += 1
+
+            if create:
+                try:
+                    entry = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._in_use -= 1
+                        self._cond.notify()
+                    raise
+            else:
+                now = time.monotonic()
+                if self._expired(entry, now):
+                    self._release_slot()
+                    self._close_entry(entry, 'recycled')
+                    continue
+                if not self._healthy(entry, now):
+                    self._release_slot()
+                    self._close_entry(entry, 'health_check_failures')
+                    continue
+
+            with self._cond:
+                self._wait.add(time.monotonic() - started)
+            return entry
+
+    def _release_slot(self) -> None:
+        with self._cond:
+            self._in_use -= 1
+
+    def _release(self, entry: _Entry, held_since: Optional[float]) -> None:
+        now = time.monotonic()
+        conn = entry.conn
+        reusable = not conn.closed
+        if reusable:
+            try:
+                status = conn.get_transaction_status()
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    reusable = False
+                elif status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                reusable = False
+
+        with self._cond:
+            self._in_use -= 1
+            if held_since is not None:
+                self._hold.add(now - held_since)
+
+        if not reusable:
+            self._close_entry(entry, 'discarded')
+            return
+        if (now - entry.created_at) > self.max_lifetime or self._closed:
+            self._close_entry(entry, 'recycled')
+            return
+
+        entry.last_used = now
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    # -- API pública -------------------------------------------------------
+
+    @contextmanager
+    def connection(self):
+        """Empresta uma conexão; ao sair, transações não confirmadas são desfeitas."""
+        scope = _request_scope.get()
+        if scope is not None:
+            if scope.entry is None:
+                scope.entry = self._acquire()
+                scope.checked_out_at = time.monotonic()
+            try:
+                yield scope.entry.conn
+            except Exception:
+                if not scope.entry.conn.closed:
+                    scope.entry.conn.rollback()
+                raise
+            return
+
+        entry = self._acquire()
+        held_since = time.monotonic()
+        try:
+            yield entry.conn
+        finally:
+            self._release(entry, held_since)
+
+    def _release_scope(self, scope: _RequestScope) -> None:
+        if scope.entry is not None:
+            entry, scope.entry = scope.entry, None
+            self._release(entry, scope.checked_out_at)
+
+    @contextmanager
+    def request_scope(self):
+        """Faz com que uma requisição inteira use uma única conexão do pool (obtida sob demanda)."""
+        if _request_scope.get() is not None:
+            yield
+            return
+        scope = _RequestScope()
+        token = _request_scope.set(scope)
+        try:
+            yield
+        finally:
+            _request_scope.reset(token)
+            self._release_scope(scope)
+
+    def warmup(self) -> None:
+        """Abre ``min_size`` conexões antecipadamente."""
+        entries = []
+        try:
+            while len(entries) < self.min_size:
+                entries.append(self._acquire())
+        finally:
+            for entry in entries:
+                self._release(entry, None)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for entry in idle:
+            self._close_entry(entry, 'recycled')
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'waiting': self._waiting,
+                'max_size': self.max_size,
+                'wait': self._wait.snapshot(),
+                'checkout': self._hold.snapshot(),
+                **self._counters,
+            }
+
+
+class PoolScopeMiddleware:
+    """Middleware ASGI que abre um ``request_scope`` por requisição HTTP.
+
+    A devolução da conexão (que pode fazer ROLLBACK) roda no threadpool para não bloquear o event loop.
+    """
+
+    def __init__(self, app, pool: ConnectionPool) -> None:
+        self.app = app
+        self.pool = pool
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        request_scope = _RequestScope()
+        token = _request_scope.set(request_scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_scope.reset(token)
+            if request_scope.entry is not None:
+                await run_in_threadpool(self.pool._release_scope, request_scope)
@@ -0,0 +1,60 @@
+# Cache LRU de tokens JWT já verificados, compartilhado por auth_client e auth_middleware
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class TokenCache:
+    """LRU limitado de tokens verificados, indexado pelo SHA-256 do token.
+
+    Uma entrada só é devolvida enquanto o ``exp`` do token não passou; depois disso ela é
+    descartada e o chamador volta a decodificar (e recebe o erro de token expirado do PyJWT).
+    """
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        self.maxsize = maxsize if maxsize is not None else int(os.getenv('JWT_CACHE_SIZE', '4096'))
+        self._entries: 'OrderedDict[bytes, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Any]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            exp, value = entry
+            if exp is not None and exp <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, token: str, value: Any, exp: Optional[float]) -> None:
+        if self.maxsize <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (exp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'size': len(self._entries), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, Float, Date
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum, JSON, Boolean, Float, Date, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.db import Base
@@ -42,6 +42,11 @@ class ServiceProvider(Base):
     history = relationship("ServiceProviderHistory", back_populates="provider", cascade="all, delete-orphan")
     ratings = relationship("ServiceProviderRating", back_populates="provider", cascade="all, delete-orphan")
 
+    # Paginação por keyset (ORDER BY created_at DESC, id DESC)
+    __table_args__ = (
+        Index('idx_service_providers_created_id', 'created_at', 'id'),
+    )
+
 
 class ServiceProviderHistory(Base):
     __tablename__ = "service_provider_history"
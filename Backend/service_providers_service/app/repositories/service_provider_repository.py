@@ -4,6 +4,7 @@ from typing import List, Optional, Dict, Any
 from ..models.service_providers import ServiceProvider, ServiceProviderHistory, ServiceProviderRating
 from ..schemas.service_providers import ServiceProviderIn, ServiceProviderUpdate, ServiceProviderHistoryIn, ServiceProviderRatingIn, ServiceProviderSearchIn
 from datetime import datetime, date
+from ...shared.pagination import Page, keyset_page
 
 
 class ServiceProviderRepository:
@@ -74,7 +75,29 @@ class ServiceProviderRepository:
                               city: Optional[str] = None,
                               state: Optional[str] = None,
                               min_rating: Optional[float] = None,
-                              max_rating: Optional[float] = None) -> List[ServiceProvider]:
+                              max_rating: Optional[float] = None,
+                              cursor: Optional[str] = None,
+                              limit: Optional[int] = None) -> Page:
+        return keyset_page(self._service_providers_query(status, service_type, is_contractor, city, state, min_rating, max_rating), ServiceProvider.created_at, ServiceProvider.id, cursor, limit)
+
+    def find_service_providers(self, 
+                               status: Optional[str] = None,
+                               service_type: Optional[str] = None,
+                               is_contractor: Optional[bool] = None,
+                               city: Optional[str] = None,
+                               state: Optional[str] = None,
+                               min_rating: Optional[float] = None,
+                               max_rating: Optional[float] = None) -> List[ServiceProvider]:
+        return self._service_providers_query(status, service_type, is_contractor, city, state, min_rating, max_rating).order_by(desc(ServiceProvider.created_at)).all()
+
+    def _service_providers_query(self, 
+                                 status: Optional[str] = None,
+                                 service_type: Optional[str] = None,
+                                 is_contractor: Optional[bool] = None,
+                                 city: Optional[str] = None,
+                                 state: Optional[str] = None,
+                                 min_rating: Optional[float] = None,
+                                 max_rating: Optional[float] = None):
         query = self.db.query(ServiceProvider)
         
         if status:
@@ -92,7 +115,7 @@ class ServiceProviderRepository:
         if max_rating is not None:
             query = query.filter(ServiceProvider.rating <= max_rating)
             
-        return query.order_by(desc(ServiceProvider.created_at)).all()
+        return query
 
     def search_service_providers(self, search_data: ServiceProviderSearchIn) -> List[ServiceProvider]:
         query = self.db.query(ServiceProvider)
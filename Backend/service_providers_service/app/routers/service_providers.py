@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..core.db import get_db
@@ -9,6 +9,7 @@ from ..schemas.service_providers import (
     ServiceProviderSearchIn, ServiceProviderStatsOut
 )
 from ..services.service_provider_service import ServiceProviderService
+from ...shared.pagination import set_next_cursor
 
 router = APIRouter(prefix="/service-providers", tags=["service-providers"])
 
@@ -21,6 +22,7 @@ def create_service_provider(provider_data: ServiceProviderIn, created_by: str =
 
 @router.get("/", response_model=List[ServiceProviderOut])
 def list_service_providers(
+    response: Response,
     status: Optional[str] = None,
     service_type: Optional[str] = None,
     is_contractor: Optional[bool] = None,
@@ -28,10 +30,12 @@ def list_service_providers(
     state: Optional[str] = None,
     min_rating: Optional[float] = None,
     max_rating: Optional[float] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
     db: Session = Depends(get_db)
 ):
     service = ServiceProviderService(db)
-    return service.list_service_providers(status, service_type, is_contractor, city, state, min_rating, max_rating)
+    return set_next_cursor(response, service.list_service_providers(status, service_type, is_contractor, city, state, min_rating, max_rating, cursor, limit))
 
 
 @router.post("/search", response_model=List[ServiceProviderOut])
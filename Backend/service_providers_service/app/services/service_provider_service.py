@@ -8,6 +8,7 @@ from ..schemas.service_providers import (
     ServiceProviderSearchIn, ServiceProviderStatsOut
 )
 from datetime import datetime
+from ...shared.pagination import Page
 
 
 class ServiceProviderService:
@@ -49,11 +50,13 @@ class ServiceProviderService:
                               city: Optional[str] = None,
                               state: Optional[str] = None,
                               min_rating: Optional[float] = None,
-                              max_rating: Optional[float] = None) -> List[ServiceProviderOut]:
-        providers = self.repository.list_service_providers(
-            status, service_type, is_contractor, city, state, min_rating, max_rating
+                              max_rating: Optional[float] = None,
+                              cursor: Optional[str] = None,
+                              limit: Optional[int] = None) -> Page:
+        page = self.repository.list_service_providers(
+            status, service_type, is_contractor, city, state, min_rating, max_rating, cursor, limit
         )
-        return [ServiceProviderOut.from_orm(provider) for provider in providers]
+        return Page([ServiceProviderOut.from_orm(provider) for provider in page.items], page.next_cursor)
 
     def search_service_providers(self, search_data: ServiceProviderSearchIn) -> List[ServiceProviderOut]:
         providers = self.repository.search_service_providers(search_data)
@@ -137,45 +140,45 @@ class ServiceProviderService:
         return ServiceProviderStatsOut(**stats)
 
     def get_active_service_providers(self) -> List[ServiceProviderOut]:
-        providers = self.repository.list_service_providers(status="active")
+        providers = self.repository.find_service_providers(status="active")
         return [ServiceProviderOut.from_orm(provider) for provider in providers]
 
     def get_pending_service_providers(self) -> List[ServiceProviderOut]:
-        providers = self.repository.list_service_providers(status="pending")
+        providers = self.repository.find_service_providers(status="pending")
         return [ServiceProviderOut.from_orm(provider) for provider in providers]
 
     def get_suspended_service_providers(self) -> List[ServiceProviderOut]:
-        providers = self.repository.list_service_providers(status="suspended")
+        providers = self.repository.find_service_providers(status="suspended")
         return [ServiceProviderOut.from_orm(provider) for provider in providers]
 
     def get_rejected_service_providers(self) -> List[ServiceProviderOut]:
-        providers = self.repository.list_service_providers(status="rejected")
+        providers = self.repository.find_service_providers(status="rejected")
         return [ServiceProviderOut.from_orm(provider) for provider in providers]
 
     def get_service_providers_by_rating_range(self, min_rating: float, max_rating: float) -> List[ServiceProviderOut]:
-        providers = self.repository.list_service_providers(min_rating=min_rating, max_rating=max_rating)
+        providers = self.repository.find_service_providers(min_rating=min_rating, max_rating=max_rating)
         return [ServiceProviderOut.from_orm(provider) for provider in providers]
 
     def get_service_providers_by_contract_status(self, is_contractor: bool) -> List[ServiceProviderOut]:
-        providers = self.repository.list_service_providers(is_contractor=is_contractor)
+        providers = self.repository.find_service_providers(is_contractor=is_contractor)
         return [ServiceProviderOut.from_orm(provider) for provider in providers]
 
     def get_service_providers_by_insurance_expiry(self, days_ahead: int = 30) -> List[ServiceProviderOut]:
         # This would need to be implemented in the repository
         # For now, return all providers
-        providers = self.repository.list_service_providers()
+        providers = self.repository.find_service_providers()
         return [ServiceProviderOut.from_orm(provider) for provider in providers]
 
     def get_service_providers_by_license_expiry(self, days_ahead: int = 30) -> List[ServiceProviderOut]:
         # This would need to be implemented in the repository
         # For now, return all providers
-        providers = self.repository.list_service_providers()
+        providers = self.repository.find_service_providers()
         return [ServiceProviderOut.from_orm(provider) for provider in providers]
 
     def get_service_providers_by_contract_expiry(self, days_ahead: int = 30) -> List[ServiceProviderOut]:
         # This would need to be implemented in the repository
         # For now, return all providers
-        providers = self.repository.list_service_providers()
+        providers = self.repository.find_service_providers()
         return [ServiceProviderOut.from_orm(provider) for provider in providers]
 
     def get_service_providers_by_name(self, name: str) -> List[ServiceProviderOut]:
@@ -0,0 +1,97 @@
+# Pool asyncpg usado pelo modo assíncrono (DB_DRIVER=asyncpg) dos serviços de SQL puro
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from .db_pool import _LatencyWindow
+
+
+def to_db_timestamp(value: Optional[datetime]) -> Optional[datetime]:
+    """asyncpg só aceita datetime sem fuso em colunas ``timestamp``; converte para UTC ingênuo."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+async def _init_connection(conn) -> None:
+    # json/jsonb chegam já decodificados, como no psycopg2
+    for typename in ('json', 'jsonb'):
+        await conn.set_type_codec(typename, encoder=json.dumps, decoder=json.loads, schema='pg_catalog')
+
+
+class AsyncPool:
+    """Pool asyncpg com os mesmos parâmetros (DB_POOL_*) e métricas do ``ConnectionPool`` síncrono.
+
+    O asyncpg prepara cada consulta na primeira execução em uma conexão e guarda o statement
+    preparado num cache por conexão (``statement_cache_size``). Os repositórios assíncronos mantêm
+    as consultas fixas em constantes de módulo, então depois do aquecimento toda execução reutiliza
+    o statement já preparado (só Bind/Execute, sem Parse).
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_idle: Optional[float] = None,
+        statement_cache_size: Optional[int] = None,
+    ) -> None:
+        self.dsn = dsn
+        self.min_size = min_size if min_size is not None else int(os.getenv('DB_POOL_MIN_SIZE', '1'))
+        self.max_size = max_size if max_size is not None else int(os.getenv('DB_POOL_MAX_SIZE', '10'))
+        self.timeout = timeout if timeout is not None else float(os.getenv('DB_POOL_TIMEOUT', '10'))
+        self.max_idle = max_idle if max_idle is not None else float(os.getenv('DB_POOL_MAX_IDLE', '300'))
+        self.statement_cache_size = (
+            statement_cache_size if statement_cache_size is not None
+            else int(os.getenv('DB_STATEMENT_CACHE_SIZE', '256'))
+        )
+        self._pool = None
+        self._wait = _LatencyWindow()
+        self._hold = _LatencyWindow()
+
+    async def open(self) -> None:
+        if self._pool is None:
+            import asyncpg
+            self._pool = await asyncpg.create_pool(
+                self.dsn,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                max_inactive_connection_lifetime=self.max_idle,
+                statement_cache_size=self.statement_cache_size,
+                init=_init_connection,
+            )
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    @asynccontextmanager
+    async def connection(self):
+        if self._pool is None:
+            await self.open()
+        started = time.monotonic()
+        async with self._pool.acquire(timeout=self.timeout) as conn:
+            acquired = time.monotonic()
+            self._wait.add(acquired - started)
+            try:
+                yield conn
+            finally:
+                self._hold.add(time.monotonic() - acquired)
+
+    def stats(self) -> Dict[str, Any]:
+        size = self._pool.get_size() if self._pool is not None else 0
+        idle = self._pool.get_idle_size() if self._pool is not None else 0
+        return {
+            'driver': 'asyncpg',
+            'size': size,
+            'idle': idle,
+            'in_use': size - idle,
+            'max_size': self.max_size,
+            'wait': self._wait.snapshot(),
+            'checkout': self._hold.snapshot(),
+        }
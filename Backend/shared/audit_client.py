@@ -0,0 +1,150 @@
+# Cliente do audit_service que não bloqueia a requisição de quem registra o evento
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BATCH_PATH = '/api/audit/logs/batch'
+
+
+class AuditClient:
+    """Enfileira eventos de auditoria em memória e os envia em lote (NDJSON) numa thread.
+
+    - ``record(...)`` só coloca o evento na fila e volta na hora; com a fila cheia (audit_service
+      fora do ar por muito tempo) o evento é descartado e contado em ``dropped``
+    - a thread envia quando junta ``batch_size`` eventos ou a cada ``flush_interval`` segundos
+    - 429/5xx/erro de rede: o mesmo lote é reenviado depois do ``Retry-After`` (ou com backoff)
+    - 4xx: o lote é inválido e descartado (registrado no log)
+    - ``close()`` envia o que ainda estiver na fila; é chamado também no atexit
+    """
+
+    def __init__(self, base_url: Optional[str] = None, batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None, max_queue: Optional[int] = None,
+                 timeout: float = 5.0) -> None:
+        self.url = (base_url or os.getenv('AUDIT_SERVICE_URL', 'http://audit_service:8017')).rstrip('/') + BATCH_PATH
+        self.batch_size = batch_size or int(os.getenv('AUDIT_CLIENT_BATCH_SIZE', '200'))
+        self.flush_interval = (flush_interval if flush_interval is not None
+                               else float(os.getenv('AUDIT_CLIENT_FLUSH_INTERVAL', '1')))
+        self.timeout = timeout
+        self._queue: queue.Queue = queue.Queue(max_queue or int(os.getenv('AUDIT_CLIENT_MAX_QUEUE', '10000')))
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.sent = 0
+        self.dropped = 0
+        self.retries = 0
+
+    def record(self, user_id: str, user_email: str, action: str, resource_type: str, description: str,
+               **fields: Any) -> bool:
+        """Campos extras iguais aos de ``AuditLogIn`` (resource_id, tenant_id, old_values, ...)."""
+        event = dict(fields, user_id=user_id, user_email=user_email, action=action,
+                     resource_type=resource_type, description=description)
+        event.setdefault('created_at', datetime.utcnow())
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _ensure_started(self) -> None:
+        if self._worker is not None:
+            return
+        with self._start_lock:
+            if self._worker is None and not self._stop.is_set():
+                self._worker = threading.Thread(target=self._run, name='audit-client', daemon=True)
+                self._worker.start()
+                atexit.register(self.close)
+
+    def close(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+    # -- envio -----------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._deliver(batch)
+            elif self._stop.is_set():
+                return
+
+    def _next_batch(self) -> List[Dict[str, Any]]:
+        batch: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            # Encerrando: só esvazia o que já está na fila
+            wait = 0 if self._stop.is_set() else deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=wait) if wait > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _deliver(self, batch: List[Dict[str, Any]]) -> None:
+        body = '\n'.join(json.dumps(event, default=str) for event in batch).encode()
+        backoff = 1.0
+        failures_while_closing = 0
+        while True:
+            retry_after = None
+            try:
+                request = urllib.request.Request(
+                    self.url, data=body, method='POST',
+                    headers={'Content-Type': 'application/x-ndjson'}
+                )
+                with urllib.request.urlopen(request, timeout=self.timeout):
+                    self.sent += len(batch)
+                    return
+            except urllib.error.HTTPError as e:
+                if e.code != 429 and e.code < 500:
+                    logger.warning(f'Lote de auditoria recusado ({e.code}): {e.read()[:500]!r}')
+                    self.dropped += len(batch)
+                    return
+                retry_after = e.headers.get('Retry-After')
+            except (urllib.error.URLError, OSError) as e:
+                logger.warning(f'audit_service indisponível: {e}')
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else backoff
+            if self._stop.is_set():
+                # Na saída do processo não adianta insistir por muito tempo
+                failures_while_closing += 1
+                if failures_while_closing >= 3:
+                    self.dropped += len(batch)
+                    return
+                delay = min(delay, 1.0)
+            self.retries += 1
+            time.sleep(delay)
+            backoff = min(backoff * 2, 30.0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'queued': self._queue.qsize(),
+            'sent': self.sent,
+            'dropped': self.dropped,
+            'retries': self.retries,
+        }
+
+
+_default_client: Optional[AuditClient] = None
+_default_lock = threading.Lock()
+
+
+def get_audit_client() -> AuditClient:
+    """Cliente único por processo, configurado pelas variáveis AUDIT_*."""
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = AuditClient()
+    return _default_client
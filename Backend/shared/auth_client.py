@@ -3,8 +3,12 @@
 import jwt
 from fastapi import HTTPException, Header, Depends
 from typing import Optional
+from .token_cache import TokenCache
 SECRET='SECRET_KEY'
 
+# tokens already verified in this process; entries expire with the token's 'exp'
+_token_cache = TokenCache()
+
 def decode_token(authorization: Optional[str]):
     if not authorization:
         raise HTTPException(status_code=401, detail='Missing authorization header')
@@ -12,16 +16,20 @@ def decode_token(authorization: Optional[str]):
         token = authorization.split(' ',1)[1]
     else:
         token = authorization
-    try:
-        payload = jwt.decode(token, SECRET, algorithms=['HS256'])
-    except Exception as e:
-        raise HTTPException(status_code=401, detail='Invalid token')
-    return payload
+    payload = _token_cache.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, SECRET, algorithms=['HS256'])
+        except Exception as e:
+            raise HTTPException(status_code=401, detail='Invalid token')
+        _token_cache.put(token, payload, payload.get('exp'))
+    # copy: the cached dict is shared by every request carrying this token
+    return dict(payload)
 
 def get_current_user(authorization: Optional[str] = Header(None)):
     payload = decode_token(authorization)
     # payload must contain 'sub' and 'role'
-    return {'id': payload.get('sub'), 'role': payload.get('role')}
+    return {'id': payload.get('sub'), 'role': payload.get('role'), 'tenant_id': payload.get('tenant_id')}
 
 def require_role(allowed_roles):
     def dep(authorization: Optional[str] = Header(None)):
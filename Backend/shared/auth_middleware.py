@@ -1,35 +1,55 @@
 import jwt
 from fastapi import HTTPException, Depends, Header
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple
 import os
+from .permissions import compile_permissions
+from .token_cache import TokenCache
+
+
+class VerifiedToken(NamedTuple):
+    payload: Dict[str, Any]
+    permissions: frozenset
+    has_all: bool
 
 
 class AuthMiddleware:
     def __init__(self):
         self.jwt_secret = os.getenv('JWT_SECRET', 'SECRET_KEY')
         self.jwt_algorithm = 'HS256'
-    
-    def verify_token(self, authorization: Optional[str] = Header(None)) -> Dict[str, Any]:
+        self.token_cache = TokenCache()
+
+    def _verify(self, authorization: Optional[str]) -> VerifiedToken:
         if not authorization:
             raise HTTPException(status_code=401, detail="Token de autorização necessário")
-        
+
+        token = authorization.replace("Bearer ", "")
+        verified = self.token_cache.get(token)
+        if verified is not None:
+            return verified
+
         try:
-            token = authorization.replace("Bearer ", "")
             payload = jwt.decode(token, self.jwt_secret, algorithms=[self.jwt_algorithm])
-            return payload
         except jwt.ExpiredSignatureError:
             raise HTTPException(status_code=401, detail="Token expirado")
         except jwt.InvalidTokenError:
             raise HTTPException(status_code=401, detail="Token inválido")
-    
+
+        permissions = compile_permissions(tuple(payload.get('permissions') or ()))
+        verified = VerifiedToken(payload, permissions, 'all' in permissions)
+        self.token_cache.put(token, verified, payload.get('exp'))
+        return verified
+
+    def verify_token(self, authorization: Optional[str] = Header(None)) -> Dict[str, Any]:
+        return dict(self._verify(authorization).payload)
+
     def require_permission(self, permission: str):
-        def permission_checker(payload: Dict[str, Any] = Depends(self.verify_token)):
-            user_permissions = payload.get('permissions', [])
-            if 'all' not in user_permissions and permission not in user_permissions:
+        def permission_checker(authorization: Optional[str] = Header(None)):
+            verified = self._verify(authorization)
+            if not verified.has_all and permission not in verified.permissions:
                 raise HTTPException(status_code=403, detail=f"Permissão '{permission}' necessária")
-            return payload
+            return dict(verified.payload)
         return permission_checker
-    
+
     def require_role(self, role: str):
         def role_checker(payload: Dict[str, Any] = Depends(self.verify_token)):
             user_role = payload.get('role')
@@ -37,7 +57,7 @@ class AuthMiddleware:
                 raise HTTPException(status_code=403, detail=f"Role '{role}' necessária")
             return payload
         return role_checker
-    
+
     def require_tenant_access(self, tenant_id: int):
         def tenant_checker(payload: Dict[str, Any] = Depends(self.verify_token)):
             user_tenant_id = payload.get('tenant_id')
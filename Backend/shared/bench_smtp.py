@@ -0,0 +1,59 @@
+# Servidor SMTP local e lento (aiosmtpd) para os benchmarks de envio; só os scripts de bench o importam
+import asyncio
+import socket
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+from aiosmtpd.controller import Controller
+
+
+class SlowSMTPHandler:
+    """
+    Imita um provedor remoto: atraso no handshake (TCP + STARTTLS + AUTH) e em cada DATA.
+    Destinatários com ``reject`` no endereço são recusados (550) e, com ``max_recipients``,
+    os que passarem do limite por mensagem recebem 452, como na maioria dos provedores.
+    """
+
+    def __init__(self, handshake_delay: float, data_delay: float, max_recipients: Optional[int] = None) -> None:
+        self.handshake_delay = handshake_delay
+        self.data_delay = data_delay
+        self.max_recipients = max_recipients
+        self.messages = 0
+        self.recipients = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        await asyncio.sleep(self.handshake_delay)
+        session.host_name = hostname
+        return responses
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if 'reject' in address:
+            return '550 Mailbox unavailable'
+        if self.max_recipients is not None and len(envelope.rcpt_tos) >= self.max_recipients:
+            return '452 Too many recipients'
+        envelope.rcpt_tos.append(address)
+        return '250 OK'
+
+    async def handle_DATA(self, server, session, envelope):
+        await asyncio.sleep(self.data_delay)
+        self.messages += 1
+        self.recipients += len(envelope.rcpt_tos)
+        return '250 Message accepted for delivery'
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def slow_smtp_server(handler: SlowSMTPHandler) -> Iterator[Tuple[str, int]]:
+    """Sobe o servidor numa porta livre de 127.0.0.1 e devolve ``(host, porta)``; para ao sair do bloco."""
+    host, port = '127.0.0.1', free_port()
+    controller = Controller(handler, hostname=host, port=port)
+    controller.start()
+    try:
+        yield host, port
+    finally:
+        controller.stop()
@@ -1,4 +1,5 @@
 # Sistema de Permissões do Sistema de Condomínios
+from functools import lru_cache
 
 # Permissões por Role
 ROLE_PERMISSIONS = {
@@ -91,6 +92,15 @@ MODULE_PERMISSIONS = {
     ]
 }
 
+@lru_cache(maxsize=1024)
+def compile_permissions(permissions: tuple) -> frozenset:
+    """
+    Permissões do token em um frozenset para verificação O(1) (memorizado por combinação).
+    Só as do token: as padrão do role não entram, senão um usuário com permissões restringidas
+    as recuperaria.
+    """
+    return frozenset(permissions)
+
 def get_permissions_for_role(role: str) -> list:
     """Retorna as permissões para um role específico"""
     return ROLE_PERMISSIONS.get(role, [])
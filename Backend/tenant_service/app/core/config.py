@@ -4,6 +4,10 @@ import os
 class Settings:
     def __init__(self) -> None:
         self.database_url: str = os.getenv('DATABASE_URL', '')
+        # 'psycopg2' (rotas def + pool síncrono) ou 'asyncpg' (rotas async def + pool asyncpg)
+        self.db_driver: str = os.getenv('DB_DRIVER', 'psycopg2')
+        # Threads que executam as rotas def no modo psycopg2 (limite do threadpool do anyio)
+        self.threadpool_size: int = int(os.getenv('THREADPOOL_SIZE', '40'))
         self.jwt_secret: str = os.getenv('JWT_SECRET', 'SECRET_KEY')
         self.jwt_algorithm: str = 'HS256'
         self.jwt_ttl_hours: int = int(os.getenv('JWT_TTL_HOURS', '8'))
@@ -1,6 +1,12 @@
-import psycopg2
+from shared.async_db import AsyncPool
+from shared.db_pool import ConnectionPool
+from shared.tenant_cache import TenantCache
 from .config import settings
 
+pool = ConnectionPool(settings.database_url)
+async_pool = AsyncPool(settings.database_url)
+tenant_cache = TenantCache()
+
 
 def get_conn():
-    return psycopg2.connect(settings.database_url)
+    return pool.connection()
@@ -0,0 +1,86 @@
+from typing import Optional, Tuple, Dict, Any
+from shared.pagination import Page, decode_cursor, fetch_limit, list_size, page_from_rows
+from ..core.db import async_pool
+
+
+# Consultas fixas em constantes: cada uma é preparada uma vez por conexão pelo asyncpg.
+# theme_config é jsonb; o codec registrado pelo AsyncPool converte dicts automaticamente.
+TENANT_COLUMNS = 'id, name, cnpj, address, phone, email, theme_config, is_active, created_at'
+INSERT_TENANT = 'INSERT INTO tenants (name, cnpj, address, phone, email, theme_config) VALUES ($1, $2, $3, $4, $5, $6) RETURNING id'
+INSERT_ADMIN_USER = 'INSERT INTO users (tenant_id, email, password, full_name, role, permissions) VALUES ($1, $2, $3, $4, $5, $6)'
+GET_TENANT_BY_ID = f'SELECT {TENANT_COLUMNS} FROM tenants WHERE id = $1'
+GET_TENANT_BY_CNPJ = f'SELECT {TENANT_COLUMNS} FROM tenants WHERE cnpj = $1'
+LIST_TENANTS = f'SELECT {TENANT_COLUMNS} FROM tenants ORDER BY created_at DESC, id DESC LIMIT $1'
+LIST_TENANTS_AFTER = f'SELECT {TENANT_COLUMNS} FROM tenants WHERE (created_at, id) < ($2, $3) ORDER BY created_at DESC, id DESC LIMIT $1'
+# Cursor numa linha com created_at NULL (vêm primeiro no DESC): as outras NULL de id menor e depois as datadas
+LIST_TENANTS_AFTER_NULL = f'SELECT {TENANT_COLUMNS} FROM tenants WHERE (created_at IS NOT NULL OR id < $2) ORDER BY created_at DESC, id DESC LIMIT $1'
+# Campos nulos mantêm o valor atual, como no UPDATE dinâmico do repositório síncrono
+UPDATE_TENANT = '''UPDATE tenants SET name = COALESCE($1, name), address = COALESCE($2, address),
+                   phone = COALESCE($3, phone), email = COALESCE($4, email),
+                   theme_config = COALESCE($5, theme_config), is_active = COALESCE($6, is_active)
+                   WHERE id = $7'''
+DEACTIVATE_TENANT = 'UPDATE tenants SET is_active = false WHERE id = $1'
+
+
+async def create_tenant_with_admin(
+    name: str,
+    cnpj: str,
+    address: str,
+    phone: str,
+    email: str,
+    theme_config: Optional[Dict[str, Any]],
+    admin_email: str,
+    admin_password: str,
+    admin_name: str
+) -> int:
+    """Cria o tenant e o usuário administrador na mesma transação"""
+    async with async_pool.connection() as conn:
+        async with conn.transaction():
+            tenant_id = await conn.fetchval(INSERT_TENANT, name, cnpj, address, phone, email, theme_config)
+            await conn.execute(INSERT_ADMIN_USER, tenant_id, admin_email, admin_password, admin_name, 'admin', ['all'])
+            return tenant_id
+
+
+async def get_tenant_by_id(tenant_id: int) -> Optional[Tuple]:
+    async with async_pool.connection() as conn:
+        return await conn.fetchrow(GET_TENANT_BY_ID, tenant_id)
+
+
+async def get_tenant_by_cnpj(cnpj: str) -> Optional[Tuple]:
+    async with async_pool.connection() as conn:
+        return await conn.fetchrow(GET_TENANT_BY_CNPJ, cnpj)
+
+
+async def list_tenants(cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    size = list_size(limit, cursor)
+    position = decode_cursor(cursor)
+    async with async_pool.connection() as conn:
+        if position is None:
+            rows = await conn.fetch(LIST_TENANTS, fetch_limit(size))
+        elif position[0] is None:
+            rows = await conn.fetch(LIST_TENANTS_AFTER_NULL, fetch_limit(size), position[1])
+        else:
+            rows = await conn.fetch(LIST_TENANTS_AFTER, fetch_limit(size), *position)
+    return page_from_rows(rows, size, lambda r: (r[8], r[0]))
+
+
+async def update_tenant(
+    tenant_id: int,
+    name: Optional[str] = None,
+    address: Optional[str] = None,
+    phone: Optional[str] = None,
+    email: Optional[str] = None,
+    theme_config: Optional[Dict[str, Any]] = None,
+    is_active: Optional[bool] = None
+) -> bool:
+    if all(v is None for v in (name, address, phone, email, theme_config, is_active)):
+        return False
+    async with async_pool.connection() as conn:
+        status = await conn.execute(UPDATE_TENANT, name, address, phone, email, theme_config, is_active, tenant_id)
+        return status != 'UPDATE 0'
+
+
+async def delete_tenant(tenant_id: int) -> bool:
+    async with async_pool.connection() as conn:
+        status = await conn.execute(DEACTIVATE_TENANT, tenant_id)
+        return status != 'UPDATE 0'
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import List, Optional
+from shared.pagination import set_next_cursor
 from ..schemas.tenants import TenantIn, TenantOut, TenantUpdate
 from ..services.tenant_service import tenant_service
 
@@ -7,7 +8,7 @@ router = APIRouter(prefix="/tenants", tags=["tenants"])
 
 
 @router.post("/", response_model=TenantOut)
-async def create_tenant(tenant_data: TenantIn):
+def create_tenant(tenant_data: TenantIn):
     try:
         return tenant_service.create_tenant(tenant_data)
     except ValueError as e:
@@ -17,15 +18,17 @@ async def create_tenant(tenant_data: TenantIn):
 
 
 @router.get("/", response_model=List[TenantOut])
-async def list_tenants():
+def list_tenants(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1)):
     try:
-        return tenant_service.list_tenants()
+        return set_next_cursor(response, tenant_service.list_tenants(cursor, limit))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail="Erro interno do servidor")
 
 
 @router.get("/{tenant_id}", response_model=TenantOut)
-async def get_tenant(tenant_id: int):
+def get_tenant(tenant_id: int):
     tenant = tenant_service.get_tenant(tenant_id)
     if not tenant:
         raise HTTPException(status_code=404, detail="Condomínio não encontrado")
@@ -33,7 +36,7 @@ async def get_tenant(tenant_id: int):
 
 
 @router.get("/cnpj/{cnpj}", response_model=TenantOut)
-async def get_tenant_by_cnpj(cnpj: str):
+def get_tenant_by_cnpj(cnpj: str):
     tenant = tenant_service.get_tenant_by_cnpj(cnpj)
     if not tenant:
         raise HTTPException(status_code=404, detail="Condomínio não encontrado")
@@ -41,7 +44,7 @@ async def get_tenant_by_cnpj(cnpj: str):
 
 
 @router.put("/{tenant_id}", response_model=TenantOut)
-async def update_tenant(tenant_id: int, update_data: TenantUpdate):
+def update_tenant(tenant_id: int, update_data: TenantUpdate):
     try:
         tenant = tenant_service.update_tenant(tenant_id, update_data)
         if not tenant:
@@ -52,7 +55,7 @@ async def update_tenant(tenant_id: int, update_data: TenantUpdate):
 
 
 @router.delete("/{tenant_id}")
-async def delete_tenant(tenant_id: int):
+def delete_tenant(tenant_id: int):
     success = tenant_service.delete_tenant(tenant_id)
     if not success:
         raise HTTPException(status_code=404, detail="Condomínio não encontrado")
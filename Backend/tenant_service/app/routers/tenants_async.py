@@ -0,0 +1,63 @@
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import List, Optional
+from shared.pagination import set_next_cursor
+from ..schemas.tenants import TenantIn, TenantOut, TenantUpdate
+from ..services.tenant_service_async import async_tenant_service
+
+# Mesmas rotas de app/routers/tenants.py, sobre o pool asyncpg (DB_DRIVER=asyncpg)
+router = APIRouter(prefix="/tenants", tags=["tenants"])
+
+
+@router.post("/", response_model=TenantOut)
+async def create_tenant(tenant_data: TenantIn):
+    try:
+        return await async_tenant_service.create_tenant(tenant_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        raise HTTPException(status_code=500, detail="Erro interno do servidor")
+
+
+@router.get("/", response_model=List[TenantOut])
+async def list_tenants(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1)):
+    try:
+        return set_next_cursor(response, await async_tenant_service.list_tenants(cursor, limit))
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=500, detail="Erro interno do servidor")
+
+
+@router.get("/{tenant_id}", response_model=TenantOut)
+async def get_tenant(tenant_id: int):
+    tenant = await async_tenant_service.get_tenant(tenant_id)
+    if not tenant:
+        raise HTTPException(status_code=404, detail="Condomínio não encontrado")
+    return tenant
+
+
+@router.get("/cnpj/{cnpj}", response_model=TenantOut)
+async def get_tenant_by_cnpj(cnpj: str):
+    tenant = await async_tenant_service.get_tenant_by_cnpj(cnpj)
+    if not tenant:
+        raise HTTPException(status_code=404, detail="Condomínio não encontrado")
+    return tenant
+
+
+@router.put("/{tenant_id}", response_model=TenantOut)
+async def update_tenant(tenant_id: int, update_data: TenantUpdate):
+    try:
+        tenant = await async_tenant_service.update_tenant(tenant_id, update_data)
+        if not tenant:
+            raise HTTPException(status_code=404, detail="Condomínio não encontrado")
+        return tenant
+    except Exception:
+        raise HTTPException(status_code=500, detail="Erro interno do servidor")
+
+
+@router.delete("/{tenant_id}")
+async def delete_tenant(tenant_id: int):
+    success = await async_tenant_service.delete_tenant(tenant_id)
+    if not success:
+        raise HTTPException(status_code=404, detail="Condomínio não encontrado")
+    return {"message": "Condomínio desativado com sucesso"}
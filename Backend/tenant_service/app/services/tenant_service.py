@@ -1,13 +1,18 @@
-from typing import List, Optional, Dict, Any
+from typing import Optional, Dict, Any
+from shared.pagination import Page
+from shared.tenant_cache import tenant_from_row
 from ..repositories.tenant_repository import (
-    create_tenant, get_tenant_by_id, get_tenant_by_cnpj, 
+    create_tenant_with_admin, get_tenant_by_id, get_tenant_by_cnpj, 
     list_tenants, update_tenant, delete_tenant
 )
 from ..schemas.tenants import TenantIn, TenantOut, TenantUpdate, TenantThemeConfig
 from datetime import datetime
 import json
-import psycopg2
-from ..core.config import settings
+from ..core.db import tenant_cache
+
+
+def _load_tenant(tenant_id: int):
+    return tenant_from_row(get_tenant_by_id(tenant_id))
 
 
 class TenantService:
@@ -22,42 +27,25 @@ class TenantService:
         if tenant_data.theme_config:
             theme_config = tenant_data.theme_config.dict()
         
-        # Criar tenant
-        tenant_id = create_tenant(
+        # Criar tenant e usuário administrador (mesma transação)
+        tenant_id = create_tenant_with_admin(
             name=tenant_data.name,
             cnpj=tenant_data.cnpj,
             address=tenant_data.address,
             phone=tenant_data.phone,
             email=tenant_data.email,
-            theme_config=theme_config
+            theme_config=theme_config,
+            admin_email=tenant_data.admin_email,
+            admin_password=tenant_data.admin_password,
+            admin_name=tenant_data.admin_name
         )
         
-        # Criar usuário administrador
-        self._create_admin_user(tenant_id, tenant_data.admin_email, tenant_data.admin_password, tenant_data.admin_name)
-        
         # Retornar tenant criado
         tenant = get_tenant_by_id(tenant_id)
         return self._row_to_tenant_out(tenant)
     
-    def _create_admin_user(self, tenant_id: int, email: str, password: str, full_name: str):
-        """Cria o usuário administrador para o tenant"""
-        conn = psycopg2.connect(settings.database_url)
-        cur = conn.cursor()
-        try:
-            cur.execute(
-                'INSERT INTO users (tenant_id, email, password, full_name, role, permissions) VALUES (%s, %s, %s, %s, %s, %s)',
-                (tenant_id, email, password, full_name, 'admin', json.dumps(['all']))
-            )
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            cur.close()
-            conn.close()
-    
     def get_tenant(self, tenant_id: int) -> Optional[TenantOut]:
-        tenant = get_tenant_by_id(tenant_id)
+        tenant = tenant_cache.get(tenant_id, _load_tenant)
         if not tenant:
             return None
         return self._row_to_tenant_out(tenant)
@@ -68,9 +56,9 @@ class TenantService:
             return None
         return self._row_to_tenant_out(tenant)
     
-    def list_tenants(self) -> List[TenantOut]:
-        tenants = list_tenants()
-        return [self._row_to_tenant_out(tenant) for tenant in tenants]
+    def list_tenants(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        page = list_tenants(cursor, limit)
+        return Page([self._row_to_tenant_out(tenant) for tenant in page.items], page.next_cursor)
     
     def update_tenant(self, tenant_id: int, update_data: TenantUpdate) -> Optional[TenantOut]:
         # Preparar dados para atualização
@@ -84,22 +72,30 @@ class TenantService:
         success = update_tenant(tenant_id, **update_dict)
         if not success:
             return None
+        # Os demais processos são avisados pelo NOTIFY do trigger em tenants
+        tenant_cache.invalidate(tenant_id)
         
         # Retornar tenant atualizado
         return self.get_tenant(tenant_id)
     
     def delete_tenant(self, tenant_id: int) -> bool:
-        return delete_tenant(tenant_id)
+        success = delete_tenant(tenant_id)
+        if success:
+            tenant_cache.invalidate(tenant_id)
+        return success
     
     def _row_to_tenant_out(self, row: tuple) -> TenantOut:
         tenant_id, name, cnpj, address, phone, email, theme_config_json, is_active, created_at = row
         
         theme_config = None
-        if theme_config_json:
+        if isinstance(theme_config_json, str):
             try:
                 theme_config = json.loads(theme_config_json)
             except json.JSONDecodeError:
                 theme_config = None
+        elif theme_config_json:
+            # psycopg2/asyncpg já entregam jsonb decodificado
+            theme_config = theme_config_json
         
         return TenantOut(
             id=tenant_id,
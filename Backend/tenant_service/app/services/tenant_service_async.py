@@ -0,0 +1,76 @@
+from typing import Optional
+from shared.pagination import Page
+from shared.tenant_cache import tenant_from_row
+from ..core.db import tenant_cache
+from ..repositories import tenant_repository_async as repo
+from ..schemas.tenants import TenantIn, TenantOut, TenantUpdate
+from .tenant_service import TenantService
+
+
+async def _load_tenant(tenant_id: int):
+    return tenant_from_row(await repo.get_tenant_by_id(tenant_id))
+
+
+class AsyncTenantService:
+    """Versão async def do TenantService, sobre o pool asyncpg (DB_DRIVER=asyncpg)"""
+
+    _row_to_tenant_out = TenantService._row_to_tenant_out
+
+    async def create_tenant(self, tenant_data: TenantIn) -> TenantOut:
+        # Verificar se CNPJ já existe
+        existing = await repo.get_tenant_by_cnpj(tenant_data.cnpj)
+        if existing:
+            raise ValueError("CNPJ já cadastrado")
+
+        theme_config = tenant_data.theme_config.dict() if tenant_data.theme_config else None
+
+        tenant_id = await repo.create_tenant_with_admin(
+            name=tenant_data.name,
+            cnpj=tenant_data.cnpj,
+            address=tenant_data.address,
+            phone=tenant_data.phone,
+            email=tenant_data.email,
+            theme_config=theme_config,
+            admin_email=tenant_data.admin_email,
+            admin_password=tenant_data.admin_password,
+            admin_name=tenant_data.admin_name
+        )
+
+        tenant = await repo.get_tenant_by_id(tenant_id)
+        return self._row_to_tenant_out(tenant)
+
+    async def get_tenant(self, tenant_id: int) -> Optional[TenantOut]:
+        tenant = await tenant_cache.aget(tenant_id, _load_tenant)
+        if not tenant:
+            return None
+        return self._row_to_tenant_out(tenant)
+
+    async def get_tenant_by_cnpj(self, cnpj: str) -> Optional[TenantOut]:
+        tenant = await repo.get_tenant_by_cnpj(cnpj)
+        if not tenant:
+            return None
+        return self._row_to_tenant_out(tenant)
+
+    async def list_tenants(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+        page = await repo.list_tenants(cursor, limit)
+        return Page([self._row_to_tenant_out(tenant) for tenant in page.items], page.next_cursor)
+
+    async def update_tenant(self, tenant_id: int, update_data: TenantUpdate) -> Optional[TenantOut]:
+        update_dict = update_data.dict(exclude_unset=True)
+        # .dict() já converte o TenantThemeConfig aninhado em dict
+
+        success = await repo.update_tenant(tenant_id, **update_dict)
+        if not success:
+            return None
+        tenant_cache.invalidate(tenant_id)
+
+        return await self.get_tenant(tenant_id)
+
+    async def delete_tenant(self, tenant_id: int) -> bool:
+        success = await repo.delete_tenant(tenant_id)
+        if success:
+            tenant_cache.invalidate(tenant_id)
+        return success
+
+
+async_tenant_service = AsyncTenantService()
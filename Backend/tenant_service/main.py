@@ -1,8 +1,18 @@
 from fastapi import FastAPI
-from app.routers import tenants, health
+from app.core.config import settings
+from app.core.db import pool, async_pool, tenant_cache
+from app.routers import health
+from shared.db_pool import PoolScopeMiddleware
 
 app = FastAPI(title="Tenant Service", version="1.0.0")
 
+if settings.db_driver == "asyncpg":
+    from app.routers import tenants_async as tenants
+else:
+    from app.routers import tenants
+
+    app.add_middleware(PoolScopeMiddleware, pool=pool)
+
 app.include_router(health.router)
 app.include_router(tenants.router)
 
@@ -10,3 +20,27 @@ app.include_router(tenants.router)
 @app.get("/")
 async def root():
     return {"message": "Tenant Service is running"}
+
+@app.get("/metrics/db-pool")
+def db_pool_metrics():
+    return (async_pool if settings.db_driver == "asyncpg" else pool).stats()
+
+@app.get("/metrics/tenant-cache")
+def tenant_cache_metrics():
+    return tenant_cache.stats()
+
+@app.on_event("startup")
+async def open_async_pool():
+    if settings.db_driver == "asyncpg":
+        await async_pool.open()
+    else:
+        # As rotas def rodam no threadpool do anyio; uma consulta lenta ocupa só uma thread
+        import anyio.to_thread
+        anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    tenant_cache.listen(settings.database_url)
+
+@app.on_event("shutdown")
+async def close_db_pools():
+    tenant_cache.stop()
+    await async_pool.close()
+    pool.close()
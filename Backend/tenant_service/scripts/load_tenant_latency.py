@@ -0,0 +1,123 @@
+"""
+Teste de carga: latência de GET /tenants/{id} enquanto um POST /tenants está lento.
+
+O script segura um lock SHARE na tabela ``tenants`` por ``--hold`` segundos (o INSERT do
+create_tenant fica esperando; SELECTs não são afetados), dispara o POST e, em paralelo,
+mede a latência de GETs concorrentes. Compara com uma rodada de referência sem o POST.
+
+Com o serviço bloqueando o event loop, os GETs da segunda rodada ficariam parados até o
+lock ser liberado (p99 ~ --hold); com as rotas no threadpool (DB_DRIVER=psycopg2) ou no
+pool asyncpg (DB_DRIVER=asyncpg), as duas rodadas têm latências equivalentes.
+
+Uso (serviço rodando e DATABASE_URL apontando para o mesmo banco):
+    python scripts/load_tenant_latency.py --url http://localhost:8008 --tenant-id 1
+"""
+import argparse
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+
+
+def _get(url: str) -> float:
+    started = time.perf_counter()
+    with urllib.request.urlopen(url, timeout=60) as resp:
+        resp.read()
+    return time.perf_counter() - started
+
+
+def _post_tenant(base_url: str) -> float:
+    suffix = uuid.uuid4().hex[:12]
+    body = json.dumps({
+        'name': f'Carga {suffix}',
+        'cnpj': suffix,
+        'address': 'Rua do Teste, 1',
+        'phone': '0000-0000',
+        'email': f'carga-{suffix}@example.com',
+        'admin_email': f'admin-{suffix}@example.com',
+        'admin_password': 'carga',
+        'admin_name': 'Admin Carga',
+    }).encode()
+    req = urllib.request.Request(f'{base_url}/tenants/', data=body, headers={'Content-Type': 'application/json'})
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=120) as resp:
+            resp.read()
+    except urllib.error.HTTPError as e:
+        print(f'POST /tenants/ respondeu {e.code}')
+    return time.perf_counter() - started
+
+
+def _percentiles(samples):
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+    return {'n': len(ordered), 'p50_ms': pct(0.50), 'p95_ms': pct(0.95), 'p99_ms': pct(0.99), 'max_ms': ordered[-1] * 1000}
+
+
+def _measure(url: str, concurrency: int, duration: float):
+    samples = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def loop():
+        while time.monotonic() < deadline:
+            elapsed = _get(url)
+            with lock:
+                samples.append(elapsed)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(loop)
+    return _percentiles(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://localhost:8008')
+    parser.add_argument('--tenant-id', type=int, default=1)
+    parser.add_argument('--database-url', default=os.getenv('DATABASE_URL', ''))
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--hold', type=float, default=5.0, help='segundos que o create_tenant fica bloqueado')
+    args = parser.parse_args()
+
+    get_url = f'{args.url}/tenants/{args.tenant_id}'
+    _get(get_url)  # aquecimento (e falha cedo se o tenant não existir)
+
+    baseline = _measure(get_url, args.concurrency, args.hold)
+
+    blocker = psycopg2.connect(args.database_url)
+    cur = blocker.cursor()
+    cur.execute('LOCK TABLE tenants IN SHARE MODE')
+    post_time = {}
+    poster = threading.Thread(target=lambda: post_time.update(elapsed=_post_tenant(args.url)))
+    poster.start()
+    time.sleep(0.2)  # garante que o POST já está esperando o lock
+    release = threading.Timer(args.hold, blocker.rollback)
+    release.start()
+    try:
+        during = _measure(get_url, args.concurrency, args.hold)
+    finally:
+        release.join()
+        poster.join()
+        blocker.close()
+
+    print(f'{"":24}{"n":>7}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"max ms":>10}')
+    for label, stats in (('GET sem create', baseline), ('GET durante create', during)):
+        print(f'{label:24}{stats["n"]:>7}{stats["p50_ms"]:>10.1f}{stats["p95_ms"]:>10.1f}'
+              f'{stats["p99_ms"]:>10.1f}{stats["max_ms"]:>10.1f}')
+    print(f'POST /tenants/ levou {post_time.get("elapsed", 0):.2f}s')
+    if during['p99_ms'] > max(10 * baseline['p99_ms'], 250):
+        raise SystemExit('GET /tenants/{id} ficou bloqueado pelo create_tenant')
+
+
+if __name__ == '__main__':
+    main()
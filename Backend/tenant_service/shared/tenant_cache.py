@@ -0,0 +1,163 @@
+# Cache read-through dos condomínios (tenants) compartilhado por auth_service e tenant_service
+import json
+import logging
+import os
+import select
+import threading
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Canal do NOTIFY disparado pelo trigger tenants_notify_change (Scripts/init_db.sql)
+TENANT_CHANNEL = 'tenant_changed'
+
+TENANT_COLUMNS = 'id, name, cnpj, address, phone, email, theme_config, is_active, created_at'
+
+
+class CachedTenant(NamedTuple):
+    id: int
+    name: str
+    cnpj: str
+    address: Optional[str]
+    phone: Optional[str]
+    email: Optional[str]
+    theme_config: Optional[Dict[str, Any]]
+    is_active: bool
+    created_at: Optional[datetime]
+
+
+def tenant_from_row(row) -> Optional[CachedTenant]:
+    """Converte uma linha ``SELECT {TENANT_COLUMNS}`` já com o tema decodificado."""
+    if row is None:
+        return None
+    values = list(row)
+    theme = values[6]
+    if isinstance(theme, str):
+        try:
+            theme = json.loads(theme)
+        except json.JSONDecodeError:
+            theme = None
+    values[6] = theme or None
+    return CachedTenant(*values)
+
+
+class TenantCache:
+    """Cache em memória de ``CachedTenant`` por id, com TTL e invalidação via LISTEN/NOTIFY.
+
+    - entradas valem por ``ttl`` segundos (rede de segurança caso uma notificação se perca)
+    - ``listen(dsn)`` abre uma conexão dedicada que escuta ``tenant_changed`` e invalida o id
+      recebido; se a conexão cair, o cache inteiro é limpo antes de reconectar
+    - condomínios inexistentes não são guardados
+    """
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        self.ttl = ttl if ttl is not None else float(os.getenv('TENANT_CACHE_TTL', '300'))
+        self._entries: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # Incrementado a cada invalidação: uma leitura que começou antes dela não é guardada
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def lookup(self, tenant_id: int) -> Optional[CachedTenant]:
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def store(self, tenant_id: int, tenant: Optional[CachedTenant], generation: Optional[int] = None) -> Optional[CachedTenant]:
+        if tenant is not None and self.ttl > 0:
+            with self._lock:
+                if generation is None or generation == self._generation:
+                    self._entries[tenant_id] = (time.monotonic() + self.ttl, tenant)
+        return tenant
+
+    def get(self, tenant_id: int, loader: Callable[[int], Optional[CachedTenant]]) -> Optional[CachedTenant]:
+        tenant = self.lookup(tenant_id)
+        if tenant is None:
+            generation = self._generation
+            tenant = self.store(tenant_id, loader(tenant_id), generation)
+        return tenant
+
+    async def aget(self, tenant_id: int, loader: Callable[[int], Awaitable[Optional[CachedTenant]]]) -> Optional[CachedTenant]:
+        tenant = self.lookup(tenant_id)
+        if tenant is None:
+            generation = self._generation
+            tenant = self.store(tenant_id, await loader(tenant_id), generation)
+        return tenant
+
+    def invalidate(self, tenant_id: Optional[int] = None) -> None:
+        """Remove um condomínio do cache (ou todos, com ``tenant_id=None``)."""
+        with self._lock:
+            if tenant_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(tenant_id, None)
+            self._generation += 1
+            self.invalidations += 1
+
+    # -- LISTEN/NOTIFY -----------------------------------------------------
+
+    def listen(self, dsn: str) -> None:
+        if self._listener is not None or not dsn:
+            return
+        self._stop.clear()
+        self._listener = threading.Thread(target=self._listen_loop, args=(dsn,), name='tenant-cache-listener', daemon=True)
+        self._listener.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._listener is not None:
+            self._listener.join(timeout=5)
+            self._listener = None
+
+    def _listen_loop(self, dsn: str) -> None:
+        import psycopg2
+
+        backoff = 1.0
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(dsn)
+                conn.autocommit = True
+                conn.cursor().execute(f'LISTEN {TENANT_CHANNEL}')
+                # Notificações perdidas enquanto não havia conexão: começa do zero
+                self.invalidate()
+                backoff = 1.0
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], 1.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        payload = conn.notifies.pop(0).payload
+                        self.invalidate(int(payload) if payload.isdigit() else None)
+            except Exception as e:
+                logger.warning(f'Listener do cache de condomínios caiu: {e}; reconectando em {backoff:.0f}s')
+                self.invalidate()
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'listening': self._listener is not None and self._listener.is_alive(),
+            }
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, select
+
+from shared.counter_buffer import CounterBuffer
+
+metadata = MetaData()
+documents = Table(
+    'documents', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('download_count', Integer, nullable=False, default=0),
+)
+
+
+def test_flush_applies_counters_on_sqlite(tmp_path):
+    engine = create_engine(f'sqlite:///{tmp_path / "counters.db"}')
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(documents.insert(), [{'id': 1, 'download_count': 0}, {'id': 2, 'download_count': 5}])
+
+    buffer = CounterBuffer(engine, interval=60)
+    for row_id in (1, 1, 2, 3):  # 3 não existe: é ignorado
+        buffer.increment(documents.c.download_count, row_id)
+    buffer.flush()
+
+    with engine.connect() as conn:
+        counts = dict(conn.execute(select(documents.c.id, documents.c.download_count)).all())
+    assert counts == {1: 2, 2: 6}
+    stats = buffer.stats()
+    assert stats['errors'] == 0
+    assert stats['pending_rows'] == 0
+    assert stats['rows_updated'] == 2
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+from shared.pagination import keyset_page
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = 'items'
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, nullable=True)
+
+
+def _session(tmp_path):
+    engine = create_engine(f'sqlite:///{tmp_path / "pages.db"}')
+    Base.metadata.create_all(engine)
+    db = Session(engine)
+    db.add_all([
+        Item(id=1, created_at=datetime(2024, 1, 1)),
+        Item(id=2, created_at=None),
+        Item(id=3, created_at=datetime(2024, 1, 2)),
+        Item(id=4, created_at=None),
+        Item(id=5, created_at=datetime(2024, 1, 2)),
+    ])
+    db.commit()
+    return db
+
+
+def test_pages_through_null_created_at(tmp_path):
+    db = _session(tmp_path)
+    seen, cursor = [], None
+    while True:
+        page = keyset_page(db.query(Item), Item.created_at, Item.id, cursor, 2)
+        seen += [item.id for item in page.items]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    # created_at NULL primeiro (como no DESC do PostgreSQL), depois do mais recente para o mais antigo
+    assert seen == [4, 2, 5, 3, 1]
+
+
+def test_without_limit_or_cursor_returns_everything(tmp_path):
+    db = _session(tmp_path)
+    page = keyset_page(db.query(Item), Item.created_at, Item.id, None, None)
+    assert [item.id for item in page.items] == [4, 2, 5, 3, 1]
+    assert page.next_cursor is None
@@ -4,6 +4,8 @@ import os
 class Settings:
     def __init__(self) -> None:
         self.database_url: str = os.getenv('DATABASE_URL', '')
+        # 'psycopg2' (rotas def + pool síncrono) ou 'asyncpg' (rotas async def + pool asyncpg)
+        self.db_driver: str = os.getenv('DB_DRIVER', 'psycopg2')
 
 
 settings = Settings()
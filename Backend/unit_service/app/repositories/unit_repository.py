@@ -1,24 +1,34 @@
-from typing import List, Tuple, Optional
+from typing import Optional
+from shared.pagination import Page, after_position, decode_cursor, fetch_limit, list_size, page_from_rows
 from ..core.db import get_conn
 
 
-def list_units_rows() -> List[Tuple]:
-    conn = get_conn(); cur = conn.cursor()
-    cur.execute('SELECT id,block,number,owner_id FROM units ORDER BY id')
-    rows = cur.fetchall(); cur.close(); conn.close()
-    return rows
+def list_units_rows(cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    size = list_size(limit, cursor)
+    position = decode_cursor(cursor)
+    after, params = '', []
+    if position:
+        condition, params = after_position(position)
+        after = f'WHERE {condition} '
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute(f'SELECT id,block,number,owner_id,created_at FROM units {after}ORDER BY created_at DESC, id DESC LIMIT %s',
+                    (*params, fetch_limit(size)))
+        rows = cur.fetchall(); cur.close()
+    return page_from_rows(rows, size, lambda r: (r[4], r[0]))
 
 
 def insert_unit(block: str, number: str, owner_id: Optional[int]) -> int:
-    conn = get_conn(); cur = conn.cursor()
-    try:
-        cur.execute('INSERT INTO units (block,number,owner_id) VALUES (%s,%s,%s) RETURNING id', (block, number, owner_id))
-        uid = cur.fetchone()[0]; conn.commit()
-        return uid
-    except Exception as e:
-        conn.rollback(); raise e
-    finally:
-        cur.close(); conn.close()
+    with get_conn() as conn:
+        cur = conn.cursor()
+        try:
+            cur.execute('INSERT INTO units (block,number,owner_id) VALUES (%s,%s,%s) RETURNING id', (block, number, owner_id))
+            uid = cur.fetchone()[0]; conn.commit()
+            return uid
+        except Exception as e:
+            conn.rollback(); raise e
+        finally:
+            cur.close()
 
 
 
@@ -0,0 +1,30 @@
+from typing import Optional
+from shared.pagination import Page, decode_cursor, fetch_limit, list_size, page_from_rows
+from ..core.db import async_pool
+
+# Consultas fixas em constantes: cada uma é preparada uma vez por conexão pelo asyncpg
+LIST_UNITS = 'SELECT id,block,number,owner_id,created_at FROM units ORDER BY created_at DESC, id DESC LIMIT $1'
+LIST_UNITS_AFTER = '''SELECT id,block,number,owner_id,created_at FROM units WHERE (created_at, id) < ($2, $3)
+                      ORDER BY created_at DESC, id DESC LIMIT $1'''
+# Cursor numa linha com created_at NULL (vêm primeiro no DESC): as outras NULL de id menor e depois as datadas
+LIST_UNITS_AFTER_NULL = '''SELECT id,block,number,owner_id,created_at FROM units WHERE (created_at IS NOT NULL OR id < $2)
+                           ORDER BY created_at DESC, id DESC LIMIT $1'''
+INSERT_UNIT = 'INSERT INTO units (block,number,owner_id) VALUES ($1,$2,$3) RETURNING id'
+
+
+async def list_units_rows(cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    size = list_size(limit, cursor)
+    position = decode_cursor(cursor)
+    async with async_pool.connection() as conn:
+        if position is None:
+            rows = await conn.fetch(LIST_UNITS, fetch_limit(size))
+        elif position[0] is None:
+            rows = await conn.fetch(LIST_UNITS_AFTER_NULL, fetch_limit(size), position[1])
+        else:
+            rows = await conn.fetch(LIST_UNITS_AFTER, fetch_limit(size), *position)
+    return page_from_rows(rows, size, lambda r: (r[4], r[0]))
+
+
+async def insert_unit(block: str, number: str, owner_id: Optional[int]) -> int:
+    async with async_pool.connection() as conn:
+        return await conn.fetchval(INSERT_UNIT, block, number, owner_id)
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
 from shared import auth_client
+from shared.pagination import set_next_cursor
 from ..schemas.units import UnitIn, UnitOut
 from ..services.unit_service import list_units, create_unit
 
@@ -9,8 +10,8 @@ router = APIRouter(prefix='/units', tags=['units'])
 
 
 @router.get('', response_model=List[UnitOut], dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
-def list_units_ep():
-    return list_units()
+def list_units_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1)):
+    return set_next_cursor(response, list_units(cursor, limit))
 
 
 @router.post('', response_model=UnitOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
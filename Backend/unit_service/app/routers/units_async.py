@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
+from shared import auth_client
+from shared.pagination import set_next_cursor
+from ..schemas.units import UnitIn, UnitOut
+from ..services.unit_service_async import list_units, create_unit
+
+
+# Mesmas rotas de app/routers/units.py, em async def sobre o pool asyncpg (DB_DRIVER=asyncpg)
+router = APIRouter(prefix='/units', tags=['units'])
+
+
+@router.get('', response_model=List[UnitOut], dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def list_units_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1)):
+    return set_next_cursor(response, await list_units(cursor, limit))
+
+
+@router.post('', response_model=UnitOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def create_unit_ep(u: UnitIn):
+    return await create_unit(u.block, u.number, u.owner_id)
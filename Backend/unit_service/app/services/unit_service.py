@@ -1,10 +1,15 @@
 from fastapi import HTTPException
+from shared.pagination import Page
 from ..repositories.unit_repository import list_units_rows, insert_unit
 
 
-def list_units():
-    rows = list_units_rows()
-    return [{'id':r[0],'block':r[1],'number':r[2],'owner_id':r[3]} for r in rows]
+def row_to_unit(r):
+    return {'id':r[0],'block':r[1],'number':r[2],'owner_id':r[3]}
+
+
+def list_units(cursor: str | None = None, limit: int | None = None) -> Page:
+    page = list_units_rows(cursor, limit)
+    return Page([row_to_unit(r) for r in page.items], page.next_cursor)
 
 
 def create_unit(block: str, number: str, owner_id: int | None):
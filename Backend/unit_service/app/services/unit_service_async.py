@@ -0,0 +1,17 @@
+from fastapi import HTTPException
+from shared.pagination import Page
+from ..repositories.unit_repository_async import list_units_rows, insert_unit
+from .unit_service import row_to_unit
+
+
+async def list_units(cursor: str | None = None, limit: int | None = None) -> Page:
+    page = await list_units_rows(cursor, limit)
+    return Page([row_to_unit(r) for r in page.items], page.next_cursor)
+
+
+async def create_unit(block: str, number: str, owner_id: int | None):
+    try:
+        uid = await insert_unit(block, number, owner_id)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {'id': uid, 'block': block, 'number': number, 'owner_id': owner_id}
@@ -1,11 +1,33 @@
-
 from fastapi import FastAPI
-from app.routers.units import router as units_router
+from app.core.config import settings
+from app.core.db import pool, async_pool
+from shared.db_pool import PoolScopeMiddleware
 
 app = FastAPI(title='Unit Service')
 
+if settings.db_driver == 'asyncpg':
+    from app.routers.units_async import router as units_router
+else:
+    from app.routers.units import router as units_router
+
+    app.add_middleware(PoolScopeMiddleware, pool=pool)
+
 app.include_router(units_router)
 
 @app.get('/health')
 def health():
     return {'status': 'ok'}
+
+@app.get('/metrics/db-pool')
+def db_pool_metrics():
+    return (async_pool if settings.db_driver == 'asyncpg' else pool).stats()
+
+@app.on_event('startup')
+async def open_async_pool():
+    if settings.db_driver == 'asyncpg':
+        await async_pool.open()
+
+@app.on_event('shutdown')
+async def close_db_pools():
+    await async_pool.close()
+    pool.close()
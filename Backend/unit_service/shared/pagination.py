@@ -0,0 +1,105 @@
+# Paginação por keyset em (created_at, id) compartilhada pelos serviços
+import base64
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+PAGE_SIZE_DEFAULT = int(os.getenv('PAGE_SIZE_DEFAULT', '50'))
+PAGE_SIZE_MAX = int(os.getenv('PAGE_SIZE_MAX', '200'))
+
+# Header com o cursor da próxima página (ausente na última página)
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+def page_size(limit: Optional[int]) -> int:
+    if not limit or limit < 1:
+        return min(PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX)
+    return min(limit, PAGE_SIZE_MAX)
+
+
+def list_size(limit: Optional[int], cursor: Optional[str]) -> Optional[int]:
+    """
+    Tamanho da página de uma listagem. Sem ``limit`` nem ``cursor`` a listagem vem inteira (None),
+    como antes da paginação: quem não segue o ``X-Next-Cursor`` continua recebendo todas as linhas.
+    """
+    if not limit and not cursor:
+        return None
+    return page_size(limit)
+
+
+def fetch_limit(size: Optional[int]) -> Optional[int]:
+    """LIMIT da consulta: uma linha a mais indica que há próxima página; None = sem limite (``LIMIT NULL``)."""
+    return None if size is None else size + 1
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    position = [created_at.isoformat() if created_at is not None else None, row_id]
+    raw = json.dumps(position, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[Optional[datetime], int]]:
+    """Devolve a posição (created_at, id) codificada no cursor; cursor malformado vira 400."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at) if created_at is not None else None, int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail='Cursor de paginação inválido')
+
+
+def after_position(position: Tuple[Optional[datetime], int]) -> Tuple[str, list]:
+    """
+    Condição SQL (psycopg2) e parâmetros das linhas depois de ``position`` na ordem
+    ``created_at DESC, id DESC``. No PostgreSQL, ``created_at`` NULL vem primeiro nessa ordem (é a
+    do índice (created_at, id) lido de trás para frente): depois de uma posição NULL vêm as outras
+    NULL de id menor e então todas as datadas; depois de uma posição datada, as NULL já passaram.
+    """
+    created_at, row_id = position
+    if created_at is None:
+        return '(created_at IS NOT NULL OR id < %s)', [row_id]
+    return '(created_at, id) < (%s, %s)', [created_at, row_id]
+
+
+def page_from_rows(rows: Sequence, size: Optional[int], key: Callable[[Any], Tuple[Optional[datetime], int]]) -> Page:
+    """``rows`` deve ter sido buscado com ``LIMIT fetch_limit(size)``: a linha extra indica que há próxima página."""
+    if size is not None and len(rows) > size:
+        rows = list(rows[:size])
+        return Page(rows, encode_cursor(*key(rows[-1])))
+    return Page(list(rows), None)
+
+
+def keyset_page(query, created_column, id_column, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    """
+    Aplica a paginação por keyset a uma ``Query`` do SQLAlchemy, do mais recente para o mais antigo.
+    ``created_at`` NULL vem primeiro em qualquer banco, como no PostgreSQL (ver ``after_position``).
+    """
+    from sqlalchemy import or_, tuple_
+
+    size = list_size(limit, cursor)
+    position = decode_cursor(cursor)
+    if position is not None:
+        created_at, row_id = position
+        if created_at is None:
+            query = query.filter(or_(created_column.isnot(None), id_column < row_id))
+        else:
+            query = query.filter(tuple_(created_column, id_column) < tuple_(created_at, row_id))
+    rows = query.order_by(created_column.desc().nulls_first(), id_column.desc()).limit(fetch_limit(size)).all()
+    return page_from_rows(rows, size, lambda r: (getattr(r, created_column.key), getattr(r, id_column.key)))
+
+
+def set_next_cursor(response, page: Page) -> List[Any]:
+    """Publica o cursor da próxima página no header e devolve os itens para o corpo da resposta."""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
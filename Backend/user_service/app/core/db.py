@@ -1,12 +1,10 @@
-import psycopg2
+from shared.async_db import AsyncPool
+from shared.db_pool import ConnectionPool
 from .config import settings
 
-
-def get_conn():
-    return psycopg2.connect(settings.database_url)
-
-
-
-
+pool = ConnectionPool(settings.database_url)
+async_pool = AsyncPool(settings.database_url)
 
 
+def get_conn():
+    return pool.connection()
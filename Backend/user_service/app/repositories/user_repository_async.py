@@ -0,0 +1,57 @@
+from typing import List, Optional
+from shared.pagination import Page, decode_cursor, fetch_limit, list_size, page_from_rows
+from ..core.db import async_pool
+
+# Consultas fixas em constantes: cada uma é preparada uma vez por conexão pelo asyncpg.
+# permissions é jsonb; o codec registrado pelo AsyncPool converte listas Python automaticamente.
+LIST_USERS = '''SELECT id, tenant_id, email, full_name, role, permissions, is_active, created_at FROM users
+                WHERE tenant_id=$1 ORDER BY created_at DESC, id DESC LIMIT $2'''
+LIST_USERS_AFTER = '''SELECT id, tenant_id, email, full_name, role, permissions, is_active, created_at FROM users
+                      WHERE tenant_id=$1 AND (created_at, id) < ($3, $4) ORDER BY created_at DESC, id DESC LIMIT $2'''
+# Cursor numa linha com created_at NULL (vêm primeiro no DESC): as outras NULL de id menor e depois as datadas
+LIST_USERS_AFTER_NULL = '''SELECT id, tenant_id, email, full_name, role, permissions, is_active, created_at FROM users
+                           WHERE tenant_id=$1 AND (created_at IS NOT NULL OR id < $3) ORDER BY created_at DESC, id DESC LIMIT $2'''
+INSERT_USER = 'INSERT INTO users (tenant_id, email, password, full_name, role, permissions) VALUES ($1, $2, $3, $4, $5, $6) RETURNING id'
+GET_USER = 'SELECT id, tenant_id, email, full_name, role, permissions, is_active FROM users WHERE id=$1 AND tenant_id=$2'
+# Campos nulos mantêm o valor atual, como no UPDATE dinâmico do repositório síncrono
+UPDATE_USER = '''UPDATE users SET full_name = COALESCE($1, full_name), role = COALESCE($2, role),
+                 permissions = COALESCE($3, permissions), is_active = COALESCE($4, is_active)
+                 WHERE id = $5 AND tenant_id = $6'''
+DEACTIVATE_USER = 'UPDATE users SET is_active = false WHERE id = $1 AND tenant_id = $2'
+
+
+async def list_users_rows(tenant_id: int, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    size = list_size(limit, cursor)
+    position = decode_cursor(cursor)
+    async with async_pool.connection() as conn:
+        if position is None:
+            rows = await conn.fetch(LIST_USERS, tenant_id, fetch_limit(size))
+        elif position[0] is None:
+            rows = await conn.fetch(LIST_USERS_AFTER_NULL, tenant_id, fetch_limit(size), position[1])
+        else:
+            rows = await conn.fetch(LIST_USERS_AFTER, tenant_id, fetch_limit(size), *position)
+    return page_from_rows(rows, size, lambda r: (r[7], r[0]))
+
+
+async def insert_user(tenant_id: int, email: str, password: str, full_name: Optional[str], role: str, permissions: Optional[List[str]] = None) -> int:
+    async with async_pool.connection() as conn:
+        return await conn.fetchval(INSERT_USER, tenant_id, email, password, full_name, role, permissions or [])
+
+
+async def get_user_row(user_id: int, tenant_id: int) -> Optional[tuple]:
+    async with async_pool.connection() as conn:
+        return await conn.fetchrow(GET_USER, user_id, tenant_id)
+
+
+async def update_user(user_id: int, tenant_id: int, full_name: Optional[str] = None, role: Optional[str] = None, permissions: Optional[List[str]] = None, is_active: Optional[bool] = None) -> bool:
+    if full_name is None and role is None and permissions is None and is_active is None:
+        return False
+    async with async_pool.connection() as conn:
+        status = await conn.execute(UPDATE_USER, full_name, role, permissions, is_active, user_id, tenant_id)
+        return status != 'UPDATE 0'
+
+
+async def delete_user(user_id: int, tenant_id: int) -> bool:
+    async with async_pool.connection() as conn:
+        status = await conn.execute(DEACTIVATE_USER, user_id, tenant_id)
+        return status != 'UPDATE 0'
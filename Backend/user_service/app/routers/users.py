@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
 from shared import auth_client
+from shared.pagination import set_next_cursor
 from ..schemas.users import UserIn, UserOut
 from ..services.user_service import list_users, create_user, get_user
 
@@ -8,14 +9,14 @@ from ..services.user_service import list_users, create_user, get_user
 router = APIRouter(prefix='/users', tags=['users'])
 
 
-@router.get('', response_model=List[UserOut], dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
-def list_users_ep():
-    return list_users()
+@router.get('', response_model=List[UserOut])
+def list_users_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1), auth=Depends(auth_client.require_role(['admin','sindico']))):
+    return set_next_cursor(response, list_users(auth, cursor, limit))
 
 
 @router.post('', response_model=UserOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
 def create_user_ep(u: UserIn):
-    return create_user(u.email, u.password, u.full_name, u.role)
+    return create_user(u.tenant_id, u.email, u.password, u.full_name, u.role, u.permissions)
 
 
 @router.get('/{user_id}', response_model=UserOut)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
+from shared import auth_client
+from shared.pagination import set_next_cursor
+from ..schemas.users import UserIn, UserOut
+from ..services.user_service_async import list_users, create_user, get_user
+
+
+# Mesmas rotas de app/routers/users.py, em async def sobre o pool asyncpg (DB_DRIVER=asyncpg)
+router = APIRouter(prefix='/users', tags=['users'])
+
+
+@router.get('', response_model=List[UserOut])
+async def list_users_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1), auth=Depends(auth_client.require_role(['admin','sindico']))):
+    return set_next_cursor(response, await list_users(auth, cursor, limit))
+
+
+@router.post('', response_model=UserOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def create_user_ep(u: UserIn):
+    return await create_user(u.tenant_id, u.email, u.password, u.full_name, u.role, u.permissions)
+
+
+@router.get('/{user_id}', response_model=UserOut)
+async def get_user_ep(user_id: int, auth=Depends(auth_client.get_current_user)):
+    return await get_user(user_id, auth)
@@ -1,27 +1,35 @@
 from fastapi import HTTPException
+from typing import List, Optional
+from shared.pagination import Page
 from ..repositories.user_repository import list_users_rows, insert_user, get_user_row
 
 
-def list_users():
-    rows = list_users_rows()
-    return [{'id':r[0],'email':r[1],'full_name':r[2],'role':r[3]} for r in rows]
+def row_to_user(r):
+    return {'id': r[0], 'tenant_id': r[1], 'email': r[2], 'full_name': r[3], 'role': r[4],
+            'permissions': r[5] or [], 'is_active': r[6]}
 
 
-def create_user(email: str, password: str, full_name: str | None, role: str):
+def list_users(caller: dict, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    page = list_users_rows(caller['tenant_id'], cursor, limit)
+    return Page([row_to_user(r) for r in page.items], page.next_cursor)
+
+
+def create_user(tenant_id: int, email: str, password: str, full_name: str | None, role: str, permissions: Optional[List[str]] = None):
     try:
-        uid = insert_user(email, password, full_name, role)
+        uid = insert_user(tenant_id, email, password, full_name, role, permissions)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
-    return {'id': uid, 'email': email, 'full_name': full_name, 'role': role}
+    return {'id': uid, 'tenant_id': tenant_id, 'email': email, 'full_name': full_name, 'role': role,
+            'permissions': permissions or [], 'is_active': True}
 
 
 def get_user(user_id: int, caller: dict):
-    if caller['id'] != user_id and caller['role'] not in ('admin','sindico'):
+    if str(caller['id']) != str(user_id) and caller['role'] not in ('admin','sindico'):
         raise HTTPException(status_code=403, detail='Forbidden')
-    r = get_user_row(user_id)
+    r = get_user_row(user_id, caller['tenant_id'])
     if not r:
         raise HTTPException(status_code=404, detail='User not found')
-    return {'id': r[0], 'email': r[1], 'full_name': r[2], 'role': r[3]}
+    return row_to_user(r)
 
 
 
@@ -0,0 +1,28 @@
+from fastapi import HTTPException
+from typing import List, Optional
+from shared.pagination import Page
+from ..repositories.user_repository_async import list_users_rows, insert_user, get_user_row
+from .user_service import row_to_user
+
+
+async def list_users(caller: dict, cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    page = await list_users_rows(caller['tenant_id'], cursor, limit)
+    return Page([row_to_user(r) for r in page.items], page.next_cursor)
+
+
+async def create_user(tenant_id: int, email: str, password: str, full_name: str | None, role: str, permissions: Optional[List[str]] = None):
+    try:
+        uid = await insert_user(tenant_id, email, password, full_name, role, permissions)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {'id': uid, 'tenant_id': tenant_id, 'email': email, 'full_name': full_name, 'role': role,
+            'permissions': permissions or [], 'is_active': True}
+
+
+async def get_user(user_id: int, caller: dict):
+    if str(caller['id']) != str(user_id) and caller['role'] not in ('admin','sindico'):
+        raise HTTPException(status_code=403, detail='Forbidden')
+    r = await get_user_row(user_id, caller['tenant_id'])
+    if not r:
+        raise HTTPException(status_code=404, detail='User not found')
+    return row_to_user(r)
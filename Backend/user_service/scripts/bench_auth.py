@@ -0,0 +1,68 @@
+"""Micro-benchmark do custo de autenticação por requisição.
+
+Compara a verificação completa do JWT (decode + HMAC + busca linear na lista de permissões)
+com o caminho em cache do auth_client deste serviço e de shared/auth_middleware.py.
+
+Uso (a partir de Backend/):  python -m user_service.scripts.bench_auth [iterações]
+"""
+import datetime
+import sys
+import timeit
+import warnings
+
+import jwt
+from shared.auth_middleware import AuthMiddleware
+from shared.permissions import ROLE_PERMISSIONS
+
+from ..shared import auth_client
+
+SECRET = 'SECRET_KEY'
+
+# a chave de demonstração é curta; o aviso do PyJWT só polui a saída
+warnings.filterwarnings('ignore', module='jwt')
+
+
+def make_token() -> str:
+    payload = {
+        'sub': '42',
+        'tenant_id': 1,
+        'role': 'sindico',
+        'permissions': list(ROLE_PERMISSIONS['sindico']),
+        'exp': datetime.datetime.utcnow() + datetime.timedelta(hours=8),
+    }
+    return jwt.encode(payload, SECRET, algorithm='HS256')
+
+
+def baseline(header: str, permission: str) -> dict:
+    # comportamento anterior: decodifica sempre e procura na lista
+    payload = jwt.decode(header.replace('Bearer ', ''), SECRET, algorithms=['HS256'])
+    user_permissions = payload.get('permissions', [])
+    if 'all' not in user_permissions and permission not in user_permissions:
+        raise RuntimeError('forbidden')
+    return payload
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    header = 'Bearer ' + make_token()
+    permission = 'export_data'  # último item da lista do síndico: pior caso da busca linear
+
+    middleware = AuthMiddleware()
+    middleware.jwt_secret = SECRET
+    checker = middleware.require_permission(permission)
+
+    cases = [
+        ('auth_middleware sem cache', lambda: baseline(header, permission)),
+        ('auth_middleware com cache', lambda: checker(header)),
+        ('auth_client sem cache', lambda: (auth_client._token_cache.clear(), auth_client.get_current_user(header))),
+        ('auth_client com cache', lambda: auth_client.get_current_user(header)),
+    ]
+    print(f'{number} iterações por caso')
+    for name, fn in cases:
+        fn()
+        seconds = min(timeit.repeat(fn, number=number, repeat=3))
+        print(f'{name:<28} {seconds / number * 1e6:8.2f} µs/requisição')
+
+
+if __name__ == '__main__':
+    main()
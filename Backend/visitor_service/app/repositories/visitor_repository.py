@@ -1,86 +1,89 @@
-from typing import List, Tuple, Optional
+from typing import Tuple, Optional
+from shared.pagination import Page, after_position, decode_cursor, fetch_limit, list_size, page_from_rows
 from ..core.db import get_conn
 
 
-def list_visitors() -> List[Tuple]:
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute('''SELECT id, name, document, unit_id, visit_date, expected_duration, 
-                   purpose, contact_phone, status, check_in, check_out 
-                   FROM visitors ORDER BY visit_date DESC''')
-    rows = cur.fetchall()
-    cur.close()
-    conn.close()
-    return rows
+def list_visitors(cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    size = list_size(limit, cursor)
+    position = decode_cursor(cursor)
+    after, params = '', []
+    if position:
+        condition, params = after_position(position)
+        after = f'WHERE {condition} '
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute(f'''SELECT id, name, document, unit_id, visit_date, expected_duration, 
+                       purpose, contact_phone, status, check_in, check_out, created_at 
+                       FROM visitors {after}ORDER BY created_at DESC, id DESC LIMIT %s''',
+                    (*params, fetch_limit(size)))
+        rows = cur.fetchall()
+        cur.close()
+    return page_from_rows(rows, size, lambda r: (r[11], r[0]))
 
 
 def get_visitor(visitor_id: int) -> Optional[Tuple]:
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute('''SELECT id, name, document, unit_id, visit_date, expected_duration, 
-                   purpose, contact_phone, status, check_in, check_out 
-                   FROM visitors WHERE id=%s''', (visitor_id,))
-    row = cur.fetchone()
-    cur.close()
-    conn.close()
-    return row
+    with get_conn() as conn:
+        cur = conn.cursor()
+        cur.execute('''SELECT id, name, document, unit_id, visit_date, expected_duration, 
+                       purpose, contact_phone, status, check_in, check_out 
+                       FROM visitors WHERE id=%s''', (visitor_id,))
+        row = cur.fetchone()
+        cur.close()
+        return row
 
 
 def create_visitor(name: str, document: str, unit_id: int, visit_date, 
                    expected_duration: int, purpose: str, contact_phone: str = None) -> int:
-    conn = get_conn()
-    cur = conn.cursor()
-    try:
-        cur.execute('''INSERT INTO visitors (name, document, unit_id, visit_date, 
-                     expected_duration, purpose, contact_phone, status) 
-                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s) RETURNING id''',
-                    (name, document, unit_id, visit_date, expected_duration, 
-                     purpose, contact_phone, 'scheduled'))
-        visitor_id = cur.fetchone()[0]
-        conn.commit()
-        return visitor_id
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        cur.close()
-        conn.close()
+    with get_conn() as conn:
+        cur = conn.cursor()
+        try:
+            cur.execute('''INSERT INTO visitors (name, document, unit_id, visit_date, 
+                         expected_duration, purpose, contact_phone, status) 
+                         VALUES (%s, %s, %s, %s, %s, %s, %s, %s) RETURNING id''',
+                        (name, document, unit_id, visit_date, expected_duration, 
+                         purpose, contact_phone, 'scheduled'))
+            visitor_id = cur.fetchone()[0]
+            conn.commit()
+            return visitor_id
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            cur.close()
 
 
 def update_visitor_status(visitor_id: int, status: str, check_in=None, check_out=None) -> None:
-    conn = get_conn()
-    cur = conn.cursor()
-    try:
-        if check_in:
-            cur.execute('UPDATE visitors SET status=%s, check_in=%s WHERE id=%s',
-                       (status, check_in, visitor_id))
-        elif check_out:
-            cur.execute('UPDATE visitors SET status=%s, check_out=%s WHERE id=%s',
-                       (status, check_out, visitor_id))
-        else:
-            cur.execute('UPDATE visitors SET status=%s WHERE id=%s',
-                       (status, visitor_id))
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        cur.close()
-        conn.close()
+    with get_conn() as conn:
+        cur = conn.cursor()
+        try:
+            if check_in:
+                cur.execute('UPDATE visitors SET status=%s, check_in=%s WHERE id=%s',
+                           (status, check_in, visitor_id))
+            elif check_out:
+                cur.execute('UPDATE visitors SET status=%s, check_out=%s WHERE id=%s',
+                           (status, check_out, visitor_id))
+            else:
+                cur.execute('UPDATE visitors SET status=%s WHERE id=%s',
+                           (status, visitor_id))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            cur.close()
 
 
 def delete_visitor(visitor_id: int) -> None:
-    conn = get_conn()
-    cur = conn.cursor()
-    try:
-        cur.execute('DELETE FROM visitors WHERE id=%s', (visitor_id,))
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        cur.close()
-        conn.close()
+    with get_conn() as conn:
+        cur = conn.cursor()
+        try:
+            cur.execute('DELETE FROM visitors WHERE id=%s', (visitor_id,))
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            cur.close()
 
 
 
@@ -0,0 +1,68 @@
+from typing import Optional
+from shared.async_db import to_db_timestamp
+from shared.pagination import Page, decode_cursor, fetch_limit, list_size, page_from_rows
+from ..core.db import async_pool
+
+# Consultas fixas em constantes: cada uma é preparada uma vez por conexão pelo asyncpg
+LIST_VISITORS = '''SELECT id, name, document, unit_id, visit_date, expected_duration,
+                   purpose, contact_phone, status, check_in, check_out, created_at
+                   FROM visitors ORDER BY created_at DESC, id DESC LIMIT $1'''
+LIST_VISITORS_AFTER = '''SELECT id, name, document, unit_id, visit_date, expected_duration,
+                         purpose, contact_phone, status, check_in, check_out, created_at
+                         FROM visitors WHERE (created_at, id) < ($2, $3)
+                         ORDER BY created_at DESC, id DESC LIMIT $1'''
+# Cursor numa linha com created_at NULL (vêm primeiro no DESC): as outras NULL de id menor e depois as datadas
+LIST_VISITORS_AFTER_NULL = '''SELECT id, name, document, unit_id, visit_date, expected_duration,
+                              purpose, contact_phone, status, check_in, check_out, created_at
+                              FROM visitors WHERE (created_at IS NOT NULL OR id < $2)
+                              ORDER BY created_at DESC, id DESC LIMIT $1'''
+GET_VISITOR = '''SELECT id, name, document, unit_id, visit_date, expected_duration,
+                 purpose, contact_phone, status, check_in, check_out
+                 FROM visitors WHERE id=$1'''
+INSERT_VISITOR = '''INSERT INTO visitors (name, document, unit_id, visit_date,
+                    expected_duration, purpose, contact_phone, status)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, 'scheduled') RETURNING id'''
+UPDATE_STATUS_CHECK_IN = 'UPDATE visitors SET status=$1, check_in=$2 WHERE id=$3'
+UPDATE_STATUS_CHECK_OUT = 'UPDATE visitors SET status=$1, check_out=$2 WHERE id=$3'
+UPDATE_STATUS = 'UPDATE visitors SET status=$1 WHERE id=$2'
+DELETE_VISITOR = 'DELETE FROM visitors WHERE id=$1'
+
+
+async def list_visitors(cursor: Optional[str] = None, limit: Optional[int] = None) -> Page:
+    size = list_size(limit, cursor)
+    position = decode_cursor(cursor)
+    async with async_pool.connection() as conn:
+        if position is None:
+            rows = await conn.fetch(LIST_VISITORS, fetch_limit(size))
+        elif position[0] is None:
+            rows = await conn.fetch(LIST_VISITORS_AFTER_NULL, fetch_limit(size), position[1])
+        else:
+            rows = await conn.fetch(LIST_VISITORS_AFTER, fetch_limit(size), *position)
+    return page_from_rows(rows, size, lambda r: (r[11], r[0]))
+
+
+async def get_visitor(visitor_id: int) -> Optional[tuple]:
+    async with async_pool.connection() as conn:
+        return await conn.fetchrow(GET_VISITOR, visitor_id)
+
+
+async def create_visitor(name: str, document: str, unit_id: int, visit_date,
+                         expected_duration: int, purpose: str, contact_phone: str = None) -> int:
+    async with async_pool.connection() as conn:
+        return await conn.fetchval(INSERT_VISITOR, name, document, unit_id, to_db_timestamp(visit_date),
+                                   expected_duration, purpose, contact_phone)
+
+
+async def update_visitor_status(visitor_id: int, status: str, check_in=None, check_out=None) -> None:
+    async with async_pool.connection() as conn:
+        if check_in:
+            await conn.execute(UPDATE_STATUS_CHECK_IN, status, to_db_timestamp(check_in), visitor_id)
+        elif check_out:
+            await conn.execute(UPDATE_STATUS_CHECK_OUT, status, to_db_timestamp(check_out), visitor_id)
+        else:
+            await conn.execute(UPDATE_STATUS, status, visitor_id)
+
+
+async def delete_visitor(visitor_id: int) -> None:
+    async with async_pool.connection() as conn:
+        await conn.execute(DELETE_VISITOR, visitor_id)
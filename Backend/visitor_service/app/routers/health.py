@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
 from shared import auth_client
+from shared.pagination import set_next_cursor
 from ..schemas.visitors import VisitorIn, VisitorOut, VisitorUpdate
 from ..services.visitor_service import list_visitors, get_visitor, create_visitor, check_in_visitor, check_out_visitor, delete_visitor
 
@@ -19,8 +20,8 @@ def info():
 
 
 @router.get('/visitors', response_model=List[VisitorOut], dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
-def list_visitors_ep():
-    return list_visitors()
+def list_visitors_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1)):
+    return set_next_cursor(response, list_visitors(cursor, limit))
 
 
 @router.get('/visitors/{visitor_id}', response_model=VisitorOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
+from shared import auth_client
+from shared.pagination import set_next_cursor
+from ..schemas.visitors import VisitorIn, VisitorOut
+from ..services import visitor_service_async as svc
+
+# Mesmas rotas de app/routers/health.py, em async def sobre o pool asyncpg (DB_DRIVER=asyncpg)
+router = APIRouter(prefix='', tags=['visitors'])
+
+
+@router.get('/health')
+async def health():
+    return {'status': 'ok'}
+
+
+@router.get('/info')
+async def info():
+    return {'service': 'Visitor Service'}
+
+
+@router.get('/visitors', response_model=List[VisitorOut], dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def list_visitors_ep(response: Response, cursor: Optional[str] = None, limit: Optional[int] = Query(None, ge=1)):
+    return set_next_cursor(response, await svc.list_visitors(cursor, limit))
+
+
+@router.get('/visitors/{visitor_id}', response_model=VisitorOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def get_visitor_ep(visitor_id: int):
+    return await svc.get_visitor(visitor_id)
+
+
+@router.post('/visitors', response_model=VisitorOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def create_visitor_ep(visitor: VisitorIn):
+    return await svc.create_visitor(visitor.name, visitor.document, visitor.unit_id,
+                                    visitor.visit_date, visitor.expected_duration,
+                                    visitor.purpose, visitor.contact_phone)
+
+
+@router.post('/visitors/{visitor_id}/check-in', response_model=VisitorOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def check_in_visitor_ep(visitor_id: int):
+    return await svc.check_in_visitor(visitor_id)
+
+
+@router.post('/visitors/{visitor_id}/check-out', response_model=VisitorOut, dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def check_out_visitor_ep(visitor_id: int):
+    return await svc.check_out_visitor(visitor_id)
+
+
+@router.delete('/visitors/{visitor_id}', dependencies=[Depends(auth_client.require_role(['admin','sindico']))])
+async def delete_visitor_ep(visitor_id: int):
+    return await svc.delete_visitor(visitor_id)
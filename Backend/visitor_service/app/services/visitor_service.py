@@ -1,26 +1,27 @@
 from fastapi import HTTPException
 from datetime import datetime
+from shared.pagination import Page
 from ..repositories import visitor_repository as repo
 
 
-def list_visitors():
-    rows = repo.list_visitors()
-    return [{
+def row_to_visitor(r):
+    return {
         'id': r[0], 'name': r[1], 'document': r[2], 'unit_id': r[3],
         'visit_date': r[4], 'expected_duration': r[5], 'purpose': r[6],
         'contact_phone': r[7], 'status': r[8], 'check_in': r[9], 'check_out': r[10]
-    } for r in rows]
+    }
+
+
+def list_visitors(cursor: str = None, limit: int = None) -> Page:
+    page = repo.list_visitors(cursor, limit)
+    return Page([row_to_visitor(r) for r in page.items], page.next_cursor)
 
 
 def get_visitor(visitor_id: int):
     row = repo.get_visitor(visitor_id)
     if not row:
         raise HTTPException(status_code=404, detail='Visitor not found')
-    return {
-        'id': row[0], 'name': row[1], 'document': row[2], 'unit_id': row[3],
-        'visit_date': row[4], 'expected_duration': row[5], 'purpose': row[6],
-        'contact_phone': row[7], 'status': row[8], 'check_in': row[9], 'check_out': row[10]
-    }
+    return row_to_visitor(row)
 
 
 def create_visitor(name: str, document: str, unit_id: int, visit_date, 
@@ -0,0 +1,54 @@
+from fastapi import HTTPException
+from datetime import datetime
+from shared.pagination import Page
+from ..repositories import visitor_repository_async as repo
+from .visitor_service import row_to_visitor
+
+
+async def list_visitors(cursor: str = None, limit: int = None) -> Page:
+    page = await repo.list_visitors(cursor, limit)
+    return Page([row_to_visitor(r) for r in page.items], page.next_cursor)
+
+
+async def get_visitor(visitor_id: int):
+    row = await repo.get_visitor(visitor_id)
+    if not row:
+        raise HTTPException(status_code=404, detail='Visitor not found')
+    return row_to_visitor(row)
+
+
+async def create_visitor(name: str, document: str, unit_id: int, visit_date,
+                         expected_duration: int, purpose: str, contact_phone: str = None):
+    try:
+        visitor_id = await repo.create_visitor(name, document, unit_id, visit_date,
+                                               expected_duration, purpose, contact_phone)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await get_visitor(visitor_id)
+
+
+async def check_in_visitor(visitor_id: int):
+    visitor = await get_visitor(visitor_id)
+    if visitor['status'] != 'scheduled':
+        raise HTTPException(status_code=400, detail='Visitor is not scheduled')
+
+    await repo.update_visitor_status(visitor_id, 'checked_in', check_in=datetime.now())
+    return await get_visitor(visitor_id)
+
+
+async def check_out_visitor(visitor_id: int):
+    visitor = await get_visitor(visitor_id)
+    if visitor['status'] != 'checked_in':
+        raise HTTPException(status_code=400, detail='Visitor is not checked in')
+
+    await repo.update_visitor_status(visitor_id, 'checked_out', check_out=datetime.now())
+    return await get_visitor(visitor_id)
+
+
+async def delete_visitor(visitor_id: int):
+    visitor = await get_visitor(visitor_id)
+    if visitor['status'] in ['checked_in']:
+        raise HTTPException(status_code=400, detail='Cannot delete checked-in visitor')
+
+    await repo.delete_visitor(visitor_id)
+    return {'message': 'Visitor deleted successfully'}
@@ -63,6 +63,20 @@ CREATE TABLE IF NOT EXISTS reservations (
   created_at TIMESTAMP DEFAULT now()
 );
 
+-- Reservas ativas da mesma área não podem se sobrepor dentro do mesmo condomínio
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'reservations_no_overlap') THEN
+    UPDATE reservations r SET tenant_id = u.tenant_id
+      FROM units u WHERE r.unit_id = u.id AND r.tenant_id IS NULL;
+    ALTER TABLE reservations ADD CONSTRAINT reservations_no_overlap
+      EXCLUDE USING gist (tenant_id WITH =, area WITH =, tsrange(start_time, end_time) WITH &&)
+      WHERE (status <> 'cancelled');
+  END IF;
+END $$;
+
 CREATE TABLE IF NOT EXISTS maintenance_orders (
   id SERIAL PRIMARY KEY,
   tenant_id INTEGER REFERENCES tenants(id),
@@ -79,6 +93,159 @@ CREATE TABLE IF NOT EXISTS maintenance_orders (
   created_at TIMESTAMP DEFAULT now()
 );
 
+-- Paginação por keyset das listagens (ORDER BY created_at DESC, id DESC)
+CREATE INDEX IF NOT EXISTS idx_tenants_created_id ON tenants (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_users_tenant_created_id ON users (tenant_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_units_created_id ON units (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_visitors_created_id ON visitors (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_reservations_created_id ON reservations (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_reservations_tenant_created_id ON reservations (tenant_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_reservations_unit_created_id ON reservations (unit_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_maintenance_orders_created_id ON maintenance_orders (created_at, id);
+
+-- Rollups diários por condomínio usados pelo reporting_service
+-- Cada tabela guarda contadores no menor grão que os relatórios precisam; triggers aplicam
+-- +1/-1 a cada INSERT/UPDATE/DELETE nas tabelas de origem, então um relatório soma dias já
+-- agregados em vez de varrer as linhas brutas.
+CREATE TABLE IF NOT EXISTS visitor_daily_counts (
+  tenant_id INTEGER,
+  day DATE NOT NULL,
+  status TEXT,
+  unit_id INTEGER,
+  count INTEGER NOT NULL DEFAULT 0,
+  UNIQUE NULLS NOT DISTINCT (tenant_id, day, status, unit_id)
+);
+
+CREATE TABLE IF NOT EXISTS maintenance_daily_counts (
+  tenant_id INTEGER,
+  day DATE NOT NULL,
+  status TEXT,
+  category TEXT,
+  priority TEXT,
+  count INTEGER NOT NULL DEFAULT 0,
+  UNIQUE NULLS NOT DISTINCT (tenant_id, day, status, category, priority)
+);
+
+CREATE TABLE IF NOT EXISTS reservation_daily_counts (
+  tenant_id INTEGER,
+  day DATE NOT NULL,
+  status TEXT,
+  area TEXT,
+  count INTEGER NOT NULL DEFAULT 0,
+  UNIQUE NULLS NOT DISTINCT (tenant_id, day, status, area)
+);
+
+CREATE INDEX IF NOT EXISTS idx_visitor_daily_counts_day ON visitor_daily_counts (day);
+CREATE INDEX IF NOT EXISTS idx_maintenance_daily_counts_day ON maintenance_daily_counts (day);
+CREATE INDEX IF NOT EXISTS idx_reservation_daily_counts_day ON reservation_daily_counts (day);
+
+-- Os dias parciais nas pontas do período ainda são lidos das tabelas brutas
+-- (maintenance_orders usa idx_maintenance_orders_created_id, acima)
+CREATE INDEX IF NOT EXISTS idx_visitors_visit_date ON visitors (visit_date);
+CREATE INDEX IF NOT EXISTS idx_reservations_start_time ON reservations (start_time);
+
+CREATE OR REPLACE FUNCTION visitor_daily_counts_apply() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.visit_date IS NOT NULL THEN
+    INSERT INTO visitor_daily_counts (tenant_id, day, status, unit_id, count)
+    VALUES (OLD.tenant_id, OLD.visit_date::date, OLD.status, OLD.unit_id, -1)
+    ON CONFLICT (tenant_id, day, status, unit_id) DO UPDATE SET count = visitor_daily_counts.count - 1;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.visit_date IS NOT NULL THEN
+    INSERT INTO visitor_daily_counts (tenant_id, day, status, unit_id, count)
+    VALUES (NEW.tenant_id, NEW.visit_date::date, NEW.status, NEW.unit_id, 1)
+    ON CONFLICT (tenant_id, day, status, unit_id) DO UPDATE SET count = visitor_daily_counts.count + 1;
+  END IF;
+  RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION maintenance_daily_counts_apply() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.created_at IS NOT NULL THEN
+    INSERT INTO maintenance_daily_counts (tenant_id, day, status, category, priority, count)
+    VALUES (OLD.tenant_id, OLD.created_at::date, OLD.status, OLD.category, OLD.priority, -1)
+    ON CONFLICT (tenant_id, day, status, category, priority) DO UPDATE SET count = maintenance_daily_counts.count - 1;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.created_at IS NOT NULL THEN
+    INSERT INTO maintenance_daily_counts (tenant_id, day, status, category, priority, count)
+    VALUES (NEW.tenant_id, NEW.created_at::date, NEW.status, NEW.category, NEW.priority, 1)
+    ON CONFLICT (tenant_id, day, status, category, priority) DO UPDATE SET count = maintenance_daily_counts.count + 1;
+  END IF;
+  RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION reservation_daily_counts_apply() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.start_time IS NOT NULL THEN
+    INSERT INTO reservation_daily_counts (tenant_id, day, status, area, count)
+    VALUES (OLD.tenant_id, OLD.start_time::date, OLD.status, OLD.area, -1)
+    ON CONFLICT (tenant_id, day, status, area) DO UPDATE SET count = reservation_daily_counts.count - 1;
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.start_time IS NOT NULL THEN
+    INSERT INTO reservation_daily_counts (tenant_id, day, status, area, count)
+    VALUES (NEW.tenant_id, NEW.start_time::date, NEW.status, NEW.area, 1)
+    ON CONFLICT (tenant_id, day, status, area) DO UPDATE SET count = reservation_daily_counts.count + 1;
+  END IF;
+  RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER visitors_daily_counts_ins_del
+  AFTER INSERT OR DELETE ON visitors
+  FOR EACH ROW EXECUTE FUNCTION visitor_daily_counts_apply();
+CREATE OR REPLACE TRIGGER visitors_daily_counts_upd
+  AFTER UPDATE OF tenant_id, visit_date, status, unit_id ON visitors
+  FOR EACH ROW WHEN ((OLD.tenant_id, OLD.visit_date::date, OLD.status, OLD.unit_id)
+                     IS DISTINCT FROM (NEW.tenant_id, NEW.visit_date::date, NEW.status, NEW.unit_id))
+  EXECUTE FUNCTION visitor_daily_counts_apply();
+
+CREATE OR REPLACE TRIGGER maintenance_orders_daily_counts_ins_del
+  AFTER INSERT OR DELETE ON maintenance_orders
+  FOR EACH ROW EXECUTE FUNCTION maintenance_daily_counts_apply();
+CREATE OR REPLACE TRIGGER maintenance_orders_daily_counts_upd
+  AFTER UPDATE OF tenant_id, created_at, status, category, priority ON maintenance_orders
+  FOR EACH ROW WHEN ((OLD.tenant_id, OLD.created_at::date, OLD.status, OLD.category, OLD.priority)
+                     IS DISTINCT FROM (NEW.tenant_id, NEW.created_at::date, NEW.status, NEW.category, NEW.priority))
+  EXECUTE FUNCTION maintenance_daily_counts_apply();
+
+CREATE OR REPLACE TRIGGER reservations_daily_counts_ins_del
+  AFTER INSERT OR DELETE ON reservations
+  FOR EACH ROW EXECUTE FUNCTION reservation_daily_counts_apply();
+CREATE OR REPLACE TRIGGER reservations_daily_counts_upd
+  AFTER UPDATE OF tenant_id, start_time, status, area ON reservations
+  FOR EACH ROW WHEN ((OLD.tenant_id, OLD.start_time::date, OLD.status, OLD.area)
+                     IS DISTINCT FROM (NEW.tenant_id, NEW.start_time::date, NEW.status, NEW.area))
+  EXECUTE FUNCTION reservation_daily_counts_apply();
+
+-- Recalcula os rollups a partir das tabelas brutas (carga inicial ou reconciliação)
+CREATE OR REPLACE FUNCTION report_rollups_rebuild() RETURNS void AS $$
+BEGIN
+  LOCK TABLE visitors, maintenance_orders, reservations IN SHARE MODE;
+  TRUNCATE visitor_daily_counts, maintenance_daily_counts, reservation_daily_counts;
+  INSERT INTO visitor_daily_counts (tenant_id, day, status, unit_id, count)
+    SELECT tenant_id, visit_date::date, status, unit_id, COUNT(*) FROM visitors
+    WHERE visit_date IS NOT NULL GROUP BY 1, 2, 3, 4;
+  INSERT INTO maintenance_daily_counts (tenant_id, day, status, category, priority, count)
+    SELECT tenant_id, created_at::date, status, category, priority, COUNT(*) FROM maintenance_orders
+    WHERE created_at IS NOT NULL GROUP BY 1, 2, 3, 4, 5;
+  INSERT INTO reservation_daily_counts (tenant_id, day, status, area, count)
+    SELECT tenant_id, start_time::date, status, area, COUNT(*) FROM reservations
+    WHERE start_time IS NOT NULL GROUP BY 1, 2, 3, 4;
+END $$ LANGUAGE plpgsql;
+
+SELECT report_rollups_rebuild();
+
+-- Invalidação do cache de condomínios (Backend/shared/tenant_cache.py) em auth_service e
+-- tenant_service: toda alteração em tenants avisa os processos que fazem LISTEN tenant_changed
+CREATE OR REPLACE FUNCTION tenants_notify_change() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('tenant_changed', OLD.id::text);
+  RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER tenants_notify_change
+  AFTER UPDATE OR DELETE ON tenants
+  FOR EACH ROW EXECUTE FUNCTION tenants_notify_change();
+
 -- seed sample tenants
 INSERT INTO tenants (name, cnpj, address, phone, email, theme_config) VALUES
 ('Condomínio Alphaline', '12.345.678/0001-90', 'Rua das Flores, 123', '(11) 99999-9999', 'contato@alphaline.com', '{"primary_color": "#1976d2", "secondary_color": "#dc004e", "background_color": "#f5f5f5", "text_color": "#333333"}'),
@@ -115,3 +282,23 @@ ON CONFLICT DO NOTHING;
 -- Comentário: Os novos serviços (budget, events, meetings, minutes, employees, 
 -- documents, assets, notices, audit, service_providers, family_members, notifications)
 -- criam suas próprias tabelas automaticamente usando SQLAlchemy
+
+-- Busca textual (family_members, documents, notices, assets): trigramas e tsvector em português
+-- sem acentos. Os serviços repetem estes comandos ao subir (shared/search.py); aqui ficam para
+-- quando o usuário da aplicação não tem permissão de criar extensões.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- unaccent() é STABLE; índices de expressão exigem uma função IMMUTABLE
+CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+  LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+  AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$;
+
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'pt_unaccent') THEN
+    CREATE TEXT SEARCH CONFIGURATION pt_unaccent (COPY = portuguese);
+    ALTER TEXT SEARCH CONFIGURATION pt_unaccent
+      ALTER MAPPING FOR hword, hword_part, word WITH unaccent, portuguese_stem;
+  END IF;
+END $$;